@@ -0,0 +1,141 @@
+"""
+bench_copy_binary.py
+
+Per-table load benchmark: executemany vs. text (CSV) COPY vs. binary COPY.
+
+Covers the numeric-heavy tables accommodation_calendar, payments and bookings. Synthetic
+NumPy columns are loaded into a temporary copy of each table (`LIKE <table>`, no FKs), so
+the benchmark only needs the schema, not seeded data. Each timing covers encoding in Python
+plus the transfer and server-side parsing.
+
+    python -m benchmarks.bench_copy_binary --rows 100000
+    python -m benchmarks.bench_copy_binary --rows 1000000 --methods copy_text copy_binary
+"""
+
+
+# Stdlib imports
+import argparse
+import sys
+import time
+from pathlib import Path
+
+
+# Third-party imports
+import numpy as np
+from psycopg2 import sql
+
+
+# Path/bootstrap
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(PROJECT_ROOT))
+
+
+# Internal imports
+from benchmarks.common import print_table, write_results
+from src.db.connection import managed_connection
+from src.db import sql_repo as sqlrepo
+from src.db.utils.copy_binary import copy_binary, copy_text
+
+
+
+TABLES = ("accommodation_calendar", "payments", "bookings")
+METHODS = ("executemany", "copy_text", "copy_binary")
+WINDOW_START = np.datetime64("2022-01-01T00:00:00", "us")
+WINDOW_US = int(4 * 365 * 24 * 3600 * 1e6)
+
+
+
+# Synthetic columns (name, pg_type, values)
+def _timestamps(rng, n):
+    return WINDOW_START + rng.integers(0, WINDOW_US, n).astype("timedelta64[us]")
+
+def gen_columns(table: str, n: int, rng) -> list:
+    if table == "accommodation_calendar":
+        return [
+            ("accommodation_id", "int4", rng.integers(1, 100_000, n, dtype=np.int32)),
+            ("day", "date", _timestamps(rng, n).astype("datetime64[D]")),
+            ("is_blocked", "bool", rng.integers(0, 2, n).astype(bool)),
+            ("price_addition_cents", "int4", rng.integers(-500, 501, n, dtype=np.int32)),
+            ("min_nights", "int4", rng.integers(2, 8, n, dtype=np.int32)),
+        ]
+    if table == "payments":
+        return [
+            ("customer_id", "int4", rng.integers(1, 100_000, n, dtype=np.int32)),
+            ("amount_cents", "int4", rng.integers(5_000, 700_000, n, dtype=np.int32)),
+            ("status", "enum", rng.choice(np.array(["payed", "open", "cancelled"]), n)),
+            ("payment_method_id", "int4", rng.integers(1, 200_000, n, dtype=np.int32)),
+        ]
+    if table == "bookings":
+        start = _timestamps(rng, n)
+        return [
+            ("guest_account_id", "int4", rng.integers(1, 100_000, n, dtype=np.int32)),
+            ("accommodation_id", "int4", rng.integers(1, 100_000, n, dtype=np.int32)),
+            ("start_date", "timestamp", start),
+            ("end_date", "timestamp", start + rng.integers(1, 15, n).astype("timedelta64[D]")),
+            ("payment_id", "int4", rng.integers(1, 100_000, n, dtype=np.int32)),
+            ("status", "enum", rng.choice(np.array(["pending", "confirmed", "cancelled", "completed"]), n)),
+            ("created_at", "timestamp", start - rng.integers(1, 90, n).astype("timedelta64[D]")),
+        ]
+    raise ValueError(f"No synthetic generator for {table!r}")
+
+
+
+# Load methods
+def _load(cur, method: str, tmp: str, columns: list):
+    names = [name for name, _, _ in columns]
+    if method == "copy_binary":
+        copy_binary(cur, tmp, names, [(values, pg_type) for _, pg_type, values in columns])
+        return
+
+    rows = list(zip(*(values.tolist() for _, _, values in columns)))
+    if method == "copy_text":
+        copy_text(cur, tmp, names, rows)
+    else:
+        query = sql.SQL(sqlrepo.INSERT_ROWS).format(
+            tbl=sql.Identifier(tmp),
+            cols=sql.SQL(", ").join(map(sql.Identifier, names)),
+            vals=sql.SQL(", ").join(sql.Placeholder() * len(names)),
+        )
+        cur.executemany(query, rows)
+
+def bench_table(table: str, n: int, methods, seed: int) -> list:
+    columns = gen_columns(table, n, np.random.default_rng(seed))
+    results = []
+    with managed_connection() as conn:
+        for method in methods:
+            tmp = f"bench_{table}"
+            with conn.cursor() as cur:
+                cur.execute(sql.SQL(sqlrepo.CREATE_TEMP_TABLE_LIKE).format(
+                    tmp=sql.Identifier(tmp), tbl=sql.Identifier(table),
+                ))
+                t0 = time.perf_counter()
+                _load(cur, method, tmp, columns)
+                elapsed = time.perf_counter() - t0
+            conn.rollback()
+
+            results.append({
+                "table": table,
+                "method": method,
+                "rows": n,
+                "seconds": round(elapsed, 3),
+                "rows_per_s": int(n / elapsed) if elapsed else None,
+            })
+    return results
+
+
+
+# CLI entrypoint
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark executemany vs. text COPY vs. binary COPY.")
+    parser.add_argument("--rows", type=int, default=100_000)
+    parser.add_argument("--tables", nargs="*", choices=TABLES, default=list(TABLES))
+    parser.add_argument("--methods", nargs="*", choices=METHODS, default=list(METHODS))
+    parser.add_argument("--seed", type=int, default=42)
+    args = parser.parse_args()
+
+    results = []
+    for table in args.tables:
+        results += bench_table(table, args.rows, args.methods, args.seed)
+
+    print_table(results, ["table", "method", "rows", "seconds", "rows_per_s"])
+    print(f"Results written to {write_results('copy_binary', {'rows': args.rows, 'results': results})}")
@@ -0,0 +1,104 @@
+"""
+bench_export.py
+
+Compare memory and wall time of the full-database export paths.
+
+Methods:
+- dataframe: db_introspect.dump_database_contents() (fetchall + pandas, all tables in RAM)
+- copy:      db_export with COPY TO STDOUT into one file per table
+- cursor:    db_export with a named server-side cursor and itersize batching
+
+Every method runs in its own subprocess so peak RSS is measured in isolation.
+Run against a datamart seeded at the scale of interest (multi-GB for the RSS comparison):
+
+    python -m benchmarks.bench_export
+    python -m benchmarks.bench_export --methods copy cursor --itersize 50000
+"""
+
+
+# Stdlib imports
+import argparse
+import json
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+
+# Path/bootstrap
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(PROJECT_ROOT))
+
+
+# Internal imports
+from benchmarks.common import peak_rss_mb, print_table, write_results
+
+
+
+METHODS = ("dataframe", "copy", "cursor")
+
+
+
+# Single measurement (runs inside the child process)
+def run_once(method: str, itersize: int) -> dict:
+    """
+    Export the whole database once with `method` and return timing/memory figures.
+    """
+    from src.db.utils import db_export
+    from src.db.utils.db_introspect import dump_database_contents
+
+    rss_before = peak_rss_mb()
+    t0 = time.perf_counter()
+    bytes_written = None
+
+    if method == "dataframe":
+        dfs = dump_database_contents()
+        rows = sum(len(df) for df in dfs.values())
+    else:
+        with tempfile.TemporaryDirectory() as tmp:
+            files = db_export.export_database_streaming(Path(tmp), method=method, itersize=itersize)
+            bytes_written = sum(path.stat().st_size for path in files.values())
+            rows = None
+
+    return {
+        "method": method,
+        "seconds": round(time.perf_counter() - t0, 3),
+        "rows": rows,
+        "bytes_written": bytes_written,
+        "rss_before_mb": round(rss_before, 1),
+        "peak_rss_mb": round(peak_rss_mb(), 1),
+        "rss_growth_mb": round(peak_rss_mb() - rss_before, 1),
+    }
+
+
+
+# Driver
+def run(methods, itersize: int) -> list:
+    results = []
+    for method in methods:
+        proc = subprocess.run(
+            [sys.executable, "-m", "benchmarks.bench_export", "--child", method, "--itersize", str(itersize)],
+            cwd=PROJECT_ROOT, capture_output=True, text=True, check=True,
+        )
+        # The child prints its result as the last stdout line (log lines come first)
+        results.append(json.loads(proc.stdout.strip().splitlines()[-1]))
+    return results
+
+
+
+# CLI entrypoint
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark full-database export paths.")
+    parser.add_argument("--methods", nargs="*", choices=METHODS, default=list(METHODS))
+    parser.add_argument("--itersize", type=int, default=10_000)
+    parser.add_argument("--child", choices=METHODS, help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.child:
+        print(json.dumps(run_once(args.child, args.itersize)))
+        sys.exit(0)
+
+    results = run(args.methods, args.itersize)
+    print_table(results, ["method", "seconds", "rows", "bytes_written", "rss_before_mb", "peak_rss_mb", "rss_growth_mb"])
+    print(f"Results written to {write_results('export', {'itersize': args.itersize, 'results': results})}")
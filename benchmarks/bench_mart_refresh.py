@@ -0,0 +1,96 @@
+"""
+bench_mart_refresh.py
+
+Refresh time of the reporting aggregates: incremental (change log) vs. full rebuild, per delta size.
+
+For every delta size the benchmark, inside one transaction that is rolled back at the end:
+1. shifts the end date of `delta` random bookings by one day (the triggers log the changes)
+2. times refresh_incremental() on the agg_* tables
+3. times a full rebuild (plain REFRESH of every mart)
+4. verifies the incremental result against the rebuild (mismatching rows must be 0)
+
+The seeded datamart is left unchanged. Run the pipeline (src/main.py) first so the agg_* tables
+are loaded.
+
+    python -m benchmarks.bench_mart_refresh --deltas 10 100 1000 10000
+"""
+
+
+# Stdlib imports
+import argparse
+import sys
+import time
+from pathlib import Path
+
+
+# Third-party imports
+from psycopg2 import sql
+
+
+# Path/bootstrap
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(PROJECT_ROOT))
+
+
+# Internal imports
+from benchmarks.common import print_table, write_results
+from src.db.connection import managed_connection
+from src.db import refresh_marts as marts
+from src.db import sql_repo as sqlrepo
+from src.utils.logger import logger
+
+
+
+REPORT_COLUMNS = ["delta", "changes", "incremental_ms", "full_ms", "speedup", "mismatches"]
+
+
+
+def measure_delta(cur, delta: int) -> dict:
+    """
+    Apply a delta of `delta` bookings and time incremental vs. full refresh (caller rolls back).
+    """
+    cur.execute(sqlrepo.COUNT_PENDING_MART_CHANGES)
+    if cur.fetchone()[0]:
+        logger.warning("mart_changes has pending rows; they are included in the incremental timing")
+
+    cur.execute(sqlrepo.BENCH_SHIFT_BOOKING_END_DATES, (delta,))
+    incremental = marts.refresh_incremental(cur)
+
+    t0 = time.perf_counter()
+    for mart_name in marts.AGGREGATES:
+        cur.execute(sql.SQL(sqlrepo.REFRESH_MATERIALIZED_VIEW).format(sql.Identifier(mart_name)))
+    full_ms = (time.perf_counter() - t0) * 1000
+
+    mismatches = marts.verify_aggregates(cur)
+    return {
+        "delta": delta,
+        "changes": incremental["changes"],
+        "keys": incremental["keys"],
+        "incremental_ms": incremental["duration_ms"],
+        "full_ms": round(full_ms, 3),
+        "speedup": round(full_ms / incremental["duration_ms"], 1) if incremental["duration_ms"] else None,
+        "mismatches": sum(mismatches.values()),
+    }
+
+def run(deltas: list) -> list:
+    results = []
+    for delta in deltas:
+        with managed_connection() as conn, conn.cursor() as cur:
+            results.append(measure_delta(cur, delta))
+            conn.rollback()
+    return results
+
+
+
+# CLI entrypoint
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark incremental vs. full refresh of the reporting aggregates.")
+    parser.add_argument("--deltas", nargs="*", type=int, default=[10, 100, 1000], help="changed bookings per run")
+    args = parser.parse_args()
+
+    results = run(args.deltas)
+    print_table(results, REPORT_COLUMNS)
+    print(f"Results written to {write_results('mart_refresh', {'runs': results})}")
+    if any(result["mismatches"] for result in results):
+        print("Incremental aggregates differ from the full rebuild!")
+        sys.exit(1)
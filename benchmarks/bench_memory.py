@@ -0,0 +1,160 @@
+"""
+bench_memory.py
+
+In-process memory footprint of generated tables: list of row lists vs. ColumnTable.
+
+The row layout is what the generators used to build: one list per row holding boxed ints, bools,
+ISO timestamp strings and shared label strings. The columnar layout is src.db.utils.columnar
+(typed arrays, epoch-µs timestamps, dictionary-encoded labels). Both are built from the same
+synthetic NumPy columns and measured with tracemalloc (allocations made while building the
+representation, NumPy buffers included). Bytes per row are extrapolated to --extrapolate rows,
+so the 10M-row footprint can be judged without allocating it.
+
+No database needed.
+
+    python -m benchmarks.bench_memory
+    python -m benchmarks.bench_memory --rows 2000000 --shapes bookings
+"""
+
+
+# Stdlib imports
+import argparse
+import gc
+import sys
+import tracemalloc
+from pathlib import Path
+
+
+# Third-party imports
+import numpy as np
+
+
+# Path/bootstrap
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(PROJECT_ROOT))
+
+
+# Internal imports
+from benchmarks.common import peak_rss_mb, print_table, write_results
+from src.db.utils.columnar import ColumnTable
+
+
+
+SHAPES = ("bookings", "accommodation_calendar")
+LAYOUTS = ("row_lists", "columnar")
+BOOKING_STATUSES = ["pending", "confirmed", "cancelled", "completed"]
+WINDOW_START_US = int(np.datetime64("2022-01-01T00:00:00", "us").astype(np.int64))
+WINDOW_US = 4 * 365 * 24 * 3600 * 1_000_000
+DAY_US = 24 * 3600 * 1_000_000
+
+
+
+# Synthetic columns (name, pg_type, values, categorical)
+def gen_columns(shape: str, n: int, rng) -> list:
+    """
+    Timestamp/date columns are int64 epoch µs, label columns are int codes into their label list.
+    """
+    if shape == "bookings":
+        start = WINDOW_START_US + rng.integers(0, WINDOW_US // 1_000_000, n) * 1_000_000
+        return [
+            ("guest_account_id", "int4", rng.integers(1, 100_000, n, dtype=np.int32), None),
+            ("accommodation_id", "int4", rng.integers(1, 100_000, n, dtype=np.int32), None),
+            ("start_date", "timestamp", start, None),
+            ("end_date", "timestamp", start + rng.integers(1, 15, n) * DAY_US, None),
+            ("payment_id", "int4", rng.integers(1, 100_000, n, dtype=np.int32), None),
+            ("status", "enum", rng.integers(0, len(BOOKING_STATUSES), n), BOOKING_STATUSES),
+            ("created_at", "timestamp", start - rng.integers(1, 90, n) * DAY_US, None),
+        ]
+    if shape == "accommodation_calendar":
+        return [
+            ("accommodation_id", "int4", rng.integers(1, 100_000, n, dtype=np.int32), None),
+            ("day", "date", WINDOW_START_US + rng.integers(0, 4 * 365, n) * DAY_US, None),
+            ("is_blocked", "bool", rng.integers(0, 2, n).astype(bool), None),
+            ("price_addition_cents", "int4", rng.integers(-500, 501, n, dtype=np.int32), None),
+            ("min_nights", "int4", rng.integers(2, 8, n, dtype=np.int32), None),
+        ]
+    raise ValueError(f"No synthetic generator for {shape!r}")
+
+
+
+# Layouts
+def _python_column(pg_type: str, values: np.ndarray, labels: list) -> list:
+    if labels is not None:
+        return [labels[code] for code in values.tolist()]
+    if pg_type == "timestamp":
+        return [ts.isoformat() for ts in values.view("datetime64[us]").tolist()]
+    if pg_type == "date":
+        return values.view("datetime64[us]").astype("datetime64[D]").tolist()
+    return values.tolist()
+
+def build_row_lists(columns: list) -> list:
+    python_columns = [_python_column(pg_type, values, labels) for _, pg_type, values, labels in columns]
+    return [list(row) for row in zip(*python_columns)]
+
+def build_columnar(columns: list) -> ColumnTable:
+    table = ColumnTable("bench")
+    for name, pg_type, values, labels in columns:
+        if labels is not None:
+            table.add(name, [labels[code] for code in values.tolist()], pg_type, categorical=True)
+        else:
+            table.add(name, values.copy(), pg_type)  # to_column() would reuse the source buffer
+    return table
+
+def measure(build, columns: list) -> int:
+    """
+    Return the bytes still allocated by `build(columns)` while its result is alive.
+    """
+    gc.collect()
+    tracemalloc.start()
+    before, _ = tracemalloc.get_traced_memory()
+    result = build(columns)
+    after, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del result
+    return after - before
+
+def bench_shape(shape: str, n: int, extrapolate: int, seed: int) -> list:
+    columns = gen_columns(shape, n, np.random.default_rng(seed))
+    builders = {"row_lists": build_row_lists, "columnar": build_columnar}
+    results = []
+    for layout in LAYOUTS:
+        nbytes = measure(builders[layout], columns)
+        per_row = nbytes / n
+        results.append({
+            "shape": shape,
+            "layout": layout,
+            "rows": n,
+            "bytes_per_row": round(per_row, 1),
+            "mib": round(nbytes / 2**20, 1),
+            f"mib_at_{extrapolate}": round(per_row * extrapolate / 2**20, 1),
+        })
+    baseline = results[0]["bytes_per_row"]
+    for row in results:
+        row["vs_row_lists"] = round(row["bytes_per_row"] / baseline, 3) if baseline else None
+    return results
+
+
+
+# CLI entrypoint
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Memory footprint of row lists vs. columnar tables.")
+    parser.add_argument("--rows", type=int, default=1_000_000, help="rows actually built per shape")
+    parser.add_argument("--extrapolate", type=int, default=10_000_000, help="row count to extrapolate to")
+    parser.add_argument("--shapes", nargs="*", choices=SHAPES, default=list(SHAPES))
+    parser.add_argument("--seed", type=int, default=42)
+    args = parser.parse_args()
+
+    results = []
+    for shape in args.shapes:
+        results += bench_shape(shape, args.rows, args.extrapolate, args.seed)
+
+    columns = ["shape", "layout", "rows", "bytes_per_row", "mib", f"mib_at_{args.extrapolate}", "vs_row_lists"]
+    print_table(results, columns)
+    payload = {
+        "rows": args.rows,
+        "extrapolate": args.extrapolate,
+        "peak_rss_mb": round(peak_rss_mb(), 1),
+        "results": results,
+        "server_tuning": None,  # in-process only, no server involved
+    }
+    print(f"Results written to {write_results('memory', payload)}")
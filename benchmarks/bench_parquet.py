@@ -0,0 +1,96 @@
+"""
+bench_parquet.py
+
+Read-back benchmark: Parquet files vs. the current dump_database_contents() DataFrame path.
+
+Steps:
+- export all tables once with db_export_parquet (timed)
+- load every table into pandas from the Parquet files (timed)
+- load every table into pandas via dump_database_contents() (timed)
+
+Run against a seeded datamart:
+
+    python -m benchmarks.bench_parquet
+    python -m benchmarks.bench_parquet --row-group-size 50000 --repeat 5
+"""
+
+
+# Stdlib imports
+import argparse
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+
+# Third-party imports
+import pandas as pd
+
+
+# Path/bootstrap
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(PROJECT_ROOT))
+
+
+# Internal imports
+from benchmarks.common import print_table, write_results
+from src.db.utils.db_export_parquet import export_database_parquet
+from src.db.utils.db_introspect import dump_database_contents
+
+
+
+def _frames_size_mb(frames: dict) -> float:
+    return sum(df.memory_usage(deep=True).sum() for df in frames.values()) / (1024 * 1024)
+
+def _best_of(repeat: int, fn):
+    """
+    Run `fn` `repeat` times and return (best seconds, last result).
+    """
+    best, result = None, None
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        result = fn()
+        elapsed = time.perf_counter() - t0
+        best = elapsed if best is None else min(best, elapsed)
+    return best, result
+
+def run(row_group_size: int, repeat: int) -> list:
+    with tempfile.TemporaryDirectory() as tmp:
+        t0 = time.perf_counter()
+        files = export_database_parquet(Path(tmp), row_group_size=row_group_size)
+        export_seconds = time.perf_counter() - t0
+        parquet_mb = sum(path.stat().st_size for path in files.values()) / (1024 * 1024)
+
+        parquet_seconds, parquet_frames = _best_of(
+            repeat, lambda: {table: pd.read_parquet(path) for table, path in files.items()}
+        )
+
+    dump_seconds, dump_frames = _best_of(repeat, dump_database_contents)
+
+    return [
+        {
+            "path": "parquet",
+            "export_s": round(export_seconds, 3),
+            "file_mb": round(parquet_mb, 2),
+            "read_s": round(parquet_seconds, 3),
+            "frames_mb": round(_frames_size_mb(parquet_frames), 2),
+        },
+        {
+            "path": "dump_database_contents",
+            "read_s": round(dump_seconds, 3),
+            "frames_mb": round(_frames_size_mb(dump_frames), 2),
+        },
+    ]
+
+
+
+# CLI entrypoint
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark Parquet read-back against the DataFrame dump.")
+    parser.add_argument("--row-group-size", type=int, default=100_000)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    results = run(args.row_group_size, args.repeat)
+    print_table(results, ["path", "export_s", "file_mb", "read_s", "frames_mb"])
+    print(f"Results written to {write_results('parquet', {'row_group_size': args.row_group_size, 'results': results})}")
@@ -0,0 +1,134 @@
+"""
+bench_partitioning.py
+
+Monthly RANGE partitioning vs. the unpartitioned public tables.
+
+For each partitioned table (bookings, messages, notifications, accommodation_calendar) the seeded
+rows of the public table are copied into two regular (logged) tables with the same indexes:
+- load: `INSERT ... SELECT` into an unpartitioned copy (`LIKE` the partitioned table, so it gets
+  its primary key and indexes) vs. into the partitioned table (rows routed to their monthly
+  partition), each committed on its own
+- range query: count of one month (middle of the seeding window) on the unpartitioned copy vs.
+  the partitioned table (partition pruning), both vacuumed and analyzed first, best of --repeat
+
+The partitioned schema and its partitions are created first if missing (src/db/partitions.py).
+The partitioned tables must be empty; the copy is dropped and the partitioned table emptied again
+afterwards.
+
+    python -m benchmarks.bench_partitioning
+    python -m benchmarks.bench_partitioning --tables bookings messages --repeat 10
+"""
+
+
+# Stdlib imports
+import argparse
+import datetime
+import sys
+import time
+from pathlib import Path
+
+
+# Third-party imports
+from psycopg2 import sql
+
+
+# Path/bootstrap
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(PROJECT_ROOT))
+
+
+# Internal imports
+from benchmarks.common import print_table, write_results
+import src.db.data_lists as seeds
+from src.db import partitions
+from src.db import sql_repo as sqlrepo
+from src.db.connection import managed_connection
+
+
+
+REPORT_COLUMNS = [
+    "table", "rows", "load_plain_s", "load_partitioned_s",
+    "range_plain_ms", "range_partitioned_ms", "range_rows",
+]
+
+
+
+def _timed(cur, query, params=None) -> float:
+    t0 = time.perf_counter()
+    cur.execute(query, params)
+    return time.perf_counter() - t0
+
+def _best_range_ms(cur, table, column: str, bounds: tuple, repeat: int) -> tuple:
+    query = sql.SQL(sqlrepo.COUNT_ROWS_IN_RANGE).format(tbl=table, col=sql.Identifier(column))
+    best, rows = None, None
+    for _ in range(repeat):
+        elapsed = _timed(cur, query, bounds)
+        rows = cur.fetchone()[0]
+        best = elapsed if best is None else min(best, elapsed)
+    return round(best * 1000, 3), rows
+
+def _middle_month() -> tuple:
+    middle = seeds.start_timestamp + (seeds.stop_timestamp - seeds.start_timestamp) / 2
+    month = datetime.date(middle.year, middle.month, 1)
+    return month, partitions.next_month(month)
+
+def measure_table(cur, table: str, repeat: int) -> dict:
+    """
+    Load and range-query one table; `cur` is on an autocommit connection.
+    """
+    column = partitions.PARTITIONED_TABLES[table]
+    public = sql.Identifier("public", table)
+    partitioned = sql.Identifier(partitions.PARTITION_SCHEMA, table)
+    plain_copy = sql.Identifier("public", f"bench_plain_{table}")
+
+    cur.execute(sql.SQL(sqlrepo.COUNT_ROWS).format(partitioned))
+    if cur.fetchone()[0]:
+        raise ValueError(f"{partitions.PARTITION_SCHEMA}.{table} is not empty")
+
+    cur.execute(sql.SQL(sqlrepo.DROP_TABLE_IF_EXISTS).format(plain_copy))
+    cur.execute(sql.SQL(sqlrepo.CREATE_TABLE_LIKE_WITH_INDEXES).format(target=plain_copy, tbl=partitioned))
+    try:
+        load_plain = _timed(cur, sql.SQL(sqlrepo.INSERT_SELECT_ALL).format(target=plain_copy, source=public))
+        rows = cur.rowcount
+        load_partitioned = _timed(cur, sql.SQL(sqlrepo.INSERT_SELECT_ALL).format(target=partitioned, source=public))
+
+        for target in (plain_copy, partitioned):
+            cur.execute(sql.SQL(sqlrepo.VACUUM_ANALYZE_TABLE).format(target))
+        bounds = _middle_month()
+        range_plain_ms, range_rows = _best_range_ms(cur, plain_copy, column, bounds, repeat)
+        range_partitioned_ms, _ = _best_range_ms(cur, partitioned, column, bounds, repeat)
+    finally:
+        cur.execute(sql.SQL(sqlrepo.DROP_TABLE).format(plain_copy))
+        cur.execute(sql.SQL(sqlrepo.TRUNCATE_TABLE).format(partitioned))
+
+    return {
+        "table": table,
+        "rows": rows,
+        "load_plain_s": round(load_plain, 3),
+        "load_partitioned_s": round(load_partitioned, 3),
+        "range_plain_ms": range_plain_ms,
+        "range_partitioned_ms": range_partitioned_ms,
+        "range_rows": range_rows,
+        "month": str(bounds[0]),
+    }
+
+def run(tables: list, repeat: int) -> list:
+    partitions.ensure_partitioned_schema()
+    with managed_connection() as conn:
+        conn.autocommit = True
+        with conn.cursor() as cur:
+            return [measure_table(cur, table, repeat) for table in tables]
+
+
+
+# CLI entrypoint
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Compare monthly RANGE partitioning with the unpartitioned tables.")
+    parser.add_argument("--tables", nargs="*", choices=list(partitions.PARTITIONED_TABLES),
+                        default=list(partitions.PARTITIONED_TABLES))
+    parser.add_argument("--repeat", type=int, default=5, help="range query runs per table (best is kept)")
+    args = parser.parse_args()
+
+    results = run(args.tables, args.repeat)
+    print_table(results, REPORT_COLUMNS)
+    print(f"Results written to {write_results('partitioning', {'runs': results})}")
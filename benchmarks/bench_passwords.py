@@ -0,0 +1,94 @@
+"""
+bench_passwords.py
+
+Password hash generation for credentials.password_hash: hashes/s of each algorithm and cost in one
+process vs. the process pool of src.db.utils.passwords, the encoded size per row (vs. the former
+random strings of data_lists.pwd_hash_length) and the time to read the same hashes back from the
+hash cache. Algorithms whose optional package is missing are skipped. No database needed.
+
+    python -m benchmarks.bench_passwords
+    python -m benchmarks.bench_passwords --rows 2000 --algorithms bcrypt:10 argon2id:2 --workers 8
+"""
+
+
+# Stdlib imports
+import argparse
+import os
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+
+# Path/bootstrap
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(PROJECT_ROOT))
+
+
+# Internal imports
+from benchmarks.common import print_table, write_results
+import src.db.data_lists as seeds
+from src.db.utils import passwords
+from src.utils.logger import logger
+
+
+
+# algorithm:cost pairs at moderate costs, so a run takes seconds rather than hours
+DEFAULT_ALGORITHMS = ["pbkdf2_sha256:100000", "scrypt:14", "bcrypt:10", "argon2id:2"]
+
+
+
+def bench_algorithm(algorithm: str, cost: int, n: int, workers: int, seed: int) -> dict:
+    t0 = time.perf_counter()
+    serial = passwords.compute_hashes(algorithm, cost, seed, 0, n, workers=1)
+    serial_s = time.perf_counter() - t0
+
+    t0 = time.perf_counter()
+    pooled = passwords.compute_hashes(algorithm, cost, seed, 0, n, workers=workers)
+    pooled_s = time.perf_counter() - t0
+    assert pooled == serial
+
+    # first call fills the cache, the second reads it back
+    passwords.hash_passwords(n, algorithm, cost, seed=seed, workers=workers)
+    t0 = time.perf_counter()
+    passwords.hash_passwords(n, algorithm, cost, seed=seed, workers=workers)
+    cached_s = time.perf_counter() - t0
+
+    return {
+        "algorithm": algorithm,
+        "cost": cost,
+        "rows": n,
+        "serial_per_s": round(n / serial_s, 1),
+        "pool_per_s": round(n / pooled_s, 1),
+        "speedup": round(serial_s / pooled_s, 2),
+        "cached_s": round(cached_s, 4),
+        "bytes_per_row": round(sum(len(h) for h in serial) / n, 1),
+    }
+
+
+
+# CLI entrypoint
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark password hash generation (serial vs. process pool vs. cache).")
+    parser.add_argument("--rows", type=int, default=1000)
+    parser.add_argument("--algorithms", nargs="*", default=DEFAULT_ALGORITHMS, help="algorithm:cost pairs")
+    parser.add_argument("--workers", type=int, default=os.cpu_count())
+    parser.add_argument("--seed", type=int, default=42)
+    args = parser.parse_args()
+
+    results = []
+    with tempfile.TemporaryDirectory() as cache_dir:
+        passwords.HASH_CACHE_DIR = Path(cache_dir)    # keep benchmark hashes out of the real cache
+        for entry in args.algorithms:
+            algorithm, _, cost = entry.partition(":")
+            try:
+                passwords._require(algorithm)
+            except ImportError as e:
+                logger.warning(f"Skipping {algorithm}: {e}")
+                continue
+            results.append(bench_algorithm(algorithm, passwords.resolve_cost(algorithm, cost or None), args.rows, args.workers, args.seed))
+
+    print_table(results, ["algorithm", "cost", "rows", "serial_per_s", "pool_per_s", "speedup", "cached_s", "bytes_per_row"])
+    print(f"Random strings (PASSWORD_HASH=off): {seeds.pwd_hash_length} bytes per row")
+    payload = {"rows": args.rows, "workers": args.workers, "results": results, "server_tuning": None}  # in-process only
+    print(f"Results written to {write_results('passwords', payload)}")
@@ -0,0 +1,256 @@
+"""
+bench_pipeline.py
+
+Benchmark the seeding pipeline of src/main.py at several scales.
+
+For every scale profile (data_lists.scale_profiles, base rows per table) the full pipeline runs
+once (SQL setup + every gen_dummydata_* stage) and each stage records:
+- wall time and rows/sec (rows counted in the tables the stage fills)
+- peak RSS of the benchmark process after the stage
+- round trips, rows and bytes sent and time waiting on the database, counted client-side by
+  src.db.utils.instrumentation
+- server statements: statements executed on the server (pg_stat_statements delta, if available)
+- WAL volume generated on the server (pg_current_wal_lsn delta)
+
+Results go to benchmarks/results/pipeline_<timestamp>.json and are compared against the stored
+baseline benchmarks/baselines/pipeline.json (if present) so regressions are visible.
+
+With --tuning phased the bulk_load tuning profile (src.db.tuning) is active while the stages run and
+serve afterwards; every run records the profile the server actually matched during the stages.
+--distribution hotspot seeds skewed foreign keys and timestamps (data_lists.distribution_profiles).
+Runs are only compared with baseline runs of the same tuning profile and distribution.
+
+Server statement counting needs pg_stat_statements in shared_preload_libraries (set in
+docker-compose.yml); otherwise the column stays empty.
+
+    python -m benchmarks.bench_pipeline --scales 1k 100k
+    python -m benchmarks.bench_pipeline --scales 1k --save-baseline
+    python -m benchmarks.bench_pipeline --scales 1k --fail-on-regression
+    python -m benchmarks.bench_pipeline --scales 1m --tuning phased
+    python -m benchmarks.bench_pipeline --scales 100k --distribution hotspot
+"""
+
+
+# Stdlib imports
+import argparse
+import json
+import random
+import sys
+from pathlib import Path
+
+
+# Third-party imports
+import psycopg2
+from psycopg2 import sql
+
+
+# Path/bootstrap
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(PROJECT_ROOT))
+
+
+# Internal imports
+from benchmarks.common import peak_rss_mb, print_table, write_results
+import src.db.data_lists as seeds
+from src.db import refresh_marts as marts
+from src.db import run_sql_files as setup
+from src.db import sql_repo as sqlrepo
+from src.db import tuning
+from src.db.connection import managed_connection
+from src.db.utils import distributions, instrumentation
+from src.main import STAGES
+from src.utils.logger import logger
+
+
+
+BASELINE_PATH = PROJECT_ROOT / "benchmarks" / "baselines" / "pipeline.json"
+
+# Statements issued by the measurement itself between two pg_stat_statements snapshots
+MEASUREMENT_STATEMENTS = 2
+
+# Metrics compared against the baseline (higher is worse for all of them)
+COMPARED_METRICS = ("seconds", "peak_rss_mb", "round_trips", "bytes_sent", "wal_bytes")
+STAGE_COLUMNS = [
+    "scale", "stage", "seconds", "db_seconds", "rows", "rows_per_s", "peak_rss_mb",
+    "round_trips", "bytes_sent", "server_statements", "wal_bytes",
+]
+
+
+
+# Server-side counters
+def _enable_pg_stat_statements(cur) -> bool:
+    """
+    Make sure pg_stat_statements is usable (created if missing); False if the library is not preloaded.
+    """
+    try:
+        cur.execute(sqlrepo.FETCH_HAS_PG_STAT_STATEMENTS)
+        if not cur.fetchone()[0]:
+            cur.execute(sqlrepo.CREATE_PG_STAT_STATEMENTS)
+        cur.execute(sqlrepo.FETCH_STATEMENT_CALLS)
+        return True
+    except psycopg2.Error as e:
+        logger.warning(f"pg_stat_statements unavailable, server statements not recorded: {e}")
+        return False
+
+def _count_rows(cur, tables: list) -> int:
+    total = 0
+    for table in tables:
+        cur.execute(sql.SQL(sqlrepo.COUNT_ROWS).format(sql.Identifier(table)))
+        total += cur.fetchone()[0]
+    return total
+
+def measure_stage(cur, has_pgss: bool, name: str, fn, tables: list) -> dict:
+    """
+    Run one pipeline stage and collect its metrics.
+
+    Args:
+        cur: autocommit cursor on a separate measurement connection.
+        has_pgss (bool): whether pg_stat_statements can be queried.
+        name (str): stage name.
+        fn (callable): the stage itself.
+        tables (list): tables whose row count is attributed to the stage.
+    """
+    cur.execute(sqlrepo.FETCH_WAL_LSN)
+    lsn_before = cur.fetchone()[0]
+    if has_pgss:
+        cur.execute(sqlrepo.FETCH_STATEMENT_CALLS)
+        calls_before = cur.fetchone()[0]
+
+    with instrumentation.stage_scope(name) as stats:
+        fn()
+
+    cur.execute(sqlrepo.FETCH_WAL_BYTES_SINCE, (lsn_before,))
+    wal_bytes = cur.fetchone()[0]
+    server_statements = None
+    if has_pgss:
+        cur.execute(sqlrepo.FETCH_STATEMENT_CALLS)
+        server_statements = cur.fetchone()[0] - calls_before - MEASUREMENT_STATEMENTS
+
+    rows = _count_rows(cur, tables) if tables else None
+    elapsed = stats.wall_s
+    return {
+        "stage": name,
+        "seconds": round(elapsed, 3),
+        "db_seconds": round(stats.db_s, 3),
+        "rows": rows,
+        "rows_per_s": int(rows / elapsed) if rows and elapsed else None,
+        "peak_rss_mb": round(peak_rss_mb(), 1),
+        "round_trips": stats.round_trips,
+        "bytes_sent": stats.bytes_sent,
+        "server_statements": server_statements,
+        "wal_bytes": wal_bytes,
+    }
+
+def run_scale(scale: str, seed: int, tuning_mode: str = "off", distribution: str = "uniform") -> dict:
+    """
+    Run the complete pipeline once at `scale` and return per-stage metrics.
+
+    Args:
+        tuning_mode (str): "phased" switches to the bulk_load profile for the stages and to serve afterwards.
+        distribution (str): column distribution profile of the generated data.
+    """
+    seeds.num_gen_dummydata = seeds.scale_profiles[scale]
+    distributions.apply_profile(distribution)
+    random.seed(seed)
+    logger.info(f"Pipeline benchmark: scale {scale} ({seeds.num_gen_dummydata} base rows, {distribution} distribution)")
+
+    if tuning_mode == "phased":
+        tuning.apply_profile("bulk_load")
+    try:
+        tuning_profile = tuning.describe_server()["profile"]
+        with managed_connection() as conn:
+            conn.autocommit = True
+            with conn.cursor() as cur:
+                has_pgss = _enable_pg_stat_statements(cur)
+
+                stages = [measure_stage(cur, has_pgss, "sql_setup", setup.run_sql_files, [])]
+                with marts.change_log_paused():
+                    for name, generate, tables in STAGES:
+                        stages.append(measure_stage(cur, has_pgss, name, generate, tables))
+    finally:
+        if tuning_mode == "phased":
+            tuning.apply_profile("serve")
+
+    for stage in stages:
+        stage["scale"] = scale
+    return {
+        "scale": scale,
+        "base_rows": seeds.num_gen_dummydata,
+        "tuning_profile": tuning_profile,
+        "distribution": distribution,
+        "total_seconds": round(sum(stage["seconds"] for stage in stages), 3),
+        "stages": stages,
+    }
+
+
+
+# Baseline comparison
+def compare_to_baseline(runs: list, baseline: dict, tolerance: float) -> list:
+    """
+    Return one entry per (scale, stage, metric) that got worse than baseline * (1 + tolerance).
+    Only runs with the same tuning profile and distribution are compared.
+    """
+    baseline_stages = {
+        (run["scale"], run.get("tuning_profile"), run.get("distribution", "uniform"), stage["stage"]): stage
+        for run in baseline.get("runs", [])
+        for stage in run["stages"]
+    }
+
+    regressions = []
+    for run in runs:
+        for stage in run["stages"]:
+            base = baseline_stages.get((run["scale"], run.get("tuning_profile"), run.get("distribution", "uniform"), stage["stage"]))
+            if base is None:
+                continue
+            for metric in COMPARED_METRICS:
+                current, previous = stage.get(metric), base.get(metric)
+                if current is None or not previous:
+                    continue
+                if current > previous * (1 + tolerance):
+                    regressions.append({
+                        "scale": run["scale"],
+                        "stage": stage["stage"],
+                        "metric": metric,
+                        "baseline": previous,
+                        "current": current,
+                        "change": f"{(current / previous - 1) * 100:+.0f}%",
+                    })
+    return regressions
+
+
+
+# CLI entrypoint
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark the seeding pipeline at several scales.")
+    parser.add_argument("--scales", nargs="*", choices=list(seeds.scale_profiles), default=["1k"])
+    parser.add_argument("--seed", type=int, default=42, help="RNG seed for the generators")
+    parser.add_argument("--tolerance", type=float, default=0.2, help="allowed slowdown before flagging")
+    parser.add_argument("--tuning", choices=["off", "phased"], default="off", help="switch server tuning profiles between phases")
+    parser.add_argument("--distribution", choices=list(seeds.distribution_profiles), default="uniform", help="column distributions of the seed data")
+    parser.add_argument("--save-baseline", action="store_true", help="store this run as the new baseline")
+    parser.add_argument("--fail-on-regression", action="store_true", help="exit 1 if anything regressed")
+    args = parser.parse_args()
+
+    runs = [run_scale(scale, args.seed, args.tuning, args.distribution) for scale in args.scales]
+    payload = {"seed": args.seed, "tuning": args.tuning, "runs": runs}
+
+    print_table([stage for run in runs for stage in run["stages"]], STAGE_COLUMNS)
+    print(f"Results written to {write_results('pipeline', payload)}")
+
+    if args.save_baseline:
+        BASELINE_PATH.parent.mkdir(parents=True, exist_ok=True)
+        BASELINE_PATH.write_text(json.dumps(payload, indent=2), encoding="utf-8")
+        print(f"Baseline saved to {BASELINE_PATH}")
+        sys.exit(0)
+
+    if not BASELINE_PATH.exists():
+        print("No baseline stored yet (run with --save-baseline).")
+        sys.exit(0)
+
+    regressions = compare_to_baseline(runs, json.loads(BASELINE_PATH.read_text(encoding="utf-8")), args.tolerance)
+    if regressions:
+        print(f"\n{len(regressions)} regression(s) against {BASELINE_PATH.name}:")
+        print_table(regressions, ["scale", "stage", "metric", "baseline", "current", "change"])
+    else:
+        print(f"\nNo regressions against {BASELINE_PATH.name} (tolerance {args.tolerance:.0%}).")
+    sys.exit(1 if regressions and args.fail_on_regression else 0)
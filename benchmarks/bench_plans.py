@@ -0,0 +1,254 @@
+"""
+bench_plans.py
+
+Capture query plans of the datamart's hot queries and detect plan regressions between runs.
+
+Every query in CATALOGUE (lookups from sql_repo, the customer journey steps and the final join of
+test_33_final_customer_journey_join_assertion) runs with `EXPLAIN (ANALYZE, BUFFERS, FORMAT JSON)`
+against the seeded datamart, parameterized with ids sampled from the data. Per query it records:
+- plan shape: node types with the relations/indexes they touch (compact signature)
+- indexes used, and whether the composite index the query was written for is among them
+- planning and execution time (best of --repeat) and shared buffer hits/reads
+
+Results (including the full JSON plans) go to benchmarks/results/plans_<timestamp>.json and are
+compared against benchmarks/baselines/plans.json: a changed plan shape or an execution time
+above baseline * (1 + tolerance) is reported.
+
+Small datasets (scale "default") are often planned as sequential scans; seed at least the 100k
+profile before judging index usage.
+
+    python -m benchmarks.bench_plans
+    python -m benchmarks.bench_plans --repeat 5 --save-baseline
+    python -m benchmarks.bench_plans --fail-on-regression
+"""
+
+
+# Stdlib imports
+import argparse
+import json
+import sys
+from pathlib import Path
+
+
+# Path/bootstrap
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(PROJECT_ROOT))
+
+
+# Internal imports
+from benchmarks.common import print_table, write_results
+from src.db import maintenance
+from src.db import sql_repo as sqlrepo
+from src.db.connection import managed_connection
+from src.utils.logger import logger
+
+
+
+BASELINE_PATH = PROJECT_ROOT / "benchmarks" / "baselines" / "plans.json"
+
+# Execution times below this are noise; they are never flagged as slowdowns
+MIN_COMPARED_MS = 0.5
+
+REPORT_COLUMNS = [
+    "query", "execution_ms", "planning_ms", "shared_hit", "shared_read",
+    "expected_index", "uses_expected_index", "shape",
+]
+
+# name → (query, parameter names from PLAN_SAMPLE_PARAMETERS, index the query should use or None)
+CATALOGUE = {
+    "booking_dates": (sqlrepo.FETCH_BOOKING_DATES, ["accommodation_id"], None),
+    "overlapping_bookings": (
+        sqlrepo.PLAN_OVERLAPPING_BOOKINGS,
+        ["accommodation_id", "end_date", "start_date"],
+        "idx_bookings_accommodation_dates",
+    ),
+    "accommodation_price": (sqlrepo.FETCH_ACCOMMODATION_PRICE, ["accommodation_id"], "accommodations_pkey"),
+    "payments_for_user": (sqlrepo.FETCH_PAYMENT_ID_FOR_USER, ["guest_account_id"], "idx_payments_customer"),
+    "payout_account_for_host": (
+        sqlrepo.GET_PAYOUT_ACCOUNT_ID_WITH_HOST_ID, ["host_account_id"], "idx_payout_accounts_host",
+    ),
+    "search_active_accommodations": (sqlrepo.JOURNEY_SEARCH_ACTIVE_ACCOMMODATIONS, ["city"], None),
+    "sum_price_additions": (
+        sqlrepo.JOURNEY_SUM_PRICE_ADDITIONS,
+        ["accommodation_id", "start_date", "end_date"],
+        "idx_calendar_accommodation_day",
+    ),
+    "accommodation_images": (sqlrepo.JOURNEY_FETCH_IMAGES, ["accommodation_id"], None),
+    "available_days": (
+        sqlrepo.JOURNEY_FETCH_AVAILABLE_DAYS, ["accommodation_id"], "idx_calendar_accommodation_day",
+    ),
+    "blocked_days": (
+        sqlrepo.JOURNEY_COUNT_BLOCKED_DAYS,
+        ["accommodation_id", "start_date", "end_date"],
+        "idx_calendar_accommodation_day",
+    ),
+    "conversation_history": (
+        sqlrepo.PLAN_CONVERSATION_HISTORY, ["conversation_id"], "idx_messages_conversation_sent",
+    ),
+    "recent_reviews": (
+        sqlrepo.PLAN_RECENT_REVIEWS, ["accommodation_id"], "reviews_accommodation_id_created_at_idx",
+    ),
+    "host_active_listings": (
+        sqlrepo.PLAN_HOST_ACTIVE_LISTINGS, ["host_account_id"], "idx_accommodations_host_active",
+    ),
+    "recent_notifications": (
+        sqlrepo.PLAN_RECENT_NOTIFICATIONS, ["notification_account_id"], "idx_notifications_account_sent",
+    ),
+    "default_payout_account": (
+        sqlrepo.JOURNEY_FETCH_DEFAULT_PAYOUT_ACCOUNT, ["host_account_id"], "idx_payout_accounts_host",
+    ),
+    "final_journey_join": (sqlrepo.JOURNEY_FINAL_JOIN, ["booking_id", "review_id"], None),
+}
+
+
+
+# Plan inspection
+def plan_shape(node: dict) -> str:
+    """
+    Compact signature of a plan tree, e.g. `Nested Loop(Index Scan[bookings_pkey],Seq Scan[reviews])`.
+    Costs, row counts and timings are left out so only structural changes alter it.
+    """
+    target = node.get("Index Name") or node.get("Relation Name")
+    label = node["Node Type"] + (f"[{target}]" if target else "")
+    children = node.get("Plans", [])
+    if children:
+        label += "(" + ",".join(plan_shape(child) for child in children) + ")"
+    return label
+
+def indexes_used(node: dict) -> list:
+    """
+    Return the sorted names of all indexes referenced anywhere in the plan tree.
+    """
+    found = set()
+    stack = [node]
+    while stack:
+        current = stack.pop()
+        if "Index Name" in current:
+            found.add(current["Index Name"])
+        stack.extend(current.get("Plans", []))
+    return sorted(found)
+
+
+
+# Capture
+def fetch_sample_parameters(cur) -> dict:
+    """
+    Pick one booking (with payment and a review of its accommodation) and related ids as query parameters.
+    """
+    cur.execute(sqlrepo.PLAN_SAMPLE_PARAMETERS)
+    row = cur.fetchone()
+    if row is None:
+        raise RuntimeError("Plan capture needs a seeded datamart (a paid booking with a reviewed accommodation)")
+    return {col.name: value for col, value in zip(cur.description, row)}
+
+def explain(cur, query: str, params: tuple) -> dict:
+    """
+    Run `query` under EXPLAIN (ANALYZE, BUFFERS, FORMAT JSON) and return the top-level plan document.
+    """
+    cur.execute(sqlrepo.EXPLAIN_ANALYZE + query, params)
+    return cur.fetchone()[0][0]
+
+def capture_plans(cur, repeat: int) -> list:
+    """
+    Explain every CATALOGUE query `repeat` times and return one result dict per query.
+    """
+    sample = fetch_sample_parameters(cur)
+    results = []
+    for name, (query, param_names, expected_index) in CATALOGUE.items():
+        params = tuple(sample[param] for param in param_names)
+        runs = [explain(cur, query, params) for _ in range(repeat)]
+        best = min(runs, key=lambda doc: doc["Execution Time"])
+        root = best["Plan"]
+        used = indexes_used(root)
+        results.append({
+            "query": name,
+            "execution_ms": round(best["Execution Time"], 3),
+            "planning_ms": round(best["Planning Time"], 3),
+            "shared_hit": root.get("Shared Hit Blocks"),
+            "shared_read": root.get("Shared Read Blocks"),
+            "expected_index": expected_index,
+            "uses_expected_index": None if expected_index is None else expected_index in used,
+            "indexes": used,
+            "shape": plan_shape(root),
+            "plan": best,
+        })
+        if expected_index and expected_index not in used:
+            logger.warning(f"Query plan '{name}' does not use {expected_index}: {plan_shape(root)}")
+    return results
+
+
+
+# Baseline comparison
+def compare_to_baseline(results: list, baseline: dict, tolerance: float) -> list:
+    """
+    Return an entry for every plan shape change and every execution time grown beyond tolerance.
+    """
+    previous_by_name = {entry["query"]: entry for entry in baseline.get("queries", [])}
+
+    changes = []
+    for entry in results:
+        previous = previous_by_name.get(entry["query"])
+        if previous is None:
+            continue
+        if entry["shape"] != previous["shape"]:
+            changes.append({
+                "query": entry["query"],
+                "kind": "plan_shape",
+                "baseline": previous["shape"],
+                "current": entry["shape"],
+                "change": "changed",
+            })
+        current_ms, previous_ms = entry["execution_ms"], previous["execution_ms"]
+        if current_ms >= MIN_COMPARED_MS and previous_ms and current_ms > previous_ms * (1 + tolerance):
+            changes.append({
+                "query": entry["query"],
+                "kind": "slowdown",
+                "baseline": previous_ms,
+                "current": current_ms,
+                "change": f"{(current_ms / previous_ms - 1) * 100:+.0f}%",
+            })
+    return changes
+
+
+
+# CLI entrypoint
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Capture query plans of hot queries and compare them to a baseline.")
+    parser.add_argument("--repeat", type=int, default=3, help="EXPLAIN ANALYZE runs per query (best is kept)")
+    parser.add_argument("--no-analyze", action="store_true", help="skip analyzing tables with stale statistics before capturing")
+    parser.add_argument("--tolerance", type=float, default=0.5, help="allowed execution-time growth before flagging")
+    parser.add_argument("--save-baseline", action="store_true", help="store this run as the new baseline")
+    parser.add_argument("--fail-on-regression", action="store_true", help="exit 1 if anything regressed")
+    args = parser.parse_args()
+
+    if not args.no_analyze:
+        maintenance.ensure_fresh_statistics()
+
+    with managed_connection() as conn:
+        conn.autocommit = True
+        with conn.cursor() as cur:
+            results = capture_plans(cur, args.repeat)
+            cur.execute(sqlrepo.FETCH_SERVER_VERSION)
+            server_version = cur.fetchone()[0]
+
+    payload = {"server_version": server_version, "repeat": args.repeat, "queries": results}
+    print_table(results, REPORT_COLUMNS)
+    print(f"Results written to {write_results('plans', payload)}")
+
+    if args.save_baseline:
+        BASELINE_PATH.parent.mkdir(parents=True, exist_ok=True)
+        BASELINE_PATH.write_text(json.dumps(payload, indent=2, default=str), encoding="utf-8")
+        print(f"Baseline saved to {BASELINE_PATH}")
+        sys.exit(0)
+
+    if not BASELINE_PATH.exists():
+        print("No baseline stored yet (run with --save-baseline).")
+        sys.exit(0)
+
+    changes = compare_to_baseline(results, json.loads(BASELINE_PATH.read_text(encoding="utf-8")), args.tolerance)
+    if changes:
+        print(f"\n{len(changes)} plan change(s) against {BASELINE_PATH.name}:")
+        print_table(changes, ["query", "kind", "baseline", "current", "change"])
+    else:
+        print(f"\nNo plan changes against {BASELINE_PATH.name} (tolerance {args.tolerance:.0%}).")
+    sys.exit(1 if changes and args.fail_on_regression else 0)
@@ -0,0 +1,112 @@
+"""
+bench_textgen.py
+
+Text generation throughput and text sizes: per-row generation (f-strings / " ".join(choice(...)),
+as the generators used to do) vs. the batched models of src.db.utils.textgen.
+
+Per method it records rows/s on one core and the size distribution of the generated texts (mean,
+p50, p99 bytes and the share above TOAST_THRESHOLD, the row size from which PostgreSQL starts to
+compress and move values out of line). No database needed.
+
+    python -m benchmarks.bench_textgen
+    python -m benchmarks.bench_textgen --rows 2000000 --methods review_template message_words
+"""
+
+
+# Stdlib imports
+import argparse
+import random
+import sys
+import time
+from pathlib import Path
+
+
+# Third-party imports
+import numpy as np
+
+
+# Path/bootstrap
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(PROJECT_ROOT))
+
+
+# Internal imports
+from benchmarks.common import print_table, write_results
+import src.db.data_lists as seeds
+from src.db import gen_seed_data as gen
+from src.db.utils import textgen
+
+
+
+# TOAST_TUPLE_THRESHOLD of the default 8 kB page
+TOAST_THRESHOLD = 2032
+
+METHODS = ("review_per_row", "review_template", "message_per_row", "message_words", "message_markov")
+
+
+
+# Methods: (rows) → list/array of texts
+def review_per_row(n: int) -> list:
+    o = seeds.christmas_accommodation_reviews
+    texts = []
+    for _ in range(n):
+        sentiment = random.choice(("negative", "positive"))
+        texts.append(
+            f"{random.choice(o['openings'][sentiment])}! "
+            f"{random.choice(o['accommodation_features'][sentiment])}. "
+            f"{random.choice(o['intensifiers']).capitalize()}, "
+            f"{random.choice(o['experiences'][sentiment])}. "
+            f"{random.choice(o['connectors'])} "
+            f"{random.choice(o['host_details'][sentiment])}. "
+            f"{random.choice(o['random_details'])}. "
+            f"{random.choice(o['comfort_ratings'][sentiment]).capitalize()}. "
+            f"{random.choice(o['final_thoughts'][sentiment])}!"
+        )
+    return texts
+
+def review_template(n: int) -> list:
+    return gen._gen_review_descriptions([random.randint(1, 5) for _ in range(n)])
+
+def message_per_row(n: int) -> list:
+    words = seeds.christmas_gibberish_words
+    return [" ".join(random.choice(words) for _ in range(random.randint(1, 10))) for _ in range(n)]
+
+def message_words(n: int):
+    return textgen.text_model("messages.body").generate(n)
+
+def message_markov(n: int):
+    lengths = textgen.LengthDistribution("lognormal", min=3, max=600, median=20, sigma=1.0)
+    return textgen.MarkovText(textgen.corpus_sentences("christmas_accommodation_reviews"), lengths).generate(n)
+
+def bench_method(method: str, n: int, seed: int) -> dict:
+    random.seed(seed)
+    t0 = time.perf_counter()
+    texts = globals()[method](n)
+    elapsed = time.perf_counter() - t0
+
+    sizes = np.fromiter((len(text.encode("utf-8")) for text in texts), dtype=np.int64, count=len(texts))
+    return {
+        "method": method,
+        "rows": n,
+        "seconds": round(elapsed, 3),
+        "rows_per_s": int(n / elapsed) if elapsed else None,
+        "mean_bytes": round(float(sizes.mean()), 1),
+        "p50_bytes": int(np.percentile(sizes, 50)),
+        "p99_bytes": int(np.percentile(sizes, 99)),
+        "toast_share": round(float((sizes > TOAST_THRESHOLD).mean()), 5),
+    }
+
+
+
+# CLI entrypoint
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark per-row vs. batched text generation.")
+    parser.add_argument("--rows", type=int, default=1_000_000)
+    parser.add_argument("--methods", nargs="*", choices=METHODS, default=list(METHODS))
+    parser.add_argument("--seed", type=int, default=42)
+    args = parser.parse_args()
+
+    results = [bench_method(method, args.rows, args.seed) for method in args.methods]
+    print_table(results, ["method", "rows", "seconds", "rows_per_s", "mean_bytes", "p50_bytes", "p99_bytes", "toast_share"])
+    payload = {"rows": args.rows, "results": results, "server_tuning": None}  # in-process only
+    print(f"Results written to {write_results('textgen', payload)}")
@@ -0,0 +1,269 @@
+"""
+bench_workload.py
+
+Concurrent load generator replaying the customer journey from tests/integration/test_business_logic.py.
+
+Every virtual user (one thread, one connection) loops until the duration is over and picks a
+journey by weight:
+- browse (read): search active accommodations in a city, check price, images, calendar and
+  blocked days for a date range
+- book (read + write): the browse steps, then create a pending booking, pay, confirm and block
+  the dates, message the host, complete + review, and schedule the host payout
+
+Write journeys run in one transaction per journey and are rolled back unless --commit is given,
+so the seeded datamart stays unchanged. Latency is recorded per step and reported as p50/p95/p99.
+Before the run, tables with stale planner statistics are analyzed (src.db.maintenance).
+
+    python -m benchmarks.bench_workload --concurrency 16 --duration 60
+    python -m benchmarks.bench_workload --read-weight 50 --write-weight 50 --commit
+"""
+
+
+# Stdlib imports
+import argparse
+import datetime
+import random
+import sys
+import time
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from pathlib import Path
+
+
+# Third-party imports
+import numpy as np
+import psycopg2
+
+
+# Path/bootstrap
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(PROJECT_ROOT))
+
+
+# Internal imports
+from benchmarks.common import print_table, write_results
+import src.db.data_lists as seeds
+from src.db import maintenance
+from src.db import sql_repo as sqlrepo
+from src.db.connection import managed_connection
+from src.utils.logger import logger
+
+
+
+REPORT_COLUMNS = ["step", "count", "p50_ms", "p95_ms", "p99_ms", "max_ms"]
+
+
+
+# Workload inputs
+def load_pools() -> dict:
+    """
+    Load the ids the virtual users draw from (active accommodations with host/city, guests with a payment method).
+    """
+    with managed_connection() as conn, conn.cursor() as cur:
+        cur.execute(sqlrepo.WORKLOAD_ACTIVE_ACCOMMODATIONS)
+        accommodations = cur.fetchall()
+        cur.execute(sqlrepo.WORKLOAD_GUESTS_WITH_PAYMENT_METHOD)
+        guests = cur.fetchall()
+
+    if not accommodations or not guests:
+        raise RuntimeError("Workload needs a seeded datamart (active accommodations and guests with payment methods)")
+    return {"accommodations": accommodations, "guests": guests}
+
+def _random_stay(rng) -> tuple:
+    """
+    Return (start_date, end_date, nights) inside the seeding window.
+    """
+    window_days = (seeds.stop_timestamp - seeds.start_timestamp).days - 14
+    start = seeds.start_timestamp.date() + datetime.timedelta(days=rng.randint(0, window_days))
+    nights = rng.randint(1, 14)
+    return start, start + datetime.timedelta(days=nights), nights
+
+
+
+# Journeys
+@contextmanager
+def _timed(latencies: dict, step: str):
+    t0 = time.perf_counter()
+    yield
+    latencies[step].append(time.perf_counter() - t0)
+
+def browse_journey(cur, pools: dict, rng, latencies: dict) -> dict:
+    """
+    Read-only part of the journey. Returns the selection used by booking_journey().
+    """
+    accommodation_id, host_id, city = rng.choice(pools["accommodations"])
+    start, end, nights = _random_stay(rng)
+
+    with _timed(latencies, "search_active_accommodations"):
+        cur.execute(sqlrepo.JOURNEY_SEARCH_ACTIVE_ACCOMMODATIONS, (city,))
+        cur.fetchall()
+
+    with _timed(latencies, "check_price"):
+        cur.execute(sqlrepo.JOURNEY_FETCH_PRICE, (accommodation_id,))
+        price_cents = cur.fetchone()[0]
+        cur.execute(sqlrepo.JOURNEY_SUM_PRICE_ADDITIONS, (accommodation_id, start, end))
+        additions = cur.fetchone()[0]
+
+    with _timed(latencies, "check_images"):
+        cur.execute(sqlrepo.JOURNEY_FETCH_IMAGES, (accommodation_id,))
+        cur.fetchall()
+
+    with _timed(latencies, "check_calendar"):
+        cur.execute(sqlrepo.JOURNEY_FETCH_AVAILABLE_DAYS, (accommodation_id,))
+        cur.fetchall()
+
+    with _timed(latencies, "verify_not_blocked"):
+        cur.execute(sqlrepo.JOURNEY_COUNT_BLOCKED_DAYS, (accommodation_id, start, end))
+        cur.fetchone()
+
+    return {
+        "accommodation_id": accommodation_id,
+        "host_id": host_id,
+        "start": start,
+        "end": end,
+        "total_cents": price_cents * nights + additions,
+    }
+
+def booking_journey(cur, pools: dict, rng, latencies: dict, selection: dict):
+    """
+    Write part of the journey, executed in the caller's transaction.
+    """
+    guest_id, payment_method_id = rng.choice(pools["guests"])
+    accommodation_id, host_id = selection["accommodation_id"], selection["host_id"]
+    start, end = selection["start"], selection["end"]
+    amount_cents = max(selection["total_cents"], 0)
+
+    with _timed(latencies, "create_booking"):
+        cur.execute(sqlrepo.JOURNEY_INSERT_PENDING_BOOKING, (guest_id, accommodation_id, start, end))
+        booking_id = cur.fetchone()[0]
+
+    with _timed(latencies, "pay"):
+        cur.execute(sqlrepo.JOURNEY_INSERT_OPEN_PAYMENT, (guest_id, amount_cents, payment_method_id))
+        payment_id = cur.fetchone()[0]
+        cur.execute(sqlrepo.JOURNEY_LINK_PAYMENT_TO_BOOKING, (payment_id, booking_id))
+        cur.execute(sqlrepo.JOURNEY_MARK_PAYMENT_PAYED, (payment_id,))
+
+    with _timed(latencies, "confirm_and_block_dates"):
+        cur.execute(sqlrepo.JOURNEY_SET_BOOKING_STATUS, ("confirmed", booking_id))
+        cur.execute(sqlrepo.JOURNEY_BLOCK_DAYS, (accommodation_id, start, end))
+
+    with _timed(latencies, "message_host"):
+        cur.execute(sqlrepo.JOURNEY_INSERT_CONVERSATION)
+        conversation_id = cur.fetchone()[0]
+        cur.execute(sqlrepo.JOURNEY_INSERT_MESSAGE, (guest_id, host_id, conversation_id, "Looking forward to the stay!"))
+        cur.execute(sqlrepo.JOURNEY_INSERT_NOTIFICATION, (host_id,))
+
+    with _timed(latencies, "complete_and_review"):
+        cur.execute(sqlrepo.JOURNEY_SET_BOOKING_STATUS, ("completed", booking_id))
+        cur.execute(sqlrepo.JOURNEY_INSERT_REVIEW, (accommodation_id, guest_id, rng.randint(1, 5), "Load test review."))
+        review_id = cur.fetchone()[0]
+
+    with _timed(latencies, "payout"):
+        cur.execute(sqlrepo.JOURNEY_FETCH_DEFAULT_PAYOUT_ACCOUNT, (host_id,))
+        payout_account = cur.fetchone()
+        if payout_account:
+            cur.execute(sqlrepo.JOURNEY_INSERT_PAYOUT, (host_id, payout_account[0], booking_id, amount_cents))
+
+    with _timed(latencies, "final_journey_join"):
+        cur.execute(sqlrepo.JOURNEY_FINAL_JOIN, (booking_id, review_id))
+        cur.fetchone()
+
+
+
+# Virtual users
+def virtual_user(vu_id: int, pools: dict, deadline: float, write_ratio: float, commit: bool, seed: int) -> dict:
+    """
+    Run journeys until `deadline` (perf_counter) on one connection and return the raw latencies.
+    """
+    rng = random.Random(seed + vu_id)
+    latencies = defaultdict(list)
+    journeys = {"browse": 0, "book": 0, "errors": 0}
+
+    with managed_connection() as conn, conn.cursor() as cur:
+        while time.perf_counter() < deadline:
+            is_booking = rng.random() < write_ratio
+            try:
+                with _timed(latencies, "journey_book" if is_booking else "journey_browse"):
+                    selection = browse_journey(cur, pools, rng, latencies)
+                    if is_booking:
+                        booking_journey(cur, pools, rng, latencies, selection)
+                    if is_booking and commit:
+                        conn.commit()
+                    else:
+                        conn.rollback()
+                journeys["book" if is_booking else "browse"] += 1
+            except psycopg2.Error as e:
+                conn.rollback()
+                journeys["errors"] += 1
+                logger.warning(f"VU {vu_id}: journey failed: {e}")
+
+    return {"latencies": latencies, "journeys": journeys}
+
+def summarize(latencies: dict) -> list:
+    """
+    Turn raw step latencies (seconds) into p50/p95/p99/max rows in milliseconds.
+    """
+    rows = []
+    for step, values in latencies.items():
+        ms = np.asarray(values) * 1000
+        p50, p95, p99 = np.percentile(ms, [50, 95, 99])
+        rows.append({
+            "step": step,
+            "count": len(ms),
+            "p50_ms": round(float(p50), 2),
+            "p95_ms": round(float(p95), 2),
+            "p99_ms": round(float(p99), 2),
+            "max_ms": round(float(ms.max()), 2),
+        })
+    return rows
+
+def run(concurrency: int, duration: float, read_weight: float, write_weight: float, commit: bool, seed: int) -> dict:
+    pools = load_pools()
+    write_ratio = write_weight / (read_weight + write_weight)
+    deadline = time.perf_counter() + duration
+
+    with ThreadPoolExecutor(max_workers=concurrency) as pool:
+        futures = [
+            pool.submit(virtual_user, vu_id, pools, deadline, write_ratio, commit, seed)
+            for vu_id in range(concurrency)
+        ]
+        results = [future.result() for future in futures]
+
+    latencies = defaultdict(list)
+    journeys = defaultdict(int)
+    for result in results:
+        for step, values in result["latencies"].items():
+            latencies[step].extend(values)
+        for kind, count in result["journeys"].items():
+            journeys[kind] += count
+
+    return {
+        "concurrency": concurrency,
+        "duration_s": duration,
+        "read_weight": read_weight,
+        "write_weight": write_weight,
+        "committed": commit,
+        "journeys": dict(journeys),
+        "journeys_per_s": round((journeys["browse"] + journeys["book"]) / duration, 1),
+        "steps": summarize(latencies),
+    }
+
+
+
+# CLI entrypoint
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Replay customer journeys as concurrent virtual users.")
+    parser.add_argument("--concurrency", type=int, default=8, help="number of virtual users")
+    parser.add_argument("--duration", type=float, default=30, help="seconds to run")
+    parser.add_argument("--read-weight", type=float, default=80, help="weight of browse-only journeys")
+    parser.add_argument("--write-weight", type=float, default=20, help="weight of booking journeys")
+    parser.add_argument("--commit", action="store_true", help="commit booking journeys instead of rolling back")
+    parser.add_argument("--seed", type=int, default=42)
+    args = parser.parse_args()
+
+    maintenance.ensure_fresh_statistics()
+    report = run(args.concurrency, args.duration, args.read_weight, args.write_weight, args.commit, args.seed)
+    print_table(report["steps"], REPORT_COLUMNS)
+    print(f"\nJourneys: {report['journeys']} ({report['journeys_per_s']}/s with {args.concurrency} VUs)")
+    print(f"Results written to {write_results('workload', report)}")
@@ -0,0 +1,71 @@
+"""
+common.py
+
+Shared helpers for the benchmark scripts.
+
+Provides:
+- peak_rss_mb(): peak resident set size of the current process in MiB
+- write_results(): store a benchmark result dict as JSON under benchmarks/results/, together with
+  the server tuning profile/settings at the time of writing (src.db.tuning)
+- print_table(): render a list of result dicts as a fixed-width text table
+"""
+
+
+# Stdlib imports
+import json
+import resource
+import sys
+import time
+from pathlib import Path
+
+
+# Third-party imports
+import psycopg2
+
+
+# Path/bootstrap
+# Go one level up (benchmarks → project root) so src.* imports work.
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(PROJECT_ROOT))
+
+
+# Internal imports
+from src.db import tuning
+from src.utils.logger import logger
+from src.utils.tables import format_table
+
+
+# Result location
+RESULTS_DIR = PROJECT_ROOT / "benchmarks" / "results"
+
+
+
+def peak_rss_mb() -> float:
+    """
+    Return the peak RSS of this process in MiB (ru_maxrss is KiB on Linux, bytes on macOS).
+    """
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    if sys.platform == "darwin":
+        return peak / (1024 * 1024)
+    return peak / 1024
+
+def write_results(name: str, payload: dict) -> Path:
+    """
+    Write `payload` to benchmarks/results/<name>_<timestamp>.json and return the path.
+    """
+    if "server_tuning" not in payload:
+        try:
+            payload = {**payload, "server_tuning": tuning.describe_server()}
+        except psycopg2.Error as e:
+            logger.warning(f"Server tuning not recorded: {e}")
+
+    RESULTS_DIR.mkdir(parents=True, exist_ok=True)
+    out_path = RESULTS_DIR / f"{name}_{time.strftime('%Y%m%d_%H%M%S')}.json"
+    out_path.write_text(json.dumps(payload, indent=2, default=str), encoding="utf-8")
+    return out_path
+
+def print_table(rows: list, columns: list):
+    """
+    Print result dicts as a simple aligned table (missing values shown as "-").
+    """
+    print(format_table(rows, columns))
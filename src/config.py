@@ -48,6 +48,47 @@ DB_PASSWORD = os.getenv("DB_PASSWORD", "failed_to_fetch")
 DB_HOST = os.getenv("DB_HOST", "failed_to_fetch")
 DB_HOST_PORT = int(os.getenv("DB_HOST_PORT", 0))
 
+# Connection/cursor leak check at the end of a pipeline run ("off", "log", "raise")
+DB_LEAK_CHECK = os.getenv("DB_LEAK_CHECK", "log")
+
+# Rows of each seeded table written to the log after its stage (0 = none, negative = all)
+LOG_TABLE_ROWS = int(os.getenv("LOG_TABLE_ROWS", 20))
+
+# Optional JSON lines file receiving the per-stage pipeline summary (empty = table in the log only)
+INSTRUMENT_JSONL = os.getenv("INSTRUMENT_JSONL", "")
+
+# Connections building the deferred plain indexes in parallel (build_indexes stage, after the bulk load)
+MIGRATION_WORKERS = int(os.getenv("MIGRATION_WORKERS", 4))
+
+# Connections running VACUUM (ANALYZE) in parallel after the load
+MAINTENANCE_WORKERS = int(os.getenv("MAINTENANCE_WORKERS", 4))
+
+# Seed data: scale profile (data_lists.scale_profiles) and RNG seed (empty = unseeded)
+SCALE_PROFILE = os.getenv("SCALE_PROFILE", "default")
+RNG_SEED = os.getenv("RNG_SEED", "")
+
+# Column distributions of the seed data (data_lists.distribution_profiles): "uniform" or "hotspot"
+DATA_DISTRIBUTION = os.getenv("DATA_DISTRIBUTION", "uniform")
+
+# credentials.password_hash: "off" (random strings) or a hash algorithm of src/db/utils/passwords.py
+# (pbkdf2_sha256, scrypt, bcrypt, argon2id) with its cost (empty = algorithm default) and hashing processes (0 = all cores)
+PASSWORD_HASH = os.getenv("PASSWORD_HASH", "off")
+PASSWORD_HASH_COST = os.getenv("PASSWORD_HASH_COST", "")
+PASSWORD_HASH_WORKERS = int(os.getenv("PASSWORD_HASH_WORKERS", 0))
+
+# Snapshot of the seeded database per (schema checksum, profile, seed): "off", "template", "dump"
+DB_SNAPSHOT = os.getenv("DB_SNAPSHOT", "off")
+
+
+# Server tuning profiles during src/main.py: "off" or "phased" (bulk_load while seeding, serve afterwards)
+DB_TUNING = os.getenv("DB_TUNING", "off")
+
+# Test database server: "docker" (compose container) or "ephemeral" (throwaway cluster, src/db/utils/pg_cluster.py)
+TEST_POSTGRES = os.getenv("TEST_POSTGRES", "docker")
+
+# Directory with the PostgreSQL server binaries for ephemeral clusters (empty = search PATH/pg_config)
+PG_BIN_DIR = os.getenv("PG_BIN_DIR", "")
+
 
 # Container/VM configuration
 COLIMA_PROFILE = os.getenv("COLIMA_PROFILE", "failed_to_fetch")
@@ -5,6 +5,8 @@ Database connection utilities for PostgreSQL.
 
 Provides:
 - db_connection(): returns a psycopg2 connection using src.config credentials
+  (leak-tracked, cursors instrumented per pipeline stage)
+- managed_connection(): context manager that always closes the connection
 - check_connection(): verifies connectivity and logs result
 
 Assumptions:
@@ -13,6 +15,7 @@ Assumptions:
 """
 # Stdlib imports
 import sys
+from contextlib import contextmanager
 from pathlib import Path
 
 # Third-party imports
@@ -25,21 +28,45 @@ sys.path.insert(0, str(PROJECT_ROOT))
 
 # Internal imports
 from src import config
+from src.db.utils.instrumentation import InstrumentedCursor
+from src.db.utils.leak_tracker import TrackedConnection
 from src.utils.logger import logger
 
 # Connection factory
-def db_connection():
+def db_connection(dbname: str = None):
     """
     Return a psycopg2 connection using credentials from src.config.
+
+    Args:
+        dbname (str): database to connect to (default config.DB_NAME).
     """
     return psycopg2.connect(
-        dbname=config.DB_NAME,
+        dbname=dbname or config.DB_NAME,
         user=config.DB_USER,
         password=config.DB_PASSWORD,
         host=config.DB_HOST,
         port=config.DB_HOST_PORT,
+        connection_factory=TrackedConnection,
+        cursor_factory=InstrumentedCursor,
     )
 
+@contextmanager
+def managed_connection(commit: bool = False, dbname: str = None):
+    """
+    Yield a connection from db_connection() and close it on exit.
+
+    Args:
+        commit (bool): commit on success; otherwise the transaction is rolled back on close.
+        dbname (str): database to connect to (default config.DB_NAME).
+    """
+    conn = db_connection(dbname)
+    try:
+        yield conn
+        if commit:
+            conn.commit()
+    finally:
+        conn.close()
+
 # Connection test
 def check_connection() -> bool:
     """
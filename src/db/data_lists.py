@@ -4,7 +4,7 @@ data_lists.py
 Central seed/config module for dummy data generation.
 
 Provides:
-- global meta settings (row count, admin count, time window, password length)
+- global meta settings (row count, scale profiles, admin count, time window, password length)
 - address/geography seed data (cities, streets, countries, address terms)
 - person/account seed data (first/last name syllables, email domains)
 - accommodation name generator words
@@ -19,6 +19,57 @@ import datetime
 # number of entries to create per table
 num_gen_dummydata = 40
 
+# named scale profiles (base rows per table) for benchmarks and snapshots
+scale_profiles = {
+    "default": 40,
+    "1k": 1_000,
+    "100k": 100_000,
+    "1m": 1_000_000,
+    "10m": 10_000_000,
+}
+
+# relative draw weights per vocabulary (dotted names as in src.db.utils.samplers, e.g.
+# "image_mimes": [6, 3, 1]); vocabularies without an entry are drawn uniformly
+vocabulary_weights = {}
+
+# column distributions per profile ("<table>.<column>" → spec, see src.db.utils.distributions);
+# selected with DATA_DISTRIBUTION, unlisted columns are drawn uniformly
+distribution_profiles = {
+    "uniform": {},
+    "hotspot": {
+        # a few hosts own most listings, a few listings get most bookings and reviews
+        "accommodations.host_account_id": {"kind": "pareto", "alpha": 1.16},
+        "bookings.guest_account_id": {"kind": "zipf", "s": 0.9},
+        "bookings.accommodation_id": {"kind": "zipf", "s": 1.1},
+        "reviews.accommodation_id": {"kind": "zipf", "s": 1.1},
+        "reviews.author_account_id": {"kind": "zipf", "s": 0.9},
+        "notifications.account_id": {"kind": "zipf", "s": 1.0},
+        # summer and christmas peaks, more weekend arrivals
+        "bookings.start_date": {
+            "kind": "seasonal",
+            "months": [0.6, 0.6, 0.8, 1.0, 1.1, 1.4, 1.9, 1.9, 1.1, 0.9, 0.7, 1.6],
+            "weekdays": [0.8, 0.8, 0.9, 1.0, 1.3, 1.4, 1.0],
+        },
+        "reviews.created_at": {"kind": "normal", "mean": 0.75, "sd": 0.2},
+        "notifications.sent_at": {"kind": "normal", "mean": 0.9, "sd": 0.1},
+    },
+}
+
+# active column distributions (replaced by src.db.utils.distributions.apply_profile())
+distributions = distribution_profiles["uniform"]
+
+# text generation per column (src.db.utils.textgen): "words" draws words from a vocabulary,
+# "markov" chains words of a corpus (vocabulary name or dotted prefix), e.g.
+# {"model": "markov", "corpus": "christmas_accommodation_reviews", "lengths": {...}};
+# lengths are words per text (lognormal: mostly short texts, a long tail beyond the TOAST threshold)
+text_models = {
+    "messages.body": {
+        "model": "words",
+        "vocabulary": "christmas_gibberish_words",
+        "lengths": {"kind": "lognormal", "median": 8, "sigma": 0.9, "min": 1, "max": 400},
+    },
+}
+
 # number of admin accounts to reserve
 admin_count = 3
 
@@ -29,6 +80,11 @@ stop_timestamp = datetime.datetime(2025, 12, 31)
 # length of generated password strings
 pwd_hash_length = 32
 
+# credentials.password_hash: "off" = random strings of pwd_hash_length, otherwise real salted hashes
+# (src.db.utils.passwords: algorithm, cost = work factor or None for its default, hashing processes
+# or None for all cores, seed for passwords/salts and the hash cache or None)
+password_hashing = {"algorithm": "off", "cost": None, "workers": None, "seed": None}
+
 """
 Target schema reminder (for mapping seeds → tables):
 
@@ -0,0 +1,151 @@
+"""
+etl_star.py
+
+Set-based ETL from the OLTP tables into the star schema of src/sql/05_star_schema.sql.
+
+Steps (each one `INSERT ... SELECT` inside the database, timed and logged):
+1. dim_date           pre-generated for the seeding window and the date range found in the data
+2. dim_location       distinct (city, country) from addresses
+3. dim_account        upsert by account_id (changed rows are updated in place, SCD type 1)
+4. dim_accommodation  upsert by accommodation_id, resolves host and location surrogate keys
+5. fact_booking       bookings with id above the watermark, dimension keys resolved by join
+6. fact_payment       payments with id above the watermark
+
+Modes:
+- full: truncates facts/dimensions (surrogate keys restart at 1) and loads everything
+- incremental: dimensions are upserted, facts append only source rows above etl_watermarks
+
+Assumptions:
+- the OLTP tables have no updated_at column, so facts loaded earlier are not revisited by an
+  incremental load (e.g. a booking confirmed later); run a full load to pick such changes up
+- everything runs in one transaction; a failing step leaves the star schema untouched
+  (load_star() takes a cursor and never commits, run_etl() owns the transaction)
+"""
+
+
+# Stdlib imports
+import argparse
+import datetime
+import sys
+import time
+from pathlib import Path
+
+
+# Third-party imports
+from psycopg2 import sql
+
+
+# Path/bootstrap
+# Go two levels up (src/db → project root) so src.* imports work.
+PROJECT_ROOT = Path(__file__).resolve().parents[2]
+sys.path.insert(0, str(PROJECT_ROOT))
+
+
+# Internal imports
+import src.db.data_lists as seeds
+from src.db.connection import managed_connection
+from src.db import sql_repo as sqlrepo
+from src.utils.logger import logger
+from src.utils.tables import format_table
+
+
+
+# Fact table → (load query, source id column in the fact table)
+FACTS = {
+    "fact_booking": (sqlrepo.STAR_LOAD_FACT_BOOKING, "booking_id"),
+    "fact_payment": (sqlrepo.STAR_LOAD_FACT_PAYMENT, "payment_id"),
+}
+
+# Days added after the seeding window so future stays still find their date key
+DATE_PADDING_DAYS = 365
+
+REPORT_COLUMNS = ["step", "rows", "seconds"]
+
+
+
+# Steps
+def _timed_step(cur, steps: list, name: str, query, params=None):
+    t0 = time.perf_counter()
+    cur.execute(query, params)
+    elapsed = time.perf_counter() - t0
+    steps.append({"step": name, "rows": cur.rowcount, "seconds": round(elapsed, 3)})
+    logger.info(f"ETL step {name}: {cur.rowcount} rows in {elapsed:.3f}s")
+
+def date_range(cur) -> tuple:
+    """
+    Return (first, last) day for dim_date: the seeding window plus padding, widened to the data's range.
+    """
+    first = seeds.start_timestamp.date()
+    last = seeds.stop_timestamp.date() + datetime.timedelta(days=DATE_PADDING_DAYS)
+    cur.execute(sqlrepo.STAR_FETCH_SOURCE_DATE_RANGE)
+    data_first, data_last = cur.fetchone()
+    return min(filter(None, (first, data_first))), max(filter(None, (last, data_last)))
+
+def _fact_watermark(cur, fact_table: str) -> int:
+    cur.execute(sqlrepo.STAR_FETCH_WATERMARK, (fact_table,))
+    row = cur.fetchone()
+    return row[0] if row else 0
+
+def load_star(cur, full: bool = False) -> list:
+    """
+    Run all ETL steps on `cur` without committing.
+
+    Args:
+        cur: cursor inside the caller's transaction.
+        full (bool): truncate and reload everything instead of an incremental load.
+
+    Returns:
+        list[dict]: step, rows, seconds per step
+    """
+    steps = []
+    if full:
+        _timed_step(cur, steps, "truncate", sqlrepo.STAR_TRUNCATE)
+
+    _timed_step(cur, steps, "dim_date", sqlrepo.STAR_LOAD_DIM_DATE, date_range(cur))
+    _timed_step(cur, steps, "dim_location", sqlrepo.STAR_LOAD_DIM_LOCATION)
+    _timed_step(cur, steps, "dim_account", sqlrepo.STAR_LOAD_DIM_ACCOUNT)
+    _timed_step(cur, steps, "dim_accommodation", sqlrepo.STAR_LOAD_DIM_ACCOMMODATION)
+
+    for fact_table, (load_query, id_column) in FACTS.items():
+        _timed_step(cur, steps, fact_table, load_query, (_fact_watermark(cur, fact_table),))
+        cur.execute(sql.SQL(sqlrepo.STAR_UPSERT_WATERMARK).format(
+            id_col=sql.Identifier(id_column),
+            fact=sql.Identifier(fact_table),
+        ), (fact_table,))
+    return steps
+
+def run_etl(full: bool = False) -> list:
+    """
+    Load the star schema in one transaction.
+
+    Args:
+        full (bool): truncate and reload everything instead of an incremental load.
+
+    Returns:
+        list[dict]: step, rows, seconds per step
+    """
+    t0 = time.perf_counter()
+    with managed_connection(commit=True) as conn, conn.cursor() as cur:
+        steps = load_star(cur, full)
+
+    logger.info(
+        f"Star schema {'full' if full else 'incremental'} load finished in {time.perf_counter() - t0:.3f}s\n"
+        + format_table(steps, REPORT_COLUMNS)
+    )
+    return steps
+
+def run_full_load():
+    """
+    Pipeline stage: bulk initial load of the star schema.
+    """
+    return run_etl(full=True)
+
+
+
+# CLI entrypoint
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Load the star schema from the OLTP tables.")
+    parser.add_argument("--full", action="store_true", help="truncate and reload instead of an incremental load")
+    args = parser.parse_args()
+
+    run_etl(full=args.full)
@@ -13,12 +13,24 @@ Provides generators for:
 
 Assumptions:
 - seed parameters and word lists live in src.db.data_lists as `seeds`
-- timestamps are generated in a uniform window [start_timestamp, stop_timestamp]
+- timestamps are drawn in the window [start_timestamp, stop_timestamp] by src.db.utils.timestamps
+  as native datetimes (executemany) or epoch-µs arrays (ColumnTables), batched per column;
+  ordering constraints (e.g. bookings.created_at < start_date) are sampled directly, not retried
 - number of rows is controlled by seeds.num_gen_dummydata
+- accounts, addresses, images, notifications, payments, bookings and accommodation_calendar are
+  built as compact ColumnTables (src.db.utils.columnar: typed arrays, dictionary-encoded labels
+  such as role, mime, city and status, epoch-µs timestamps) and loaded with one binary COPY each
+- seed vocabularies are drawn through the samplers of src.db.utils.samplers (compiled once)
+- review descriptions and message bodies are generated in batches by src.db.utils.textgen
+- foreign keys and timestamps of the columns listed in the active distribution profile
+  (data_lists.distributions) follow skewed distributions (src.db.utils.distributions)
+- credentials.password_hash holds random strings unless data_lists.password_hashing selects real
+  salted hashes (src.db.utils.passwords)
 """
 # Stdlib imports
 from random import choice, choices, randint, shuffle, sample
 import datetime
+from functools import lru_cache
 from pathlib import Path
 import sys
 from psycopg2 import sql
@@ -27,6 +39,7 @@ import string
 import json
 
 # Third-party / extra imports
+import numpy as np
 import rstr
 
 # Path/bootstrap
@@ -37,11 +50,30 @@ sys.path.insert(0, str(PROJECT_ROOT))
 import src.db.data_lists as seeds
 from src.db.connection import db_connection  
 import src.db.sql_repo as sqlrepo
+from src.db.utils.columnar import ColumnTable, column_builder
+from src.db.utils.distributions import id_sampler, timestamp_sampler
+from src.db.utils.passwords import hash_passwords
+from src.db.utils.samplers import vocab
+from src.db.utils.textgen import TemplateText, text_model
+from src.db.utils.timestamps import to_epoch_us
 from src.db.utils.db_helpers import get_tbl_contents_as_str, get_tbl_contents_as_str_sorted_by
 from src.utils.logger import logger
 
 
 
+# Review text: (christmas_accommodation_reviews part, per sentiment, capitalize, suffix)
+REVIEW_PARTS = [
+    ("openings", True, False, "! "),
+    ("accommodation_features", True, False, ". "),
+    ("intensifiers", False, True, ", "),
+    ("experiences", True, False, ". "),
+    ("connectors", False, False, " "),
+    ("host_details", True, False, ". "),
+    ("random_details", False, False, ". "),
+    ("comfort_ratings", True, True, ". "),
+    ("final_thoughts", True, False, "!"),
+]
+
 # HELPER FUNCTIONS
 def _fetch_table_ids(tbl_name: str)-> List:
     # Open connection
@@ -97,48 +129,81 @@ def _fetch_table_ids_where(tbl_name: str, where: str)-> List:
 def _random_string(n=8):
     return "".join(choice(string.ascii_letters + string.digits) for _ in range(n))
 
-def _gen_rand_timestamp():
-    delta_seconds = int((seeds.stop_timestamp - seeds.start_timestamp).total_seconds())
-    rand_sec = randint(0, delta_seconds)
-    ts = seeds.start_timestamp + datetime.timedelta(seconds=rand_sec)
-    return ts.isoformat()
+def _gen_rand_timestamp(column=None, before=None, after=None) -> datetime.datetime:
+    """
+    Random timestamp in the seed window with after <= ts < before (drawn directly, no retries),
+    following the distribution of `column` if set.
+    """
+    return timestamp_sampler(column).draw(before, after)
+
+def _gen_rand_timestamps(k: int, column=None) -> list:
+    """
+    k random timestamps (datetimes) in one batched draw.
+    """
+    return timestamp_sampler(column).draw_many(k)
+
+def _gen_rand_epoch_us(k: int, column=None) -> np.ndarray:
+    """
+    k random timestamps as int64 microseconds since the Unix epoch (for ColumnTable columns).
+    """
+    return timestamp_sampler(column).draw_many_epoch_us(k)
 
 def _gen_dummy_json():
     json_thing = {
-    "title": " ".join([
-            choice(seeds.christmas_gibberish_words) for _ in range(randint(1,4))
-            ]),
+    "title": " ".join(vocab("christmas_gibberish_words").draw_many(randint(1,4))),
     "body": "You have a new notification.",
     "type": "info"
     }
     return json.dumps(json_thing)
 
+@lru_cache(maxsize=None)
+def _review_samplers(sentiment: str) -> tuple:
+    return tuple(
+        (vocab(f"christmas_accommodation_reviews.{part}" + (f".{sentiment}" if per_sentiment else "")), capitalize, suffix)
+        for part, per_sentiment, capitalize, suffix in REVIEW_PARTS
+    )
+
+@lru_cache(maxsize=None)
+def _review_text(sentiment: str) -> TemplateText:
+    return TemplateText(_review_samplers(sentiment))
+
+def _gen_review_descriptions(ratings: list) -> list:
+    """
+    One description per rating (negative below 3 stars), generated in two batches.
+    """
+    bad = np.asarray(ratings) < 3
+    descriptions = np.empty(len(ratings), dtype=object)
+    descriptions[bad] = _review_text('negative').generate(int(bad.sum()))
+    descriptions[~bad] = _review_text('positive').generate(int((~bad).sum()))
+    return descriptions.tolist()
+
 # INSERT THE DATA
 # 1
 def gen_dummydata_accounts():
     """
     Fill dummy data for accounts table.
+
+    Returns:
+        ColumnTable: email, first_name, last_name, role, created_at
     """
     # first names
     first_names = []
+    first_name_sylls = vocab("first_name_sylls")
     for _ in range(seeds.num_gen_dummydata):
-        name = ""
         syllable_ammount = randint(seeds.fn_min_sylls, seeds.fn_max_sylls)
-        for _ in range(syllable_ammount):
-            name += choice(seeds.first_name_sylls)
-        first_names.append(name)
+        first_names.append("".join(first_name_sylls.draw_many(syllable_ammount)))
 
     # last names
     last_names = []
+    last_name_sylls = vocab("last_name_sylls")
     for _ in range(seeds.num_gen_dummydata):
-        name = ""
         syllable_ammount = randint(seeds.ln_min_sylls, seeds.ln_max_sylls)
-        for _ in range(syllable_ammount):
-            name += choice(seeds.last_name_sylls)
-        last_names.append(name)
+        last_names.append("".join(last_name_sylls.draw_many(syllable_ammount)))
 
-    # email addresses
+    # email addresses (unique; the set keeps the membership check O(1) at large scales)
     emails = []
+    seen_emails = set()
+    email_domains = vocab("email_domains")
     counter = 0
     while counter < seeds.num_gen_dummydata:
         email_address = (
@@ -146,18 +211,17 @@ def gen_dummydata_accounts():
             + "."
             + last_names[counter]
             + "@"
-            + choice(seeds.email_domains)
+            + email_domains.draw()
         )
-        if email_address not in emails:
+        if email_address not in seen_emails:
+            seen_emails.add(email_address)
             emails.append(email_address)
             counter += 1
         else:
             continue
 
     # timestamps
-    timestamps = []
-    for _ in range(seeds.num_gen_dummydata):
-        timestamps.append(_gen_rand_timestamp())
+    timestamps = _gen_rand_epoch_us(seeds.num_gen_dummydata)
 
     # roles
     roles = []
@@ -171,8 +235,15 @@ def gen_dummydata_accounts():
     cur = conn.cursor()
     query = sql.SQL(sqlrepo.DROP_ALL_TABLE_DATA).format(sql.Identifier('accounts'))
     cur.execute(query)
-    data = zip(emails, first_names, last_names, roles, timestamps)
-    cur.executemany(sqlrepo.INSERT_ACCOUNTS, data)
+    table = (
+        ColumnTable('accounts')
+        .add('email', emails, 'varchar')
+        .add('first_name', first_names, 'varchar')
+        .add('last_name', last_names, 'varchar')
+        .add('role', roles, 'enum', categorical=True)
+        .add('created_at', timestamps, 'timestamp')
+    )
+    table.copy_into(cur)
     conn.commit()
     conn.close()
 
@@ -181,7 +252,7 @@ def gen_dummydata_accounts():
     logger.info(get_tbl_contents_as_str('accounts'))
 
     # Return for later use
-    return emails, first_names, last_names, roles, timestamps
+    return table
 
 # 2
 def gen_dummydata_credentials():
@@ -191,20 +262,29 @@ def gen_dummydata_credentials():
     Returns:
         password_hash, password_updated_at
     """
-    password_hash = []
-    for _ in range(seeds.num_gen_dummydata):
-        password = "".join(
-            choices(
-                "abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZ0123456789!@#$%^&*()",
-                k=seeds.pwd_hash_length,
+    hashing = seeds.password_hashing
+    if hashing["algorithm"] == "off":
+        password_hash = []
+        for _ in range(seeds.num_gen_dummydata):
+            password = "".join(
+                choices(
+                    "abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZ0123456789!@#$%^&*()",
+                    k=seeds.pwd_hash_length,
+                )
             )
+            password_hash.append(password)
+    else:
+        # real salted hashes, computed in a process pool (cached per algorithm, cost and seed)
+        password_hash = hash_passwords(
+            seeds.num_gen_dummydata,
+            hashing["algorithm"],
+            hashing["cost"],
+            seed=hashing["seed"],
+            workers=hashing["workers"],
         )
-        password_hash.append(password)
 
     # timestamps
-    password_updated_at = []
-    for _ in range(seeds.num_gen_dummydata):
-        password_updated_at.append(_gen_rand_timestamp())
+    password_updated_at = _gen_rand_timestamps(seeds.num_gen_dummydata)
 
 
     # Insert data into SQL table
@@ -236,7 +316,7 @@ def gen_dummydata_addresses():
     Fill dummy data for addresses table.
 
     Returns:
-        line1, line2, city, postal_code, country
+        ColumnTable: line1, line2, city, postal_code, country
     """
     line1 = []
     line2 = []
@@ -244,10 +324,11 @@ def gen_dummydata_addresses():
     postal_code = []
     countries = []
 
+    city_postal = vocab("city_postal")
     for _ in range(seeds.num_gen_dummydata):
-        city, postal = choice(list(seeds.city_postal.items()))
+        city, postal = city_postal.draw()
         country_name = seeds.city_country[city]
-        street = choice(seeds.city_streets[city])
+        street = vocab(f"city_streets.{city}").draw()
         house_number = str(randint(1, 200))
 
         # line1
@@ -260,6 +341,9 @@ def gen_dummydata_addresses():
             unit_number = str(randint(1, 50))
             line2.append(f"{term1} {building_number}, {term2} {unit_number}")
 
+        else:
+            line2.append(None)
+
         cities.append(city)
         postal_code.append(postal)
         countries.append(country_name)
@@ -269,8 +353,15 @@ def gen_dummydata_addresses():
     cur = conn.cursor()
     query = sql.SQL(sqlrepo.DROP_ALL_TABLE_DATA).format(sql.Identifier('addresses'))
     cur.execute(query)
-    data = zip(line1, line2, cities, postal_code, countries)
-    cur.executemany(sqlrepo.INSERT_ADDRESSES, data)
+    table = (
+        ColumnTable('addresses')
+        .add('line1', line1, 'varchar')
+        .add('line2', line2, 'varchar')
+        .add('city', cities, 'varchar', categorical=True)
+        .add('postal_code', postal_code, 'varchar', categorical=True)
+        .add('country', countries, 'varchar', categorical=True)
+    )
+    table.copy_into(cur)
     conn.commit()
     conn.close()
 
@@ -278,7 +369,7 @@ def gen_dummydata_addresses():
     logger.info("Sample data inserted into addresses table:")
     logger.info(get_tbl_contents_as_str('addresses'))
 
-    return line1, line2, cities, postal_code, countries
+    return table
 
 # 4
 def gen_dummydata_accommodations():
@@ -291,7 +382,6 @@ def gen_dummydata_accommodations():
     titles = []
     price_cents = []
     is_active = []
-    created_at = []
 
     # host_account_id
     conn = db_connection()
@@ -311,19 +401,17 @@ def gen_dummydata_accommodations():
     cur.execute(query)
     host_account_ids = cur.fetchall()
     host_account_ids = [item[0] for item in host_account_ids]  # Unpack list of tuples
+    conn.close()
 
     # Select a randwom host account id list matching num_gen_dummydata
-    host_account_ids = [choice(host_account_ids) for _ in range(seeds.num_gen_dummydata)]
+    host_account_ids = id_sampler("accommodations.host_account_id", host_account_ids).draw_many(seeds.num_gen_dummydata)
 
     # titles
-    for _ in range(seeds.num_gen_dummydata):
-        title = [
-            choice(seeds.accomodation_title_words_dict["adjectives_general"]),
-            choice(seeds.accomodation_title_words_dict["accommodation_nouns"]),
-            choice(seeds.accomodation_title_words_dict["location_connectors"]),
-            choice(seeds.accomodation_title_words_dict["adjectives_location"]),
-            choice(seeds.accomodation_title_words_dict["place_names"]),
-        ]
+    title_words = [
+        vocab(f"accomodation_title_words_dict.{part}").draw_many(seeds.num_gen_dummydata)
+        for part in ("adjectives_general", "accommodation_nouns", "location_connectors", "adjectives_location", "place_names")
+    ]
+    for title in zip(*title_words):
         titles.append(" ".join(title))
     
     # Get Id column name from addresses table
@@ -339,8 +427,7 @@ def gen_dummydata_accommodations():
         is_active.append(choice([True, False]))
 
     # created_at
-    for _ in range(seeds.num_gen_dummydata):
-        created_at.append(_gen_rand_timestamp())
+    created_at = _gen_rand_timestamps(seeds.num_gen_dummydata)
 
     # Insert data into SQL table
     conn = db_connection()
@@ -364,20 +451,17 @@ def gen_dummydata_images():
     Fill dummy data for images table.
 
     Returns:
-        mimes, storage_keys, created_at
+        ColumnTable: mime, storage_key, created_at
     """
     mimes = []
     storage_keys = []
-    created_at = []
+    created_at = _gen_rand_epoch_us(seeds.num_gen_dummydata*4)
 
     for _ in range(seeds.num_gen_dummydata*4):  # More images than other tables
         # mime
-        mime = choice(seeds.image_mimes)
+        mime = vocab("image_mimes").draw()
         mimes.append(mime)
 
-        # timestamp
-        created_at.append(_gen_rand_timestamp())
-
         # storage key
         storage_key = "images/"
         storage_key += rstr.xeger(
@@ -391,8 +475,13 @@ def gen_dummydata_images():
     cur = conn.cursor()
     query = sql.SQL(sqlrepo.DROP_ALL_TABLE_DATA).format(sql.Identifier('images'))
     cur.execute(query)
-    data = zip(mimes, storage_keys, created_at)
-    cur.executemany(sqlrepo.INSERT_IMAGES, data)
+    table = (
+        ColumnTable('images')
+        .add('mime', mimes, 'varchar', categorical=True)
+        .add('storage_key', storage_keys, 'varchar')
+        .add('created_at', created_at, 'timestamp')
+    )
+    table.copy_into(cur)
     conn.commit()
     conn.close()
 
@@ -400,7 +489,7 @@ def gen_dummydata_images():
     logger.info("Sample data inserted into images table:")
     logger.info(get_tbl_contents_as_str('images'))
 
-    return mimes, storage_keys, created_at
+    return table
 
 # 6
 def gen_dummydata_payment_methods():
@@ -430,7 +519,7 @@ def gen_dummydata_payment_methods():
             # Append all data
             data[0].append(id)
             data[1].append(method)
-            data[2].append(_gen_rand_timestamp())
+    data[2] = _gen_rand_timestamps(len(data[0]))
 
     # Finally insert the data
     if (len(data[0])== len(data[1]) and len(data[1]) == len(data[2])):
@@ -459,7 +548,7 @@ def gen_dummydata_credit_cards():
     
     # Get Id column name
     card_ids = _fetch_table_ids_where(tbl_name='payment_methods', where="type = 'card'")
-    brand = [choice(seeds.card_brands) for _ in card_ids]
+    brand = vocab("card_brands").draw_many(len(card_ids))
     last4 = [randint(100,999) for _ in card_ids]
     exp_month = [randint(1,12) for _ in card_ids]
     exp_year = [randint(2023,2053) for _ in card_ids]
@@ -493,19 +582,24 @@ def gen_dummydata_paypal():
     paypal_ids = _fetch_table_ids_where(tbl_name='payment_methods', where="type = 'paypal'")
     paypal_user_id = [f"PP-{_random_string(n=8)}" for _ in paypal_ids]
     
-    # email addresses
-    emails = set()
+    # email addresses (unique; a list next to the set keeps the draw order, so seeded runs pair them reproducibly)
+    emails = []
+    seen_emails = set()
+    first_name_sylls = vocab("first_name_sylls")
+    last_name_sylls = vocab("last_name_sylls")
+    email_domains = vocab("email_domains")
     counter = 0
     while counter < len(paypal_ids):
         email_address = (
-            "".join(choice(seeds.first_name_sylls) for _ in range(randint(1,3)))
+            "".join(first_name_sylls.draw_many(randint(1,3)))
             + "."
-            + "".join(choice(seeds.last_name_sylls) for _ in range(randint(1,3)))
+            + "".join(last_name_sylls.draw_many(randint(1,3)))
             + "@"
-            + choice(seeds.email_domains)
+            + email_domains.draw()
         )
-        if email_address not in emails:
-            emails.add(email_address)
+        if email_address not in seen_emails:
+            seen_emails.add(email_address)
+            emails.append(email_address)
             counter += 1
         else:
             continue
@@ -542,36 +636,17 @@ def gen_dummydata_reviews():
     accomodation = []  
     author = []
     rating = [] 
-    description = [] 
-    timestamp = [] 
 
+    accomodation_sampler = id_sampler("reviews.accommodation_id", accomodation_ids)
+    author_sampler = id_sampler("reviews.author_account_id", account_ids)
     for _ in range(seeds.num_gen_dummydata*2):
-        
-        def gen_description(bad=True):
-            sentiment = 'negative' if bad else 'positive'
-            o = seeds.christmas_accommodation_reviews
-            description = (
-                f"{choice(o['openings'][sentiment])}! "
-                f"{choice(o['accommodation_features'][sentiment])}. "
-                f"{choice(o['intensifiers']).capitalize()}, "
-                f"{choice(o['experiences'][sentiment])}. "
-                f"{choice(o['connectors'])} "
-                f"{choice(o['host_details'][sentiment])}. "
-                f"{choice(o['random_details'])}. "
-                f"{choice(o['comfort_ratings'][sentiment]).capitalize()}. "
-                f"{choice(o['final_thoughts'][sentiment])}!"
-            ) 
-            return description
-        
-        accomodation.append(choice(accomodation_ids))
+        accomodation.append(accomodation_sampler.draw())
         rating.append(randint(1,5))
-        author.append(choice(account_ids))
-        if rating[-1] < 3:
-            description.append(gen_description(bad=True))
-        else:
-            description.append(gen_description(bad=False))
-        timestamp.append(_gen_rand_timestamp())
+        author.append(author_sampler.draw())
+    timestamp = _gen_rand_timestamps(len(rating), "reviews.created_at")
         
+    description = _gen_review_descriptions(rating)
+
     # Zip data 
     data = zip(accomodation, author, rating, description, timestamp)
 
@@ -598,7 +673,7 @@ def gen_dummydata_conversations():
     cur.execute(query)
     
     # Gen Data 
-    data = [_gen_rand_timestamp() for _ in range(seeds.num_gen_dummydata)]
+    data = _gen_rand_timestamps(seeds.num_gen_dummydata)
     data = zip(data)
     print(data)
     # Finally insert the data
@@ -628,7 +703,6 @@ def gen_dummydata_messages():
     sender_id = []
     receiver_id = []
     conversation_id = []
-    body = []
     is_read = []
     sent_at = []
 
@@ -644,7 +718,7 @@ def gen_dummydata_messages():
 
     for partner in message_partners:
         conv_length = randint(1,10)
-        start_time = datetime.datetime.fromisoformat(_gen_rand_timestamp())
+        start_time = _gen_rand_timestamp()
         for i in range(conv_length):
             if i%2 == 0:
                 sender_id.append(partner[0])
@@ -653,14 +727,11 @@ def gen_dummydata_messages():
                 sender_id.append(partner[1])
                 receiver_id.append(partner[0])
             conversation_id.append(partner[2])
-            body.append(
-                " ".join([
-                choice(seeds.christmas_gibberish_words) for _ in range(randint(1,10))
-                ]))
             is_read.append(True)
             sent_at.append(start_time)
             start_time += datetime.timedelta(minutes=randint(1,300))
         is_read[-1] = choice([True, False])
+    body = text_model("messages.body").generate(len(sender_id)).tolist()
 
     # Zip data 
     data = zip(sender_id, receiver_id, conversation_id, body, sent_at, is_read)
@@ -766,9 +837,9 @@ def gen_dummydata_accommodation_images():
                 is_cover.append(True)
             else:
                 is_cover.append(False)
-            caption_text = choice(seeds.christmas_accommodation_reviews["openings"]["positive"])
+            caption_text = vocab("christmas_accommodation_reviews.openings.positive").draw()
             caption.append(caption_text)
-            room_tag.append(choice(seeds.room_tags))
+            room_tag.append(vocab("room_tags").draw())
         counter += imgs_per_accomodation
         
     # Zip data 
@@ -815,20 +886,23 @@ def gen_dummydata_notifications():
     # Get account ids
     account_ids = _fetch_table_ids('accounts')
 
-    account_id = []
+    account_id = column_builder("int4")
     payload = []
-    sent_at = []
 
+    account_sampler = id_sampler("notifications.account_id", account_ids)
     for _ in range(seeds.num_gen_dummydata):
-        account_id.append(choice(account_ids))
+        account_id.append(account_sampler.draw())
         payload.append(_gen_dummy_json())
-        sent_at.append(_gen_rand_timestamp())
-
-    # Zip data 
-    data = zip(account_id, payload, sent_at)
+    sent_at = _gen_rand_epoch_us(seeds.num_gen_dummydata, "notifications.sent_at")
 
     # Finally insert the data
-    cur.executemany(sqlrepo.INSERT_NOTIFICATIONS, data)
+    table = (
+        ColumnTable('notifications')
+        .add('account_id', account_id, 'int4')
+        .add('payload', payload, 'json')
+        .add('sent_at', sent_at, 'timestamp')
+    )
+    table.copy_into(cur)
     conn.commit()
     conn.close()
 
@@ -884,104 +958,121 @@ def gen_dummydata_payout_accounts():
 # 16 +17
 def gen_dummydata_bookings_and_payments():
     """
-    Fill dummy data for bookings table.
+    Fill dummy data for bookings and payments tables.
+
+    Returns:
+        (ColumnTable bookings, ColumnTable payments)
     """
     guest_account_ids = []
-    accommodation_ids = []
+    booked_accommodation_ids = []
     start_dates = []
     end_dates = []
-    payment_ids = []
     statuses = []
     created_ats = []
 
+    customer_ids = column_builder("int4")
+    amounts_cents = column_builder("int4")
+    payment_statuses = []
+    payment_method_ids = column_builder("int4")
+
     # Insert data into SQL table
     conn = db_connection()
     cur = conn.cursor()
 
-    # Clear existing data
-    query = sql.SQL(sqlrepo.DROP_ALL_TABLE_DATA).format(sql.Identifier('bookings'))
-    cur.execute(query)
+    # Clear existing data (payments first: its ids are read back after the COPY)
+    for tbl_name in ('payments', 'bookings'):
+        query = sql.SQL(sqlrepo.DROP_ALL_TABLE_DATA).format(sql.Identifier(tbl_name))
+        cur.execute(query)
     
     # Get guest account ids
     query = sqlrepo.FETCH_GUEST_IDS
     cur.execute(query)
-    guest_account_ids = cur.fetchall()
+    guest_ids = [row[0] for row in cur.fetchall()]
 
     # Get guest account ids
     accommodation_ids = _fetch_table_ids('accommodations')
+    guest_sampler = id_sampler("bookings.guest_account_id", guest_ids)
+    accommodation_sampler = id_sampler("bookings.accommodation_id", accommodation_ids)
 
-    for accommodation_id in accommodation_ids:
-        create_booking = choice([True, False])
-        if create_booking:
-            # Generate random timestamp max 14 days before last date
-            start_date = None
-            while True:
-                start_date = _gen_rand_timestamp()
-                start_date = datetime.datetime.fromisoformat(start_date)
-                if start_date < (seeds.stop_timestamp - datetime.timedelta(days=14)):
-                    break
-            
-            # Select start and end date
-            duration = randint(1,14)
-            end_date = start_date + datetime.timedelta(days=duration)
-
-            # Get accommodation price per night
-            querry = sqlrepo.FETCH_ACCOMMODATION_PRICE
-            cur.execute(querry, (accommodation_id,))
-            accommodation_price = cur.fetchone()
-
-            # Calculate total payment ammount
-            amount_cents = accommodation_price[0] * duration
-
-            # Select guest id for booking
-            guest_id = choice(guest_account_ids)
-
-            # Create payment and insert it 
-            customer_id = guest_id[0]
-            status = choice(['payed', 'open', 'cancelled'])
-
-            # Get payment method where user id
-            while True:
-                querry = sqlrepo.FETCH_FIRST_PAYMENTMETHOD_ID_FOR_USER
-                cur.execute(querry, (guest_id,))
-                payment_method = cur.fetchone()
-                if payment_method:
-                    break
-            
-            # Insert payment
-            data = (customer_id, amount_cents, status, payment_method[0])
-            cur.execute(sqlrepo.INSERT_PAYMENTS, data)
-            payment_id = cur.fetchone()[0]
-
-            # Create booking status
-            booking_status = choice(['pending', 'confirmed', 'cancelled', 'completed'])
-
-            while True:
-                time_stamp = _gen_rand_timestamp()
-                if datetime.datetime.fromisoformat(time_stamp) < start_date:
-                    break
-            
-            guest_account_ids.append(guest_id)
-            accommodation_ids.append(accommodation_id)
-            start_dates.append(start_date)
-            end_dates.append(end_date)
-            payment_ids.append(payment_id)
-            statuses.append(booking_status)
-            created_ats.append(time_stamp)
-            
-    # Zip data 
-    data = zip(
-                guest_account_ids, 
-                accommodation_ids, 
-                start_dates, 
-                end_dates, 
-                payment_ids, 
-                statuses, 
-                created_ats
-            )
+    # Start dates end 14 days before the last date and leave one second for created_at before them
+    latest_start = seeds.stop_timestamp - datetime.timedelta(days=14)
+    earliest_start = seeds.start_timestamp + datetime.timedelta(seconds=1)
 
-    # Finally insert the data
-    cur.executemany(sqlrepo.INSERT_BOOKINGS, data)
+    # Accommodations are drawn with replacement, one booking per accommodation on average: some get
+    # several (possibly overlapping) bookings, others none (skewed towards hot listings by DATA_DISTRIBUTION)
+    for _ in range(len(accommodation_ids)):
+        accommodation_id = accommodation_sampler.draw()
+
+        # Generate random timestamp max 14 days before last date
+        start_date = _gen_rand_timestamp("bookings.start_date", before=latest_start, after=earliest_start)
+        
+        # Select start and end date
+        duration = randint(1,14)
+        end_date = start_date + datetime.timedelta(days=duration)
+
+        # Get accommodation price per night
+        querry = sqlrepo.FETCH_ACCOMMODATION_PRICE
+        cur.execute(querry, (accommodation_id,))
+        accommodation_price = cur.fetchone()
+
+        # Calculate total payment ammount
+        amount_cents = accommodation_price[0] * duration
+
+        # Select guest id for booking
+        guest_id = guest_sampler.draw()
+
+        # Create payment
+        status = choice(['payed', 'open', 'cancelled'])
+
+        # Get payment method where user id
+        while True:
+            querry = sqlrepo.FETCH_FIRST_PAYMENTMETHOD_ID_FOR_USER
+            cur.execute(querry, (guest_id,))
+            payment_method = cur.fetchone()
+            if payment_method:
+                break
+        
+        customer_ids.append(guest_id)
+        amounts_cents.append(amount_cents)
+        payment_statuses.append(status)
+        payment_method_ids.append(payment_method[0])
+
+        # Create booking status
+        booking_status = choice(['pending', 'confirmed', 'cancelled', 'completed'])
+
+        time_stamp = _gen_rand_timestamp(before=start_date)
+        
+        guest_account_ids.append(guest_id)
+        booked_accommodation_ids.append(accommodation_id)
+        start_dates.append(start_date)
+        end_dates.append(end_date)
+        statuses.append(booking_status)
+        created_ats.append(time_stamp)
+
+    # Insert payments; one COPY into the emptied table assigns ids in row order
+    payments = (
+        ColumnTable('payments')
+        .add('customer_id', customer_ids, 'int4')
+        .add('amount_cents', amounts_cents, 'int4')
+        .add('status', payment_statuses, 'enum', categorical=True)
+        .add('payment_method_id', payment_method_ids, 'int4')
+    )
+    payments.copy_into(cur)
+    cur.execute(sqlrepo.FETCH_PAYMENT_IDS)
+    payment_ids = [row[0] for row in cur.fetchall()]
+
+    # Finally insert the bookings, each with the payment of its row
+    bookings = (
+        ColumnTable('bookings')
+        .add('guest_account_id', guest_account_ids, 'int4')
+        .add('accommodation_id', booked_accommodation_ids, 'int4')
+        .add('start_date', start_dates, 'timestamp')
+        .add('end_date', end_dates, 'timestamp')
+        .add('payment_id', payment_ids, 'int4')
+        .add('status', statuses, 'enum', categorical=True)
+        .add('created_at', created_ats, 'timestamp')
+    )
+    bookings.copy_into(cur)
     conn.commit()
     conn.close()
 
@@ -991,6 +1082,8 @@ def gen_dummydata_bookings_and_payments():
     logger.info("Sample data inserted into payments table:")
     logger.info(get_tbl_contents_as_str('payments'))
 
+    return bookings, payments
+
 # 18
 def gen_dummydata_payouts():
     """
@@ -1045,8 +1138,7 @@ def gen_dummydata_payouts():
         payout_account_ids.append(payout_acc_id[0])
     
     # Select currencies
-    for _ in host_account_ids:
-        currency.append(choice(seeds.currencies))
+    currency.extend(vocab("currencies").draw_many(len(host_account_ids)))
     
     # Select status
     for _ in currency:
@@ -1077,11 +1169,11 @@ def gen_dummydata_accommodation_calendar():
     """
     Fill dummy data for accommodation_calendar table.
     """
-    accommodation_id = []
-    days = []
-    is_blocked = []
-    price_addition_cents = []
-    min_nights = []
+    accommodation_id = column_builder("int4")
+    days = column_builder("date")
+    is_blocked = column_builder("bool")
+    price_addition_cents = column_builder("int4")
+    min_nights = column_builder("int4")
 
     # Insert data into SQL table
     conn = db_connection()
@@ -1112,7 +1204,7 @@ def gen_dummydata_accommodation_calendar():
             accommodation_id.append(id)
 
             # Add day timestamp to calendar
-            days.append(day_counter)
+            days.append(to_epoch_us(day_counter))
 
             # Check if booked
             if (day_counter >= start_date and day_counter <= end_date):
@@ -1129,17 +1221,16 @@ def gen_dummydata_accommodation_calendar():
         # Increase the counter
         day_counter += datetime.timedelta(days=1)
 
-    # Zip data 
-    data = zip(
-                accommodation_id,
-                days,
-                is_blocked,
-                price_addition_cents,
-                min_nights
-            )
-
     # Finally insert the data
-    cur.executemany(sqlrepo.INSERT_ACCOMMODATION_CALENDAR, data)
+    table = (
+        ColumnTable('accommodation_calendar')
+        .add('accommodation_id', accommodation_id, 'int4')
+        .add('day', days, 'date')
+        .add('is_blocked', is_blocked, 'bool')
+        .add('price_addition_cents', price_addition_cents, 'int4')
+        .add('min_nights', min_nights, 'int4')
+    )
+    table.copy_into(cur)
     conn.commit()
     conn.close()
 
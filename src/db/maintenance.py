@@ -0,0 +1,193 @@
+"""
+maintenance.py
+
+Post-load VACUUM/ANALYZE and planner statistics verification.
+
+Features:
+- vacuum_analyze(): `VACUUM (ANALYZE)` per table, largest tables first, over MAINTENANCE_WORKERS
+  connections (VACUUM cannot run inside a transaction, so every worker runs in autocommit)
+- find_stale_tables(): tables with rows that were never analyzed, were analyzed before a given
+  point in time, or changed by more than STALE_FRACTION of their rows since the last ANALYZE
+- verify_statistics(): checks pg_stat_user_tables and the extended statistics of
+  06_extended_statistics.sql; raises StaleStatisticsError if anything is stale
+- ensure_fresh_statistics(): analyzes only the stale tables, for benchmarks before they start
+- run_post_load_maintenance(): pipeline stage (vacuum + analyze everything, then verify)
+
+Assumptions:
+- only the public schema is maintained (the partitioned comparison schema has its own benchmark)
+- VACUUM also sets the visibility map, so index-only scans work right after the load
+"""
+
+
+# Stdlib imports
+import argparse
+import datetime
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+
+# Third-party imports
+from psycopg2 import sql
+
+
+# Path/bootstrap
+# Go two levels up (src/db → project root) so src.* imports work.
+PROJECT_ROOT = Path(__file__).resolve().parents[2]
+sys.path.insert(0, str(PROJECT_ROOT))
+
+
+# Internal imports
+from src import config
+from src.db.connection import managed_connection
+from src.db import sql_repo as sqlrepo
+from src.db.utils import instrumentation
+from src.utils.logger import logger
+from src.utils.tables import format_table
+
+
+
+# Share of rows modified since the last ANALYZE that makes statistics stale
+# (autovacuum_analyze_scale_factor defaults to the same value)
+STALE_FRACTION = 0.1
+
+REPORT_COLUMNS = ["table", "seconds"]
+STALE_COLUMNS = ["table", "n_live_tup", "n_mod_since_analyze", "last_analyzed", "reason"]
+
+
+class StaleStatisticsError(RuntimeError):
+    """
+    Planner statistics are missing or outdated for at least one table.
+    """
+
+
+
+# VACUUM / ANALYZE
+def _vacuum_analyze_table(table: str) -> dict:
+    t0 = time.perf_counter()
+    with managed_connection() as conn:
+        conn.autocommit = True
+        with conn.cursor() as cur:
+            cur.execute(sql.SQL(sqlrepo.VACUUM_ANALYZE_TABLE).format(sql.Identifier(table)))
+    return {"table": table, "seconds": round(time.perf_counter() - t0, 3)}
+
+def vacuum_analyze(tables: list = None, workers: int = None) -> list:
+    """
+    Run VACUUM (ANALYZE) on `tables` (default: every public table) in parallel.
+
+    Returns:
+        list[dict]: table, seconds per table
+    """
+    workers = workers or config.MAINTENANCE_WORKERS
+    if tables is None:
+        with managed_connection() as conn, conn.cursor() as cur:
+            cur.execute(sqlrepo.FETCH_MAINTENANCE_TABLES)
+            tables = [row[0] for row in cur.fetchall()]
+
+    t0 = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=max(1, workers)) as pool:
+        results = list(pool.map(instrumentation.in_active_stage(_vacuum_analyze_table), tables))
+
+    logger.info(
+        f"VACUUM (ANALYZE) of {len(tables)} tables in {time.perf_counter() - t0:.3f}s ({workers} workers)\n"
+        + format_table(sorted(results, key=lambda r: -r["seconds"]), REPORT_COLUMNS)
+    )
+    return results
+
+
+
+# Verification
+def find_stale_tables(rows: list, analyzed_since: datetime.datetime = None, stale_fraction: float = STALE_FRACTION) -> list:
+    """
+    Return the rows (dicts of FETCH_TABLE_STATISTICS_STATE) whose statistics are stale, with a reason.
+    Empty tables are never stale.
+    """
+    stale = []
+    for row in rows:
+        if not row["n_live_tup"]:
+            continue
+        if row["last_analyzed"] is None:
+            reason = "never analyzed"
+        elif analyzed_since and row["last_analyzed"] < analyzed_since:
+            reason = "analyzed before load"
+        elif row["n_mod_since_analyze"] > stale_fraction * row["n_live_tup"]:
+            reason = "modified since analyze"
+        else:
+            continue
+        stale.append({**row, "reason": reason})
+    return stale
+
+def fetch_statistics_state(cur) -> tuple:
+    """
+    Return (table rows, extended statistics rows) as dicts.
+    """
+    cur.execute(sqlrepo.FETCH_TABLE_STATISTICS_STATE)
+    tables = [
+        {"table": table, "n_live_tup": live, "n_mod_since_analyze": modified, "last_analyzed": analyzed, "last_vacuumed": vacuumed}
+        for table, live, modified, analyzed, vacuumed in cur.fetchall()
+    ]
+    cur.execute(sqlrepo.FETCH_EXTENDED_STATISTICS_STATE)
+    extended = [{"statistics": name, "table": table, "built": built} for name, table, built in cur.fetchall()]
+    return tables, extended
+
+def verify_statistics(analyzed_since: datetime.datetime = None) -> list:
+    """
+    Raise StaleStatisticsError if table statistics are stale or extended statistics were not built.
+
+    Returns:
+        list[dict]: table statistics state (all tables), for logging/benchmark output
+    """
+    with managed_connection() as conn, conn.cursor() as cur:
+        tables, extended = fetch_statistics_state(cur)
+
+    populated = {row["table"] for row in tables if row["n_live_tup"]}
+    unbuilt = [row["statistics"] for row in extended if not row["built"] and row["table"] in populated]
+    stale = find_stale_tables(tables, analyzed_since)
+    if stale or unbuilt:
+        message = f"{len(stale)} tables with stale statistics, extended statistics not built: {unbuilt or 'none'}"
+        if stale:
+            message += "\n" + format_table(stale, STALE_COLUMNS)
+        raise StaleStatisticsError(message)
+
+    logger.info(f"Statistics fresh for {len(populated)} populated tables and {len(extended)} extended statistics")
+    return tables
+
+def ensure_fresh_statistics() -> list:
+    """
+    Analyze the tables whose statistics are stale (if any), then verify. Used before benchmarks.
+    """
+    with managed_connection() as conn, conn.cursor() as cur:
+        tables, extended = fetch_statistics_state(cur)
+
+    to_analyze = {row["table"] for row in find_stale_tables(tables)}
+    to_analyze |= {row["table"] for row in extended if not row["built"]}
+    if to_analyze:
+        vacuum_analyze(sorted(to_analyze))
+    return verify_statistics()
+
+def run_post_load_maintenance():
+    """
+    Pipeline stage: VACUUM (ANALYZE) every table, then verify that every statistic is fresh.
+    """
+    # server clock, compared against last_analyze (the container clock may differ from the host)
+    with managed_connection() as conn, conn.cursor() as cur:
+        cur.execute(sqlrepo.FETCH_SERVER_TIME)
+        started_at = cur.fetchone()[0]
+    vacuum_analyze()
+    verify_statistics(analyzed_since=started_at)
+
+
+
+# CLI entrypoint
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="VACUUM/ANALYZE the datamart and verify planner statistics.")
+    parser.add_argument("--verify-only", action="store_true", help="only check that statistics are fresh")
+    parser.add_argument("--workers", type=int, default=None, help="parallel connections (default MAINTENANCE_WORKERS)")
+    args = parser.parse_args()
+
+    if args.verify_only:
+        verify_statistics()
+    else:
+        vacuum_analyze(workers=args.workers)
+        verify_statistics()
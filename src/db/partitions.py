@@ -0,0 +1,179 @@
+"""
+partitions.py
+
+Partition manager for the alternative, monthly RANGE-partitioned schema (src/sql/partitioned_schema.sql).
+
+Features:
+- create_schema(): creates the "partitioned" schema with the partitioned parent tables
+- create_partitions(): pre-creates one partition per month for a time window
+  (default: data_lists.start_timestamp .. stop_timestamp)
+- detach_partitions_before(): detaches (optionally drops) partitions of months before a cutoff
+
+Partitions are named <table>_y<YYYY>m<MM> (e.g. bookings_y2022m01); the manager relies on that
+convention to find a partition's month.
+
+Assumptions:
+- the public tables stay the primary schema; "partitioned" is an alternative for comparison
+- a month can only be created while its DEFAULT partition holds no rows of that month
+"""
+
+
+# Stdlib imports
+import argparse
+import datetime
+import re
+import sys
+from pathlib import Path
+
+
+# Third-party imports
+from psycopg2 import sql
+
+
+# Path/bootstrap
+# Go two levels up (src/db → project root) so src.* imports work.
+PROJECT_ROOT = Path(__file__).resolve().parents[2]
+sys.path.insert(0, str(PROJECT_ROOT))
+
+
+# Internal imports
+import src.db.data_lists as seeds
+from src.db.connection import managed_connection
+from src.db import sql_repo as sqlrepo
+from src.utils.logger import logger
+
+
+
+# Partitioning configuration
+PARTITION_SCHEMA = "partitioned"
+SCHEMA_FILE = PROJECT_ROOT / "src" / "sql" / "partitioned_schema.sql"
+
+# table → partition key column
+PARTITIONED_TABLES = {
+    "bookings": "start_date",
+    "messages": "sent_at",
+    "notifications": "sent_at",
+    "accommodation_calendar": "day",
+}
+
+_PARTITION_NAME = re.compile(r"_y(\d{4})m(\d{2})$")
+
+
+
+# Naming and bounds
+def month_starts(start: datetime.date, stop: datetime.date) -> list:
+    """
+    Return the first day of every month from the month of `start` through the month of `stop`.
+    """
+    month = datetime.date(start.year, start.month, 1)
+    months = []
+    while month <= stop:
+        months.append(month)
+        month = next_month(month)
+    return months
+
+def next_month(month: datetime.date) -> datetime.date:
+    return datetime.date(month.year + month.month // 12, month.month % 12 + 1, 1)
+
+def partition_name(table: str, month: datetime.date) -> str:
+    return f"{table}_y{month.year}m{month.month:02d}"
+
+def partition_month(name: str):
+    """
+    Return the month (first day) encoded in a partition name, or None (e.g. DEFAULT partitions).
+    """
+    match = _PARTITION_NAME.search(name)
+    if match is None:
+        return None
+    return datetime.date(int(match.group(1)), int(match.group(2)), 1)
+
+
+
+# Management
+def create_schema(cur) -> bool:
+    """
+    Create the partitioned schema from SCHEMA_FILE unless it exists. Returns True if created.
+    """
+    cur.execute(sqlrepo.FETCH_SCHEMA_EXISTS, (PARTITION_SCHEMA,))
+    if cur.fetchone()[0]:
+        return False
+    cur.execute(SCHEMA_FILE.read_text(encoding="utf-8"))
+    logger.info(f"Created schema '{PARTITION_SCHEMA}' from {SCHEMA_FILE.name}")
+    return True
+
+def create_partitions(cur, start: datetime.date = None, stop: datetime.date = None, tables: list = None) -> int:
+    """
+    Create the monthly partitions for [start, stop] (existing ones are skipped).
+
+    Returns:
+        int: number of partitions ensured
+    """
+    start = start or seeds.start_timestamp.date()
+    stop = stop or seeds.stop_timestamp.date()
+    count = 0
+    for table in tables or PARTITIONED_TABLES:
+        parent = sql.Identifier(PARTITION_SCHEMA, table)
+        for month in month_starts(start, stop):
+            cur.execute(
+                sql.SQL(sqlrepo.CREATE_RANGE_PARTITION).format(
+                    part=sql.Identifier(PARTITION_SCHEMA, partition_name(table, month)),
+                    parent=parent,
+                ),
+                (month, next_month(month)),
+            )
+            count += 1
+    logger.info(f"Ensured {count} monthly partitions for {start:%Y-%m}..{stop:%Y-%m}")
+    return count
+
+def detach_partitions_before(cur, cutoff: datetime.date, drop: bool = False, tables: list = None) -> list:
+    """
+    Detach every monthly partition whose month ends on or before `cutoff`.
+
+    Args:
+        cur: open cursor (caller commits).
+        cutoff (date): partitions of months entirely before this day are detached.
+        drop (bool): drop the detached tables instead of keeping them as standalone tables.
+
+    Returns:
+        list[str]: detached partition names
+    """
+    detached = []
+    for table in tables or PARTITIONED_TABLES:
+        cur.execute(sqlrepo.FETCH_PARTITIONS, (PARTITION_SCHEMA, table))
+        for (name,) in cur.fetchall():
+            month = partition_month(name)
+            if month is None or next_month(month) > cutoff:
+                continue
+            part = sql.Identifier(PARTITION_SCHEMA, name)
+            cur.execute(sql.SQL(sqlrepo.DETACH_PARTITION).format(parent=sql.Identifier(PARTITION_SCHEMA, table), part=part))
+            if drop:
+                cur.execute(sql.SQL(sqlrepo.DROP_TABLE).format(part))
+            detached.append(name)
+    logger.info(f"{'Dropped' if drop else 'Detached'} {len(detached)} partitions before {cutoff}")
+    return detached
+
+def ensure_partitioned_schema():
+    """
+    Create the schema (if missing) and the partitions for the seeding window in one transaction.
+    """
+    with managed_connection(commit=True) as conn, conn.cursor() as cur:
+        create_schema(cur)
+        create_partitions(cur)
+
+
+
+# CLI entrypoint
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Manage the monthly partitions of the partitioned schema.")
+    parser.add_argument("--start", type=datetime.date.fromisoformat, help="first day of the window (default: seeds)")
+    parser.add_argument("--stop", type=datetime.date.fromisoformat, help="last day of the window (default: seeds)")
+    parser.add_argument("--detach-before", type=datetime.date.fromisoformat, help="detach months before this day")
+    parser.add_argument("--drop", action="store_true", help="drop detached partitions")
+    args = parser.parse_args()
+
+    with managed_connection(commit=True) as conn, conn.cursor() as cur:
+        create_schema(cur)
+        if args.detach_before:
+            detach_partitions_before(cur, args.detach_before, args.drop)
+        else:
+            create_partitions(cur, args.start, args.stop)
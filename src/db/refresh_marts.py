@@ -0,0 +1,248 @@
+"""
+refresh_marts.py
+
+Refresh manager for the materialized reporting marts defined in src/sql/03_marts.sql.
+
+Features:
+- refresh_mart(): refreshes one mart, CONCURRENTLY when it is already populated
+- refresh_all_marts(): refreshes every mart in MARTS order and logs a timing table
+- every refresh is recorded in mart_refresh_log (duration, row count, concurrent or not)
+- incremental maintenance of the agg_* tables (src/sql/04_mart_incremental.sql):
+  - rebuild_aggregates(): full load of every agg_* table from its mart, clears the change log
+  - refresh_incremental(): consumes mart_changes and recomputes only the touched aggregate keys
+  - verify_aggregates(): row-by-row comparison of agg_* tables against freshly rebuilt marts
+  - change_log_paused(): disables the change log triggers around the seeding, re-enabled on exit
+
+Assumptions:
+- a never-populated mart (created WITH NO DATA) cannot be refreshed concurrently; its first
+  refresh is always a plain one
+- runs in autocommit so every refresh and its log row commit on their own; a concurrent refresh
+  never blocks dashboard readers
+- the incremental functions take a cursor and never commit; the caller owns the transaction
+"""
+
+
+# Stdlib imports
+import argparse
+import sys
+import time
+from contextlib import contextmanager
+from pathlib import Path
+
+
+# Third-party imports
+from psycopg2 import sql
+
+
+# Path/bootstrap
+# Go two levels up (src/db → project root) so src.* imports work.
+PROJECT_ROOT = Path(__file__).resolve().parents[2]
+sys.path.insert(0, str(PROJECT_ROOT))
+
+
+# Internal imports
+from src.db.connection import managed_connection
+from src.db import sql_repo as sqlrepo
+from src.utils.logger import logger
+from src.utils.tables import format_table
+
+
+
+# Marts in refresh order (names of the materialized views in 03_marts.sql)
+MARTS = [
+    "mart_daily_revenue",
+    "mart_monthly_occupancy",
+    "mart_review_ratings",
+    "mart_payout_reconciliation",
+]
+
+REPORT_COLUMNS = ["mart", "concurrent", "duration_ms", "row_count"]
+
+# Incrementally maintained mart → (aggregate table, key columns, delta keys query, delta insert query)
+AGGREGATES = {
+    "mart_daily_revenue": (
+        "agg_daily_revenue", ["day", "host_account_id", "city"],
+        sqlrepo.MART_DELTA_KEYS_DAILY_REVENUE, sqlrepo.MART_DELTA_INSERT_DAILY_REVENUE,
+    ),
+    "mart_monthly_occupancy": (
+        "agg_monthly_occupancy", ["accommodation_id"],
+        sqlrepo.MART_DELTA_KEYS_MONTHLY_OCCUPANCY, sqlrepo.MART_DELTA_INSERT_MONTHLY_OCCUPANCY,
+    ),
+    "mart_review_ratings": (
+        "agg_review_ratings", ["accommodation_id"],
+        sqlrepo.MART_DELTA_KEYS_REVIEW_RATINGS, sqlrepo.MART_DELTA_INSERT_REVIEW_RATINGS,
+    ),
+    "mart_payout_reconciliation": (
+        "agg_payout_reconciliation", ["booking_id"],
+        sqlrepo.MART_DELTA_KEYS_PAYOUT_RECONCILIATION, sqlrepo.MART_DELTA_INSERT_PAYOUT_RECONCILIATION,
+    ),
+}
+AGGREGATE_TABLES = [agg_table for agg_table, *_ in AGGREGATES.values()]
+
+# Tables whose row triggers (trg_<table>_mart_change) log into mart_changes
+CHANGE_LOG_TABLES = ["bookings", "payments", "reviews", "payouts"]
+
+
+
+def refresh_mart(cur, mart_name: str, concurrently: bool = True) -> dict:
+    """
+    Refresh one mart and record the refresh in mart_refresh_log.
+
+    Args:
+        cur: cursor on an autocommit connection.
+        mart_name (str): materialized view to refresh.
+        concurrently (bool): use REFRESH ... CONCURRENTLY if the mart is already populated.
+
+    Returns:
+        dict: mart, concurrent, duration_ms, row_count
+    """
+    cur.execute(sqlrepo.FETCH_MART_IS_POPULATED, (mart_name,))
+    row = cur.fetchone()
+    if row is None:
+        raise ValueError(f"Unknown mart {mart_name!r} (run 03_marts.sql first)")
+    concurrent = concurrently and row[0]
+
+    template = sqlrepo.REFRESH_MATERIALIZED_VIEW_CONCURRENTLY if concurrent else sqlrepo.REFRESH_MATERIALIZED_VIEW
+    t0 = time.perf_counter()
+    cur.execute(sql.SQL(template).format(sql.Identifier(mart_name)))
+    duration_ms = round((time.perf_counter() - t0) * 1000, 3)
+
+    cur.execute(sql.SQL(sqlrepo.COUNT_ROWS).format(sql.Identifier(mart_name)))
+    row_count = cur.fetchone()[0]
+    cur.execute(sqlrepo.INSERT_MART_REFRESH_LOG, (mart_name, concurrent, duration_ms, row_count))
+
+    return {"mart": mart_name, "concurrent": concurrent, "duration_ms": duration_ms, "row_count": row_count}
+
+def refresh_all_marts(concurrently: bool = True, marts: list = None) -> list:
+    """
+    Refresh all marts (or the given subset) and log the timings.
+    """
+    with managed_connection() as conn:
+        conn.autocommit = True
+        with conn.cursor() as cur:
+            results = [refresh_mart(cur, mart_name, concurrently) for mart_name in (marts or MARTS)]
+
+    logger.info("Refreshed reporting marts:\n" + format_table(results, REPORT_COLUMNS))
+    return results
+
+
+
+# Incremental maintenance
+def rebuild_aggregates(cur, refresh: bool = True):
+    """
+    Full rebuild: refresh every mart (plain REFRESH) and copy it into its agg_* table.
+    Clears the change log first, so changes made afterwards are picked up by refresh_incremental().
+
+    Args:
+        cur: open cursor (caller commits).
+        refresh (bool): False if the marts were just refreshed and can be copied as they are.
+    """
+    cur.execute(sqlrepo.TRUNCATE_MART_CHANGES)
+    for mart_name, (agg_table, _, _, _) in AGGREGATES.items():
+        if refresh:
+            cur.execute(sql.SQL(sqlrepo.REFRESH_MATERIALIZED_VIEW).format(sql.Identifier(mart_name)))
+        cur.execute(sql.SQL(sqlrepo.TRUNCATE_TABLE).format(sql.Identifier(agg_table)))
+        cur.execute(sql.SQL(sqlrepo.COPY_MART_INTO_AGGREGATE).format(
+            agg=sql.Identifier(agg_table),
+            mart=sql.Identifier(mart_name),
+        ))
+
+def set_change_log_triggers(enabled: bool):
+    """
+    Enable or disable the mart_changes triggers of CHANGE_LOG_TABLES.
+    """
+    action = sql.SQL("ENABLE" if enabled else "DISABLE")
+    with managed_connection(commit=True) as conn, conn.cursor() as cur:
+        for table in CHANGE_LOG_TABLES:
+            cur.execute(sql.SQL(sqlrepo.SET_TABLE_TRIGGER).format(
+                table=sql.Identifier(table),
+                action=action,
+                trigger=sql.Identifier(f"trg_{table}_mart_change"),
+            ))
+
+@contextmanager
+def change_log_paused():
+    """
+    Disable the change log triggers for the pipeline stages: the bulk load is covered by the full
+    refresh and load_aggregates(), so logging every inserted row into mart_changes is pure overhead.
+    The triggers are enabled again on exit, also when a stage raises.
+    """
+    set_change_log_triggers(False)
+    try:
+        yield
+    finally:
+        set_change_log_triggers(True)
+
+def load_aggregates():
+    """
+    Pipeline stage after refresh_all_marts(): load the agg_* tables from the fresh marts.
+    """
+    with managed_connection(commit=True) as conn, conn.cursor() as cur:
+        rebuild_aggregates(cur, refresh=False)
+
+def refresh_incremental(cur) -> dict:
+    """
+    Apply all pending changes from mart_changes to the agg_* tables.
+
+    Every aggregate key touched by a change is deleted and recomputed from the base tables,
+    so the cost scales with the delta, not with the total history.
+
+    Returns:
+        dict: changes consumed, keys recomputed per aggregate table and duration_ms
+    """
+    t0 = time.perf_counter()
+    cur.execute(sqlrepo.CONSUME_MART_CHANGES)
+    changes = cur.rowcount
+
+    keys = {}
+    for agg_table, key_columns, keys_query, insert_query in AGGREGATES.values():
+        cur.execute(sql.SQL(sqlrepo.CREATE_MART_DELTA_KEYS).format(sql.SQL(keys_query)))
+        keys[agg_table] = cur.rowcount
+        if keys[agg_table]:
+            cols = sql.SQL(", ").join(map(sql.Identifier, key_columns))
+            cur.execute(sql.SQL(sqlrepo.DELETE_MART_DELTA_KEYS).format(agg=sql.Identifier(agg_table), cols=cols))
+            cur.execute(insert_query)
+        cur.execute(sqlrepo.DROP_MART_DELTA_KEYS)
+    cur.execute(sqlrepo.DROP_MART_DELTA)
+
+    return {"changes": changes, "keys": keys, "duration_ms": round((time.perf_counter() - t0) * 1000, 3)}
+
+def verify_aggregates(cur) -> dict:
+    """
+    Correctness check: apply pending changes, rebuild the marts from scratch and count
+    rows that differ between each agg_* table and its mart (0 everywhere = correct).
+    """
+    refresh_incremental(cur)
+    mismatches = {}
+    for mart_name, (agg_table, _, _, _) in AGGREGATES.items():
+        cur.execute(sql.SQL(sqlrepo.REFRESH_MATERIALIZED_VIEW).format(sql.Identifier(mart_name)))
+        cur.execute(sql.SQL(sqlrepo.COUNT_AGGREGATE_MISMATCHES).format(
+            agg=sql.Identifier(agg_table),
+            mart=sql.Identifier(mart_name),
+        ))
+        mismatches[agg_table] = cur.fetchone()[0]
+    return mismatches
+
+
+
+# CLI entrypoint
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Refresh the materialized reporting marts.")
+    parser.add_argument("--marts", nargs="*", choices=MARTS, help="subset of marts to refresh")
+    parser.add_argument("--blocking", action="store_true", help="plain REFRESH instead of CONCURRENTLY")
+    parser.add_argument("--incremental", action="store_true", help="apply pending changes to the agg_* tables")
+    parser.add_argument("--rebuild", action="store_true", help="full rebuild of the agg_* tables")
+    parser.add_argument("--verify", action="store_true", help="compare the agg_* tables against a full rebuild")
+    args = parser.parse_args()
+
+    if args.incremental or args.rebuild or args.verify:
+        with managed_connection(commit=True) as conn, conn.cursor() as cur:
+            if args.rebuild:
+                rebuild_aggregates(cur)
+                logger.info("Rebuilt incremental aggregates")
+            if args.incremental:
+                logger.info(f"Incremental refresh: {refresh_incremental(cur)}")
+            if args.verify:
+                logger.info(f"Aggregate mismatches against full rebuild: {verify_aggregates(cur)}")
+    else:
+        refresh_all_marts(concurrently=not args.blocking, marts=args.marts)
@@ -1,18 +1,48 @@
+"""
+run_sql_files.py
+
+Migration runner for the SQL files in src/sql.
+
+Features:
+- applies FILES in order and records each one with its SHA-256 checksum in schema_migrations;
+  already applied, unchanged files are skipped
+- splits every file into statements (src.db.utils.sql_statements) and runs them in one
+  transaction, so a failing file leaves nothing half-built and stops the run
+- plain `CREATE INDEX` statements are not run with their file but queued in
+  schema_deferred_indexes (same transaction as the schema_migrations record);
+  build_deferred_indexes() builds the pending ones in parallel over MIGRATION_WORKERS
+  connections after the bulk load (the "build_indexes" stage of src/main.py)
+
+Assumptions:
+- applied files are never edited; a changed checksum raises MigrationChecksumError
+  (tear down and set up the database again instead)
+- nothing depends on a non-unique index, so the files and the seed data work without them
+- every index is built and marked as built in one transaction, so a failed build stays
+  pending and the next build_deferred_indexes() run resumes with it
+"""
+
+
 # Stdlib imports
-from pathlib import Path
+import hashlib
 import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
 
-# Third-party imports
-import psycopg2
 
 # Path/bootstrap
 # Go two levels up (src/db → project root) so src.* imports work.
 PROJECT_ROOT = Path(__file__).resolve().parents[2]
 sys.path.insert(0, str(PROJECT_ROOT))
 
+
 # Internal imports
-from src.db.connection import db_connection, check_connection
+from src import config
+from src.db.connection import db_connection, check_connection, managed_connection
+from src.db import sql_repo as sqlrepo
+from src.db.utils import instrumentation
 from src.db.utils.db_introspect import fetch_db_schema_DfOutput
+from src.db.utils.sql_statements import is_parallel_index, split_statements
 from src.utils.logger import logger
 
 
@@ -22,7 +52,11 @@ SQL_DIR = PROJECT_ROOT / "src" / "sql"
 
 FILES = [
     "01_schema.sql",
-    "02_seed.sql"
+    "02_seed.sql",
+    "03_marts.sql",
+    "04_mart_incremental.sql",
+    "05_star_schema.sql",
+    "06_extended_statistics.sql",
 ]
 
 # initial connectivity check, keep logic as-is
@@ -31,34 +65,108 @@ logger.info(f"Loading the following files to DB {FILES}")
 
 
 
-# helpers
-def _run_sql_file(conn, path: Path):
+class MigrationChecksumError(RuntimeError):
     """
-    Execute the full contents of a .sql file in one cursor/transaction.
-    Commits after successful execution.
+    An already applied SQL file was changed afterwards.
     """
-    with conn.cursor() as cur, open(path, "r", encoding="utf-8") as f:
-        cur.execute(f.read())
+
+
+
+# helpers
+def file_checksum(path: Path) -> str:
+    return hashlib.sha256(path.read_bytes()).hexdigest()
+
+def _applied_migrations(conn) -> dict:
+    with conn.cursor() as cur:
+        cur.execute(sqlrepo.CREATE_SCHEMA_MIGRATIONS)
+        cur.execute(sqlrepo.CREATE_SCHEMA_DEFERRED_INDEXES)
+        cur.execute(sqlrepo.FETCH_APPLIED_MIGRATIONS)
+        applied = dict(cur.fetchall())
     conn.commit()
+    return applied
+
+def _build_index(filename: str, position: int, statement: str):
+    with managed_connection(commit=True) as conn, conn.cursor() as cur:
+        t0 = time.perf_counter()
+        cur.execute(statement)
+        duration_ms = round((time.perf_counter() - t0) * 1000, 3)
+        cur.execute(sqlrepo.MARK_DEFERRED_INDEX_BUILT, (duration_ms, filename, position))
+
+def _run_sql_file(conn, path: Path, checksum: str):
+    """
+    Execute a .sql file statement by statement, queue its plain indexes and record the
+    migration, all in one transaction.
+    """
+    statements = split_statements(path.read_text(encoding="utf-8"))
+
+    t0 = time.perf_counter()
+    try:
+        with conn.cursor() as cur:
+            deferred = 0
+            for position, statement in enumerate(statements):
+                if is_parallel_index(statement):
+                    cur.execute(sqlrepo.INSERT_DEFERRED_INDEX, (path.name, position, statement))
+                    deferred += 1
+                else:
+                    cur.execute(statement)
+            duration_ms = round((time.perf_counter() - t0) * 1000, 3)
+            cur.execute(sqlrepo.INSERT_SCHEMA_MIGRATION, (path.name, checksum, duration_ms))
+        conn.commit()
+    except Exception:
+        conn.rollback()
+        raise
+    logger.info(f"Ran {path.name} without errors ({duration_ms} ms, {deferred} indexes deferred)")
 
 
 
 # main routine
 def run_sql_files():
+    """
+    Apply every pending file of FILES; raises on the first failure.
+    """
     conn = db_connection()
-    for fname in FILES:
-        try:
-            _run_sql_file(conn, SQL_DIR / fname)
-            logger.info(f"Ran {fname} without errors")
-        except psycopg2.Error as e:
-            logger.exception(e)
-    conn.close()
+    try:
+        applied = _applied_migrations(conn)
+        for fname in FILES:
+            path = SQL_DIR / fname
+            checksum = file_checksum(path)
+            if fname in applied:
+                if applied[fname].strip() != checksum:
+                    raise MigrationChecksumError(f"{fname} changed after it was applied")
+                logger.info(f"Skipped {fname} (already applied)")
+                continue
+            _run_sql_file(conn, path, checksum)
+    finally:
+        conn.close()
 
     # run schema introspection at the end
     fetch_db_schema_DfOutput()
 
+def build_deferred_indexes(workers: int = None):
+    """
+    Build the pending deferred indexes over `workers` connections (default MIGRATION_WORKERS);
+    re-raises the first failure, the failed and unfinished indexes stay pending.
+    """
+    workers = workers or config.MIGRATION_WORKERS
+    with managed_connection(commit=True) as conn, conn.cursor() as cur:
+        cur.execute(sqlrepo.CREATE_SCHEMA_DEFERRED_INDEXES)
+        cur.execute(sqlrepo.FETCH_PENDING_DEFERRED_INDEXES)
+        pending = cur.fetchall()
+    if not pending:
+        logger.info("No deferred indexes pending")
+        return
+
+    t0 = time.perf_counter()
+    build_index = instrumentation.in_active_stage(_build_index)
+    with ThreadPoolExecutor(max_workers=max(1, workers)) as pool:
+        futures = [pool.submit(build_index, *row) for row in pending]
+        for future in futures:
+            future.result()
+    logger.info(f"Built {len(pending)} deferred indexes in {time.perf_counter() - t0:.3f}s ({workers} workers)")
+
 
 
 # CLI entrypoint
 if __name__ == "__main__":
-    run_sql_files()
\ No newline at end of file
+    run_sql_files()
+    build_deferred_indexes()
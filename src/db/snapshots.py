@@ -0,0 +1,219 @@
+"""
+snapshots.py
+
+Save and restore seeded databases so repeated test/benchmark cycles skip the data generation.
+
+A snapshot is keyed by (schema checksum, generator profile, RNG seed). The schema checksum covers
+every SQL file in src/sql, src/main.py (the pipeline stages) and every module under src/db, so
+editing any of them invalidates existing snapshots instead of restoring stale data. The generator
+profile is SCALE_PROFILE plus DATA_DISTRIBUTION and PASSWORD_HASH(_COST) when they differ from
+the defaults (generator_profile()).
+
+Modes:
+- template: `CREATE DATABASE snap_... TEMPLATE <DB_NAME>`; restoring drops DB_NAME and clones it
+  back from the template (file-level copy inside the server, fastest)
+- dump: pg_dump custom-format archive in snapshots/<name>.dump, restored with pg_restore; survives
+  a teardown of the container volume. pg_dump/pg_restore run inside the container (docker exec),
+  so their version always matches the server
+
+Assumptions:
+- CREATE/DROP DATABASE run on the maintenance database "postgres"
+- nothing else is connected to DB_NAME while saving or restoring; remaining sessions are terminated
+- template snapshots are set to ALLOW_CONNECTIONS false so they cannot be changed by accident
+"""
+
+
+# Stdlib imports
+import argparse
+import hashlib
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+
+# Third-party imports
+from psycopg2 import sql
+
+
+# Path/bootstrap
+# Go two levels up (src/db → project root) so src.* imports work.
+PROJECT_ROOT = Path(__file__).resolve().parents[2]
+sys.path.insert(0, str(PROJECT_ROOT))
+
+
+# Internal imports
+from src import config
+import src.db.data_lists as seeds
+from src.db import run_sql_files as setup
+from src.db import sql_repo as sqlrepo
+from src.db.connection import managed_connection
+from src.utils.logger import logger
+
+
+
+SNAPSHOT_PREFIX = "snap_"
+SNAPSHOT_DIR = PROJECT_ROOT / "snapshots"
+MAINTENANCE_DB = "postgres"
+MODES = ("template", "dump")
+
+# Python sources that decide what ends up in a snapshot (next to every SQL file in setup.SQL_DIR)
+PIPELINE_SOURCE = PROJECT_ROOT / "src" / "main.py"
+DB_SOURCE_DIR = PROJECT_ROOT / "src" / "db"
+
+
+
+# Snapshot keys
+def snapshot_sources() -> list:
+    """
+    Every SQL file, src/main.py and every module under src/db, in a stable order.
+    """
+    return sorted(setup.SQL_DIR.glob("*.sql")) + [PIPELINE_SOURCE] + sorted(DB_SOURCE_DIR.rglob("*.py"))
+
+def schema_checksum() -> str:
+    """
+    SHA-256 over snapshot_sources() (relative paths and contents).
+    """
+    digest = hashlib.sha256()
+    for path in snapshot_sources():
+        digest.update(path.relative_to(PROJECT_ROOT).as_posix().encode())
+        digest.update(setup.file_checksum(path).encode())
+    return digest.hexdigest()
+
+def generator_profile(scale: str = None) -> str:
+    """
+    Profile part of the key: `scale` (default SCALE_PROFILE), suffixed with a non-uniform
+    DATA_DISTRIBUTION and the password hash algorithm and cost if hashing is on.
+    """
+    profile = scale or config.SCALE_PROFILE
+    if config.DATA_DISTRIBUTION != "uniform":
+        profile += f"_{config.DATA_DISTRIBUTION}"
+    if config.PASSWORD_HASH != "off":
+        profile += f"_{config.PASSWORD_HASH}{config.PASSWORD_HASH_COST}"
+    return profile
+
+def snapshot_name(checksum: str, profile: str, seed: int) -> str:
+    """
+    Database/file name of the snapshot for a key (well below the 63 byte identifier limit).
+    """
+    return f"{SNAPSHOT_PREFIX}{profile}_s{seed}_{checksum[:12]}".lower()
+
+def current_snapshot_name(seed: int, scale: str = None) -> str:
+    return snapshot_name(schema_checksum(), generator_profile(scale), seed)
+
+def dump_path(name: str) -> Path:
+    return SNAPSHOT_DIR / f"{name}.dump"
+
+
+
+# Helpers
+def _maintenance_cursor(conn):
+    conn.autocommit = True
+    return conn.cursor()
+
+def _recreate_database(cur, dbname: str, template: str = None):
+    cur.execute(sqlrepo.TERMINATE_DATABASE_CONNECTIONS, (dbname,))
+    cur.execute(sql.SQL(sqlrepo.DROP_DATABASE).format(sql.Identifier(dbname)))
+    if template:
+        cur.execute(sql.SQL(sqlrepo.CREATE_DATABASE_FROM_TEMPLATE).format(
+            target=sql.Identifier(dbname),
+            template=sql.Identifier(template),
+        ))
+    else:
+        cur.execute(sql.SQL(sqlrepo.CREATE_DATABASE).format(sql.Identifier(dbname)))
+
+def _docker_exec(*args) -> list:
+    return ["docker", "exec", "-i", config.DOCKER_PROFILE, *args]
+
+
+
+# Snapshot handling
+def list_snapshots() -> list:
+    """
+    Return [{"name", "mode"}] for all template databases and dump archives.
+    """
+    with managed_connection(dbname=MAINTENANCE_DB) as conn, _maintenance_cursor(conn) as cur:
+        cur.execute(sqlrepo.FETCH_SNAPSHOT_DATABASES, (SNAPSHOT_PREFIX,))
+        snapshots = [{"name": row[0], "mode": "template"} for row in cur.fetchall()]
+    snapshots += [{"name": path.stem, "mode": "dump"} for path in sorted(SNAPSHOT_DIR.glob(f"{SNAPSHOT_PREFIX}*.dump"))]
+    return snapshots
+
+def snapshot_exists(name: str, mode: str) -> bool:
+    return {"name": name, "mode": mode} in list_snapshots()
+
+def save_snapshot(name: str, mode: str):
+    """
+    Save the current state of DB_NAME as snapshot `name` (an existing one is replaced).
+    """
+    t0 = time.perf_counter()
+    if mode == "template":
+        with managed_connection(dbname=MAINTENANCE_DB) as conn, _maintenance_cursor(conn) as cur:
+            cur.execute(sqlrepo.TERMINATE_DATABASE_CONNECTIONS, (config.DB_NAME,))
+            _recreate_database(cur, name, template=config.DB_NAME)
+            cur.execute(sql.SQL(sqlrepo.SET_DATABASE_ALLOW_CONNECTIONS).format(sql.Identifier(name)), (False,))
+    else:
+        SNAPSHOT_DIR.mkdir(parents=True, exist_ok=True)
+        partial = dump_path(name).with_suffix(".partial")
+        with open(partial, "wb") as f:
+            subprocess.run(_docker_exec("pg_dump", "-U", config.DB_USER, "-Fc", config.DB_NAME), stdout=f, check=True)
+        partial.replace(dump_path(name))
+
+    logger.info(f"Saved snapshot {name} ({mode}) in {time.perf_counter() - t0:.3f}s")
+
+def restore_snapshot(name: str, mode: str):
+    """
+    Replace DB_NAME with snapshot `name`.
+    """
+    t0 = time.perf_counter()
+    with managed_connection(dbname=MAINTENANCE_DB) as conn, _maintenance_cursor(conn) as cur:
+        _recreate_database(cur, config.DB_NAME, template=name if mode == "template" else None)
+
+    if mode == "dump":
+        with open(dump_path(name), "rb") as f:
+            subprocess.run(
+                _docker_exec("pg_restore", "-U", config.DB_USER, "-d", config.DB_NAME, "--exit-on-error"),
+                stdin=f,
+                check=True,
+            )
+
+    logger.info(f"Restored snapshot {name} ({mode}) in {time.perf_counter() - t0:.3f}s")
+
+def recreate_database(dbname: str, template: str = None):
+    """
+    Drop and create database `dbname`, empty or cloned from template snapshot `template`.
+    """
+    with managed_connection(dbname=MAINTENANCE_DB) as conn, _maintenance_cursor(conn) as cur:
+        _recreate_database(cur, dbname, template=template)
+
+def drop_database(dbname: str):
+    with managed_connection(dbname=MAINTENANCE_DB) as conn, _maintenance_cursor(conn) as cur:
+        cur.execute(sqlrepo.TERMINATE_DATABASE_CONNECTIONS, (dbname,))
+        cur.execute(sql.SQL(sqlrepo.DROP_DATABASE).format(sql.Identifier(dbname)))
+
+def drop_snapshot(name: str, mode: str):
+    if mode == "template":
+        drop_database(name)
+    else:
+        dump_path(name).unlink(missing_ok=True)
+    logger.info(f"Dropped snapshot {name} ({mode})")
+
+
+
+# CLI entrypoint
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Save, restore and list seeded database snapshots.")
+    parser.add_argument("action", choices=["list", "save", "restore", "drop"])
+    parser.add_argument("--profile", choices=list(seeds.scale_profiles), default=config.SCALE_PROFILE)
+    parser.add_argument("--seed", type=int, default=int(config.RNG_SEED) if config.RNG_SEED else None)
+    parser.add_argument("--mode", choices=MODES, default=config.DB_SNAPSHOT if config.DB_SNAPSHOT in MODES else "template")
+    args = parser.parse_args()
+
+    if args.action == "list":
+        for snapshot in list_snapshots():
+            print(f"{snapshot['mode']:<10} {snapshot['name']}")
+        sys.exit(0)
+
+    if args.seed is None:
+        parser.error("--seed (or RNG_SEED) is required to build the snapshot key")
+    name = current_snapshot_name(args.seed, args.profile)
+    {"save": save_snapshot, "restore": restore_snapshot, "drop": drop_snapshot}[args.action](name, args.mode)
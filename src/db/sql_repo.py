@@ -44,6 +44,30 @@ DUMP_TABLE = """
     FROM {};
 """
 
+FETCH_TABLE_COLUMN_TYPES = """
+    SELECT a.attname, t.typname, t.typtype
+    FROM pg_attribute a
+    JOIN pg_type t ON t.oid = a.atttypid
+    WHERE a.attrelid = %s::regclass
+      AND a.attnum > 0
+      AND NOT a.attisdropped
+    ORDER BY a.attnum;
+"""
+
+SELECT_COLUMNS = """
+    SELECT {cols}
+    FROM {tbl};
+"""
+
+# first statement of an export: every table is read from the same snapshot
+SET_EXPORT_TRANSACTION = """
+    SET TRANSACTION ISOLATION LEVEL REPEATABLE READ READ ONLY;
+"""
+
+COPY_TABLE_TO_CSV = """
+    COPY {} TO STDOUT WITH (FORMAT csv, HEADER true);
+"""
+
 
 # 2. Drop all data from a specific table
 DROP_ALL_TABLE_DATA = """
@@ -84,6 +108,12 @@ FETCH_GUEST_IDS = """
     WHERE role = 'guest';
 """
 
+FETCH_PAYMENT_IDS = """
+    SELECT id
+    FROM payments
+    ORDER BY id;
+"""
+
 FETCH_FIRST_PAYMENTMETHOD_ID_FOR_USER = """
     SELECT id
     FROM payment_methods
@@ -161,55 +191,16 @@ INSERT_PAYOUT_ACCOUNTS = """
     VALUES (%s, %s, %s);
 """
 
-INSERT_IMAGES = """
-    INSERT INTO images (mime, storage_key, created_at)
-    VALUES (%s, %s, %s);
-"""
-
 INSERT_ACCOMMODATION_AMENITIES = """
     INSERT INTO accommodation_amenities (accommodation_id, amenity_id)
     VALUES (%s, %s);
 """
 
-INSERT_BOOKINGS = """
-    INSERT INTO bookings (
-        guest_account_id,
-        accommodation_id,
-        start_date,
-        end_date,
-        payment_id,
-        status,
-        created_at
-    )
-    VALUES (%s, %s, %s, %s, %s, %s, %s);
-"""
-
-INSERT_ACCOMMODATION_CALENDAR = """
-    INSERT INTO accommodation_calendar (
-        accommodation_id,
-        day,
-        is_blocked,
-        price_addition_cents,
-        min_nights
-    )
-    VALUES (%s, %s, %s, %s, %s);
-"""
-
 INSERT_CONVERSATIONS = """
     INSERT INTO conversations (created_at)
     VALUES (%s);
 """
 
-INSERT_ADDRESSES = """
-    INSERT INTO addresses (line1, line2, city, postal_code, country)
-    VALUES (%s, %s, %s, %s, %s);
-"""
-
-INSERT_NOTIFICATIONS = """
-    INSERT INTO notifications (account_id, payload, sent_at)
-    VALUES (%s, %s, %s);
-"""
-
 INSERT_CREDIT_CARDS = """
     INSERT INTO credit_cards (
         payment_method_id,
@@ -233,27 +224,11 @@ INSERT_ACCOMMODATION_IMAGES = """
     VALUES (%s, %s, %s, %s, %s, %s);
 """
 
-INSERT_PAYMENTS = """
-    INSERT INTO payments (
-        customer_id,
-        amount_cents,
-        status,
-        payment_method_id
-    )
-    VALUES (%s, %s, %s, %s)
-    RETURNING id;
-"""
-
 INSERT_CREDENTIALS = """
     INSERT INTO credentials (account_id, password_hash, password_updated_at)
     VALUES (%s, %s, %s);
 """
 
-INSERT_ACCOUNTS = """
-    INSERT INTO accounts (email, first_name, last_name, role, created_at)
-    VALUES (%s, %s, %s, %s, %s);
-"""
-
 INSERT_ACCOMMODATIONS = """
     INSERT INTO accommodations (
         host_account_id,
@@ -320,3 +295,926 @@ INSERT_PAYPAL = """
     INSERT INTO paypal (payment_method_id, paypal_user_id, email)
     VALUES (%s, %s, %s);
 """
+
+
+# 10. Bulk loading via COPY
+COPY_TABLE_FROM_BINARY = """
+    COPY {tbl} ({cols}) FROM STDIN WITH (FORMAT binary);
+"""
+
+COPY_TABLE_FROM_CSV = """
+    COPY {tbl} ({cols}) FROM STDIN WITH (FORMAT csv);
+"""
+
+CREATE_TEMP_TABLE_LIKE = """
+    CREATE TEMP TABLE {tmp} (LIKE {tbl} INCLUDING DEFAULTS) ON COMMIT DROP;
+"""
+
+INSERT_ROWS = """
+    INSERT INTO {tbl} ({cols})
+    VALUES ({vals});
+"""
+
+
+# 11. Benchmark measurements
+COUNT_ROWS = """
+    SELECT COUNT(*)
+    FROM {};
+"""
+
+FETCH_WAL_LSN = """
+    SELECT pg_current_wal_lsn();
+"""
+
+FETCH_WAL_BYTES_SINCE = """
+    SELECT pg_wal_lsn_diff(pg_current_wal_lsn(), %s)::bigint;
+"""
+
+FETCH_HAS_PG_STAT_STATEMENTS = """
+    SELECT EXISTS (
+        SELECT 1
+        FROM pg_extension
+        WHERE extname = 'pg_stat_statements'
+    );
+"""
+
+CREATE_PG_STAT_STATEMENTS = """
+    CREATE EXTENSION pg_stat_statements;
+"""
+
+FETCH_STATEMENT_CALLS = """
+    SELECT COALESCE(SUM(calls), 0)::bigint
+    FROM pg_stat_statements
+    WHERE dbid = (SELECT oid FROM pg_database WHERE datname = current_database());
+"""
+
+FETCH_SERVER_VERSION = """
+    SHOW server_version;
+"""
+
+
+# 12. Customer journey workload (mirrors tests/integration/test_business_logic.py)
+JOURNEY_SEARCH_ACTIVE_ACCOMMODATIONS = """
+    SELECT a.id, a.title, a.price_cents
+    FROM accommodations a
+    JOIN addresses ad ON ad.id = a.address_id
+    WHERE a.is_active = TRUE
+      AND ad.city = %s
+    ORDER BY a.id
+    LIMIT 50;
+"""
+
+JOURNEY_FETCH_PRICE = """
+    SELECT price_cents
+    FROM accommodations
+    WHERE id = %s;
+"""
+
+JOURNEY_SUM_PRICE_ADDITIONS = """
+    SELECT COALESCE(SUM(price_addition_cents), 0)
+    FROM accommodation_calendar
+    WHERE accommodation_id = %s
+      AND day >= %s
+      AND day < %s;
+"""
+
+JOURNEY_FETCH_IMAGES = """
+    SELECT i.storage_key, ai.is_cover, ai.sort_order
+    FROM accommodation_images ai
+    JOIN images i ON i.id = ai.image_id
+    WHERE ai.accommodation_id = %s
+    ORDER BY ai.sort_order;
+"""
+
+JOURNEY_FETCH_AVAILABLE_DAYS = """
+    SELECT day, price_addition_cents, min_nights
+    FROM accommodation_calendar
+    WHERE accommodation_id = %s
+      AND is_blocked = FALSE
+    ORDER BY day;
+"""
+
+JOURNEY_COUNT_BLOCKED_DAYS = """
+    SELECT COUNT(*)
+    FROM accommodation_calendar
+    WHERE accommodation_id = %s
+      AND day >= %s
+      AND day < %s
+      AND is_blocked = TRUE;
+"""
+
+JOURNEY_INSERT_PENDING_BOOKING = """
+    INSERT INTO bookings (
+        guest_account_id, accommodation_id, start_date, end_date, payment_id, status
+    )
+    VALUES (%s, %s, %s, %s, NULL, 'pending')
+    RETURNING id;
+"""
+
+JOURNEY_INSERT_OPEN_PAYMENT = """
+    INSERT INTO payments (customer_id, amount_cents, status, payment_method_id)
+    VALUES (%s, %s, 'open', %s)
+    RETURNING id;
+"""
+
+JOURNEY_LINK_PAYMENT_TO_BOOKING = """
+    UPDATE bookings
+    SET payment_id = %s
+    WHERE id = %s;
+"""
+
+JOURNEY_MARK_PAYMENT_PAYED = """
+    UPDATE payments
+    SET status = 'payed'
+    WHERE id = %s;
+"""
+
+JOURNEY_SET_BOOKING_STATUS = """
+    UPDATE bookings
+    SET status = %s
+    WHERE id = %s;
+"""
+
+JOURNEY_BLOCK_DAYS = """
+    UPDATE accommodation_calendar
+    SET is_blocked = TRUE
+    WHERE accommodation_id = %s
+      AND day >= %s
+      AND day < %s;
+"""
+
+JOURNEY_INSERT_CONVERSATION = """
+    INSERT INTO conversations DEFAULT VALUES
+    RETURNING id;
+"""
+
+JOURNEY_INSERT_MESSAGE = """
+    INSERT INTO messages (sender_id, receiver_id, conversation_id, body)
+    VALUES (%s, %s, %s, %s);
+"""
+
+JOURNEY_INSERT_NOTIFICATION = """
+    INSERT INTO notifications (account_id, payload)
+    VALUES (%s, '{"type":"booking_confirmed"}');
+"""
+
+JOURNEY_INSERT_REVIEW = """
+    INSERT INTO reviews (accommodation_id, author_account_id, rating, description)
+    VALUES (%s, %s, %s, %s)
+    RETURNING id;
+"""
+
+JOURNEY_FETCH_DEFAULT_PAYOUT_ACCOUNT = """
+    SELECT id
+    FROM payout_accounts
+    WHERE host_account_id = %s
+    ORDER BY is_default DESC, id
+    LIMIT 1;
+"""
+
+JOURNEY_INSERT_PAYOUT = """
+    INSERT INTO payouts (
+        host_account_id, payout_account_id, booking_id, amount_cents, currency, status
+    )
+    VALUES (%s, %s, %s, %s, 'EUR', 'scheduled');
+"""
+
+JOURNEY_FINAL_JOIN = """
+    SELECT
+        b.id, b.status, p.amount_cents, p.status, pm.type,
+        a.title, r.rating, guest.email, host.email
+    FROM bookings b
+    JOIN payments p ON p.id = b.payment_id
+    JOIN payment_methods pm ON pm.id = p.payment_method_id
+    JOIN accommodations a ON a.id = b.accommodation_id
+    JOIN reviews r ON r.accommodation_id = a.id
+    JOIN accounts guest ON guest.id = b.guest_account_id
+    JOIN accounts host ON host.id = a.host_account_id
+    WHERE b.id = %s
+      AND r.id = %s;
+"""
+
+WORKLOAD_ACTIVE_ACCOMMODATIONS = """
+    SELECT a.id, a.host_account_id, ad.city
+    FROM accommodations a
+    JOIN addresses ad ON ad.id = a.address_id
+    WHERE a.is_active = TRUE;
+"""
+
+WORKLOAD_GUESTS_WITH_PAYMENT_METHOD = """
+    SELECT DISTINCT ON (pm.customer_id) pm.customer_id, pm.id
+    FROM payment_methods pm
+    JOIN accounts acc ON acc.id = pm.customer_id
+    WHERE acc.role = 'guest'
+    ORDER BY pm.customer_id, pm.id;
+"""
+
+
+# 13. Query plan catalogue (benchmarks/bench_plans.py)
+EXPLAIN_ANALYZE = """
+    EXPLAIN (ANALYZE, BUFFERS, FORMAT JSON)
+"""
+
+PLAN_SAMPLE_PARAMETERS = """
+    SELECT
+        b.id AS booking_id,
+        b.accommodation_id,
+        b.guest_account_id,
+        b.start_date,
+        b.end_date,
+        r.id AS review_id,
+        a.host_account_id,
+        ad.city,
+        (SELECT conversation_id FROM messages ORDER BY conversation_id LIMIT 1) AS conversation_id,
+        (SELECT account_id FROM notifications ORDER BY account_id LIMIT 1) AS notification_account_id
+    FROM bookings b
+    JOIN payments p ON p.id = b.payment_id
+    JOIN accommodations a ON a.id = b.accommodation_id
+    JOIN addresses ad ON ad.id = a.address_id
+    JOIN reviews r ON r.accommodation_id = a.id
+    ORDER BY b.id, r.id
+    LIMIT 1;
+"""
+
+PLAN_OVERLAPPING_BOOKINGS = """
+    SELECT id, guest_account_id, status
+    FROM bookings
+    WHERE accommodation_id = %s
+      AND start_date < %s
+      AND end_date > %s;
+"""
+
+PLAN_CONVERSATION_HISTORY = """
+    SELECT sender_id, receiver_id, body, sent_at
+    FROM messages
+    WHERE conversation_id = %s
+    ORDER BY sent_at;
+"""
+
+PLAN_RECENT_REVIEWS = """
+    SELECT id, author_account_id, rating, created_at
+    FROM reviews
+    WHERE accommodation_id = %s
+    ORDER BY created_at DESC
+    LIMIT 10;
+"""
+
+PLAN_HOST_ACTIVE_LISTINGS = """
+    SELECT id, title, price_cents
+    FROM accommodations
+    WHERE host_account_id = %s
+      AND is_active = TRUE;
+"""
+
+PLAN_RECENT_NOTIFICATIONS = """
+    SELECT id, payload, sent_at
+    FROM notifications
+    WHERE account_id = %s
+    ORDER BY sent_at DESC
+    LIMIT 20;
+"""
+
+
+# 14. Index advisor (pg_index / pg_stat_user_indexes)
+FETCH_INDEX_USAGE = """
+    SELECT
+        t.relname AS table_name,
+        c.relname AS index_name,
+        ARRAY(
+            SELECT a.attname::text
+            FROM unnest(i.indkey::int2[]) WITH ORDINALITY AS k(attnum, ord)
+            JOIN pg_attribute a ON a.attrelid = i.indrelid AND a.attnum = k.attnum
+            ORDER BY k.ord
+        ) AS columns,
+        i.indisprimary AS is_primary,
+        i.indisunique AS is_unique,
+        (i.indexprs IS NOT NULL OR i.indpred IS NOT NULL) AS is_partial_or_expression,
+        am.amname AS method,
+        pg_relation_size(i.indexrelid) AS size_bytes,
+        COALESCE(s.idx_scan, 0) AS idx_scan,
+        COALESCE(ts.n_tup_ins + ts.n_tup_upd - ts.n_tup_hot_upd, 0) AS index_writes
+    FROM pg_index i
+    JOIN pg_class c ON c.oid = i.indexrelid
+    JOIN pg_class t ON t.oid = i.indrelid
+    JOIN pg_namespace n ON n.oid = t.relnamespace
+    JOIN pg_am am ON am.oid = c.relam
+    LEFT JOIN pg_stat_user_indexes s ON s.indexrelid = i.indexrelid
+    LEFT JOIN pg_stat_user_tables ts ON ts.relid = i.indrelid
+    WHERE n.nspname = 'public'
+    ORDER BY t.relname, c.relname;
+"""
+
+FETCH_TABLE_SCAN_STATS = """
+    SELECT
+        relname AS table_name,
+        seq_scan,
+        seq_tup_read,
+        COALESCE(idx_scan, 0) AS idx_scan,
+        n_live_tup
+    FROM pg_stat_user_tables
+    WHERE schemaname = 'public'
+    ORDER BY seq_tup_read DESC;
+"""
+
+FETCH_FOREIGN_KEY_COLUMNS = """
+    SELECT
+        t.relname AS table_name,
+        con.conname AS constraint_name,
+        ARRAY(
+            SELECT a.attname::text
+            FROM unnest(con.conkey) WITH ORDINALITY AS k(attnum, ord)
+            JOIN pg_attribute a ON a.attrelid = con.conrelid AND a.attnum = k.attnum
+            ORDER BY k.ord
+        ) AS columns
+    FROM pg_constraint con
+    JOIN pg_class t ON t.oid = con.conrelid
+    JOIN pg_namespace n ON n.oid = t.relnamespace
+    WHERE con.contype = 'f'
+      AND n.nspname = 'public'
+    ORDER BY t.relname, con.conname;
+"""
+
+RESET_STATISTICS = """
+    SELECT pg_stat_reset();
+"""
+
+
+# 15. Reporting marts (src/sql/03_marts.sql)
+FETCH_MART_IS_POPULATED = """
+    SELECT ispopulated
+    FROM pg_matviews
+    WHERE schemaname = 'public'
+      AND matviewname = %s;
+"""
+
+REFRESH_MATERIALIZED_VIEW = """
+    REFRESH MATERIALIZED VIEW {};
+"""
+
+REFRESH_MATERIALIZED_VIEW_CONCURRENTLY = """
+    REFRESH MATERIALIZED VIEW CONCURRENTLY {};
+"""
+
+INSERT_MART_REFRESH_LOG = """
+    INSERT INTO mart_refresh_log (mart_name, concurrent, duration_ms, row_count)
+    VALUES (%s, %s, %s, %s);
+"""
+
+
+# 16. Incremental mart maintenance (src/sql/04_mart_incremental.sql)
+# Delta queries work on two temp tables: mart_delta (consumed change rows) and
+# mart_delta_keys (aggregate keys of one mart); aggregate bodies mirror 03_marts.sql.
+CONSUME_MART_CHANGES = """
+    CREATE TEMP TABLE mart_delta ON COMMIT DROP AS
+    SELECT *
+    FROM mart_changes
+    WITH NO DATA;
+
+    WITH consumed AS (
+        DELETE FROM mart_changes
+        RETURNING *
+    )
+    INSERT INTO mart_delta
+    SELECT * FROM consumed;
+"""
+
+DROP_MART_DELTA = """
+    DROP TABLE mart_delta;
+"""
+
+CREATE_MART_DELTA_KEYS = """
+    CREATE TEMP TABLE mart_delta_keys ON COMMIT DROP AS {};
+"""
+
+DROP_MART_DELTA_KEYS = """
+    DROP TABLE mart_delta_keys;
+"""
+
+DELETE_MART_DELTA_KEYS = """
+    DELETE FROM {agg}
+    WHERE ({cols}) IN (SELECT {cols} FROM mart_delta_keys);
+"""
+
+MART_DELTA_KEYS_DAILY_REVENUE = """
+    SELECT DISTINCT d.day, a.host_account_id, ad.city
+    FROM mart_delta d
+    JOIN accommodations a ON a.id = d.accommodation_id
+    JOIN addresses ad ON ad.id = a.address_id
+    WHERE d.day IS NOT NULL
+"""
+
+MART_DELTA_INSERT_DAILY_REVENUE = """
+    INSERT INTO agg_daily_revenue
+    SELECT
+        b.start_date::date AS day,
+        a.host_account_id,
+        ad.city,
+        COUNT(*) AS bookings,
+        SUM(p.amount_cents)::bigint AS revenue_cents
+    FROM bookings b
+    JOIN payments p ON p.id = b.payment_id
+    JOIN accommodations a ON a.id = b.accommodation_id
+    JOIN addresses ad ON ad.id = a.address_id
+    WHERE b.status IN ('confirmed', 'completed')
+      AND p.status = 'payed'
+      AND a.host_account_id IN (SELECT host_account_id FROM mart_delta_keys)
+      AND (b.start_date::date, a.host_account_id, ad.city) IN (SELECT day, host_account_id, city FROM mart_delta_keys)
+    GROUP BY 1, 2, 3;
+"""
+
+MART_DELTA_KEYS_MONTHLY_OCCUPANCY = """
+    SELECT DISTINCT accommodation_id
+    FROM mart_delta
+    WHERE source_table = 'bookings'
+"""
+
+MART_DELTA_INSERT_MONTHLY_OCCUPANCY = """
+    INSERT INTO agg_monthly_occupancy
+    SELECT
+        b.accommodation_id,
+        date_trunc('month', night)::date AS month,
+        COUNT(DISTINCT night) AS booked_nights,
+        EXTRACT(DAY FROM date_trunc('month', night) + INTERVAL '1 month' - INTERVAL '1 day')::int AS days_in_month,
+        ROUND(
+            COUNT(DISTINCT night)::numeric
+            / EXTRACT(DAY FROM date_trunc('month', night) + INTERVAL '1 month' - INTERVAL '1 day'),
+            4
+        ) AS occupancy_rate
+    FROM bookings b
+    CROSS JOIN LATERAL generate_series(b.start_date::date, b.end_date::date - 1, INTERVAL '1 day') AS night
+    WHERE b.status IN ('confirmed', 'completed')
+      AND b.accommodation_id IN (SELECT accommodation_id FROM mart_delta_keys)
+    GROUP BY b.accommodation_id, date_trunc('month', night);
+"""
+
+MART_DELTA_KEYS_REVIEW_RATINGS = """
+    SELECT DISTINCT accommodation_id
+    FROM mart_delta
+    WHERE source_table = 'reviews'
+"""
+
+MART_DELTA_INSERT_REVIEW_RATINGS = """
+    INSERT INTO agg_review_ratings
+    SELECT
+        accommodation_id,
+        COUNT(*) AS reviews,
+        ROUND(AVG(rating), 2) AS avg_rating,
+        MIN(rating) AS min_rating,
+        MAX(rating) AS max_rating,
+        COUNT(*) FILTER (WHERE rating = 1) AS rating_1,
+        COUNT(*) FILTER (WHERE rating = 2) AS rating_2,
+        COUNT(*) FILTER (WHERE rating = 3) AS rating_3,
+        COUNT(*) FILTER (WHERE rating = 4) AS rating_4,
+        COUNT(*) FILTER (WHERE rating = 5) AS rating_5,
+        MAX(created_at) AS last_review_at
+    FROM reviews
+    WHERE accommodation_id IN (SELECT accommodation_id FROM mart_delta_keys)
+    GROUP BY accommodation_id;
+"""
+
+MART_DELTA_KEYS_PAYOUT_RECONCILIATION = """
+    SELECT DISTINCT booking_id
+    FROM mart_delta
+    WHERE booking_id IS NOT NULL
+"""
+
+MART_DELTA_INSERT_PAYOUT_RECONCILIATION = """
+    INSERT INTO agg_payout_reconciliation
+    SELECT
+        r.*,
+        r.payed_cents - r.payout_cents AS difference_cents,
+        CASE
+            WHEN r.payouts = 0 THEN 'no_payout'
+            WHEN r.payed_cents = r.payout_cents THEN 'balanced'
+            WHEN r.payed_cents > r.payout_cents THEN 'underpaid'
+            ELSE 'overpaid'
+        END AS reconciliation_status
+    FROM (
+        SELECT
+            b.id AS booking_id,
+            a.host_account_id,
+            b.payment_id,
+            COALESCE(MAX(p.amount_cents) FILTER (WHERE p.status = 'payed'), 0) AS payed_cents,
+            COALESCE(SUM(po.amount_cents), 0)::bigint AS payout_cents,
+            COUNT(po.id) AS payouts
+        FROM bookings b
+        JOIN accommodations a ON a.id = b.accommodation_id
+        LEFT JOIN payments p ON p.id = b.payment_id
+        LEFT JOIN payouts po ON po.booking_id = b.id
+        WHERE b.status IN ('confirmed', 'completed')
+          AND b.id IN (SELECT booking_id FROM mart_delta_keys)
+        GROUP BY b.id, a.host_account_id, b.payment_id
+    ) r;
+"""
+
+TRUNCATE_MART_CHANGES = """
+    TRUNCATE mart_changes;
+"""
+
+SET_TABLE_TRIGGER = """
+    ALTER TABLE {table} {action} TRIGGER {trigger};
+"""
+
+TRUNCATE_TABLE = """
+    TRUNCATE {};
+"""
+
+COPY_MART_INTO_AGGREGATE = """
+    INSERT INTO {agg}
+    SELECT * FROM {mart};
+"""
+
+COUNT_AGGREGATE_MISMATCHES = """
+    SELECT COUNT(*)
+    FROM (
+        (SELECT * FROM {agg} EXCEPT ALL SELECT * FROM {mart})
+        UNION ALL
+        (SELECT * FROM {mart} EXCEPT ALL SELECT * FROM {agg})
+    ) diff;
+"""
+
+COUNT_PENDING_MART_CHANGES = """
+    SELECT COUNT(*)
+    FROM mart_changes;
+"""
+
+BENCH_SHIFT_BOOKING_END_DATES = """
+    UPDATE bookings
+    SET end_date = end_date + INTERVAL '1 day'
+    WHERE id IN (
+        SELECT id
+        FROM bookings
+        ORDER BY random()
+        LIMIT %s
+    );
+"""
+
+
+# 17. Star schema ETL (src/sql/05_star_schema.sql)
+STAR_TRUNCATE = """
+    TRUNCATE fact_payment, fact_booking, dim_accommodation, dim_account, dim_location, etl_watermarks
+    RESTART IDENTITY;
+"""
+
+STAR_FETCH_SOURCE_DATE_RANGE = """
+    SELECT
+        LEAST(
+            (SELECT MIN(start_date)::date FROM bookings),
+            (SELECT MIN(created_at)::date FROM accounts)
+        ),
+        GREATEST(
+            (SELECT MAX(end_date)::date FROM bookings),
+            (SELECT MAX(created_at)::date FROM accounts)
+        );
+"""
+
+STAR_LOAD_DIM_DATE = """
+    INSERT INTO dim_date (
+        date_key, date, year, quarter, month, month_name, day, iso_week, day_of_week, is_weekend
+    )
+    SELECT
+        to_char(d, 'YYYYMMDD')::int,
+        d::date,
+        EXTRACT(YEAR FROM d),
+        EXTRACT(QUARTER FROM d),
+        EXTRACT(MONTH FROM d),
+        trim(to_char(d, 'Month')),
+        EXTRACT(DAY FROM d),
+        EXTRACT(WEEK FROM d),
+        EXTRACT(ISODOW FROM d),
+        EXTRACT(ISODOW FROM d) >= 6
+    FROM generate_series(%s::date, %s::date, INTERVAL '1 day') AS d
+    ON CONFLICT (date_key) DO NOTHING;
+"""
+
+STAR_LOAD_DIM_LOCATION = """
+    INSERT INTO dim_location (city, country)
+    SELECT DISTINCT city, country
+    FROM addresses
+    ON CONFLICT (city, country) DO NOTHING;
+"""
+
+STAR_LOAD_DIM_ACCOUNT = """
+    INSERT INTO dim_account (account_id, email, first_name, last_name, role, created_date_key)
+    SELECT acc.id, acc.email, acc.first_name, acc.last_name, acc.role, dd.date_key
+    FROM accounts acc
+    LEFT JOIN dim_date dd ON dd.date = acc.created_at::date
+    ON CONFLICT (account_id) DO UPDATE
+    SET email = EXCLUDED.email,
+        first_name = EXCLUDED.first_name,
+        last_name = EXCLUDED.last_name,
+        role = EXCLUDED.role,
+        created_date_key = EXCLUDED.created_date_key
+    WHERE (dim_account.email, dim_account.first_name, dim_account.last_name, dim_account.role, dim_account.created_date_key)
+        IS DISTINCT FROM (EXCLUDED.email, EXCLUDED.first_name, EXCLUDED.last_name, EXCLUDED.role, EXCLUDED.created_date_key);
+"""
+
+STAR_LOAD_DIM_ACCOMMODATION = """
+    INSERT INTO dim_accommodation (accommodation_id, host_account_key, location_key, title, price_cents, is_active)
+    SELECT a.id, host.account_key, loc.location_key, a.title, a.price_cents, a.is_active
+    FROM accommodations a
+    LEFT JOIN dim_account host ON host.account_id = a.host_account_id
+    LEFT JOIN addresses ad ON ad.id = a.address_id
+    LEFT JOIN dim_location loc ON loc.city = ad.city AND loc.country = ad.country
+    ON CONFLICT (accommodation_id) DO UPDATE
+    SET host_account_key = EXCLUDED.host_account_key,
+        location_key = EXCLUDED.location_key,
+        title = EXCLUDED.title,
+        price_cents = EXCLUDED.price_cents,
+        is_active = EXCLUDED.is_active
+    WHERE (dim_accommodation.host_account_key, dim_accommodation.location_key, dim_accommodation.title,
+           dim_accommodation.price_cents, dim_accommodation.is_active)
+        IS DISTINCT FROM (EXCLUDED.host_account_key, EXCLUDED.location_key, EXCLUDED.title,
+                          EXCLUDED.price_cents, EXCLUDED.is_active);
+"""
+
+STAR_LOAD_FACT_BOOKING = """
+    INSERT INTO fact_booking (
+        booking_id, guest_account_key, host_account_key, accommodation_key, location_key,
+        start_date_key, end_date_key, status, nights, amount_cents
+    )
+    SELECT
+        b.id,
+        guest.account_key,
+        da.host_account_key,
+        da.accommodation_key,
+        da.location_key,
+        start_dd.date_key,
+        end_dd.date_key,
+        b.status,
+        b.end_date::date - b.start_date::date,
+        p.amount_cents
+    FROM bookings b
+    LEFT JOIN dim_account guest ON guest.account_id = b.guest_account_id
+    LEFT JOIN dim_accommodation da ON da.accommodation_id = b.accommodation_id
+    LEFT JOIN dim_date start_dd ON start_dd.date = b.start_date::date
+    LEFT JOIN dim_date end_dd ON end_dd.date = b.end_date::date
+    LEFT JOIN payments p ON p.id = b.payment_id
+    WHERE b.id > %s
+    ORDER BY b.id;
+"""
+
+STAR_LOAD_FACT_PAYMENT = """
+    INSERT INTO fact_payment (
+        payment_id, customer_account_key, booking_id, service_date_key, method_type, status, amount_cents
+    )
+    SELECT
+        p.id,
+        customer.account_key,
+        b.id,
+        dd.date_key,
+        pm.type,
+        p.status,
+        p.amount_cents
+    FROM payments p
+    LEFT JOIN dim_account customer ON customer.account_id = p.customer_id
+    LEFT JOIN payment_methods pm ON pm.id = p.payment_method_id
+    LEFT JOIN LATERAL (
+        SELECT id, start_date
+        FROM bookings
+        WHERE payment_id = p.id
+        ORDER BY id
+        LIMIT 1
+    ) b ON TRUE
+    LEFT JOIN dim_date dd ON dd.date = b.start_date::date
+    WHERE p.id > %s
+    ORDER BY p.id;
+"""
+
+STAR_FETCH_WATERMARK = """
+    SELECT last_source_id
+    FROM etl_watermarks
+    WHERE fact_table = %s;
+"""
+
+STAR_UPSERT_WATERMARK = """
+    INSERT INTO etl_watermarks (fact_table, last_source_id, loaded_at)
+    SELECT %s, COALESCE(MAX({id_col}), 0), CURRENT_TIMESTAMP
+    FROM {fact}
+    ON CONFLICT (fact_table) DO UPDATE
+    SET last_source_id = EXCLUDED.last_source_id,
+        loaded_at = EXCLUDED.loaded_at;
+"""
+
+
+# 18. Partition management (src/sql/partitioned_schema.sql)
+FETCH_SCHEMA_EXISTS = """
+    SELECT EXISTS (
+        SELECT 1
+        FROM pg_namespace
+        WHERE nspname = %s
+    );
+"""
+
+CREATE_RANGE_PARTITION = """
+    CREATE TABLE IF NOT EXISTS {part} PARTITION OF {parent}
+    FOR VALUES FROM (%s) TO (%s);
+"""
+
+FETCH_PARTITIONS = """
+    SELECT c.relname
+    FROM pg_inherits i
+    JOIN pg_class c ON c.oid = i.inhrelid
+    JOIN pg_class p ON p.oid = i.inhparent
+    JOIN pg_namespace n ON n.oid = p.relnamespace
+    WHERE n.nspname = %s
+      AND p.relname = %s
+    ORDER BY c.relname;
+"""
+
+DETACH_PARTITION = """
+    ALTER TABLE {parent} DETACH PARTITION {part};
+"""
+
+DROP_TABLE = """
+    DROP TABLE {};
+"""
+
+DROP_TABLE_IF_EXISTS = """
+    DROP TABLE IF EXISTS {};
+"""
+
+CREATE_TABLE_LIKE_WITH_INDEXES = """
+    CREATE TABLE {target} (LIKE {tbl} INCLUDING DEFAULTS INCLUDING INDEXES);
+"""
+
+INSERT_SELECT_ALL = """
+    INSERT INTO {target}
+    SELECT * FROM {source};
+"""
+
+COUNT_ROWS_IN_RANGE = """
+    SELECT COUNT(*)
+    FROM {tbl}
+    WHERE {col} >= %s
+      AND {col} < %s;
+"""
+
+
+# 19. Migration bookkeeping (src/db/run_sql_files.py)
+CREATE_SCHEMA_MIGRATIONS = """
+    CREATE TABLE IF NOT EXISTS schema_migrations (
+        filename VARCHAR(255) PRIMARY KEY,
+        checksum CHAR(64) NOT NULL,
+        applied_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+        duration_ms NUMERIC(12, 3)
+    );
+"""
+
+FETCH_APPLIED_MIGRATIONS = """
+    SELECT filename, checksum
+    FROM schema_migrations;
+"""
+
+INSERT_SCHEMA_MIGRATION = """
+    INSERT INTO schema_migrations (filename, checksum, duration_ms)
+    VALUES (%s, %s, %s);
+"""
+
+CREATE_SCHEMA_DEFERRED_INDEXES = """
+    CREATE TABLE IF NOT EXISTS schema_deferred_indexes (
+        filename VARCHAR(255) NOT NULL,
+        position INT NOT NULL,
+        statement TEXT NOT NULL,
+        built_at TIMESTAMP,
+        duration_ms NUMERIC(12, 3),
+        PRIMARY KEY (filename, position)
+    );
+"""
+
+INSERT_DEFERRED_INDEX = """
+    INSERT INTO schema_deferred_indexes (filename, position, statement)
+    VALUES (%s, %s, %s);
+"""
+
+FETCH_PENDING_DEFERRED_INDEXES = """
+    SELECT filename, position, statement
+    FROM schema_deferred_indexes
+    WHERE built_at IS NULL
+    ORDER BY filename, position;
+"""
+
+MARK_DEFERRED_INDEX_BUILT = """
+    UPDATE schema_deferred_indexes
+    SET built_at = CURRENT_TIMESTAMP, duration_ms = %s
+    WHERE filename = %s
+      AND position = %s;
+"""
+
+
+# 20. Database snapshots (src/db/snapshots.py), run on the maintenance database
+FETCH_SNAPSHOT_DATABASES = """
+    SELECT datname
+    FROM pg_database
+    WHERE starts_with(datname, %s)
+    ORDER BY datname;
+"""
+
+TERMINATE_DATABASE_CONNECTIONS = """
+    SELECT pg_terminate_backend(pid)
+    FROM pg_stat_activity
+    WHERE datname = %s
+      AND pid <> pg_backend_pid();
+"""
+
+CREATE_DATABASE_FROM_TEMPLATE = """
+    CREATE DATABASE {target} TEMPLATE {template};
+"""
+
+CREATE_DATABASE = """
+    CREATE DATABASE {};
+"""
+
+DROP_DATABASE = """
+    DROP DATABASE IF EXISTS {} WITH (FORCE);
+"""
+
+SET_DATABASE_ALLOW_CONNECTIONS = """
+    ALTER DATABASE {} ALLOW_CONNECTIONS %s;
+"""
+
+
+# 21. Test isolation (tests/conftest.py)
+ACQUIRE_ADVISORY_LOCK = """
+    SELECT pg_advisory_lock(hashtext(%s));
+"""
+
+RELEASE_ADVISORY_LOCK = """
+    SELECT pg_advisory_unlock(hashtext(%s));
+"""
+
+SAVEPOINT = """
+    SAVEPOINT {};
+"""
+
+ROLLBACK_TO_SAVEPOINT = """
+    ROLLBACK TO SAVEPOINT {name};
+    RELEASE SAVEPOINT {name};
+"""
+
+
+# 22. Server tuning profiles (src/db/tuning.py)
+FETCH_SETTINGS = """
+    SELECT name, current_setting(name), context
+    FROM pg_settings
+    WHERE name = ANY(%s)
+    ORDER BY name;
+"""
+
+ALTER_SYSTEM_SET = """
+    ALTER SYSTEM SET {} = %s;
+"""
+
+ALTER_SYSTEM_RESET = """
+    ALTER SYSTEM RESET {};
+"""
+
+RELOAD_CONF = """
+    SELECT pg_reload_conf();
+"""
+
+
+# 23. Post-load maintenance (src/db/maintenance.py)
+FETCH_MAINTENANCE_TABLES = """
+    SELECT relname
+    FROM pg_stat_user_tables
+    WHERE schemaname = 'public'
+    ORDER BY n_live_tup DESC, relname;
+"""
+
+VACUUM_ANALYZE_TABLE = """
+    VACUUM (ANALYZE) {};
+"""
+
+FETCH_TABLE_STATISTICS_STATE = """
+    SELECT
+        relname,
+        n_live_tup,
+        n_mod_since_analyze,
+        GREATEST(last_analyze, last_autoanalyze) AS last_analyzed,
+        GREATEST(last_vacuum, last_autovacuum) AS last_vacuumed
+    FROM pg_stat_user_tables
+    WHERE schemaname = 'public'
+    ORDER BY relname;
+"""
+
+FETCH_EXTENDED_STATISTICS_STATE = """
+    SELECT
+        s.stxname,
+        c.relname,
+        EXISTS (
+            SELECT 1
+            FROM pg_stats_ext e
+            WHERE e.statistics_schemaname = n.nspname
+              AND e.statistics_name = s.stxname
+        ) AS built
+    FROM pg_statistic_ext s
+    JOIN pg_class c ON c.oid = s.stxrelid
+    JOIN pg_namespace n ON n.oid = c.relnamespace
+    WHERE n.nspname = 'public'
+    ORDER BY s.stxname;
+"""
+
+FETCH_SERVER_TIME = """
+    SELECT clock_timestamp();
+"""
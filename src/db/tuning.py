@@ -0,0 +1,155 @@
+"""
+tuning.py
+
+Server tuning profiles for the pipeline phases, applied with ALTER SYSTEM + pg_reload_conf().
+
+Profiles:
+- bulk_load: seeding/ETL; asynchronous commit, few checkpoints (large max_wal_size, long
+  checkpoint_timeout), compressed WAL, large maintenance_work_mem and parallel index builds
+- serve: query benchmarks/dashboards; synchronous commit, stock checkpointing, more work_mem,
+  SSD cost settings and no JIT for the short OLTP queries
+- default: every setting of the profiles reset to the server default
+
+Features:
+- apply_profile(): switches the running server to a profile (new sessions pick it up, running
+  sessions after their next statement)
+- detect_profile(): name of the profile the server currently matches ("custom" otherwise), so
+  benchmark results can record it even when the profile was applied by another process
+- describe_server(): profile name plus the current value of every tuned setting
+
+Assumptions:
+- ALTER SYSTEM needs a superuser (the compose POSTGRES_USER is one); without the privilege the
+  profile is not applied and a warning is logged
+- only reloadable settings are switched here; restart-only settings (shared_buffers, wal_level)
+  go into the compose `command:` flags
+- values are written in the format SHOW returns them (e.g. "8GB", "30min") so detection works
+"""
+
+
+# Stdlib imports
+import argparse
+import sys
+from pathlib import Path
+
+
+# Third-party imports
+import psycopg2
+from psycopg2 import sql
+
+
+# Path/bootstrap
+# Go two levels up (src/db → project root) so src.* imports work.
+PROJECT_ROOT = Path(__file__).resolve().parents[2]
+sys.path.insert(0, str(PROJECT_ROOT))
+
+
+# Internal imports
+from src.db.connection import managed_connection
+from src.db import sql_repo as sqlrepo
+from src.utils.logger import logger
+from src.utils.tables import format_table
+
+
+
+PROFILES = {
+    "bulk_load": {
+        "synchronous_commit": "off",
+        "max_wal_size": "8GB",
+        "checkpoint_timeout": "30min",
+        "checkpoint_completion_target": "0.9",
+        "wal_compression": "pglz",
+        "maintenance_work_mem": "1GB",
+        "max_parallel_maintenance_workers": "4",
+        "work_mem": "4MB",
+        "random_page_cost": "4",
+        "jit": "on",
+    },
+    "serve": {
+        "synchronous_commit": "on",
+        "max_wal_size": "1GB",
+        "checkpoint_timeout": "5min",
+        "checkpoint_completion_target": "0.9",
+        "wal_compression": "off",
+        "maintenance_work_mem": "256MB",
+        "max_parallel_maintenance_workers": "2",
+        "work_mem": "16MB",
+        "random_page_cost": "1.1",
+        "jit": "off",
+    },
+}
+
+# Every setting touched by a profile ("default" resets exactly these)
+TUNED_SETTINGS = sorted({name for settings in PROFILES.values() for name in settings})
+
+REPORT_COLUMNS = ["setting", "value", "context"]
+
+
+
+# Profile handling
+def fetch_settings(cur) -> dict:
+    """
+    Return {setting: (current value, context)} for TUNED_SETTINGS.
+    """
+    cur.execute(sqlrepo.FETCH_SETTINGS, (TUNED_SETTINGS,))
+    return {name: (value, context) for name, value, context in cur.fetchall()}
+
+def apply_profile(name: str) -> bool:
+    """
+    Switch the server to profile `name` ("default" resets every tuned setting).
+
+    Returns:
+        bool: False if the settings could not be changed (missing privileges).
+    """
+    if name != "default" and name not in PROFILES:
+        raise ValueError(f"Unknown tuning profile {name!r}, expected one of {['default', *PROFILES]}")
+
+    with managed_connection() as conn:
+        conn.autocommit = True  # ALTER SYSTEM cannot run inside a transaction block
+        with conn.cursor() as cur:
+            try:
+                if name == "default":
+                    for setting in TUNED_SETTINGS:
+                        cur.execute(sql.SQL(sqlrepo.ALTER_SYSTEM_RESET).format(sql.Identifier(setting)))
+                else:
+                    for setting, value in PROFILES[name].items():
+                        cur.execute(sql.SQL(sqlrepo.ALTER_SYSTEM_SET).format(sql.Identifier(setting)), (value,))
+                cur.execute(sqlrepo.RELOAD_CONF)
+            except psycopg2.Error as e:
+                logger.warning(f"Tuning profile {name} not applied: {e}")
+                return False
+
+    logger.info(f"Tuning profile {name} applied")
+    return True
+
+def detect_profile(settings: dict) -> str:
+    """
+    Return the profile whose values all match `settings` ({setting: value}), "custom" otherwise.
+    """
+    for name, profile in PROFILES.items():
+        if all(str(settings.get(setting, "")).lower() == value.lower() for setting, value in profile.items()):
+            return name
+    return "custom"
+
+def describe_server() -> dict:
+    """
+    Return {"profile": detected profile, "settings": {setting: value}} of the running server.
+    """
+    with managed_connection() as conn, conn.cursor() as cur:
+        settings = {name: value for name, (value, _) in fetch_settings(cur).items()}
+    return {"profile": detect_profile(settings), "settings": settings}
+
+
+
+# CLI entrypoint
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Switch or show the server tuning profile.")
+    parser.add_argument("profile", nargs="?", choices=["default", *PROFILES], help="profile to apply (omit to show)")
+    args = parser.parse_args()
+
+    if args.profile:
+        apply_profile(args.profile)
+
+    with managed_connection() as conn, conn.cursor() as cur:
+        rows = [{"setting": name, "value": value, "context": context} for name, (value, context) in fetch_settings(cur).items()]
+    print(format_table(rows, REPORT_COLUMNS))
+    print(f"Profile: {describe_server()['profile']}")
@@ -0,0 +1,219 @@
+"""
+columnar.py
+
+Compact columnar in-memory tables for generated data, shared by the generators and the loaders.
+
+A list of boxed Python values costs 30–100 bytes per value (an int object, a datetime or an ISO
+string plus the list slot). Here every column is one typed buffer:
+- int2/int4/int8/float8/bool: NumPy array of the matching width
+- timestamp: int64 microseconds since the Unix epoch (NaT = NULL)
+- date: datetime64[D]
+- dictionary-encoded (categorical) columns, e.g. city, role, status, mime: uint8/uint16 codes plus
+  the list of distinct labels
+- text/varchar/json without dictionary encoding: a plain list of str (nothing smaller exists)
+
+Features:
+- column_builder(): append-only buffer (array.array for fixed width) for generator loops
+- to_column(): lists, arrays, builders, datetimes or ISO strings → Column
+- ColumnTable: named columns of equal length; copy_into() loads it with one binary COPY
+  (src.db.utils.copy_binary), rows() yields Python tuples for executemany/logging
+
+Assumptions:
+- integer values given for timestamp/date columns are epoch microseconds (the builder format)
+- integer/bool columns have no NULLs; use a categorical or text column for nullable values
+"""
+
+
+# Stdlib imports
+import array
+import sys
+from dataclasses import dataclass
+from pathlib import Path
+
+
+# Third-party imports
+import numpy as np
+
+
+# Path/bootstrap
+# Go three levels up (src/db/utils → project root) so imports work when run as script.
+PROJECT_ROOT = Path(__file__).resolve().parents[3]
+sys.path.insert(0, str(PROJECT_ROOT))
+
+
+# Internal imports
+from src.db.utils.copy_binary import copy_binary
+
+
+
+NUMERIC_DTYPES = {
+    "int2": np.int16,
+    "int4": np.int32,
+    "int8": np.int64,
+    "float8": np.float64,
+    "bool": np.bool_,
+}
+
+# array.array typecodes of the builders (timestamps and dates as epoch microseconds)
+BUILDER_TYPECODES = {
+    "int2": "h",
+    "int4": "i",
+    "int8": "q",
+    "float8": "d",
+    "bool": "b",
+    "timestamp": "q",
+    "date": "q",
+}
+
+
+
+# Columns
+@dataclass
+class Column:
+    """
+    One column; for dictionary-encoded columns `values` holds the codes into `categories`.
+    """
+    pg_type: str
+    values: object
+    categories: list = None
+
+    def __len__(self) -> int:
+        return len(self.values)
+
+    @property
+    def nbytes(self) -> int:
+        """
+        Approximate memory held by the column (buffers, list slots and string objects).
+        """
+        size = _list_nbytes(self.values) if isinstance(self.values, list) else self.values.nbytes
+        if self.categories is not None:
+            size += _list_nbytes(self.categories)
+        return size
+
+    def wire_values(self):
+        """
+        Values in the form copy_binary() expects.
+        """
+        if self.categories is not None:
+            return np.array(self.categories, dtype=object)[self.values]
+        if self.pg_type == "timestamp":
+            return self.values.view("datetime64[us]")
+        return self.values
+
+    def python_values(self) -> list:
+        if self.categories is not None:
+            return [self.categories[code] for code in self.values.tolist()]
+        if isinstance(self.values, list):
+            return self.values
+        if self.pg_type == "timestamp":
+            return self.values.view("datetime64[us]").tolist()
+        return self.values.tolist()
+
+def _list_nbytes(values: list) -> int:
+    return sys.getsizeof(values) + sum(sys.getsizeof(value) for value in values if value is not None)
+
+def code_dtype(n_categories: int):
+    if n_categories <= 1 << 8:
+        return np.uint8
+    if n_categories <= 1 << 16:
+        return np.uint16
+    return np.int32
+
+def encode_categorical(values) -> tuple:
+    """
+    Dictionary-encode `values` in order of first appearance.
+
+    Returns:
+        (np.ndarray codes, list categories)
+    """
+    lookup = {}
+    codes = [lookup.setdefault(value, len(lookup)) for value in values]
+    return np.asarray(codes, dtype=code_dtype(len(lookup))), list(lookup)
+
+def _epoch_us(values) -> np.ndarray:
+    """
+    Timestamps (epoch µs ints, datetime64, datetimes, ISO strings, None) → int64 epoch µs.
+    """
+    if isinstance(values, array.array) or (isinstance(values, np.ndarray) and values.dtype.kind in "iu"):
+        return np.asarray(values, dtype=np.int64)
+    return np.asarray(values, dtype="datetime64[us]").view(np.int64)
+
+def to_column(values, pg_type: str, categorical: bool = False) -> Column:
+    """
+    Convert generated values into a compact Column.
+
+    Args:
+        values: list, NumPy array or column_builder() buffer.
+        pg_type (str): copy_binary type (int2, int4, int8, float8, bool, date, timestamp, text,
+            varchar, json, enum).
+        categorical (bool): dictionary-encode the values (few distinct labels).
+    """
+    if categorical:
+        codes, categories = encode_categorical(values)
+        return Column(pg_type, codes, categories)
+    if pg_type in NUMERIC_DTYPES:
+        return Column(pg_type, np.asarray(values, dtype=NUMERIC_DTYPES[pg_type]))
+    if pg_type == "timestamp":
+        return Column(pg_type, _epoch_us(values))
+    if pg_type == "date":
+        return Column(pg_type, _epoch_us(values).view("datetime64[us]").astype("datetime64[D]"))
+    return Column(pg_type, list(values))
+
+def column_builder(pg_type: str):
+    """
+    Return an empty append-only buffer for a generator loop: array.array for fixed-width types
+    (append epoch microseconds for timestamp/date), a list otherwise.
+    """
+    if pg_type in BUILDER_TYPECODES:
+        return array.array(BUILDER_TYPECODES[pg_type])
+    return []
+
+
+
+# Tables
+class ColumnTable:
+    """
+    Named columns of equal length holding the generated rows of one database table.
+    """
+
+    def __init__(self, table_name: str):
+        self.table_name = table_name
+        self.columns = {}
+
+    def add(self, name: str, values, pg_type: str, categorical: bool = False) -> "ColumnTable":
+        column = values if isinstance(values, Column) else to_column(values, pg_type, categorical)
+        if self.columns and len(column) != len(self):
+            raise ValueError(f"{self.table_name}.{name}: {len(column)} values, expected {len(self)}")
+        self.columns[name] = column
+        return self
+
+    def __len__(self) -> int:
+        return len(next(iter(self.columns.values()))) if self.columns else 0
+
+    @property
+    def column_names(self) -> list:
+        return list(self.columns)
+
+    @property
+    def nbytes(self) -> int:
+        return sum(column.nbytes for column in self.columns.values())
+
+    def column(self, name: str) -> list:
+        return self.columns[name].python_values()
+
+    def rows(self):
+        """
+        Yield one tuple of Python values per row (executemany parameters).
+        """
+        return zip(*(column.python_values() for column in self.columns.values()))
+
+    def copy_into(self, cur):
+        """
+        Load all rows into `table_name` with one binary COPY.
+        """
+        copy_binary(
+            cur,
+            self.table_name,
+            self.column_names,
+            [(column.wire_values(), column.pg_type) for column in self.columns.values()],
+        )
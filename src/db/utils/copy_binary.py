@@ -0,0 +1,215 @@
+"""
+copy_binary.py
+
+Encode column arrays into PostgreSQL's binary COPY format and load them with `COPY ... FROM STDIN`.
+
+Features:
+- encode_copy_binary(): NumPy/list columns → binary COPY stream (header, tuples, trailer)
+- copy_binary(): load columns into a table with `COPY ... (FORMAT binary)`
+- copy_text(): the text (CSV) COPY equivalent, used as the baseline in benchmarks
+
+Supported column types:
+- fixed width: int2, int4, int8, float8, bool, date, timestamp
+- variable width: text, varchar, json and enum labels (sent as UTF-8 text)
+
+Assumptions:
+- timestamps are naive (TIMESTAMP WITHOUT TIME ZONE), given as datetime64, datetime/ISO values
+  or int64 microseconds since the Unix epoch
+- when every column is fixed width and NULL-free the whole stream is built by one
+  structured NumPy array without a per-row Python loop
+"""
+
+
+# Stdlib imports
+import csv
+import io
+import struct
+import sys
+from pathlib import Path
+
+
+# Third-party imports
+import numpy as np
+from psycopg2 import sql
+
+
+# Path/bootstrap
+# Go three levels up (src/db/utils → project root) so imports work when run as script.
+PROJECT_ROOT = Path(__file__).resolve().parents[3]
+sys.path.insert(0, str(PROJECT_ROOT))
+
+
+# Internal imports
+from src.db import sql_repo as sqlrepo
+
+
+
+# Binary COPY format constants
+COPY_HEADER = b"PGCOPY\n\xff\r\n\x00" + struct.pack(">ii", 0, 0)
+COPY_TRAILER = struct.pack(">h", -1)
+NULL_FIELD = struct.pack(">i", -1)
+
+# PostgreSQL epoch (2000-01-01) relative to the Unix epoch
+PG_EPOCH_US = np.datetime64("2000-01-01T00:00:00", "us")
+PG_EPOCH_DAY = np.datetime64("2000-01-01", "D")
+UNIX_TO_PG_US = 946_684_800_000_000
+
+# pg type → big-endian NumPy format of the wire value
+FIXED_FORMATS = {
+    "int2": ">i2",
+    "int4": ">i4",
+    "int8": ">i8",
+    "float8": ">f8",
+    "bool": "?",
+    "date": ">i4",
+    "timestamp": ">i8",
+}
+TEXT_TYPES = {"text", "varchar", "json", "enum"}
+
+
+
+# Value conversion
+def _null_mask(values) -> np.ndarray:
+    """
+    Return a boolean NULL mask (None entries, NaT for datetime64 arrays) or None if there are none.
+    """
+    if isinstance(values, np.ndarray):
+        if values.dtype.kind == "M":
+            mask = np.isnat(values)
+        elif values.dtype == object:
+            mask = np.fromiter((v is None for v in values), dtype=bool, count=len(values))
+        else:
+            return None
+    else:
+        mask = np.fromiter((v is None for v in values), dtype=bool, count=len(values))
+    return mask if mask.any() else None
+
+def _fixed_wire_values(values, pg_type: str, mask) -> np.ndarray:
+    """
+    Convert a column to its big-endian wire representation.
+
+    NULL slots get a placeholder value; the caller replaces them with the NULL marker.
+    Integer timestamps are read as microseconds since the Unix epoch.
+    """
+    if pg_type == "timestamp":
+        wire = (np.asarray(values, dtype="datetime64[us]") - PG_EPOCH_US).astype(np.int64)
+    elif pg_type == "date":
+        days = np.asarray(values, dtype="datetime64[us]").astype("datetime64[D]")
+        wire = (days - PG_EPOCH_DAY).astype(np.int32)
+    else:
+        if mask is not None:
+            values = [0 if is_null else value for value, is_null in zip(values, mask)]
+        wire = np.asarray(values)
+    return wire.astype(FIXED_FORMATS[pg_type])
+
+def _field_width(pg_type: str) -> int:
+    return np.dtype(FIXED_FORMATS[pg_type]).itemsize
+
+
+
+# Encoding
+def _encode_fixed_only(columns: list) -> bytes:
+    """
+    Fast path: all columns fixed width, no NULLs → one structured array holds every tuple.
+    """
+    n_rows = len(columns[0][0])
+    fields = [("n", ">i2")]
+    for i, (_, pg_type) in enumerate(columns):
+        fields += [(f"l{i}", ">i4"), (f"v{i}", FIXED_FORMATS[pg_type])]
+
+    tuples = np.empty(n_rows, dtype=np.dtype(fields))
+    tuples["n"] = len(columns)
+    for i, (values, pg_type) in enumerate(columns):
+        tuples[f"l{i}"] = _field_width(pg_type)
+        tuples[f"v{i}"] = _fixed_wire_values(values, pg_type, None)
+
+    return COPY_HEADER + tuples.tobytes() + COPY_TRAILER
+
+def _field_bytes(values, pg_type: str) -> list:
+    """
+    Encode one column as a list of per-row field bytes (length prefix + value, or NULL marker).
+    """
+    mask = _null_mask(values)
+
+    if pg_type in TEXT_TYPES:
+        out = []
+        for value in values:
+            if value is None:
+                out.append(NULL_FIELD)
+            else:
+                data = str(value).encode("utf-8")
+                out.append(struct.pack(">i", len(data)) + data)
+        return out
+
+    width = _field_width(pg_type)
+    field = np.empty(len(values), dtype=[("l", ">i4"), ("v", FIXED_FORMATS[pg_type])])
+    field["l"] = width
+    field["v"] = _fixed_wire_values(values, pg_type, mask)
+
+    # A void view turns every (length, value) pair into one bytes object without a Python loop
+    out = field.view(f"V{4 + width}").tolist()
+    if mask is not None:
+        for i in np.flatnonzero(mask):
+            out[i] = NULL_FIELD
+    return out
+
+def encode_copy_binary(columns: list) -> bytes:
+    """
+    Encode columns into a complete binary COPY stream.
+
+    Args:
+        columns (list): (values, pg_type) per column, all of equal length. `values` may be a
+            NumPy array or a list; None (or NaT) encodes NULL.
+
+    Returns:
+        bytes: header + one tuple per row + trailer.
+    """
+    if not columns:
+        raise ValueError("encode_copy_binary() needs at least one column")
+    n_rows = len(columns[0][0])
+    for values, pg_type in columns:
+        if len(values) != n_rows:
+            raise ValueError("encode_copy_binary(): columns have different lengths")
+        if pg_type not in FIXED_FORMATS and pg_type not in TEXT_TYPES:
+            raise ValueError(f"encode_copy_binary(): unsupported column type {pg_type!r}")
+
+    if all(pg_type in FIXED_FORMATS and _null_mask(values) is None for values, pg_type in columns):
+        return _encode_fixed_only(columns)
+
+    row_header = struct.pack(">h", len(columns))
+    per_column = [_field_bytes(values, pg_type) for values, pg_type in columns]
+    body = b"".join(row_header + b"".join(fields) for fields in zip(*per_column))
+    return COPY_HEADER + body + COPY_TRAILER
+
+
+
+# Loading
+def copy_binary(cur, table_name: str, column_names: list, columns: list):
+    """
+    Load columns into `table_name` with one binary `COPY ... FROM STDIN`.
+
+    Args:
+        cur: open psycopg2 cursor.
+        table_name (str): target table.
+        column_names (list): target column names, same order as `columns`.
+        columns (list): (values, pg_type) per column, see encode_copy_binary().
+    """
+    query = sql.SQL(sqlrepo.COPY_TABLE_FROM_BINARY).format(
+        tbl=sql.Identifier(table_name),
+        cols=sql.SQL(", ").join(map(sql.Identifier, column_names)),
+    )
+    cur.copy_expert(query, io.BytesIO(encode_copy_binary(columns)))
+
+def copy_text(cur, table_name: str, column_names: list, rows):
+    """
+    Load row tuples into `table_name` with one text (CSV) `COPY ... FROM STDIN`.
+    None is written as an unquoted empty field, which CSV COPY reads as NULL.
+    """
+    buf = io.StringIO()
+    csv.writer(buf).writerows(rows)
+    buf.seek(0)
+    query = sql.SQL(sqlrepo.COPY_TABLE_FROM_CSV).format(
+        tbl=sql.Identifier(table_name),
+        cols=sql.SQL(", ").join(map(sql.Identifier, column_names)),
+    )
+    cur.copy_expert(query, buf)
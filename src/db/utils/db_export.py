@@ -0,0 +1,214 @@
+"""
+db_export.py
+
+Streaming full-database export with constant client memory.
+
+Features:
+- export_table_copy(): streams one table via `COPY ... TO STDOUT` straight into a file
+- iter_table_rows(): yields rows from a named (server-side) cursor in itersize batches
+- export_table_cursor(): writes one table as CSV from a server-side cursor
+- begin_export_transaction(): starts the REPEATABLE READ READ ONLY transaction of an export
+- export_database_streaming(): exports every table, one file per table, one table at a time,
+  all from one consistent snapshot
+- CLI with `csv` and `parquet` subcommands (Parquet lives in db_export_parquet)
+
+Assumptions:
+- table names come from db_introspect (public schema)
+- nothing is ever fetched with fetchall(); memory is bounded by the COPY buffer / itersize
+- all tables are read in one transaction, so the files match each other (foreign keys,
+  totals) even while the pipeline keeps writing; the snapshot is held until the export ends
+"""
+
+
+# Stdlib imports
+import argparse
+import csv
+import sys
+import time
+from pathlib import Path
+
+
+# Third-party imports
+from psycopg2 import sql
+
+
+# Path/bootstrap
+# Go three levels up (src/db/utils → project root) so imports work when run as script.
+PROJECT_ROOT = Path(__file__).resolve().parents[3]
+sys.path.insert(0, str(PROJECT_ROOT))
+
+
+# Internal imports
+from src.db.connection import managed_connection
+from src.db import sql_repo as sqlrepo
+from src.db.utils.db_introspect import fetch_all_tbl_names
+from src.utils.logger import logger
+
+
+
+# Export configuration
+EXPORT_DIR = PROJECT_ROOT / "exports"
+DEFAULT_ITERSIZE = 10_000
+EXPORT_METHODS = ("copy", "cursor")
+
+
+
+# Per-table export
+def begin_export_transaction(conn):
+    """
+    Start a REPEATABLE READ READ ONLY transaction on `conn`; every table read until the
+    next commit/rollback sees the same snapshot.
+    """
+    with conn.cursor() as cur:
+        cur.execute(sqlrepo.SET_EXPORT_TRANSACTION)
+
+def export_table_copy(cur, table_name: str, out_path: Path) -> int:
+    """
+    Stream one table to a CSV file with `COPY ... TO STDOUT`.
+
+    Args:
+        cur: open psycopg2 cursor.
+        table_name (str): table to export.
+        out_path (Path): target CSV file (with header row).
+
+    Returns:
+        int: number of bytes written.
+    """
+    query = sql.SQL(sqlrepo.COPY_TABLE_TO_CSV).format(sql.Identifier(table_name))
+    with open(out_path, "w", encoding="utf-8", newline="") as f:
+        cur.copy_expert(query, f)
+        return f.tell()
+
+def iter_table_rows(conn, table_name: str, itersize: int = DEFAULT_ITERSIZE):
+    """
+    Yield the column names, then every row of a table, via a named server-side cursor.
+
+    Rows are transferred from the server in batches of `itersize`, so client memory
+    does not grow with the table size.
+
+    Args:
+        conn: open psycopg2 connection (not in autocommit mode).
+        table_name (str): table to read.
+        itersize (int): rows per network round trip.
+
+    Yields:
+        list[str] first (column names), then one tuple per row.
+    """
+    query = sql.SQL(sqlrepo.DUMP_TABLE).format(sql.Identifier(table_name))
+    with conn.cursor(name=f"export_{table_name}") as cur:
+        cur.itersize = itersize
+        cur.execute(query)
+
+        # Column names are available after the first batch has been fetched
+        rows = iter(cur)
+        first = next(rows, None)
+        yield [desc[0] for desc in cur.description]
+        if first is None:
+            return
+        yield first
+        yield from rows
+
+def export_table_cursor(conn, table_name: str, out_path: Path, itersize: int = DEFAULT_ITERSIZE) -> int:
+    """
+    Write one table as CSV from a server-side cursor.
+
+    Returns:
+        int: number of data rows written.
+    """
+    row_count = 0
+    with open(out_path, "w", encoding="utf-8", newline="") as f:
+        writer = csv.writer(f)
+        for row_count, row in enumerate(iter_table_rows(conn, table_name, itersize)):
+            writer.writerow(row)
+    return row_count
+
+
+
+# Full database export
+def export_database_streaming(
+    out_dir: Path = EXPORT_DIR,
+    method: str = "copy",
+    itersize: int = DEFAULT_ITERSIZE,
+    tables: list = None,
+) -> dict:
+    """
+    Export every table to `<out_dir>/<table>.csv`, one table at a time, all inside one
+    REPEATABLE READ READ ONLY transaction.
+
+    Args:
+        out_dir (Path): target directory (created if missing).
+        method (str): "copy" (COPY TO STDOUT) or "cursor" (named cursor + csv.writer).
+        itersize (int): batch size for the cursor method.
+        tables (list): subset of tables to export; defaults to all tables.
+
+    Returns:
+        dict[str, Path]: mapping table_name → written file
+    """
+    if method not in EXPORT_METHODS:
+        raise ValueError(f"Unknown export method {method!r}, expected one of {EXPORT_METHODS}")
+
+    out_dir = Path(out_dir)
+    out_dir.mkdir(parents=True, exist_ok=True)
+    table_name_list = sorted(tables or fetch_all_tbl_names())
+
+    exported = {}
+    with managed_connection() as conn:
+        begin_export_transaction(conn)
+        for table in table_name_list:
+            out_path = out_dir / f"{table}.csv"
+            t0 = time.perf_counter()
+            if method == "copy":
+                with conn.cursor() as cur:
+                    export_table_copy(cur, table, out_path)
+            else:
+                export_table_cursor(conn, table, out_path, itersize)
+
+            exported[table] = out_path
+            logger.info(
+                f"Exported {table} → {out_path.name} "
+                f"({out_path.stat().st_size} bytes, {time.perf_counter() - t0:.2f}s)"
+            )
+
+    return exported
+
+
+
+# CLI helpers
+def _parse_projection(specs: list) -> dict:
+    """
+    Parse ["bookings:id,start_date", ...] into {"bookings": ["id", "start_date"], ...}.
+    """
+    projection = {}
+    for spec in specs or []:
+        table, _, cols = spec.partition(":")
+        projection[table] = [col for col in cols.split(",") if col]
+    return projection
+
+
+
+# CLI entrypoint
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Export all datamart tables, one file per table.")
+    subparsers = parser.add_subparsers(dest="format", required=True)
+
+    csv_parser = subparsers.add_parser("csv", help="stream tables to CSV")
+    csv_parser.add_argument("--out", type=Path, default=EXPORT_DIR, help="target directory")
+    csv_parser.add_argument("--method", choices=EXPORT_METHODS, default="copy")
+    csv_parser.add_argument("--itersize", type=int, default=DEFAULT_ITERSIZE)
+    csv_parser.add_argument("--tables", nargs="*", help="subset of tables to export")
+
+    parquet_parser = subparsers.add_parser("parquet", help="write tables to Parquet")
+    parquet_parser.add_argument("--out", type=Path, default=EXPORT_DIR, help="target directory")
+    parquet_parser.add_argument("--row-group-size", type=int, default=100_000)
+    parquet_parser.add_argument("--tables", nargs="*", help="subset of tables to export")
+    parquet_parser.add_argument(
+        "--columns", nargs="*", metavar="TABLE:COL,COL",
+        help="column projection, e.g. bookings:id,start_date,status",
+    )
+    args = parser.parse_args()
+
+    if args.format == "csv":
+        export_database_streaming(args.out, args.method, args.itersize, args.tables)
+    else:
+        from src.db.utils.db_export_parquet import export_database_parquet
+        export_database_parquet(args.out, _parse_projection(args.columns), args.row_group_size, args.tables)
@@ -0,0 +1,200 @@
+"""
+db_export_parquet.py
+
+Columnar export of the datamart to Parquet, one file per table.
+
+Features:
+- maps PostgreSQL column types to Arrow types (enums → dictionary, TIMESTAMP → timestamp[us], JSON → string)
+- reads each table in chunks from a named server-side cursor and converts every chunk
+  straight into an Arrow record batch (one Parquet row group per chunk)
+- column projection per table and configurable row-group size
+- all tables are read from one snapshot (REPEATABLE READ READ ONLY, see db_export)
+
+Assumptions:
+- table/column metadata comes from pg_catalog (public schema)
+- pyarrow is installed (see requirements.txt)
+"""
+
+
+# Stdlib imports
+import sys
+import time
+from pathlib import Path
+
+
+# Third-party imports
+import pyarrow as pa
+import pyarrow.parquet as pq
+from psycopg2 import sql
+
+
+# Path/bootstrap
+# Go three levels up (src/db/utils → project root) so imports work when run as script.
+PROJECT_ROOT = Path(__file__).resolve().parents[3]
+sys.path.insert(0, str(PROJECT_ROOT))
+
+
+# Internal imports
+from src.db.connection import managed_connection
+from src.db import sql_repo as sqlrepo
+from src.db.utils.db_export import begin_export_transaction
+from src.db.utils.db_introspect import fetch_all_tbl_names
+from src.utils.logger import logger
+
+
+
+# Export configuration
+DEFAULT_ROW_GROUP_SIZE = 100_000
+
+# PostgreSQL type name → Arrow type (enums are handled via typtype = 'e')
+PG_TO_ARROW = {
+    "int2": pa.int16(),
+    "int4": pa.int32(),
+    "int8": pa.int64(),
+    "float4": pa.float32(),
+    "float8": pa.float64(),
+    "bool": pa.bool_(),
+    "date": pa.date32(),
+    "timestamp": pa.timestamp("us"),
+    "timestamptz": pa.timestamp("us", tz="UTC"),
+    "varchar": pa.string(),
+    "bpchar": pa.string(),
+    "text": pa.string(),
+    "json": pa.string(),
+    "jsonb": pa.string(),
+    "numeric": pa.string(),
+}
+ENUM_TYPE = pa.dictionary(pa.int32(), pa.string())
+
+# Columns that must be read as text (psycopg2 would otherwise decode them to Python objects)
+CAST_TO_TEXT = {"json", "jsonb", "numeric"}
+
+
+
+# Schema mapping
+def fetch_arrow_schema(cur, table_name: str, columns: list = None) -> pa.Schema:
+    """
+    Build the Arrow schema for a table (optionally projected to `columns`, in that order).
+
+    Unknown PostgreSQL types fall back to string.
+    """
+    cur.execute(sqlrepo.FETCH_TABLE_COLUMN_TYPES, (table_name,))
+    pg_columns = {name: (typname, typtype) for name, typname, typtype in cur.fetchall()}
+
+    selected = columns or list(pg_columns)
+    missing = [col for col in selected if col not in pg_columns]
+    if missing:
+        raise ValueError(f"Unknown columns for {table_name}: {missing}")
+
+    fields = []
+    for col in selected:
+        typname, typtype = pg_columns[col]
+        arrow_type = ENUM_TYPE if typtype == "e" else PG_TO_ARROW.get(typname, pa.string())
+        field = pa.field(col, arrow_type, metadata={"pg_type": typname})
+        fields.append(field)
+    return pa.schema(fields)
+
+def _select_query(table_name: str, schema: pa.Schema) -> sql.Composed:
+    """
+    SELECT the schema's columns, casting JSON/numeric columns to text.
+    """
+    select_items = []
+    for field in schema:
+        ident = sql.Identifier(field.name)
+        if field.metadata[b"pg_type"].decode() in CAST_TO_TEXT:
+            select_items.append(sql.SQL("{}::text AS {}").format(ident, ident))
+        else:
+            select_items.append(ident)
+    return sql.SQL(sqlrepo.SELECT_COLUMNS).format(
+        cols=sql.SQL(", ").join(select_items),
+        tbl=sql.Identifier(table_name),
+    )
+
+def rows_to_record_batch(rows: list, schema: pa.Schema) -> pa.RecordBatch:
+    """
+    Convert a chunk of row tuples into one Arrow record batch.
+    """
+    columns = list(zip(*rows)) if rows else [[] for _ in schema]
+    arrays = []
+    for values, field in zip(columns, schema):
+        if pa.types.is_dictionary(field.type):
+            arrays.append(pa.array(values, type=pa.string()).dictionary_encode().cast(field.type))
+        else:
+            arrays.append(pa.array(values, type=field.type))
+    return pa.RecordBatch.from_arrays(arrays, schema=schema)
+
+
+
+# Per-table export
+def export_table_parquet(
+    conn,
+    table_name: str,
+    out_path: Path,
+    columns: list = None,
+    row_group_size: int = DEFAULT_ROW_GROUP_SIZE,
+) -> int:
+    """
+    Write one table to Parquet; each fetched chunk of `row_group_size` rows becomes one row group.
+
+    Returns:
+        int: number of rows written.
+    """
+    with conn.cursor() as cur:
+        schema = fetch_arrow_schema(cur, table_name, columns)
+
+    row_count = 0
+    with conn.cursor(name=f"parquet_{table_name}") as cur, pq.ParquetWriter(out_path, schema) as writer:
+        cur.execute(_select_query(table_name, schema))
+        while True:
+            rows = cur.fetchmany(row_group_size)
+            if not rows:
+                break
+            writer.write_batch(rows_to_record_batch(rows, schema), row_group_size=row_group_size)
+            row_count += len(rows)
+
+        # Keep an empty file readable with the right schema
+        if row_count == 0:
+            writer.write_batch(rows_to_record_batch([], schema))
+    return row_count
+
+
+
+# Full database export
+def export_database_parquet(
+    out_dir: Path,
+    columns: dict = None,
+    row_group_size: int = DEFAULT_ROW_GROUP_SIZE,
+    tables: list = None,
+) -> dict:
+    """
+    Export tables to `<out_dir>/<table>.parquet`, all inside one REPEATABLE READ READ ONLY transaction.
+
+    Args:
+        out_dir (Path): target directory (created if missing).
+        columns (dict): optional projection, table_name → list of column names.
+        row_group_size (int): rows per fetched chunk / Parquet row group.
+        tables (list): subset of tables; defaults to all tables.
+
+    Returns:
+        dict[str, Path]: mapping table_name → written file
+    """
+    columns = columns or {}
+    out_dir = Path(out_dir)
+    out_dir.mkdir(parents=True, exist_ok=True)
+    table_name_list = sorted(tables or fetch_all_tbl_names())
+
+    exported = {}
+    with managed_connection() as conn:
+        begin_export_transaction(conn)
+        for table in table_name_list:
+            out_path = out_dir / f"{table}.parquet"
+            t0 = time.perf_counter()
+            row_count = export_table_parquet(conn, table, out_path, columns.get(table), row_group_size)
+
+            exported[table] = out_path
+            logger.info(
+                f"Exported {table} → {out_path.name} "
+                f"({row_count} rows, {out_path.stat().st_size} bytes, {time.perf_counter() - t0:.2f}s)"
+            )
+
+    return exported
@@ -2,69 +2,80 @@
 db_helpers.py
 
 Utility functions for database operations, including:
-- printing all rows from a specified table for debugging purposes.
+- printing the first LOG_TABLE_ROWS rows of a specified table for debugging purposes.
 """
 from psycopg2 import sql
 
+from src import config
 from src.db.connection import db_connection
 
 
+def _row_limit(limit: int):
+    """
+    LIMIT parameter for `limit` (default config.LOG_TABLE_ROWS, negative = all rows → NULL).
+    """
+    limit = config.LOG_TABLE_ROWS if limit is None else limit
+    return None if limit < 0 else limit
+
+def _format_rows(table_name: str, rows: list) -> str:
+    return "\n".join([f"Table: {table_name}", *map(str, rows)]) + "\n"
+
+
 
-def get_tbl_contents_as_str(table_name: str) -> str:
+def get_tbl_contents_as_str(table_name: str, limit: int = None) -> str:
     """
-    Connects to the database, retrieves all rows from the specified table,
+    Connects to the database, retrieves the first rows of the specified table,
     and returns a formatted string.
 
     Args:
         table_name (str): name of the table to print.
+        limit (int): rows to print (default config.LOG_TABLE_ROWS, negative = all, 0 = none).
 
     Returns:
-        str: formatted string containing all table rows.
+        str: formatted string containing the table rows.
     """
+    limit = _row_limit(limit)
+    if limit == 0:
+        return f"Table: {table_name} (LOG_TABLE_ROWS=0, rows not logged)\n"
+
     conn = db_connection()
     cur = conn.cursor()
 
-    q = sql.SQL("SELECT * FROM {}").format(
+    q = sql.SQL("SELECT * FROM {} LIMIT %s").format(
         sql.Identifier(table_name),
     )
-    cur.execute(q)
+    cur.execute(q, (limit,))
     rows = cur.fetchall()
 
-    result_string = f"Table: {table_name}\n"
-    for row in rows:
-        result_string += f"{row}\n"
-
     cur.close()
     conn.close()
 
-    return result_string
+    return _format_rows(table_name, rows)
 
-def get_tbl_contents_as_str_sorted_by(table_name: str, sort_by: str) -> str:
+def get_tbl_contents_as_str_sorted_by(table_name: str, sort_by: str, limit: int = None) -> str:
     """
-    Connects to the database, retrieves all rows from the specified table,
-    and returns a formatted string.
+    Connects to the database, retrieves the first rows of the specified table
+    in `sort_by` order, and returns a formatted string.
 
     Args:
         table_name (str): name of the table to print.
+        sort_by (str): column to order by.
+        limit (int): rows to print (default config.LOG_TABLE_ROWS, negative = all, 0 = none).
 
     Returns:
-        str: formatted string containing all table rows.
+        str: formatted string containing the table rows.
     """
     conn = db_connection()
     cur = conn.cursor()
 
-    q = sql.SQL("SELECT * FROM {} ORDER BY {}").format(
+    q = sql.SQL("SELECT * FROM {} ORDER BY {} LIMIT %s").format(
         sql.Identifier(table_name),
         sql.Identifier(sort_by),
     )
-    cur.execute(q)
+    cur.execute(q, (_row_limit(limit),))
     rows = cur.fetchall()
 
-    result_string = f"Table: {table_name}\n"
-    for row in rows:
-        result_string += f"{row}\n"
-
     cur.close()
     conn.close()
 
-    return result_string
\ No newline at end of file
+    return _format_rows(table_name, rows)
\ No newline at end of file
@@ -16,54 +16,54 @@ sys.path.insert(0, str(PROJECT_ROOT))
 
 
 # Internal imports
-from src.db.connection import db_connection
+from src.db.connection import managed_connection
 from src.db import sql_repo as sqlrepo
 
 
 
 # Table name discovery
-def fetch_all_tbl_names():
+def _fetch_all_tbl_names(cur):
     """
-    Retrieve all table names from the target schema.
+    Retrieve all table names from the target schema on an open cursor.
     """
-    # Connect to database
-    conn = db_connection()
-    cur = conn.cursor()
-
     # Fetch list of all table names
     cur.execute(sqlrepo.FETCH_ALL_TABLE_NAMES)
     result = cur.fetchall()
 
     # Flatten and deduplicate
-    table_name_list = list({item[0] for item in result})
-
-    # Close cursor (connection intentionally left as in original logic)
-    cur.close()
+    return list({item[0] for item in result})
 
-    # Return the table name list
-    return table_name_list
+def fetch_all_tbl_names():
+    """
+    Retrieve all table names from the target schema.
+    """
+    with managed_connection() as conn, conn.cursor() as cur:
+        return _fetch_all_tbl_names(cur)
 
 
 # Table column names discovery
 def fetch_db_schema_list():
-    # Connect to database
-    conn = db_connection()
-    cur = conn.cursor()
-
-    # Discover tables
-    table_name_list = fetch_all_tbl_names()
-
-    # Init dict: table_name → DataFrame
-    table_col_dict = {table_name: None for table_name in table_name_list}
-
-    # Fetch column metadata for each table
-    for table_name in table_name_list:
-        cur.execute(sqlrepo.FETCH_TABLE_COLUMNS, (table_name,))
-        result = cur.fetchall()
-        
-        # Append column names to table names
-        table_col_dict[table_name] = [column_name[0] for column_name in result]
-    
+    """
+    Retrieve all tables and their column names.
+
+    Returns:
+        dict[str, list[str]]: mapping table_name → column names
+    """
+    with managed_connection() as conn, conn.cursor() as cur:
+        # Discover tables on the same connection
+        table_name_list = _fetch_all_tbl_names(cur)
+
+        # Init dict: table_name → column names
+        table_col_dict = {table_name: None for table_name in table_name_list}
+
+        # Fetch column names for each table
+        for table_name in table_name_list:
+            cur.execute(sqlrepo.FETCH_TABLE_COLUMNS, (table_name,))
+            result = cur.fetchall()
+
+            # Append column names to table names
+            table_col_dict[table_name] = [column_name[0] for column_name in result]
+
     # Return the dictionary
     return table_col_dict
 
@@ -77,26 +77,19 @@ def fetch_db_schema_DfOutput():
     Returns:
         dict[str, pandas.DataFrame]: mapping table_name → column-metadata-DF
     """
-    # Connect to database
-    conn = db_connection()
-    cur = conn.cursor()
-
-    # Discover tables
-    table_name_list = fetch_all_tbl_names()
+    with managed_connection() as conn, conn.cursor() as cur:
+        # Discover tables
+        table_name_list = _fetch_all_tbl_names(cur)
 
-    # Init dict: table_name → DataFrame
-    table_df_dict = {table_name: None for table_name in table_name_list}
-
-    # Fetch column metadata for each table
-    for table_name in table_name_list:
-        cur.execute(sqlrepo.FETCH_TABLE_METADATA, (table_name,))
-        result = cur.fetchall()
+        # Init dict: table_name → DataFrame
+        table_df_dict = {table_name: None for table_name in table_name_list}
 
+        # Fetch column metadata for each table
         df_columns = ["attr_name", "data_type", "is_nullable", "default_value"]
-        table_df_dict[table_name] = pd.DataFrame(data=result, columns=df_columns)
-
-    # Close cursor (connection intentionally left as in original logic)
-    cur.close()
+        for table_name in table_name_list:
+            cur.execute(sqlrepo.FETCH_TABLE_METADATA, (table_name,))
+            result = cur.fetchall()
+            table_df_dict[table_name] = pd.DataFrame(data=result, columns=df_columns)
 
     # Return mapping
     return table_df_dict
@@ -114,36 +107,30 @@ def dump_database_contents():
 
     The dicts are constructed to be consumed later in the pipeline.
     """
-    # Connect to database
-    conn = db_connection()
-    cur = conn.cursor()
-
-    # Fetch all table names
-    table_name_list = fetch_all_tbl_names()
-
-    # Dict for raw dumps
-    tbl_dump_dict = {table_name: None for table_name in table_name_list}
-
-    # Dict for DataFrame dumps
-    tbl_dump_df_dict = {table: None for table in table_name_list}
-
-    # Fetch content per table
-    for table in table_name_list:
-        query = sql.SQL(sqlrepo.DUMP_TABLE).format(sql.Identifier(table))
-        cur.execute(query)
-        result = cur.fetchall()
-
-        # store raw rows
-        tbl_dump_dict[table] = result
-
-        # build DataFrame with column names
-        column_names = [desc[0] for desc in cur.description]
-        tbl_dump_df_dict[table] = (
-            pd.DataFrame(columns=column_names, data=result).set_index(column_names[0])
-        )
-
-    # Close cursor (connection intentionally left as in original logic)
-    cur.close()
+    with managed_connection() as conn, conn.cursor() as cur:
+        # Fetch all table names
+        table_name_list = _fetch_all_tbl_names(cur)
+
+        # Dict for raw dumps
+        tbl_dump_dict = {table_name: None for table_name in table_name_list}
+
+        # Dict for DataFrame dumps
+        tbl_dump_df_dict = {table: None for table in table_name_list}
+
+        # Fetch content per table
+        for table in table_name_list:
+            query = sql.SQL(sqlrepo.DUMP_TABLE).format(sql.Identifier(table))
+            cur.execute(query)
+            result = cur.fetchall()
+
+            # store raw rows
+            tbl_dump_dict[table] = result
+
+            # build DataFrame with column names
+            column_names = [desc[0] for desc in cur.description]
+            tbl_dump_df_dict[table] = (
+                pd.DataFrame(columns=column_names, data=result).set_index(column_names[0])
+            )
 
     # Return the dataframe dict for later use
     return tbl_dump_df_dict
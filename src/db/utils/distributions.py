@@ -0,0 +1,162 @@
+"""
+distributions.py
+
+Skewed value distributions for foreign key and timestamp columns of the generated data.
+
+Uniform draws spread load evenly over every row; real traffic concentrates on a few popular
+listings, active guests and peak seasons, which is what stresses hot index pages and row locks.
+Each column ("<table>.<column>") can get a distribution in the active profile of
+data_lists.distribution_profiles (selected by DATA_DISTRIBUTION); columns without one stay uniform.
+
+Foreign keys (ids ranked in a seeded random order, rank 1 is the hottest id):
+- zipf: P(rank r) ∝ r^-s (s, default 1.1)
+- pareto: bounded Pareto over the ranks (alpha, default 1.16 ≈ 80/20)
+- normal: bell around a rank fraction (mean, sd as fractions of the id count)
+
+Timestamps (a day of the window is drawn, then a uniform second of that day):
+- seasonal: relative weight per month (months: 12 weights) and optionally per weekday
+  (weekdays: 7 weights, Monday first)
+- normal: bell around a fraction of the window (mean, sd)
+
+Features:
+- rank_probabilities() / day_weights(): the probability vectors (vectorized NumPy)
+- id_sampler(column, ids): samplers.Sampler over the ids with the column's distribution
+- timestamp_sampler(column): cached timestamps.TimestampSampler for the seed window
+
+Assumptions:
+- all randomness comes from the global `random` state (directly or via a NumPy generator seeded
+  from it), so RNG_SEED keeps skewed datasets reproducible
+- single uniform draws consume the random state like random.choice / randint did before
+"""
+
+
+# Stdlib imports
+import random
+import sys
+from pathlib import Path
+
+
+# Third-party imports
+import numpy as np
+
+
+# Path/bootstrap
+# Go three levels up (src/db/utils → project root) so imports work when run as script.
+PROJECT_ROOT = Path(__file__).resolve().parents[3]
+sys.path.insert(0, str(PROJECT_ROOT))
+
+
+# Internal imports
+import src.db.data_lists as seeds
+from src.db.utils.samplers import Sampler
+from src.db.utils.timestamps import TimestampSampler, Window
+
+
+
+ID_KINDS = ("uniform", "zipf", "pareto", "normal")
+TIMESTAMP_KINDS = ("uniform", "seasonal", "normal")
+UNIFORM = {"kind": "uniform"}
+
+_TIMESTAMP_SAMPLERS = {}
+
+
+
+# Probability vectors
+def rank_probabilities(n: int, kind: str, **params) -> np.ndarray:
+    """
+    Probability of each rank 1..n (index 0 = rank 1), None for "uniform".
+    """
+    if kind not in ID_KINDS:
+        raise ValueError(f"Unknown id distribution {kind!r}, expected one of {ID_KINDS}")
+    if kind == "uniform":
+        return None
+
+    ranks = np.arange(1, n + 1, dtype=np.float64)
+    if kind == "zipf":
+        weights = ranks ** -float(params.get("s", 1.1))
+    elif kind == "pareto":
+        # bounded Pareto on [1, n + 1]: P(rank r) = F(r + 1) - F(r)
+        alpha = float(params.get("alpha", 1.16))
+        edges = np.arange(1, n + 2, dtype=np.float64)
+        cdf = (1 - edges ** -alpha) / (1 - (n + 1) ** -alpha)
+        weights = np.diff(cdf)
+    else:
+        position = (ranks - 0.5) / n
+        weights = np.exp(-0.5 * ((position - float(params.get("mean", 0.5))) / float(params.get("sd", 0.15))) ** 2)
+    return weights / weights.sum()
+
+def day_weights(days: np.ndarray, kind: str, **params) -> np.ndarray:
+    """
+    Relative weight of every day (datetime64[D] array) of a window, None for "uniform".
+    """
+    if kind not in TIMESTAMP_KINDS:
+        raise ValueError(f"Unknown timestamp distribution {kind!r}, expected one of {TIMESTAMP_KINDS}")
+    if kind == "uniform":
+        return None
+
+    if kind == "seasonal":
+        months = np.asarray(params.get("months", [1] * 12), dtype=np.float64)
+        weekdays = np.asarray(params.get("weekdays", [1] * 7), dtype=np.float64)
+        if len(months) != 12 or len(weekdays) != 7:
+            raise ValueError("seasonal distribution needs 12 month weights and 7 weekday weights")
+        month_index = days.astype("datetime64[M]").astype(np.int64) % 12
+        weekday_index = (days.astype(np.int64) + 3) % 7  # 1970-01-01 was a Thursday
+        return months[month_index] * weekdays[weekday_index]
+
+    position = (np.arange(len(days), dtype=np.float64) + 0.5) / len(days)
+    return np.exp(-0.5 * ((position - float(params.get("mean", 0.5))) / float(params.get("sd", 0.15))) ** 2)
+
+
+
+# Column samplers
+def column_spec(column: str) -> dict:
+    """
+    Distribution of `column` ("<table>.<column>") in the active profile (uniform if not listed).
+    """
+    return seeds.distributions.get(column, UNIFORM)
+
+def id_sampler(column: str, ids: list) -> Sampler:
+    """
+    Return a Sampler over `ids` following the distribution configured for `column`.
+
+    The hot ranks are assigned to ids in a seeded random order (`"shuffle": False` keeps the
+    given order, i.e. the first ids are the hottest).
+    """
+    spec = dict(column_spec(column))
+    kind = spec.pop("kind")
+    shuffle = spec.pop("shuffle", True)
+    probabilities = rank_probabilities(len(ids), kind, **spec)
+    if probabilities is None:
+        return Sampler(ids, name=column)
+
+    ranked = list(ids)
+    if shuffle:
+        order = np.random.default_rng(random.getrandbits(64)).permutation(len(ranked))
+        ranked = [ranked[i] for i in order.tolist()]
+    return Sampler(ranked, probabilities, column)
+
+def build_timestamp_sampler(window: Window, kind: str = "uniform", name: str = "", **params) -> TimestampSampler:
+    """
+    TimestampSampler over `window` with the day weights of a timestamp distribution.
+    """
+    return TimestampSampler(window, day_weights(window.days(), kind, **params), name)
+
+def timestamp_sampler(column: str = None) -> TimestampSampler:
+    """
+    Return the (cached) TimestampSampler of `column` for the seed window; None = uniform.
+    """
+    spec = column_spec(column) if column else UNIFORM
+    key = (column, repr(sorted(spec.items())), seeds.start_timestamp, seeds.stop_timestamp)
+    if key not in _TIMESTAMP_SAMPLERS:
+        params = {k: v for k, v in spec.items() if k != "kind"}
+        window = Window(seeds.start_timestamp, seeds.stop_timestamp)
+        _TIMESTAMP_SAMPLERS[key] = build_timestamp_sampler(window, spec["kind"], column or "", **params)
+    return _TIMESTAMP_SAMPLERS[key]
+
+def apply_profile(name: str):
+    """
+    Make data_lists.distribution_profiles[name] the active column distributions.
+    """
+    if name not in seeds.distribution_profiles:
+        raise ValueError(f"Unknown distribution profile {name!r}, expected one of {list(seeds.distribution_profiles)}")
+    seeds.distributions = seeds.distribution_profiles[name]
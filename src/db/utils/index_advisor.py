@@ -0,0 +1,225 @@
+"""
+index_advisor.py
+
+Index advisor: reads pg_index / pg_stat_user_indexes after a workload and reports which
+indexes cost write throughput without paying for themselves, and where indexes are missing.
+
+Findings:
+- duplicate: same table, same columns in the same order as another index
+- prefix: columns are a leading prefix of another index on the same table
+- unused: never scanned since the statistics were last reset
+- missing: seq-scan-heavy table with a foreign key that no index starts with
+
+Every finding on an existing index carries its size and the estimated write overhead
+(index entries written = inserts + non-HOT updates on the table since the stats reset).
+
+Assumptions:
+- only plain (non-partial, non-expression) indexes take part in duplicate/prefix checks
+- primary-key and unique indexes are never suggested for removal (they back constraints);
+  when one duplicates a plain index, the plain index is reported
+- reset the statistics right before the workload so scan counts reflect that workload:
+
+    python -m src.db.utils.index_advisor --reset-stats
+    python -m benchmarks.bench_workload --duration 60
+    python -m src.db.utils.index_advisor
+"""
+
+
+# Stdlib imports
+import argparse
+import sys
+from pathlib import Path
+
+
+# Path/bootstrap
+# Go three levels up (src/db/utils → project root) so imports work when run as script.
+PROJECT_ROOT = Path(__file__).resolve().parents[3]
+sys.path.insert(0, str(PROJECT_ROOT))
+
+
+# Internal imports
+from src.db.connection import managed_connection
+from src.db import sql_repo as sqlrepo
+from src.utils.logger import logger
+from src.utils.tables import format_table
+
+
+
+# Advisor thresholds
+MIN_SEQ_TUP_READ = 100_000  # rows read by seq scans before a table counts as seq-scan heavy
+MIN_LIVE_ROWS = 1_000       # smaller tables are cheaper to scan than to index
+
+REPORT_COLUMNS = ["finding", "table_name", "index_name", "columns", "covered_by", "size_bytes", "idx_scan", "index_writes"]
+
+
+
+# Statistics
+def _fetch_dicts(cur, query: str) -> list:
+    cur.execute(query)
+    names = [col.name for col in cur.description]
+    return [dict(zip(names, row)) for row in cur.fetchall()]
+
+def fetch_index_stats(cur) -> dict:
+    """
+    Return index definitions/usage, table scan statistics and foreign keys of the public schema.
+    """
+    return {
+        "indexes": _fetch_dicts(cur, sqlrepo.FETCH_INDEX_USAGE),
+        "tables": _fetch_dicts(cur, sqlrepo.FETCH_TABLE_SCAN_STATS),
+        "foreign_keys": _fetch_dicts(cur, sqlrepo.FETCH_FOREIGN_KEY_COLUMNS),
+    }
+
+def reset_stats():
+    """
+    Reset the statistics counters of the current database (call right before the workload).
+    """
+    with managed_connection() as conn, conn.cursor() as cur:
+        cur.execute(sqlrepo.RESET_STATISTICS)
+    logger.info("Index advisor: statistics reset")
+
+
+
+# Analysis
+def _constraint_backed(index: dict) -> bool:
+    return index["is_primary"] or index["is_unique"]
+
+def _comparable(index: dict) -> bool:
+    return index["method"] == "btree" and not index["is_partial_or_expression"]
+
+def _finding(kind: str, index: dict, covered_by: str = None) -> dict:
+    return {
+        "finding": kind,
+        "table_name": index["table_name"],
+        "index_name": index["index_name"],
+        "columns": ",".join(index["columns"]),
+        "covered_by": covered_by,
+        "size_bytes": index["size_bytes"],
+        "idx_scan": index["idx_scan"],
+        "index_writes": index["index_writes"],
+    }
+
+def find_redundant_indexes(indexes: list) -> list:
+    """
+    Report duplicate and prefix-redundant indexes.
+
+    Args:
+        indexes (list): rows of FETCH_INDEX_USAGE as dicts.
+
+    Returns:
+        list[dict]: one finding per redundant index (kind "duplicate" or "prefix").
+    """
+    by_table = {}
+    for index in indexes:
+        if _comparable(index):
+            by_table.setdefault(index["table_name"], []).append(index)
+
+    findings = []
+    for candidates in by_table.values():
+        for index in candidates:
+            if _constraint_backed(index):
+                continue
+            columns = list(index["columns"])
+            for other in candidates:
+                if other is index:
+                    continue
+                other_columns = list(other["columns"])
+                if other_columns == columns:
+                    # Keep constraint-backed indexes; between two plain ones keep the first by name
+                    if _constraint_backed(other) or other["index_name"] < index["index_name"]:
+                        findings.append(_finding("duplicate", index, other["index_name"]))
+                        break
+                elif len(other_columns) > len(columns) and other_columns[:len(columns)] == columns:
+                    findings.append(_finding("prefix", index, other["index_name"]))
+                    break
+    return findings
+
+def find_unused_indexes(indexes: list, reported: set = frozenset()) -> list:
+    """
+    Report plain indexes with zero scans that are not already in `reported` (index names).
+    """
+    return [
+        _finding("unused", index)
+        for index in indexes
+        if index["idx_scan"] == 0 and not _constraint_backed(index) and index["index_name"] not in reported
+    ]
+
+def suggest_missing_indexes(indexes: list, tables: list, foreign_keys: list,
+                            min_seq_tup_read: int = MIN_SEQ_TUP_READ, min_live_rows: int = MIN_LIVE_ROWS) -> list:
+    """
+    Suggest indexes on foreign-key columns of seq-scan-heavy tables that no index starts with.
+    """
+    leading = {}
+    for index in indexes:
+        if index["columns"]:
+            leading.setdefault(index["table_name"], []).append(list(index["columns"]))
+
+    heavy = {
+        table["table_name"]: table
+        for table in tables
+        if table["seq_tup_read"] >= min_seq_tup_read
+        and table["n_live_tup"] >= min_live_rows
+        and table["seq_scan"] > table["idx_scan"]
+    }
+
+    findings = []
+    for fk in foreign_keys:
+        table = heavy.get(fk["table_name"])
+        columns = list(fk["columns"])
+        if table is None:
+            continue
+        if any(existing[:len(columns)] == columns for existing in leading.get(fk["table_name"], [])):
+            continue
+        findings.append({
+            "finding": "missing",
+            "table_name": fk["table_name"],
+            "index_name": f"idx_{fk['table_name']}_{'_'.join(columns)}",
+            "columns": ",".join(columns),
+            "covered_by": None,
+            "size_bytes": None,
+            "idx_scan": table["idx_scan"],
+            "index_writes": None,
+            "seq_scan": table["seq_scan"],
+            "seq_tup_read": table["seq_tup_read"],
+        })
+    return findings
+
+def advise(stats: dict) -> list:
+    """
+    Run all checks on the output of fetch_index_stats() and return the findings.
+    """
+    redundant = find_redundant_indexes(stats["indexes"])
+    unused = find_unused_indexes(stats["indexes"], {finding["index_name"] for finding in redundant})
+    missing = suggest_missing_indexes(stats["indexes"], stats["tables"], stats["foreign_keys"])
+    return redundant + unused + missing
+
+def run_advisor() -> list:
+    """
+    Fetch the statistics, log the findings as a table and return them.
+    """
+    with managed_connection() as conn, conn.cursor() as cur:
+        findings = advise(fetch_index_stats(cur))
+
+    if not findings:
+        logger.info("Index advisor: no findings")
+        return findings
+
+    removable = [f for f in findings if f["finding"] != "missing"]
+    logger.info(
+        f"Index advisor: {len(removable)} removable index(es) "
+        f"({sum(f['size_bytes'] or 0 for f in removable)} bytes), "
+        f"{len(findings) - len(removable)} suggested\n" + format_table(findings, REPORT_COLUMNS)
+    )
+    return findings
+
+
+
+# CLI entrypoint
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Report duplicate, prefix-redundant, unused and missing indexes.")
+    parser.add_argument("--reset-stats", action="store_true", help="reset statistics counters and exit")
+    args = parser.parse_args()
+
+    if args.reset_stats:
+        reset_stats()
+    else:
+        run_advisor()
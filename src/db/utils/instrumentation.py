@@ -0,0 +1,280 @@
+"""
+instrumentation.py
+
+Per-stage timing and round-trip instrumentation for the seeding pipeline.
+
+Features:
+- InstrumentedCursor: cursor_factory that counts statements, round trips, rows and bytes sent
+  and the time spent waiting on the database, attributed to the active stage
+- stage() decorator / stage_scope() context manager marking pipeline stages
+- in_active_stage(): wraps a function submitted to a thread pool so the worker's calls count
+  towards the stage that submitted it
+- stage_summary(): per stage wall, generation, network and server time plus the counters
+- log_summary() / write_jsonl(): structured summary table in the log, optional JSON lines
+
+Assumptions:
+- calls outside any stage pass straight through (no bookkeeping)
+- the active stage is thread-local; worker threads only see it through in_active_stage(),
+  and their database time adds up across workers (db_s can exceed wall_s)
+- executemany() costs one round trip per parameter set (psycopg2 sends them one by one)
+- network vs. server time is an estimate: round trips x measured RTT of `SELECT 1`,
+  the rest of the database wait is attributed to the server
+"""
+
+
+# Stdlib imports
+import functools
+import json
+import sys
+import threading
+import time
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from pathlib import Path
+
+
+# Third-party imports
+import psycopg2.extensions
+from psycopg2 import sql
+
+
+# Path/bootstrap
+# Go three levels up (src/db/utils → project root) so imports work when run as script.
+PROJECT_ROOT = Path(__file__).resolve().parents[3]
+sys.path.insert(0, str(PROJECT_ROOT))
+
+
+# Internal imports
+from src.utils.logger import logger
+from src.utils.tables import format_table
+
+
+
+SUMMARY_COLUMNS = [
+    "stage", "wall_s", "generation_s", "network_s", "server_s",
+    "statements", "round_trips", "rows_sent", "bytes_sent",
+]
+
+
+
+# Stage bookkeeping
+@dataclass
+class StageStats:
+    name: str
+    wall_s: float = 0.0
+    db_s: float = 0.0
+    statements: int = 0
+    round_trips: int = 0
+    rows_sent: int = 0
+    bytes_sent: int = 0
+    started_at: float = field(default_factory=time.time)
+
+
+_local = threading.local()
+_lock = threading.Lock()
+_completed = []  # finished StageStats in completion order
+
+
+def _stack() -> list:
+    stack = getattr(_local, "stack", None)
+    if stack is None:
+        stack = _local.stack = []
+    return stack
+
+def _active():
+    stack = getattr(_local, "stack", None)
+    return stack[-1] if stack else None
+
+@contextmanager
+def stage_scope(name: str):
+    """
+    Attribute all instrumented database calls inside the block to stage `name`.
+    Nested stages count towards the innermost one.
+    """
+    stats = StageStats(name)
+    stack = _stack()
+    stack.append(stats)
+
+    t0 = time.perf_counter()
+    try:
+        yield stats
+    finally:
+        stats.wall_s = time.perf_counter() - t0
+        stack.pop()
+        with _lock:
+            _completed.append(stats)
+
+def stage(name: str = None):
+    """
+    Decorator form of stage_scope(); the stage name defaults to the function name.
+    """
+    def decorator(fn):
+        @functools.wraps(fn)
+        def wrapper(*args, **kwargs):
+            with stage_scope(name or fn.__name__):
+                return fn(*args, **kwargs)
+        return wrapper
+    return decorator
+
+def in_active_stage(fn):
+    """
+    Bind `fn` to the stage active in the calling thread, e.g. before handing it to a
+    ThreadPoolExecutor; calls made by `fn` in another thread then count towards that stage.
+    """
+    stats = _active()
+    if stats is None:
+        return fn
+
+    @functools.wraps(fn)
+    def wrapper(*args, **kwargs):
+        stack = _stack()
+        stack.append(stats)
+        try:
+            return fn(*args, **kwargs)
+        finally:
+            stack.pop()
+    return wrapper
+
+def completed_stages() -> list:
+    """
+    Return the finished StageStats of this process (oldest first).
+    """
+    with _lock:
+        return list(_completed)
+
+def reset():
+    """
+    Forget all finished stages.
+    """
+    with _lock:
+        _completed.clear()
+
+
+
+# Cursor wrapper
+class InstrumentedCursor(psycopg2.extensions.cursor):
+    """
+    psycopg2 cursor_factory that records every call made while a stage is active.
+    """
+
+    def _record(self, stats, t0: float, statements: int, rows: int, nbytes: int):
+        elapsed = time.perf_counter() - t0
+        with _lock:  # worker threads of one stage share its StageStats
+            stats.db_s += elapsed
+            stats.statements += statements
+            stats.round_trips += statements
+            stats.rows_sent += rows
+            stats.bytes_sent += nbytes
+
+    def execute(self, query, vars=None):
+        stats = _active()
+        if stats is None:
+            return super().execute(query, vars)
+        t0 = time.perf_counter()
+        try:
+            return super().execute(query, vars)
+        finally:
+            self._record(stats, t0, 1, 0 if vars is None else 1, len(self.query or b""))
+
+    def executemany(self, query, vars_list):
+        stats = _active()
+        if stats is None:
+            return super().executemany(query, vars_list)
+        vars_list = list(vars_list)
+        t0 = time.perf_counter()
+        try:
+            return super().executemany(query, vars_list)
+        finally:
+            # self.query only holds the last statement; scale it by the number of parameter sets
+            self._record(stats, t0, len(vars_list), len(vars_list), len(self.query or b"") * len(vars_list))
+
+    def copy_expert(self, sql_query, file, size=8192):
+        stats = _active()
+        if stats is None:
+            return super().copy_expert(sql_query, file, size)
+        text = sql_query.as_string(self) if isinstance(sql_query, sql.Composable) else str(sql_query)
+        is_copy_in = "FROM STDIN" in text.upper()
+        start_pos = file.tell() if is_copy_in and hasattr(file, "tell") else None
+        t0 = time.perf_counter()
+        try:
+            return super().copy_expert(sql_query, file, size)
+        finally:
+            nbytes = len(text.encode())
+            if start_pos is not None:
+                nbytes += file.tell() - start_pos
+            rows = max(self.rowcount, 0) if is_copy_in else 0
+            self._record(stats, t0, 1, rows, nbytes)
+
+
+
+# Reporting
+def measure_rtt(samples: int = 5) -> float:
+    """
+    Return the fastest `SELECT 1` round trip in seconds (used to split network from server time).
+    """
+    from src.db.connection import managed_connection
+
+    best = None
+    with managed_connection() as conn, conn.cursor() as cur:
+        for _ in range(samples):
+            t0 = time.perf_counter()
+            cur.execute("SELECT 1;")
+            cur.fetchone()
+            elapsed = time.perf_counter() - t0
+            best = elapsed if best is None else min(best, elapsed)
+    return best
+
+def stage_summary(stages: list = None, rtt: float = None) -> list:
+    """
+    Build one summary row per stage.
+
+    Args:
+        stages (list): StageStats to summarize; defaults to completed_stages().
+        rtt (float): round-trip time in seconds; measured when omitted.
+
+    Returns:
+        list[dict]: rows with the SUMMARY_COLUMNS keys
+    """
+    stages = completed_stages() if stages is None else stages
+    if rtt is None:
+        rtt = measure_rtt() if stages else 0.0
+
+    rows = []
+    for stats in stages:
+        network_s = min(stats.round_trips * rtt, stats.db_s)
+        rows.append({
+            "stage": stats.name,
+            "wall_s": round(stats.wall_s, 3),
+            "generation_s": round(max(stats.wall_s - stats.db_s, 0.0), 3),
+            "network_s": round(network_s, 3),
+            "server_s": round(stats.db_s - network_s, 3),
+            "statements": stats.statements,
+            "round_trips": stats.round_trips,
+            "rows_sent": stats.rows_sent,
+            "bytes_sent": stats.bytes_sent,
+        })
+    return rows
+
+def log_summary(rows: list = None):
+    """
+    Log the per-stage summary as a table (plus a total line).
+    """
+    rows = stage_summary() if rows is None else rows
+    if not rows:
+        return
+    total = {"stage": "TOTAL"}
+    for col in SUMMARY_COLUMNS[1:]:
+        total[col] = round(sum(row[col] for row in rows), 3)
+    logger.info("Pipeline stage summary:\n" + format_table(rows + [total], SUMMARY_COLUMNS))
+
+def write_jsonl(path, rows: list = None):
+    """
+    Append one JSON line per stage (with the run timestamp) to `path`.
+    """
+    rows = stage_summary() if rows is None else rows
+    run_at = time.strftime("%Y-%m-%dT%H:%M:%S")
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with open(path, "a", encoding="utf-8") as f:
+        for row in rows:
+            f.write(json.dumps({"run_at": run_at, **row}) + "\n")
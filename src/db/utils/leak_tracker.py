@@ -0,0 +1,166 @@
+"""
+leak_tracker.py
+
+Instrumentation hook that tracks open psycopg2 connections and cursors per call site.
+
+Features:
+- TrackedConnection: connection_factory that registers itself and every cursor it creates
+- open_resources(): lists connections/cursors that are still alive and not closed
+- report_leaks(): logs or raises at the end of a pipeline run if anything leaked
+
+Assumptions:
+- src.config.DB_LEAK_CHECK is one of "off", "log", "raise"
+- objects are held via weak references only, so tracking never keeps a connection alive
+"""
+
+
+# Stdlib imports
+import sys
+import threading
+import weakref
+from collections import Counter
+from pathlib import Path
+
+
+# Third-party imports
+import psycopg2.extensions
+
+
+# Path/bootstrap
+# Go three levels up (src/db/utils → project root) so imports work when run as script.
+PROJECT_ROOT = Path(__file__).resolve().parents[3]
+sys.path.insert(0, str(PROJECT_ROOT))
+
+
+# Internal imports
+from src import config
+from src.utils.logger import logger
+
+
+
+# Tracking state
+LEAK_CHECK_MODES = ("off", "log", "raise")
+
+_lock = threading.Lock()
+_registry = {}  # id(obj) → (weakref, kind, call_site)
+
+# Frames from these files are skipped when resolving the call site
+_SKIP_FILES = (__file__, str(PROJECT_ROOT / "src" / "db" / "connection.py"))
+
+
+class ConnectionLeakError(RuntimeError):
+    """Raised by report_leaks() in "raise" mode when connections or cursors are left open."""
+
+
+
+# helpers
+def _mode() -> str:
+    mode = str(config.DB_LEAK_CHECK).lower()
+    return mode if mode in LEAK_CHECK_MODES else "log"
+
+def _call_site() -> str:
+    """
+    Return "file:line in func" of the first frame outside the tracker and connection module.
+    """
+    frame = sys._getframe(1)
+    while frame is not None and frame.f_code.co_filename in _SKIP_FILES:
+        frame = frame.f_back
+    if frame is None:
+        return "<unknown>"
+    path = Path(frame.f_code.co_filename)
+    try:
+        path = path.relative_to(PROJECT_ROOT)
+    except ValueError:
+        pass
+    return f"{path}:{frame.f_lineno} in {frame.f_code.co_name}"
+
+def _forget(key):
+    with _lock:
+        _registry.pop(key, None)
+
+
+
+# Registration
+def track(obj, kind: str):
+    """
+    Register a connection or cursor. No-op when DB_LEAK_CHECK is "off".
+
+    Args:
+        obj: psycopg2 connection/cursor (anything with a `closed` attribute).
+        kind (str): "connection" or "cursor".
+    """
+    if _mode() == "off":
+        return
+    key = id(obj)
+    ref = weakref.ref(obj, lambda _ref, key=key: _forget(key))
+    with _lock:
+        _registry[key] = (ref, kind, _call_site())
+
+
+class TrackedConnection(psycopg2.extensions.connection):
+    """
+    psycopg2 connection_factory that registers the connection and all cursors it opens.
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        track(self, "connection")
+
+    def cursor(self, *args, **kwargs):
+        cur = super().cursor(*args, **kwargs)
+        track(cur, "cursor")
+        return cur
+
+
+
+# Reporting
+def open_resources() -> list:
+    """
+    Return (kind, call_site) for every tracked object that is still alive and not closed.
+    Cursors of a closed connection count as closed.
+    """
+    with _lock:
+        entries = list(_registry.values())
+
+    leaks = []
+    for ref, kind, call_site in entries:
+        obj = ref()
+        if obj is not None and not obj.closed:
+            leaks.append((kind, call_site))
+    return leaks
+
+def reset():
+    """
+    Forget all tracked objects (e.g. between pipeline runs in one process).
+    """
+    with _lock:
+        _registry.clear()
+
+def report_leaks(mode: str = None) -> Counter:
+    """
+    Check for open connections/cursors and surface them according to the leak check mode.
+
+    Args:
+        mode (str): "off", "log" or "raise"; defaults to src.config.DB_LEAK_CHECK.
+
+    Returns:
+        Counter: (kind, call_site) → number of open objects.
+
+    Raises:
+        ConnectionLeakError: in "raise" mode if anything is still open.
+    """
+    mode = mode or _mode()
+    if mode == "off":
+        return Counter()
+
+    leaks = Counter(open_resources())
+    if not leaks:
+        logger.info("Leak check: no open connections or cursors.")
+        return leaks
+
+    lines = [f"{count}x {kind} opened at {site}" for (kind, site), count in leaks.most_common()]
+    message = "Leak check: open connections/cursors left behind:\n" + "\n".join(lines)
+    if mode == "raise":
+        raise ConnectionLeakError(message)
+    logger.warning(message)
+    return leaks
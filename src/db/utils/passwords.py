@@ -0,0 +1,220 @@
+"""
+passwords.py
+
+Real salted password hashes for credentials.password_hash, computed in a process pool and cached.
+
+Random 32-character strings make the credentials table smaller and cheaper to read than production
+(bcrypt/argon2 hashes are 60-100 bytes), so PASSWORD_HASH can switch the generator to real hashes
+of a configurable algorithm and cost. Hashing is CPU-bound by design, so rows are hashed in chunks
+by a ProcessPoolExecutor, and the results are cached per (algorithm, cost, seed) in hash_cache/ so
+repeated runs only pay for rows they have not hashed before.
+
+Algorithms (cost = work factor, None = DEFAULT_COSTS):
+- pbkdf2_sha256: iterations, Django format `pbkdf2_sha256$<iterations>$<salt>$<hash>` (stdlib)
+- scrypt: log2(N) with r=8, p=1, format `$scrypt$ln=<cost>,r=8,p=1$<salt>$<hash>` (stdlib)
+- bcrypt: log2 rounds, `$2b$<cost>$...` (optional package `bcrypt`)
+- argon2id: time cost with 64 MiB memory and 4 lanes, `$argon2id$v=19$...` (optional package `argon2-cffi`)
+
+Features:
+- hash_passwords(n, algorithm, cost, seed, workers): n hashes (rows 0..n-1), cached when seeded
+- plain_password(seed, i): the plaintext behind row i, e.g. for login benchmarks
+- hash_password() / verify_password(): one hash, check a plaintext against an encoded hash
+
+Assumptions:
+- password and salt of row i derive from sha256("<seed>:<i>"), so a cache file for a seed is
+  valid for any prefix of rows and a larger dataset only hashes the missing tail
+- unseeded runs (seed None) draw a seed from the global `random` state and are not cached
+"""
+
+
+# Stdlib imports
+import base64
+import hashlib
+import hmac
+import os
+import random
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from itertools import repeat
+from pathlib import Path
+
+
+# Path/bootstrap
+# Go three levels up (src/db/utils → project root) so imports work when run as script.
+PROJECT_ROOT = Path(__file__).resolve().parents[3]
+sys.path.insert(0, str(PROJECT_ROOT))
+
+
+# Internal imports
+from src.utils.logger import logger
+
+
+
+HASH_CACHE_DIR = PROJECT_ROOT / "hash_cache"
+
+ALGORITHMS = ("pbkdf2_sha256", "scrypt", "bcrypt", "argon2id")
+DEFAULT_COSTS = {"pbkdf2_sha256": 600_000, "scrypt": 15, "bcrypt": 12, "argon2id": 3}
+
+# Optional packages per algorithm (import name, pip name)
+OPTIONAL_PACKAGES = {"bcrypt": ("bcrypt", "bcrypt"), "argon2id": ("argon2", "argon2-cffi")}
+
+# Rows per task submitted to the pool
+CHUNK_SIZE = 256
+
+ARGON2_MEMORY_KIB = 65536
+ARGON2_PARALLELISM = 4
+SCRYPT_R = 8
+
+_STD_B64 = b"ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz0123456789+/"
+_BCRYPT_B64 = b"./ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz0123456789"
+
+
+
+# Helpers
+def _b64(data: bytes) -> str:
+    return base64.b64encode(data).decode().rstrip("=")
+
+def _b64decode(text: str) -> bytes:
+    return base64.b64decode(text + "=" * (-len(text) % 4))
+
+def _require(algorithm: str):
+    """
+    Validate `algorithm` and import its optional package (ImportError with install hint if missing).
+    """
+    if algorithm not in ALGORITHMS:
+        raise ValueError(f"Unknown password hash algorithm {algorithm!r}, expected one of {ALGORITHMS}")
+    if algorithm in OPTIONAL_PACKAGES:
+        module, package = OPTIONAL_PACKAGES[algorithm]
+        try:
+            return __import__(module)
+        except ImportError:
+            raise ImportError(f"Password hash algorithm {algorithm!r} needs the '{package}' package (pip install {package})") from None
+    return None
+
+def resolve_cost(algorithm: str, cost: int = None) -> int:
+    return DEFAULT_COSTS[algorithm] if cost is None else int(cost)
+
+def _row_material(seed: int, i: int) -> bytes:
+    return hashlib.sha256(f"{seed}:{i}".encode()).digest()
+
+def plain_password(seed: int, i: int) -> str:
+    """
+    Plaintext password of row i for `seed` (16 characters).
+    """
+    return _b64(_row_material(seed, i)[:12])
+
+def _row_salt(seed: int, i: int) -> bytes:
+    return _row_material(seed, i)[16:]
+
+
+
+# Hashing
+def hash_password(password: str, salt: bytes, algorithm: str, cost: int = None) -> str:
+    """
+    Encoded hash of `password` with a 16 byte `salt`.
+    """
+    module = _require(algorithm)
+    cost = resolve_cost(algorithm, cost)
+    secret = password.encode()
+
+    if algorithm == "pbkdf2_sha256":
+        salt_text = _b64(salt)
+        digest = hashlib.pbkdf2_hmac("sha256", secret, salt_text.encode(), cost, 32)
+        return f"pbkdf2_sha256${cost}${salt_text}${base64.b64encode(digest).decode()}"
+    if algorithm == "scrypt":
+        n = 2 ** cost
+        digest = hashlib.scrypt(secret, salt=salt, n=n, r=SCRYPT_R, p=1, maxmem=256 * SCRYPT_R * n + 2**20, dklen=32)
+        return f"$scrypt$ln={cost},r={SCRYPT_R},p=1${_b64(salt)}${_b64(digest)}"
+    if algorithm == "bcrypt":
+        salt_text = _b64(salt).encode().translate(bytes.maketrans(_STD_B64, _BCRYPT_B64))
+        return module.hashpw(secret, b"$2b$%02d$" % cost + salt_text).decode()
+
+    from argon2.low_level import Type, hash_secret
+    return hash_secret(
+        secret, salt, time_cost=cost, memory_cost=ARGON2_MEMORY_KIB,
+        parallelism=ARGON2_PARALLELISM, hash_len=32, type=Type.ID,
+    ).decode()
+
+def verify_password(password: str, encoded: str) -> bool:
+    """
+    Check `password` against a hash produced by hash_password().
+    """
+    if encoded.startswith("pbkdf2_sha256$"):
+        _, cost, salt_text, _ = encoded.split("$")
+        expected = hash_password(password, _b64decode(salt_text), "pbkdf2_sha256", int(cost))
+    elif encoded.startswith("$scrypt$"):
+        _, _, params, salt_text, _ = encoded.split("$")
+        cost = int(params.split(",")[0].removeprefix("ln="))
+        expected = hash_password(password, _b64decode(salt_text), "scrypt", cost)
+    elif encoded.startswith("$2"):
+        return _require("bcrypt").checkpw(password.encode(), encoded.encode())
+    elif encoded.startswith("$argon2id$"):
+        _require("argon2id")
+        from argon2.exceptions import VerificationError
+        from argon2.low_level import Type, verify_secret
+        try:
+            return verify_secret(encoded.encode(), password.encode(), Type.ID)
+        except VerificationError:
+            return False
+    else:
+        raise ValueError(f"Unrecognized password hash format: {encoded[:16]!r}")
+    return hmac.compare_digest(expected, encoded)
+
+def _hash_range(algorithm: str, cost: int, seed: int, start: int, stop: int) -> list:
+    """
+    Hashes of rows start..stop-1 (runs in the pool workers).
+    """
+    return [hash_password(plain_password(seed, i), _row_salt(seed, i), algorithm, cost) for i in range(start, stop)]
+
+def compute_hashes(algorithm: str, cost: int, seed: int, start: int, stop: int, workers: int = None) -> list:
+    """
+    Hashes of rows start..stop-1, in chunks of CHUNK_SIZE over `workers` processes (None = all cores).
+    """
+    workers = workers or os.cpu_count() or 1
+    if workers == 1 or stop - start <= CHUNK_SIZE:
+        return _hash_range(algorithm, cost, seed, start, stop)
+
+    starts = list(range(start, stop, CHUNK_SIZE))
+    stops = [min(s + CHUNK_SIZE, stop) for s in starts]
+    hashes = []
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        for chunk in pool.map(_hash_range, repeat(algorithm), repeat(cost), repeat(seed), starts, stops):
+            hashes.extend(chunk)
+    return hashes
+
+
+
+# Cache
+def cache_path(algorithm: str, cost: int, seed: int) -> Path:
+    return HASH_CACHE_DIR / f"{algorithm}_c{cost}_s{seed}.txt"
+
+def hash_passwords(n: int, algorithm: str, cost: int = None, seed: int = None, workers: int = None) -> list:
+    """
+    Return n password hashes (rows 0..n-1).
+
+    Args:
+        n (int): number of hashes.
+        algorithm (str): one of ALGORITHMS.
+        cost (int): work factor (None = DEFAULT_COSTS[algorithm]).
+        seed (int): derives passwords and salts; seeded results are cached in HASH_CACHE_DIR.
+            None = a seed drawn from the global random state, not cached.
+        workers (int): hashing processes (None = all cores).
+    """
+    _require(algorithm)
+    cost = resolve_cost(algorithm, cost)
+    if seed is None:
+        return compute_hashes(algorithm, cost, random.getrandbits(63), 0, n, workers)
+
+    path = cache_path(algorithm, cost, seed)
+    cached = path.read_text().splitlines() if path.exists() else []
+    if len(cached) >= n:
+        logger.info(f"Password hashes: {n} from cache {path.name}")
+        return cached[:n]
+
+    logger.info(f"Password hashes: {len(cached)} from cache, hashing {n - len(cached)} ({algorithm}, cost {cost})")
+    hashes = cached + compute_hashes(algorithm, cost, seed, len(cached), n, workers)
+    HASH_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+    tmp = path.with_suffix(".tmp")
+    tmp.write_text("\n".join(hashes) + "\n")
+    os.replace(tmp, path)
+    return hashes
@@ -0,0 +1,185 @@
+"""
+pg_cluster.py
+
+Throwaway PostgreSQL cluster for tests and benchmarks, no Docker/Colima required.
+
+Features:
+- ephemeral_cluster(): initdb into a temp dir, start postgres on a Unix socket in that dir (no TCP),
+  create the database, yield its connection settings, stop and delete everything afterwards
+- durability switched off for speed (fsync, synchronous_commit, full_page_writes, minimal WAL),
+  large shared_buffers; pg_stat_statements is preloaded if the installation ships it
+- apply_config=True points src.config at the cluster for the duration (in-process use, e.g. pytest)
+- CLI: run a command against a fresh cluster via DB_* environment variables (they take
+  precedence over .env because load_dotenv does not override existing variables)
+
+    python -m src.db.utils.pg_cluster -- python -m benchmarks.bench_pipeline --scales 1k
+    python -m src.db.utils.pg_cluster -- pytest -n auto --dist loadfile
+
+Assumptions:
+- PostgreSQL server binaries (initdb, pg_ctl, createdb) are found via PG_BIN_DIR, PATH, pg_config
+  or /usr/lib/postgresql/<version>/bin
+- initdb refuses to run as root; use an unprivileged user
+- data is lost on exit (and on a crash, which is fine for throwaway data)
+"""
+
+
+# Stdlib imports
+import argparse
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+from contextlib import contextmanager
+from pathlib import Path
+
+
+# Path/bootstrap
+# Go three levels up (src/db/utils → project root) so imports work when run as script.
+PROJECT_ROOT = Path(__file__).resolve().parents[3]
+sys.path.insert(0, str(PROJECT_ROOT))
+
+
+# Internal imports
+from src import config
+from src.utils.logger import logger
+
+
+
+CLUSTER_USER = "postgres"
+CLUSTER_DB = "datamart"
+CLUSTER_PORT = 5432     # only names the socket file, TCP is disabled
+
+# Server settings for throwaway data: no crash safety, few checkpoints, large cache
+FAST_SETTINGS = {
+    "listen_addresses": "",
+    "fsync": "off",
+    "synchronous_commit": "off",
+    "full_page_writes": "off",
+    "wal_level": "minimal",
+    "max_wal_senders": "0",
+    "max_wal_size": "4GB",
+    "checkpoint_timeout": "30min",
+    "shared_buffers": "1GB",
+    "maintenance_work_mem": "512MB",
+}
+
+# src.config attributes replaced while the cluster is applied in-process
+_CONFIG_KEYS = ("DB_HOST", "DB_HOST_PORT", "DB_NAME", "DB_USER", "DB_PASSWORD")
+
+
+
+# helpers
+def find_bin_dir() -> Path:
+    """
+    Return the directory containing initdb/pg_ctl; raises FileNotFoundError if none is installed.
+    """
+    candidates = []
+    if config.PG_BIN_DIR:
+        candidates.append(Path(config.PG_BIN_DIR))
+    if shutil.which("initdb"):
+        candidates.append(Path(shutil.which("initdb")).parent)
+    if shutil.which("pg_config"):
+        bindir = subprocess.run(["pg_config", "--bindir"], capture_output=True, text=True).stdout.strip()
+        candidates.append(Path(bindir))
+    versions = [p for p in Path("/usr/lib/postgresql").glob("*/bin") if p.parent.name.isdigit()]
+    candidates += sorted(versions, key=lambda p: int(p.parent.name), reverse=True)
+
+    for candidate in candidates:
+        if (candidate / "initdb").exists() and (candidate / "pg_ctl").exists():
+            return candidate
+    raise FileNotFoundError("No PostgreSQL server installation found (set PG_BIN_DIR)")
+
+def _has_library(bin_dir: Path, name: str) -> bool:
+    pg_config = bin_dir / "pg_config"
+    if not pg_config.exists():
+        return False
+    libdir = subprocess.run([str(pg_config), "--pkglibdir"], capture_output=True, text=True).stdout.strip()
+    return (Path(libdir) / f"{name}.so").exists()
+
+def server_options(socket_dir: Path, settings: dict) -> str:
+    """
+    Build the `pg_ctl -o` option string.
+    """
+    options = [f"-k {socket_dir}", f"-p {CLUSTER_PORT}"]
+    options += [f"-c {key}='{value}'" for key, value in settings.items()]
+    return " ".join(options)
+
+def _run(cmd: list, log_path: Path = None):
+    result = subprocess.run([str(part) for part in cmd], capture_output=True, text=True)
+    if result.returncode != 0:
+        log_tail = log_path.read_text()[-2000:] if log_path and log_path.exists() else ""
+        raise RuntimeError(f"{Path(cmd[0]).name} failed: {result.stderr.strip()}\n{log_tail}")
+
+def cluster_settings(socket_dir: Path) -> dict:
+    """
+    Connection settings of a cluster, keyed like src.config.
+    """
+    return {
+        "DB_HOST": str(socket_dir),
+        "DB_HOST_PORT": CLUSTER_PORT,
+        "DB_NAME": CLUSTER_DB,
+        "DB_USER": CLUSTER_USER,
+        "DB_PASSWORD": "",
+    }
+
+
+
+# Cluster lifecycle
+@contextmanager
+def ephemeral_cluster(apply_config: bool = False, settings: dict = None):
+    """
+    Start a throwaway cluster and yield its connection settings.
+
+    Args:
+        apply_config (bool): point src.config at the cluster while it runs.
+        settings (dict): server settings overriding FAST_SETTINGS.
+
+    Yields:
+        dict: DB_HOST (socket dir), DB_HOST_PORT, DB_NAME, DB_USER, DB_PASSWORD
+    """
+    bin_dir = find_bin_dir()
+    server_settings = {**FAST_SETTINGS, **(settings or {})}
+    if _has_library(bin_dir, "pg_stat_statements"):
+        server_settings.setdefault("shared_preload_libraries", "pg_stat_statements")
+
+    base_dir = Path(tempfile.mkdtemp(prefix="pgcluster_"))
+    data_dir = base_dir / "data"
+    log_path = base_dir / "postgres.log"
+    started = False
+    saved_config = {key: getattr(config, key) for key in _CONFIG_KEYS}
+    try:
+        _run([bin_dir / "initdb", "-D", data_dir, "-U", CLUSTER_USER, "-A", "trust", "-E", "UTF8", "--no-sync"])
+        _run([bin_dir / "pg_ctl", "-D", data_dir, "-l", log_path, "-w", "-o", server_options(base_dir, server_settings), "start"], log_path)
+        started = True
+        _run([bin_dir / "createdb", "-h", base_dir, "-p", CLUSTER_PORT, "-U", CLUSTER_USER, CLUSTER_DB], log_path)
+        logger.info(f"Ephemeral PostgreSQL cluster running in {base_dir} ({bin_dir})")
+
+        cluster = cluster_settings(base_dir)
+        if apply_config:
+            for key, value in cluster.items():
+                setattr(config, key, value)
+        yield cluster
+    finally:
+        for key, value in saved_config.items():
+            setattr(config, key, value)
+        if started:
+            subprocess.run([str(bin_dir / "pg_ctl"), "-D", str(data_dir), "-m", "immediate", "-w", "stop"], capture_output=True)
+        shutil.rmtree(base_dir, ignore_errors=True)
+        logger.info(f"Ephemeral PostgreSQL cluster in {base_dir} removed")
+
+
+
+# CLI entrypoint
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Run a command against a throwaway PostgreSQL cluster.")
+    parser.add_argument("command", nargs=argparse.REMAINDER, help="command to run (after --)")
+    args = parser.parse_args()
+    command = args.command[1:] if args.command[:1] == ["--"] else args.command
+    if not command:
+        parser.error("no command given")
+
+    with ephemeral_cluster() as cluster:
+        env = {**os.environ, **{key: str(value) for key, value in cluster.items()}}
+        returncode = subprocess.run(command, env=env).returncode
+    sys.exit(returncode)
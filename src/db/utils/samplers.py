@@ -0,0 +1,176 @@
+"""
+samplers.py
+
+Categorical samplers compiled once from the seed vocabularies in src.db.data_lists.
+
+Every vocabulary becomes a Sampler (tuple of values, optional cumulative weights), so a draw is
+one random number plus an index instead of rebuilding lists (`choice(list(d.items()))`) or walking
+nested dicts in the generator loops.
+
+Vocabulary names are dotted paths into data_lists:
+- lists: "image_mimes", "first_name_sylls"
+- dicts of lists (any depth): "city_streets.tinseltown",
+  "christmas_accommodation_reviews.openings.positive"
+- dicts of strings: sampled as (key, value) pairs, e.g. "city_postal" → ("tinseltown", "01MER")
+
+Weights come from data_lists.vocabulary_weights; vocabularies without an entry are uniform.
+
+Features:
+- vocab(name): the compiled Sampler (all vocabularies are compiled on first use, then cached)
+- Sampler.draw(): one value; Sampler.draw_many(k): k values (batched from BATCH_MIN draws on);
+  Sampler.draw_indices(k): k indices
+- Sampler.draw_column(k): k values as a dictionary-encoded columnar.Column (codes = indices)
+
+Assumptions:
+- single draws use the global `random` state and batched draws a NumPy generator seeded from it,
+  so random.seed() (RNG_SEED) keeps the output reproducible
+- vocabularies are not modified after the first vocab() call (compile_vocabularies() again if so)
+"""
+
+
+# Stdlib imports
+import random
+import sys
+from bisect import bisect
+from itertools import accumulate
+from pathlib import Path
+
+
+# Third-party imports
+import numpy as np
+
+
+# Path/bootstrap
+# Go three levels up (src/db/utils → project root) so imports work when run as script.
+PROJECT_ROOT = Path(__file__).resolve().parents[3]
+sys.path.insert(0, str(PROJECT_ROOT))
+
+
+# Internal imports
+import src.db.data_lists as seeds
+from src.db.utils.columnar import Column, code_dtype
+
+
+
+# Below this many draws a fresh NumPy generator costs more than drawing one value at a time
+BATCH_MIN = 64
+
+# data_lists attribute holding {vocabulary name: weights}
+WEIGHTS_ATTR = "vocabulary_weights"
+
+# data_lists attributes that are settings, not vocabularies
+NON_VOCABULARIES = {WEIGHTS_ATTR, "distribution_profiles", "distributions", "text_models", "password_hashing"}
+
+_SAMPLERS = None
+
+
+
+# Sampler
+class Sampler:
+    """
+    A vocabulary compiled into an indexable tuple, optionally weighted.
+    """
+    __slots__ = ("name", "values", "_cum_weights", "_probabilities")
+
+    def __init__(self, values, weights=None, name: str = ""):
+        self.name = name
+        self.values = tuple(values)
+        if not self.values:
+            raise ValueError(f"Sampler {name!r}: empty vocabulary")
+        self._cum_weights = None
+        self._probabilities = None
+        if weights is not None:
+            if len(weights) != len(self.values):
+                raise ValueError(f"Sampler {name!r}: {len(weights)} weights for {len(self.values)} values")
+            self._cum_weights = list(accumulate(weights))
+            if self._cum_weights[-1] <= 0:
+                raise ValueError(f"Sampler {name!r}: weights must sum to a positive number")
+            self._probabilities = np.asarray(weights, dtype=np.float64) / self._cum_weights[-1]
+
+    def __len__(self) -> int:
+        return len(self.values)
+
+    def __repr__(self) -> str:
+        kind = "weighted" if self._cum_weights else "uniform"
+        return f"Sampler({self.name!r}, {len(self)} values, {kind})"
+
+    def draw(self):
+        """
+        Return one value.
+        """
+        if self._cum_weights is None:
+            return self.values[random.randrange(len(self.values))]
+        total = self._cum_weights[-1]
+        return self.values[bisect(self._cum_weights, random.random() * total, 0, len(self.values) - 1)]
+
+    def draw_indices(self, k: int) -> np.ndarray:
+        """
+        Return k indices into `values` (one batched NumPy draw).
+        """
+        rng = np.random.default_rng(random.getrandbits(64))
+        return rng.choice(len(self.values), size=k, p=self._probabilities)
+
+    def draw_many(self, k: int) -> list:
+        """
+        Return k values.
+        """
+        if k < BATCH_MIN:
+            return [self.draw() for _ in range(k)]
+        values = self.values
+        return [values[i] for i in self.draw_indices(k).tolist()]
+
+    def draw_column(self, k: int, pg_type: str = "text") -> Column:
+        """
+        Return k values as a dictionary-encoded Column (for columnar.ColumnTable.add()).
+        """
+        codes = self.draw_indices(k).astype(code_dtype(len(self.values)))
+        return Column(pg_type, codes, list(self.values))
+
+
+
+# Compilation
+def _compile(path: str, value, weights: dict, out: dict):
+    if isinstance(value, (list, tuple)):
+        if value and all(isinstance(v, (str, int, float, bool)) for v in value):
+            out[path] = Sampler(value, weights.get(path), path)
+    elif isinstance(value, dict) and value:
+        if all(isinstance(v, str) for v in value.values()):
+            out[path] = Sampler(value.items(), weights.get(path), path)
+        else:
+            for key, inner in value.items():
+                _compile(f"{path}.{key}", inner, weights, out)
+
+def compile_vocabularies(module=seeds, weights: dict = None) -> dict:
+    """
+    Compile every list/dict vocabulary of `module` into Samplers.
+
+    Args:
+        module: module holding the vocabularies (default src.db.data_lists).
+        weights (dict): {vocabulary name: weights} for non-uniform vocabularies
+            (default: the module's `vocabulary_weights`).
+
+    Returns:
+        dict: {vocabulary name: Sampler}
+    """
+    if weights is None:
+        weights = getattr(module, WEIGHTS_ATTR, {})
+    out = {}
+    for name, value in vars(module).items():
+        if not name.startswith("_") and name not in NON_VOCABULARIES:
+            _compile(name, value, weights, out)
+    unknown = set(weights) - set(out)
+    if unknown:
+        raise KeyError(f"Weights for unknown vocabularies: {sorted(unknown)}")
+    return out
+
+def vocab(name: str) -> Sampler:
+    """
+    Return the compiled Sampler of vocabulary `name` (compiles data_lists on first use).
+    """
+    global _SAMPLERS
+    if _SAMPLERS is None:
+        _SAMPLERS = compile_vocabularies()
+    try:
+        return _SAMPLERS[name]
+    except KeyError:
+        raise KeyError(f"Unknown seed vocabulary {name!r}") from None
@@ -0,0 +1,104 @@
+"""
+sql_statements.py
+
+Split SQL files into single statements for the migration runner.
+
+Features:
+- split_statements(): splits on top-level semicolons; quotes, escape strings (E'...\'...'),
+  quoted identifiers, dollar-quoted bodies ($$ ... $$, $tag$ ... $tag$) and comments are respected
+- is_parallel_index(): recognizes plain `CREATE INDEX` statements that can be built in parallel
+
+Assumptions:
+- statement text is returned verbatim (comments inside a statement are kept)
+- pieces that contain only comments/whitespace are dropped
+- UNIQUE indexes are never parallelized: constraints, ON CONFLICT or REFRESH ... CONCURRENTLY
+  later in the file may depend on them
+"""
+
+
+# Stdlib imports
+import re
+
+
+
+_DOLLAR_TAG = re.compile(r"\$[A-Za-z_]*\$")
+_PARALLEL_INDEX = re.compile(r"^CREATE\s+INDEX\b", re.IGNORECASE)
+
+
+
+def _strip_comments(statement: str) -> str:
+    """
+    Return the statement without `--` and `/* */` comments (used for classification only).
+    """
+    statement = re.sub(r"/\*.*?\*/", " ", statement, flags=re.DOTALL)
+    return re.sub(r"--[^\n]*", " ", statement).strip()
+
+def _is_escape_string(text: str, i: int) -> bool:
+    """
+    True if the quote at `i` opens an E'...' escape string (E not part of a longer identifier).
+    """
+    return i > 0 and text[i - 1] in "eE" and (i == 1 or not (text[i - 2].isalnum() or text[i - 2] in "_$"))
+
+def _escape_string_end(text: str, i: int) -> int:
+    """
+    Index after the escape string opened at `i` (backslash escapes and '' both skip a quote).
+    """
+    j = i + 1
+    while j < len(text):
+        if text[j] == "\\":
+            j += 2
+        elif text.startswith("''", j):
+            j += 2
+        elif text[j] == "'":
+            return j + 1
+        else:
+            j += 1
+    return len(text)
+
+def split_statements(text: str) -> list:
+    """
+    Split SQL text into statements.
+
+    Args:
+        text (str): contents of a .sql file.
+
+    Returns:
+        list[str]: statements without the terminating semicolon, in file order.
+    """
+    statements = []
+    start = 0
+    i = 0
+    n = len(text)
+    while i < n:
+        ch = text[i]
+        if ch == "-" and text.startswith("--", i):
+            end = text.find("\n", i)
+            i = n if end == -1 else end + 1
+        elif ch == "/" and text.startswith("/*", i):
+            end = text.find("*/", i + 2)
+            i = n if end == -1 else end + 2
+        elif ch == "'" and _is_escape_string(text, i):
+            i = _escape_string_end(text, i)
+        elif ch in ("'", '"'):
+            # '' / "" inside a literal is an escaped quote and simply re-enters the loop
+            end = text.find(ch, i + 1)
+            i = n if end == -1 else end + 1
+        elif ch == "$" and _DOLLAR_TAG.match(text, i):
+            tag = _DOLLAR_TAG.match(text, i).group()
+            end = text.find(tag, i + len(tag))
+            i = n if end == -1 else end + len(tag)
+        elif ch == ";":
+            statements.append(text[start:i])
+            i += 1
+            start = i
+        else:
+            i += 1
+    statements.append(text[start:])
+
+    return [statement.strip() for statement in statements if _strip_comments(statement)]
+
+def is_parallel_index(statement: str) -> bool:
+    """
+    True for plain (non-unique) `CREATE INDEX` statements; nothing else in a file depends on them.
+    """
+    return bool(_PARALLEL_INDEX.match(_strip_comments(statement)))
@@ -0,0 +1,244 @@
+"""
+textgen.py
+
+Batched text generation for the text columns of the seed data (review descriptions, message bodies).
+
+Texts are assembled for a whole batch at once from pre-tokenized vocabularies (NumPy object arrays
+of ready-to-concatenate strings), so the per-row cost is a few C-level string concatenations
+instead of f-strings and generator expressions.
+
+Models:
+- TemplateText: one token per slot (e.g. the nine parts of a review). Adjacent slots are pre-joined
+  into product tables of up to MAX_GROUP_TOKENS entries, so a nine-slot text needs two or three
+  concatenations per row
+- WordText: words drawn independently from a vocabulary, words per text from a LengthDistribution
+- MarkovText: bigram chain trained on data_lists sentences (sentence ends link back to sentence
+  starts), all rows advanced together with one searchsorted per step
+
+Lengths (words per text) follow a LengthDistribution: uniform or lognormal (median, sigma) clipped
+to [min, max]; a heavy lognormal tail yields the few long texts that PostgreSQL compresses/TOASTs
+(beyond ~2 kB per row) like production data.
+
+Features:
+- text_model(column): model configured in data_lists.text_models (cached)
+- Model.generate(k): np.ndarray (dtype object) of k strings
+
+Assumptions:
+- randomness comes from NumPy generators seeded from the global `random` state (RNG_SEED)
+"""
+
+
+# Stdlib imports
+import random
+import sys
+from pathlib import Path
+
+
+# Third-party imports
+import numpy as np
+
+
+# Path/bootstrap
+# Go three levels up (src/db/utils → project root) so imports work when run as script.
+PROJECT_ROOT = Path(__file__).resolve().parents[3]
+sys.path.insert(0, str(PROJECT_ROOT))
+
+
+# Internal imports
+import src.db.data_lists as seeds
+from src.db.utils.samplers import Sampler, compile_vocabularies, vocab
+
+
+
+# Largest pre-joined product table of adjacent template slots
+MAX_GROUP_TOKENS = 4096
+
+LENGTH_KINDS = ("uniform", "lognormal")
+
+_MODELS = {}
+
+
+
+# Helpers
+def _rng() -> np.random.Generator:
+    return np.random.default_rng(random.getrandbits(64))
+
+def token_table(values, capitalize: bool = False, prefix: str = "", suffix: str = "") -> np.ndarray:
+    """
+    Pre-tokenize `values` into an object array of final token strings.
+    """
+    return np.array(
+        [prefix + (value.capitalize() if capitalize else value) + suffix for value in values],
+        dtype=object,
+    )
+
+def _join_segments(tokens: np.ndarray, idx: np.ndarray, lengths: np.ndarray) -> np.ndarray:
+    """
+    Join the words idx[start:start + length] of every row with single spaces.
+    """
+    starts = np.zeros(len(lengths), dtype=np.int64)
+    np.cumsum(lengths[:-1], out=starts[1:])
+    flat = (" " + tokens)[idx]
+    flat[starts] = tokens[idx[starts]]
+    return np.add.reduceat(flat, starts)
+
+class LengthDistribution:
+    """
+    Words per text: "uniform" in [min, max] or "lognormal" (median, sigma) clipped to [min, max].
+    """
+
+    def __init__(self, kind: str = "uniform", min: int = 1, max: int = 10, median: float = None, sigma: float = 1.0):
+        if kind not in LENGTH_KINDS:
+            raise ValueError(f"Unknown length distribution {kind!r}, expected one of {LENGTH_KINDS}")
+        if not 1 <= min <= max:
+            raise ValueError(f"Invalid length bounds [{min}, {max}]")
+        self.kind = kind
+        self.min = min
+        self.max = max
+        self.median = median if median is not None else (min + max) / 2
+        self.sigma = sigma
+
+    def draw(self, k: int, rng: np.random.Generator) -> np.ndarray:
+        if self.kind == "uniform":
+            return rng.integers(self.min, self.max, k, endpoint=True)
+        lengths = np.rint(rng.lognormal(np.log(self.median), self.sigma, k)).astype(np.int64)
+        return np.clip(lengths, self.min, self.max)
+
+
+
+# Models
+class TemplateText:
+    """
+    Texts of one token per slot; slots are (Sampler, capitalize, suffix).
+    """
+
+    def __init__(self, slots: list):
+        self.groups = []
+        for sampler, capitalize, suffix in slots:
+            tokens = token_table(sampler.values, capitalize, suffix=suffix)
+            if self.groups and len(self.groups[-1][0]) * len(tokens) <= MAX_GROUP_TOKENS:
+                joined, samplers = self.groups[-1]
+                self.groups[-1] = (np.add.outer(joined, tokens).ravel(), samplers + [sampler])
+            else:
+                self.groups.append((tokens, [sampler]))
+
+    def generate(self, k: int) -> np.ndarray:
+        texts = None
+        for tokens, samplers in self.groups:
+            # row-major index into the product table of the group
+            idx = np.zeros(k, dtype=np.int64)
+            for sampler in samplers:
+                idx = idx * len(sampler) + sampler.draw_indices(k)
+            texts = tokens[idx] if texts is None else texts + tokens[idx]
+        return texts if texts is not None else np.full(k, "", dtype=object)
+
+class WordText:
+    """
+    Words drawn independently from a vocabulary, joined with spaces.
+    """
+
+    def __init__(self, sampler: Sampler, lengths: LengthDistribution):
+        self.sampler = sampler
+        self.tokens = token_table(sampler.values)
+        self.lengths = lengths
+
+    def generate(self, k: int) -> np.ndarray:
+        if k == 0:
+            return np.empty(0, dtype=object)
+        lengths = self.lengths.draw(k, _rng())
+        idx = self.sampler.draw_indices(int(lengths.sum()))
+        return _join_segments(self.tokens, idx, lengths)
+
+class MarkovText:
+    """
+    Bigram (first-order Markov) word chain; each text starts at a sentence start.
+    """
+
+    def __init__(self, sentences: list, lengths: LengthDistribution):
+        words = {}
+        sentence_tokens = []
+        for sentence in sentences:
+            tokens = sentence.split()
+            if not tokens:
+                continue
+            tokens[-1] = tokens[-1].rstrip(".!?,") + "."
+            sentence_tokens.append([words.setdefault(token, len(words)) for token in tokens])
+        if not sentence_tokens:
+            raise ValueError("MarkovText needs at least one non-empty sentence")
+
+        n = len(words)
+        start_counts = np.bincount([tokens[0] for tokens in sentence_tokens], minlength=n).astype(np.float64)
+        counts = np.zeros((n, n), dtype=np.float64)
+        for tokens in sentence_tokens:
+            for current, following in zip(tokens, tokens[1:]):
+                counts[current, following] += 1
+            counts[tokens[-1]] += start_counts    # sentence end → next sentence start
+
+        # Edge list sorted by state: key = state + cumulative probability within the state (in (s, s + 1]),
+        # so one searchsorted over all edges finds the successor of every row at once
+        states, successors = np.nonzero(counts)       # row-major, i.e. sorted by state
+        probabilities = counts[states, successors] / counts.sum(axis=1)[states]
+        running = np.cumsum(probabilities)
+        first_edge = np.searchsorted(states, states, side="left")
+        cumulative = running - np.concatenate(([0.0], running))[first_edge]
+        cumulative[np.append(states[1:] != states[:-1], True)] = 1.0
+        self.keys = states + cumulative
+        self.successors = successors
+        self.start_probabilities = start_counts / start_counts.sum()
+        self.tokens = np.array(list(words), dtype=object)
+        self.lengths = lengths
+
+    def generate(self, k: int) -> np.ndarray:
+        if k == 0:
+            return np.empty(0, dtype=object)
+        rng = _rng()
+        lengths = self.lengths.draw(k, rng)
+        starts = np.zeros(k, dtype=np.int64)
+        np.cumsum(lengths[:-1], out=starts[1:])
+        idx = np.empty(int(lengths.sum()), dtype=np.int64)
+
+        state = rng.choice(len(self.tokens), size=k, p=self.start_probabilities)
+        rows = np.arange(k)
+        for step in range(int(lengths.max())):
+            alive = lengths[rows] > step
+            rows, state = rows[alive], state[alive]
+            idx[starts[rows] + step] = state
+            edges = np.searchsorted(self.keys, state + rng.random(len(state)), side="right")
+            state = self.successors[edges]
+        return _join_segments(self.tokens, idx, lengths)
+
+
+
+# Configured models
+def corpus_sentences(vocabulary: str) -> list:
+    """
+    All strings of the vocabularies under `vocabulary` (a data_lists name or dotted prefix).
+    """
+    return [
+        value
+        for name, sampler in compile_vocabularies().items()
+        if name == vocabulary or name.startswith(vocabulary + ".")
+        for value in sampler.values
+        if isinstance(value, str)
+    ]
+
+def build_model(spec: dict):
+    """
+    Build a WordText or MarkovText from a data_lists.text_models entry.
+    """
+    lengths = LengthDistribution(**spec.get("lengths", {}))
+    if spec["model"] == "words":
+        return WordText(vocab(spec["vocabulary"]), lengths)
+    if spec["model"] == "markov":
+        return MarkovText(corpus_sentences(spec["corpus"]), lengths)
+    raise ValueError(f"Unknown text model {spec['model']!r}, expected 'words' or 'markov'")
+
+def text_model(column: str):
+    """
+    Return the (cached) text model configured for `column` ("<table>.<column>").
+    """
+    spec = seeds.text_models[column]
+    key = (column, repr(spec))
+    if key not in _MODELS:
+        _MODELS[key] = build_model(spec)
+    return _MODELS[key]
@@ -0,0 +1,204 @@
+"""
+timestamps.py
+
+Timestamp sampling over the seed window with native values (datetime or int64 epoch µs).
+
+The window is precomputed once (Window: start/stop, span in seconds and days), draws are seconds
+offsets into it. Constraints like "before X" or "within N days after Y" are handled by drawing from
+the truncated distribution directly (after <= ts < before), so generators need no rejection loops
+and no ISO string round trips.
+
+Features:
+- Window: precomputed window, offset()/at() conversions
+- TimestampSampler: uniform or day-weighted (weights from src.db.utils.distributions) draws
+  - draw(before, after) → datetime, draw_epoch_us(before, after) → int
+  - draw_many(k, ...) → list of datetimes, draw_many_epoch_us(k, ...) → np.ndarray (int64),
+    with scalar or per-row bounds, for psycopg2 parameters and columnar tables respectively
+- to_epoch_us() / from_epoch_us(): datetime ↔ microseconds since the Unix epoch
+
+Assumptions:
+- timestamps are naive (TIMESTAMP WITHOUT TIME ZONE) and whole seconds
+- randomness comes from the global `random` state (batched draws: a NumPy generator seeded from it)
+- an unconstrained uniform single draw is the same randint(0, span) as before
+"""
+
+
+# Stdlib imports
+import datetime
+import random
+import sys
+from bisect import bisect_right
+from pathlib import Path
+
+
+# Third-party imports
+import numpy as np
+
+
+# Path/bootstrap
+# Go three levels up (src/db/utils → project root) so imports work when run as script.
+PROJECT_ROOT = Path(__file__).resolve().parents[3]
+sys.path.insert(0, str(PROJECT_ROOT))
+
+
+
+UNIX_EPOCH = datetime.datetime(1970, 1, 1)
+SECONDS_PER_DAY = 24 * 3600
+US_PER_SECOND = 1_000_000
+
+
+
+# Conversions
+def to_epoch_us(ts: datetime.datetime) -> int:
+    return (ts - UNIX_EPOCH) // datetime.timedelta(microseconds=1)
+
+def from_epoch_us(us: int) -> datetime.datetime:
+    return UNIX_EPOCH + datetime.timedelta(microseconds=int(us))
+
+
+
+# Window
+class Window:
+    """
+    [start, stop] with its span precomputed; positions are whole seconds from start.
+    """
+
+    def __init__(self, start: datetime.datetime, stop: datetime.datetime):
+        if stop < start:
+            raise ValueError(f"Window stop {stop} before start {start}")
+        self.start = start
+        self.stop = stop
+        self.span_seconds = int((stop - start).total_seconds())
+        self.n_days = self.span_seconds // SECONDS_PER_DAY + 1
+        self.start_us = to_epoch_us(start)
+
+    def days(self) -> np.ndarray:
+        """
+        Calendar days of the window (datetime64[D]).
+        """
+        return np.datetime64(self.start.date(), "D") + np.arange(self.n_days)
+
+    def offset(self, ts) -> int:
+        """
+        Seconds from start of a datetime (or epoch µs int).
+        """
+        if isinstance(ts, datetime.datetime):
+            return int((ts - self.start).total_seconds())
+        return (int(ts) - self.start_us) // US_PER_SECOND
+
+    def at(self, seconds: int) -> datetime.datetime:
+        return self.start + datetime.timedelta(seconds=int(seconds))
+
+    def bounds(self, before=None, after=None) -> tuple:
+        """
+        Inclusive seconds range [lo, hi] of after <= ts < before, clipped to the window.
+        """
+        lo = 0 if after is None else max(0, self.offset(after))
+        hi = self.span_seconds if before is None else min(self.span_seconds, self.offset(before) - 1)
+        if lo > hi:
+            raise ValueError(f"Empty timestamp range (after={after}, before={before}) in {self.start}..{self.stop}")
+        return lo, hi
+
+    def _offsets(self, bound) -> np.ndarray:
+        if isinstance(bound, datetime.datetime):
+            return np.int64(self.offset(bound))
+        values = np.asarray(bound)
+        if values.dtype.kind == "M":
+            values = values.astype("datetime64[us]").view(np.int64)
+        return (values.astype(np.int64) - self.start_us) // US_PER_SECOND
+
+    def bounds_many(self, before=None, after=None) -> tuple:
+        """
+        Vectorized bounds(): `before`/`after` may be datetimes, datetime64 or epoch µs arrays.
+        """
+        lo = np.int64(0) if after is None else np.maximum(0, self._offsets(after))
+        hi = np.int64(self.span_seconds) if before is None else np.minimum(self.span_seconds, self._offsets(before) - 1)
+        if np.any(lo > hi):
+            raise ValueError(f"Empty timestamp range for {int(np.sum(lo > hi))} rows in {self.start}..{self.stop}")
+        return lo, hi
+
+
+
+# Sampler
+class TimestampSampler:
+    """
+    Seconds offsets into a Window, uniform or with a relative weight per day of the window.
+    """
+
+    def __init__(self, window: Window, day_weights: np.ndarray = None, name: str = ""):
+        self.window = window
+        self.name = name
+        self._cum = None
+        if day_weights is not None:
+            if len(day_weights) != window.n_days:
+                raise ValueError(f"TimestampSampler {name!r}: {len(day_weights)} day weights for {window.n_days} days")
+            cum = np.concatenate(([0.0], np.cumsum(np.asarray(day_weights, dtype=np.float64))))
+            if cum[-1] <= 0:
+                raise ValueError(f"TimestampSampler {name!r}: day weights must sum to a positive number")
+            self._cum = cum
+            self._cum_list = cum.tolist()
+
+    @property
+    def delta_seconds(self) -> int:
+        return self.window.span_seconds
+
+    # Single draws
+    def draw_seconds(self, lo: int = 0, hi: int = None) -> int:
+        """
+        One offset in [lo, hi] (default: the whole window).
+        """
+        hi = self.window.span_seconds if hi is None else hi
+        if self._cum is None:
+            return random.randint(lo, hi)
+
+        day_lo, day_hi = lo // SECONDS_PER_DAY, hi // SECONDS_PER_DAY
+        c_lo, c_hi = self._cum_list[day_lo], self._cum_list[day_hi + 1]
+        if c_hi <= c_lo:    # no weight in range
+            return random.randint(lo, hi)
+        u = c_lo + random.random() * (c_hi - c_lo)
+        day = min(max(bisect_right(self._cum_list, u) - 1, day_lo), day_hi)
+        return random.randint(max(lo, day * SECONDS_PER_DAY), min(hi, day * SECONDS_PER_DAY + SECONDS_PER_DAY - 1))
+
+    def draw(self, before=None, after=None) -> datetime.datetime:
+        """
+        One timestamp with after <= ts < before (both optional, datetime or epoch µs).
+        """
+        return self.window.at(self.draw_seconds(*self.window.bounds(before, after)))
+
+    def draw_epoch_us(self, before=None, after=None) -> int:
+        return self.window.start_us + self.draw_seconds(*self.window.bounds(before, after)) * US_PER_SECOND
+
+    # Batched draws
+    def draw_many_seconds(self, k: int, lo=0, hi=None) -> np.ndarray:
+        """
+        k offsets, `lo`/`hi` scalars or arrays of length k (inclusive).
+        """
+        rng = np.random.default_rng(random.getrandbits(64))
+        lo = np.broadcast_to(np.asarray(lo, dtype=np.int64), (k,))
+        hi = np.broadcast_to(np.asarray(self.window.span_seconds if hi is None else hi, dtype=np.int64), (k,))
+        if self._cum is None:
+            return lo + np.floor(rng.random(k) * (hi - lo + 1)).astype(np.int64)
+
+        day_lo, day_hi = lo // SECONDS_PER_DAY, hi // SECONDS_PER_DAY
+        c_lo, c_hi = self._cum[day_lo], self._cum[day_hi + 1]
+        u = c_lo + rng.random(k) * (c_hi - c_lo)
+        day = np.clip(np.searchsorted(self._cum, u, side="right") - 1, day_lo, day_hi)
+        sec_lo = np.maximum(lo, day * SECONDS_PER_DAY)
+        sec_hi = np.minimum(hi, day * SECONDS_PER_DAY + SECONDS_PER_DAY - 1)
+        unweighted = c_hi <= c_lo    # no weight in range: uniform over [lo, hi] like draw_seconds()
+        sec_lo = np.where(unweighted, lo, sec_lo)
+        sec_hi = np.where(unweighted, hi, sec_hi)
+        return sec_lo + np.floor(rng.random(k) * (sec_hi - sec_lo + 1)).astype(np.int64)
+
+    def draw_many_epoch_us(self, k: int, before=None, after=None) -> np.ndarray:
+        """
+        k timestamps as int64 epoch µs (columnar.ColumnTable "timestamp" columns).
+        """
+        lo, hi = self.window.bounds_many(before, after)
+        return self.window.start_us + self.draw_many_seconds(k, lo, hi) * US_PER_SECOND
+
+    def draw_many(self, k: int, before=None, after=None) -> list:
+        """
+        k timestamps as datetimes (psycopg2 parameters).
+        """
+        return self.draw_many_epoch_us(k, before, after).astype("datetime64[us]").tolist()
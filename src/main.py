@@ -1,35 +1,122 @@
-from db import gen_seed_data as gen
-from db import run_sql_files as setup
+# Stdlib imports
+import random
+import sys
+from pathlib import Path
+
+# Path/bootstrap
+# Go one level up (src → project root) so src.* imports resolve to the same modules as the db package.
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(PROJECT_ROOT))
+
+# Internal imports
+from src import config
+import src.db.data_lists as seeds
+from src.db import etl_star
+from src.db import gen_seed_data as gen
+from src.db import maintenance
+from src.db import refresh_marts as marts
+from src.db import run_sql_files as setup
+from src.db import snapshots
+from src.db import tuning
+from src.db.utils import distributions, instrumentation, leak_tracker
+
+
+# Pipeline stages in execution order: (stage name, generator, tables it fills)
+STAGES = [
+    ("accounts", gen.gen_dummydata_accounts, ["accounts"]),
+    ("credentials", gen.gen_dummydata_credentials, ["credentials"]),
+    ("addresses", gen.gen_dummydata_addresses, ["addresses"]),
+    ("accommodations", gen.gen_dummydata_accommodations, ["accommodations"]),
+    ("images", gen.gen_dummydata_images, ["images"]),
+    ("payment_methods", gen.gen_dummydata_payment_methods, ["payment_methods"]),
+    ("credit_cards", gen.gen_dummydata_credit_cards, ["credit_cards"]),
+    ("paypal", gen.gen_dummydata_paypal, ["paypal"]),
+    ("reviews", gen.gen_dummydata_reviews, ["reviews"]),
+    ("conversations", gen.gen_dummydata_conversations, ["conversations"]),
+    ("messages", gen.gen_dummydata_messages, ["messages"]),
+    ("review_images", gen.gen_dummydata_review_images, ["review_images"]),
+    ("accommodation_images", gen.gen_dummydata_accommodation_images, ["accommodation_images"]),
+    ("notifications", gen.gen_dummydata_notifications, ["notifications"]),
+    ("payout_accounts", gen.gen_dummydata_payout_accounts, ["payout_accounts"]),
+    ("bookings_and_payments", gen.gen_dummydata_bookings_and_payments, ["bookings", "payments"]),
+    ("payouts", gen.gen_dummydata_payouts, ["payouts"]),
+    ("accommodation_calendar", gen.gen_dummydata_accommodation_calendar, ["accommodation_calendar"]),
+    ("accommodation_amenities", gen.gen_dummydata_accommodation_amenities, ["accommodation_amenities"]),
+    ("build_indexes", setup.build_deferred_indexes, []),
+    ("refresh_marts", marts.refresh_all_marts, marts.MARTS),
+    ("load_aggregates", marts.load_aggregates, marts.AGGREGATE_TABLES),
+    ("star_schema", etl_star.run_full_load, list(etl_star.FACTS)),
+    ("vacuum_analyze", maintenance.run_post_load_maintenance, []),
+]
+
+
+def apply_generator_settings(seed: int = None):
+    """
+    Apply SCALE_PROFILE, DATA_DISTRIBUTION and PASSWORD_HASH* to the generators and seed the RNG
+    (unless `seed` is None).
+    """
+    seeds.num_gen_dummydata = seeds.scale_profiles[config.SCALE_PROFILE]
+    distributions.apply_profile(config.DATA_DISTRIBUTION)
+    seeds.password_hashing = {
+        "algorithm": config.PASSWORD_HASH,
+        "cost": int(config.PASSWORD_HASH_COST) if config.PASSWORD_HASH_COST else None,
+        "workers": config.PASSWORD_HASH_WORKERS or None,
+        "seed": seed,
+    }
+    if seed is not None:
+        random.seed(seed)
 
 
 def main():
     """
-    (1) Run all sql setup files.
-    (2) Generate and fill all seed data.
+    (1) Apply SCALE_PROFILE, DATA_DISTRIBUTION, PASSWORD_HASH* and RNG_SEED to the generators (and the bulk_load
+        tuning profile if DB_TUNING is "phased").
+    (2) Restore the matching snapshot if DB_SNAPSHOT is enabled and one exists, otherwise run all
+        sql setup files, generate and fill all seed data, build the deferred indexes, refresh the reporting
+        marts, load the star schema, VACUUM (ANALYZE) everything (and save the snapshot). Switch to the serve tuning profile afterwards.
+    (3) Log the per-stage timing/round-trip summary (and append it to INSTRUMENT_JSONL if set).
+    (4) Report connections/cursors left open by the run.
     """
-    # Run SQL files
-    setup.run_sql_files()
-
-    # Geneerate and fill all seed data
-    gen.gen_dummydata_accounts()
-    gen.gen_dummydata_credentials()
-    gen.gen_dummydata_addresses()
-    gen.gen_dummydata_accommodations()
-    gen.gen_dummydata_images()
-    gen.gen_dummydata_payment_methods()
-    gen.gen_dummydata_credit_cards()
-    gen.gen_dummydata_paypal()
-    gen.gen_dummydata_reviews()
-    gen.gen_dummydata_conversations()
-    gen.gen_dummydata_messages()
-    gen.gen_dummydata_review_images()
-    gen.gen_dummydata_accommodation_images()
-    gen.gen_dummydata_notifications()
-    gen.gen_dummydata_payout_accounts()
-    gen.gen_dummydata_bookings_and_payments()
-    gen.gen_dummydata_payouts()
-    gen.gen_dummydata_accommodation_calendar()
-    gen.gen_dummydata_accommodation_amenities()
+    apply_generator_settings(int(config.RNG_SEED) if config.RNG_SEED else None)
+    if config.DB_TUNING == "phased":
+        tuning.apply_profile("bulk_load")
+
+    # Snapshots need a seed, unseeded runs are not reproducible
+    snapshot = None
+    if config.DB_SNAPSHOT != "off" and config.RNG_SEED:
+        snapshot = snapshots.current_snapshot_name(int(config.RNG_SEED))
+
+    try:
+        if snapshot and snapshots.snapshot_exists(snapshot, config.DB_SNAPSHOT):
+            with instrumentation.stage_scope("restore_snapshot"):
+                snapshots.restore_snapshot(snapshot, config.DB_SNAPSHOT)
+        else:
+            # Run SQL files
+            with instrumentation.stage_scope("sql_setup"):
+                setup.run_sql_files()
+
+            # Geneerate and fill all seed data (without logging the bulk load into mart_changes)
+            with marts.change_log_paused():
+                for name, generate, _ in STAGES:
+                    with instrumentation.stage_scope(name):
+                        generate()
+
+            if snapshot:
+                with instrumentation.stage_scope("save_snapshot"):
+                    snapshots.save_snapshot(snapshot, config.DB_SNAPSHOT)
+    finally:
+        # Back to the query profile, also after a failed run
+        if config.DB_TUNING == "phased":
+            tuning.apply_profile("serve")
+
+    # Per-stage summary
+    summary = instrumentation.stage_summary()
+    instrumentation.log_summary(summary)
+    if config.INSTRUMENT_JSONL:
+        instrumentation.write_jsonl(config.INSTRUMENT_JSONL, summary)
+
+    # Check for leaked connections/cursors
+    leak_tracker.report_leaks()
 
 
 if __name__ == "__main__":
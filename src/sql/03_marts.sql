@@ -0,0 +1,118 @@
+-- ============================================
+-- 03_marts.sql
+-- Purpose: Materialized reporting marts on top of the OLTP tables
+-- ============================================
+-- Created WITH NO DATA; src/db/refresh_marts.py populates them after seeding.
+-- Every mart has a unique index so it can be refreshed CONCURRENTLY (readers are never blocked).
+-- Revenue counts payed payments of confirmed/completed bookings only.
+
+
+-- 1 Daily revenue per host and city (day = first night of the stay)
+CREATE MATERIALIZED VIEW mart_daily_revenue AS
+SELECT
+    b.start_date::date AS day,
+    a.host_account_id,
+    ad.city,
+    COUNT(*) AS bookings,
+    SUM(p.amount_cents)::bigint AS revenue_cents
+FROM bookings b
+JOIN payments p ON p.id = b.payment_id
+JOIN accommodations a ON a.id = b.accommodation_id
+JOIN addresses ad ON ad.id = a.address_id
+WHERE b.status IN ('confirmed', 'completed')
+  AND p.status = 'payed'
+GROUP BY 1, 2, 3
+WITH NO DATA;
+
+CREATE UNIQUE INDEX mart_daily_revenue_key  -- Required for REFRESH ... CONCURRENTLY
+    ON mart_daily_revenue(day, host_account_id, city);
+
+
+-- 2 Occupancy rate per accommodation and month (booked nights / days in month)
+CREATE MATERIALIZED VIEW mart_monthly_occupancy AS
+SELECT
+    b.accommodation_id,
+    date_trunc('month', night)::date AS month,
+    COUNT(DISTINCT night) AS booked_nights,
+    EXTRACT(DAY FROM date_trunc('month', night) + INTERVAL '1 month' - INTERVAL '1 day')::int AS days_in_month,
+    ROUND(
+        COUNT(DISTINCT night)::numeric
+        / EXTRACT(DAY FROM date_trunc('month', night) + INTERVAL '1 month' - INTERVAL '1 day'),
+        4
+    ) AS occupancy_rate
+FROM bookings b
+CROSS JOIN LATERAL generate_series(b.start_date::date, b.end_date::date - 1, INTERVAL '1 day') AS night
+WHERE b.status IN ('confirmed', 'completed')
+GROUP BY b.accommodation_id, date_trunc('month', night)
+WITH NO DATA;
+
+CREATE UNIQUE INDEX mart_monthly_occupancy_key  -- Required for REFRESH ... CONCURRENTLY
+    ON mart_monthly_occupancy(accommodation_id, month);
+
+
+-- 3 Review rating aggregates per accommodation
+CREATE MATERIALIZED VIEW mart_review_ratings AS
+SELECT
+    accommodation_id,
+    COUNT(*) AS reviews,
+    ROUND(AVG(rating), 2) AS avg_rating,
+    MIN(rating) AS min_rating,
+    MAX(rating) AS max_rating,
+    COUNT(*) FILTER (WHERE rating = 1) AS rating_1,
+    COUNT(*) FILTER (WHERE rating = 2) AS rating_2,
+    COUNT(*) FILTER (WHERE rating = 3) AS rating_3,
+    COUNT(*) FILTER (WHERE rating = 4) AS rating_4,
+    COUNT(*) FILTER (WHERE rating = 5) AS rating_5,
+    MAX(created_at) AS last_review_at
+FROM reviews
+GROUP BY accommodation_id
+WITH NO DATA;
+
+CREATE UNIQUE INDEX mart_review_ratings_key  -- Required for REFRESH ... CONCURRENTLY
+    ON mart_review_ratings(accommodation_id);
+
+
+-- 4 Payout reconciliation per booking (payed amount vs. payouts to the host)
+CREATE MATERIALIZED VIEW mart_payout_reconciliation AS
+SELECT
+    r.*,
+    r.payed_cents - r.payout_cents AS difference_cents,
+    CASE
+        WHEN r.payouts = 0 THEN 'no_payout'
+        WHEN r.payed_cents = r.payout_cents THEN 'balanced'
+        WHEN r.payed_cents > r.payout_cents THEN 'underpaid'
+        ELSE 'overpaid'
+    END AS reconciliation_status
+FROM (
+    SELECT
+        b.id AS booking_id,
+        a.host_account_id,
+        b.payment_id,
+        COALESCE(MAX(p.amount_cents) FILTER (WHERE p.status = 'payed'), 0) AS payed_cents,
+        COALESCE(SUM(po.amount_cents), 0)::bigint AS payout_cents,
+        COUNT(po.id) AS payouts
+    FROM bookings b
+    JOIN accommodations a ON a.id = b.accommodation_id
+    LEFT JOIN payments p ON p.id = b.payment_id
+    LEFT JOIN payouts po ON po.booking_id = b.id
+    WHERE b.status IN ('confirmed', 'completed')
+    GROUP BY b.id, a.host_account_id, b.payment_id
+) r
+WITH NO DATA;
+
+CREATE UNIQUE INDEX mart_payout_reconciliation_key  -- Required for REFRESH ... CONCURRENTLY
+    ON mart_payout_reconciliation(booking_id);
+
+
+-- Refresh bookkeeping (written by src/db/refresh_marts.py)
+CREATE TABLE mart_refresh_log (
+    id SERIAL PRIMARY KEY,
+    mart_name VARCHAR(100) NOT NULL,
+    refreshed_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    concurrent BOOLEAN NOT NULL,
+    duration_ms NUMERIC(12, 3) NOT NULL,
+    row_count BIGINT NOT NULL
+);
+
+CREATE INDEX idx_mart_refresh_log_mart_refreshed    -- Latest refresh per mart
+    ON mart_refresh_log(mart_name, refreshed_at);
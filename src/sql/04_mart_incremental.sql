@@ -0,0 +1,94 @@
+-- ============================================
+-- 04_mart_incremental.sql
+-- Purpose: Incrementally maintained copies of the reporting marts
+-- ============================================
+-- agg_* tables have the same columns as the mart_* materialized views (03_marts.sql) but are
+-- maintained by src/db/refresh_marts.py from the change log below: only aggregate keys touched
+-- since the last run are recomputed. The materialized views stay the full-rebuild reference.
+
+
+-- Aggregate tables (same columns as the marts, keyed like their unique indexes)
+CREATE TABLE agg_daily_revenue AS SELECT * FROM mart_daily_revenue WITH NO DATA;
+ALTER TABLE agg_daily_revenue ADD PRIMARY KEY (day, host_account_id, city);
+
+CREATE TABLE agg_monthly_occupancy AS SELECT * FROM mart_monthly_occupancy WITH NO DATA;
+ALTER TABLE agg_monthly_occupancy ADD PRIMARY KEY (accommodation_id, month);
+
+CREATE TABLE agg_review_ratings AS SELECT * FROM mart_review_ratings WITH NO DATA;
+ALTER TABLE agg_review_ratings ADD PRIMARY KEY (accommodation_id);
+
+CREATE TABLE agg_payout_reconciliation AS SELECT * FROM mart_payout_reconciliation WITH NO DATA;
+ALTER TABLE agg_payout_reconciliation ADD PRIMARY KEY (booking_id);
+
+
+-- Change log: one row per touched booking/review (old and new version on UPDATE)
+CREATE TABLE mart_changes (
+    change_id BIGSERIAL PRIMARY KEY,
+    source_table VARCHAR(50) NOT NULL,
+    accommodation_id INT,
+    booking_id INT,
+    day DATE,
+    changed_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+);
+
+
+-- Trigger: map a changed row to the aggregate keys it can affect
+CREATE FUNCTION record_mart_change() RETURNS trigger
+LANGUAGE plpgsql AS $$
+BEGIN
+    IF TG_TABLE_NAME = 'bookings' THEN
+        IF TG_OP <> 'INSERT' THEN
+            INSERT INTO mart_changes (source_table, accommodation_id, booking_id, day)
+            VALUES (TG_TABLE_NAME, OLD.accommodation_id, OLD.id, OLD.start_date::date);
+        END IF;
+        IF TG_OP <> 'DELETE' THEN
+            INSERT INTO mart_changes (source_table, accommodation_id, booking_id, day)
+            VALUES (TG_TABLE_NAME, NEW.accommodation_id, NEW.id, NEW.start_date::date);
+        END IF;
+
+    ELSIF TG_TABLE_NAME = 'reviews' THEN
+        IF TG_OP <> 'INSERT' THEN
+            INSERT INTO mart_changes (source_table, accommodation_id)
+            VALUES (TG_TABLE_NAME, OLD.accommodation_id);
+        END IF;
+        IF TG_OP <> 'DELETE' THEN
+            INSERT INTO mart_changes (source_table, accommodation_id)
+            VALUES (TG_TABLE_NAME, NEW.accommodation_id);
+        END IF;
+
+    ELSIF TG_TABLE_NAME = 'payments' THEN
+        -- Payments reach the marts only through the bookings that reference them
+        INSERT INTO mart_changes (source_table, accommodation_id, booking_id, day)
+        SELECT TG_TABLE_NAME, b.accommodation_id, b.id, b.start_date::date
+        FROM bookings b
+        WHERE b.payment_id = CASE WHEN TG_OP = 'DELETE' THEN OLD.id ELSE NEW.id END;
+
+    ELSIF TG_TABLE_NAME = 'payouts' THEN
+        INSERT INTO mart_changes (source_table, accommodation_id, booking_id, day)
+        SELECT TG_TABLE_NAME, b.accommodation_id, b.id, b.start_date::date
+        FROM bookings b
+        WHERE b.id IN (
+            CASE WHEN TG_OP = 'INSERT' THEN NULL ELSE OLD.booking_id END,
+            CASE WHEN TG_OP = 'DELETE' THEN NULL ELSE NEW.booking_id END
+        );
+    END IF;
+
+    RETURN NULL;
+END;
+$$;
+
+CREATE TRIGGER trg_bookings_mart_change
+    AFTER INSERT OR UPDATE OR DELETE ON bookings
+    FOR EACH ROW EXECUTE FUNCTION record_mart_change();
+
+CREATE TRIGGER trg_payments_mart_change
+    AFTER INSERT OR UPDATE OR DELETE ON payments
+    FOR EACH ROW EXECUTE FUNCTION record_mart_change();
+
+CREATE TRIGGER trg_reviews_mart_change
+    AFTER INSERT OR UPDATE OR DELETE ON reviews
+    FOR EACH ROW EXECUTE FUNCTION record_mart_change();
+
+CREATE TRIGGER trg_payouts_mart_change
+    AFTER INSERT OR UPDATE OR DELETE ON payouts
+    FOR EACH ROW EXECUTE FUNCTION record_mart_change();
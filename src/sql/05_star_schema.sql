@@ -0,0 +1,92 @@
+-- ============================================
+-- 05_star_schema.sql
+-- Purpose: Star schema for analytics, loaded from the OLTP tables by src/db/etl_star.py
+-- ============================================
+-- Dimensions use surrogate keys (natural keys stay as unique columns for lookups during the load).
+-- Date keys are yyyymmdd integers; dim_date is pre-generated before the facts are loaded.
+
+
+-- DIMENSIONS
+CREATE TABLE dim_date (
+    date_key INT PRIMARY KEY,   -- yyyymmdd
+    date DATE NOT NULL UNIQUE,
+    year SMALLINT NOT NULL,
+    quarter SMALLINT NOT NULL,
+    month SMALLINT NOT NULL,
+    month_name VARCHAR(9) NOT NULL,
+    day SMALLINT NOT NULL,
+    iso_week SMALLINT NOT NULL,
+    day_of_week SMALLINT NOT NULL,  -- 1 = Monday
+    is_weekend BOOLEAN NOT NULL
+);
+
+CREATE TABLE dim_location (
+    location_key SERIAL PRIMARY KEY,
+    city VARCHAR(100) NOT NULL,
+    country VARCHAR(100) NOT NULL,
+    UNIQUE (city, country)
+);
+
+CREATE TABLE dim_account (
+    account_key SERIAL PRIMARY KEY,
+    account_id INT NOT NULL UNIQUE,
+    email VARCHAR(255),
+    first_name VARCHAR(100),
+    last_name VARCHAR(100),
+    role role,
+    created_date_key INT REFERENCES dim_date(date_key)
+);
+
+CREATE TABLE dim_accommodation (
+    accommodation_key SERIAL PRIMARY KEY,
+    accommodation_id INT NOT NULL UNIQUE,
+    host_account_key INT REFERENCES dim_account(account_key),
+    location_key INT REFERENCES dim_location(location_key),
+    title VARCHAR(255),
+    price_cents INT,
+    is_active BOOLEAN
+);
+
+
+-- FACTS
+CREATE TABLE fact_booking (
+    booking_key BIGSERIAL PRIMARY KEY,
+    booking_id INT NOT NULL UNIQUE,     -- degenerate dimension
+    guest_account_key INT REFERENCES dim_account(account_key),
+    host_account_key INT REFERENCES dim_account(account_key),
+    accommodation_key INT REFERENCES dim_accommodation(accommodation_key),
+    location_key INT REFERENCES dim_location(location_key),
+    start_date_key INT REFERENCES dim_date(date_key),
+    end_date_key INT REFERENCES dim_date(date_key),
+    status booking_status,
+    nights INT,
+    amount_cents INT
+);
+
+CREATE TABLE fact_payment (
+    payment_key BIGSERIAL PRIMARY KEY,
+    payment_id INT NOT NULL UNIQUE,     -- degenerate dimension
+    customer_account_key INT REFERENCES dim_account(account_key),
+    booking_id INT,                     -- NULL for payments without booking
+    service_date_key INT REFERENCES dim_date(date_key),
+    method_type payment_method_type,
+    status payment_status,
+    amount_cents INT
+);
+
+CREATE INDEX idx_fact_booking_start_date -- Date-range slicing
+    ON fact_booking(start_date_key);
+
+CREATE INDEX idx_fact_booking_accommodation  -- Per-accommodation drill-down
+    ON fact_booking(accommodation_key);
+
+CREATE INDEX idx_fact_payment_service_date   -- Date-range slicing
+    ON fact_payment(service_date_key);
+
+
+-- ETL bookkeeping: highest source id loaded per fact table (incremental loads)
+CREATE TABLE etl_watermarks (
+    fact_table VARCHAR(50) PRIMARY KEY,
+    last_source_id INT NOT NULL DEFAULT 0,
+    loaded_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+);
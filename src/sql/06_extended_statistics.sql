@@ -0,0 +1,29 @@
+-- ============================================
+-- 06_extended_statistics.sql
+-- Purpose: Extended statistics on correlated columns
+-- ============================================
+-- The planner assumes columns are independent and multiplies their selectivities, which
+-- underestimates filters on correlated columns (a city implies its country, most of a host's
+-- accommodations share one activity flag). These objects are filled by ANALYZE
+-- (src/db/maintenance.py runs it after the load).
+
+
+-- City determines country: search by (city, country) and GROUP BY city, country in the marts
+CREATE STATISTICS stx_addresses_city_country (dependencies, ndistinct, mcv)
+    ON city, country FROM addresses;
+
+-- Active listings per host
+CREATE STATISTICS stx_accommodations_host_active (dependencies, ndistinct)
+    ON host_account_id, is_active FROM accommodations;
+
+-- Booking status per accommodation (availability and revenue filters)
+CREATE STATISTICS stx_bookings_accommodation_status (dependencies, ndistinct)
+    ON accommodation_id, status FROM bookings;
+
+-- Blocked days per accommodation in the calendar
+CREATE STATISTICS stx_calendar_accommodation_blocked (dependencies, mcv)
+    ON accommodation_id, is_blocked FROM accommodation_calendar;
+
+-- Payment status per customer
+CREATE STATISTICS stx_payments_customer_status (dependencies, ndistinct)
+    ON customer_id, status FROM payments;
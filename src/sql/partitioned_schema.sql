@@ -0,0 +1,77 @@
+-- ============================================
+-- partitioned_schema.sql
+-- Purpose: Alternative schema with monthly RANGE partitions for the unbounded tables
+-- ============================================
+-- Not part of the default setup (run_sql_files.FILES). Created by src/db/partitions.py in the
+-- separate schema "partitioned", next to the unpartitioned public tables, so both can be compared.
+-- The partition key has to be part of every unique constraint, hence the composite primary keys.
+-- Monthly partitions are created by the partition manager; the DEFAULT partitions catch rows
+-- outside the managed window.
+
+CREATE SCHEMA partitioned;
+
+
+-- 12
+CREATE TABLE partitioned.bookings (
+    id INT NOT NULL,
+    guest_account_id INT NOT NULL,
+    accommodation_id INT NOT NULL,
+    start_date TIMESTAMP NOT NULL,
+    end_date TIMESTAMP NOT NULL,
+    payment_id INT,
+    status booking_status DEFAULT 'pending',
+    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    PRIMARY KEY (id, start_date)
+) PARTITION BY RANGE (start_date);
+
+-- 16
+CREATE TABLE partitioned.messages (
+    id INT NOT NULL,
+    sender_id INT,
+    receiver_id INT,
+    conversation_id INT,
+    body TEXT NOT NULL,
+    sent_at TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP,
+    is_read BOOLEAN DEFAULT FALSE,
+    PRIMARY KEY (id, sent_at)
+) PARTITION BY RANGE (sent_at);
+
+-- 21
+CREATE TABLE partitioned.notifications (
+    id INT NOT NULL,
+    account_id INT,
+    payload JSON,
+    sent_at TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP,
+    PRIMARY KEY (id, sent_at)
+) PARTITION BY RANGE (sent_at);
+
+-- 9
+CREATE TABLE partitioned.accommodation_calendar (
+    accommodation_id INT NOT NULL,
+    day DATE NOT NULL,
+    is_blocked BOOLEAN DEFAULT FALSE,
+    price_addition_cents INT,
+    min_nights INT DEFAULT 1,
+    PRIMARY KEY (accommodation_id, day)
+) PARTITION BY RANGE (day);
+
+
+-- Default partitions
+CREATE TABLE partitioned.bookings_default PARTITION OF partitioned.bookings DEFAULT;
+CREATE TABLE partitioned.messages_default PARTITION OF partitioned.messages DEFAULT;
+CREATE TABLE partitioned.notifications_default PARTITION OF partitioned.notifications DEFAULT;
+CREATE TABLE partitioned.accommodation_calendar_default PARTITION OF partitioned.accommodation_calendar DEFAULT;
+
+
+-- Indices (partitioned indexes, created on every partition)
+CREATE INDEX idx_p_bookings_accommodation_dates -- Optimize availability/date queries
+    ON partitioned.bookings(accommodation_id, start_date, end_date);
+
+CREATE INDEX idx_p_bookings_guest   -- Faster guest booking lookup
+    ON partitioned.bookings(guest_account_id);
+
+CREATE INDEX idx_p_messages_conversation_sent   -- Optimize ordered conversation history
+    ON partitioned.messages(conversation_id, sent_at);
+
+CREATE INDEX idx_p_notifications_account_sent   -- Optimize recent account notifications
+    ON partitioned.notifications(account_id, sent_at);
@@ -0,0 +1,25 @@
+"""
+tables.py
+
+Plain-text table formatting for summaries in logs and benchmark output.
+
+Provides:
+- format_table(): render a list of dicts as fixed-width columns (missing values shown as "-")
+"""
+
+
+
+def format_table(rows: list, columns: list) -> str:
+    """
+    Render `rows` (list of dicts) as an aligned text table with the given column order.
+    """
+    cells = [["-" if row.get(col) is None else str(row[col]) for col in columns] for row in rows]
+    widths = [max([len(col)] + [len(cell[i]) for cell in cells]) for i, col in enumerate(columns)]
+
+    lines = [
+        "  ".join(col.ljust(w) for col, w in zip(columns, widths)),
+        "  ".join("-" * w for w in widths),
+    ]
+    for cell in cells:
+        lines.append("  ".join(value.ljust(w) for value, w in zip(cell, widths)))
+    return "\n".join(lines)
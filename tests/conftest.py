@@ -0,0 +1,154 @@
+"""
+conftest.py
+
+Shared database fixtures for the test suites.
+
+Fixtures:
+- postgres_server (session): connection settings of the throwaway cluster with TEST_POSTGRES=ephemeral
+  (src.db.utils.pg_cluster), otherwise None for the docker-compose container
+- test_database (session): clones a private database for this pytest process (one per xdist
+  worker) from a seeded template snapshot and points config.DB_NAME at it, so every connection
+  opened by the code under test hits the clone; dropped at the end of the session
+- session_conn (session): one connection to the clone with an open outer transaction
+- conn (function): the session connection inside a SAVEPOINT that is rolled back after the test
+
+The template is seeded once (src.main.apply_generator_settings(), RNG_SEED or 42) and reused by later
+sessions as long as its snapshot key matches (src.db.snapshots). An advisory lock on the maintenance
+database makes parallel workers wait for a single seeding run. With TEST_POSTGRES=ephemeral the controlling pytest
+process starts one cluster for the whole run (pytest_sessionstart) and the xdist workers inherit its
+DB_* settings through the environment, so they share that cluster and its template.
+
+Parallel run (modules with shared module state have to stay on one worker):
+
+    pytest -n auto --dist loadfile
+"""
+
+
+# Stdlib imports
+import os
+from contextlib import ExitStack
+from unittest import mock
+
+# Third-party imports
+import pytest
+from psycopg2 import sql
+
+# Internal imports
+from src import config
+from src.db import refresh_marts as marts
+from src.db import run_sql_files as setup
+from src.db import snapshots
+from src.db import sql_repo as sqlrepo
+from src.db.connection import db_connection, managed_connection
+from src.db.utils import pg_cluster
+from src.main import STAGES, apply_generator_settings
+from src.utils.logger import logger
+
+
+
+TEST_SEED = int(config.RNG_SEED or 42)
+SAVEPOINT_NAME = "test_case"
+
+# Ephemeral cluster of the controlling process and its environment overrides
+_cluster_stack = ExitStack()
+
+
+
+# Helpers
+def _seed_template(name: str):
+    """
+    Run the seeding pipeline into a scratch database and save it as template snapshot `name`.
+    """
+    scratch = f"{name}_build"
+    original_db = config.DB_NAME
+    snapshots.recreate_database(scratch)
+    config.DB_NAME = scratch
+    try:
+        apply_generator_settings(TEST_SEED)
+        setup.run_sql_files()
+        with marts.change_log_paused():
+            for _, generate, _ in STAGES:
+                generate()
+        snapshots.save_snapshot(name, "template")
+    finally:
+        config.DB_NAME = original_db
+        snapshots.drop_database(scratch)
+
+def _ensure_template() -> str:
+    name = snapshots.current_snapshot_name(TEST_SEED)
+    with managed_connection(dbname=snapshots.MAINTENANCE_DB) as conn:
+        conn.autocommit = True
+        with conn.cursor() as cur:
+            cur.execute(sqlrepo.ACQUIRE_ADVISORY_LOCK, (name,))
+            try:
+                if not snapshots.snapshot_exists(name, "template"):
+                    logger.info(f"Seeding test template {name}")
+                    _seed_template(name)
+            finally:
+                cur.execute(sqlrepo.RELEASE_ADVISORY_LOCK, (name,))
+    return name
+
+
+
+# Hooks
+@pytest.hookimpl(tryfirst=True)
+def pytest_sessionstart(session):
+    """
+    Start the ephemeral cluster in the controlling process, before xdist spawns its workers.
+    """
+    if config.TEST_POSTGRES != "ephemeral" or hasattr(session.config, "workerinput"):
+        return
+    try:
+        cluster = _cluster_stack.enter_context(pg_cluster.ephemeral_cluster(apply_config=True))
+    except FileNotFoundError as e:
+        raise pytest.UsageError(f"TEST_POSTGRES=ephemeral: {e}") from None
+    _cluster_stack.enter_context(mock.patch.dict(os.environ, {key: str(value) for key, value in cluster.items()}))
+
+@pytest.hookimpl(trylast=True)
+def pytest_sessionfinish(session):
+    _cluster_stack.close()
+
+
+
+# Fixtures
+@pytest.fixture(scope="session")
+def postgres_server():
+    if config.TEST_POSTGRES != "ephemeral":
+        return None
+    return pg_cluster.cluster_settings(config.DB_HOST)
+
+@pytest.fixture(scope="session")
+def test_database(postgres_server):
+    template = _ensure_template()
+    worker = os.environ.get("PYTEST_XDIST_WORKER", "main")
+    dbname = f"{config.DB_NAME}_test_{worker}"
+    original_db = config.DB_NAME
+
+    snapshots.recreate_database(dbname, template=template)
+    config.DB_NAME = dbname
+    try:
+        yield dbname
+    finally:
+        config.DB_NAME = original_db
+        snapshots.drop_database(dbname)
+
+@pytest.fixture(scope="session")
+def session_conn(test_database):
+    connection = db_connection()
+    connection.autocommit = False
+    try:
+        yield connection
+    finally:
+        connection.rollback()
+        connection.close()
+
+@pytest.fixture(scope="function")
+def conn(session_conn):
+    savepoint = sql.Identifier(SAVEPOINT_NAME)
+    with session_conn.cursor() as cur:
+        cur.execute(sql.SQL(sqlrepo.SAVEPOINT).format(savepoint))
+    try:
+        yield session_conn
+    finally:
+        with session_conn.cursor() as cur:
+            cur.execute(sql.SQL(sqlrepo.ROLLBACK_TO_SAVEPOINT).format(name=savepoint))
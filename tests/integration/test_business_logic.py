@@ -4,8 +4,9 @@ from datetime import date
 from src.db.connection import db_connection
 
 # 0. Create Connection for all tests and rollback later
+# (on the cloned test database of tests/conftest.py; keep this module on one xdist worker: --dist loadfile)
 @pytest.fixture(scope="module")
-def conn():
+def conn(test_database):
     connection = db_connection()
     connection.autocommit = False
     try:
@@ -0,0 +1,65 @@
+# Stdlib imports
+import logging
+from datetime import date, datetime
+
+# Third-party imports
+import numpy as np
+import pytest
+
+# Internal imports
+from src.db.utils import columnar
+from src.db.utils import copy_binary as cb
+
+
+
+def test_column_table_round_trip():
+    """Test if builders, categorical labels and epoch-µs timestamps round-trip to Python rows"""
+    logging.info("==== test_column_table_round_trip =====")
+    created = columnar.column_builder("timestamp")
+    days = columnar.column_builder("date")
+    for ts in (datetime(2022, 1, 1, 12, 30), datetime(2025, 12, 31)):
+        epoch_us = int((ts - datetime(1970, 1, 1)).total_seconds()) * 1_000_000
+        created.append(epoch_us)
+        days.append(epoch_us)
+
+    table = (
+        columnar.ColumnTable("bookings")
+        .add("id", [1, 2], "int4")
+        .add("status", ["payed", None], "enum", categorical=True)
+        .add("created_at", created, "timestamp")
+        .add("day", days, "date")
+        .add("note", ["a", "b"], "text")
+    )
+
+    assert len(table) == 2
+    assert table.columns["status"].values.dtype == np.uint8
+    assert table.columns["created_at"].values.dtype == np.int64
+    assert list(table.rows()) == [
+        (1, "payed", datetime(2022, 1, 1, 12, 30), date(2022, 1, 1), "a"),
+        (2, None, datetime(2025, 12, 31), date(2025, 12, 31), "b"),
+    ]
+    # same COPY stream as the equivalent plain columns
+    assert cb.encode_copy_binary([(c.wire_values(), c.pg_type) for c in table.columns.values()]) == cb.encode_copy_binary([
+        ([1, 2], "int4"),
+        (["payed", None], "enum"),
+        (np.array(["2022-01-01T12:30", "2025-12-31"], dtype="datetime64[us]"), "timestamp"),
+        (np.array(["2022-01-01", "2025-12-31"], dtype="datetime64[D]"), "date"),
+        (["a", "b"], "text"),
+    ])
+
+    with pytest.raises(ValueError):
+        table.add("short", [1], "int4")
+
+
+def test_categorical_code_width_and_footprint():
+    """Test if dictionary codes use the smallest dtype and columns beat boxed Python lists"""
+    logging.info("==== test_categorical_code_width_and_footprint =====")
+    codes, categories = columnar.encode_categorical(["b", "a", "b", "c"])
+    assert codes.tolist() == [0, 1, 0, 2] and categories == ["b", "a", "c"]
+    assert columnar.encode_categorical(range(300))[0].dtype == np.uint16
+    assert columnar.encode_categorical(range(70_000))[0].dtype == np.int32
+
+    labels = ["guest", "host", "admin"] * 1000
+    column = columnar.to_column(labels, "enum", categorical=True)
+    assert column.nbytes < 3500
+    assert columnar.to_column(list(range(3000)), "int4").nbytes == 12_000
@@ -1,18 +1,24 @@
 # Stdlib imports
+import logging
 import subprocess
 import os
 import sys
 
+# Third-party imports
+import pytest
+
 # Internal imports
 from src.db.connection import check_connection
 
 ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", ".."))
 sys.path.insert(0, ROOT)
 from src import config
+from src.db.utils import pg_cluster
 
 
 
 # Test
+@pytest.mark.skipif(config.TEST_POSTGRES == "ephemeral", reason="checks the docker-compose container")
 def test_connection_test():
     """
     Verify check_connection() return value matches Docker/Colima runtime status.
@@ -26,4 +32,21 @@ def test_connection_test():
     if docker_running and colima_running:
         assert check_connection() is True
     else:
-        assert check_connection() is False
\ No newline at end of file
+        assert check_connection() is False
+
+def test_ephemeral_cluster_connection():
+    """Test if a throwaway cluster accepts connections and is removed afterwards"""
+    logging.info("==== test_ephemeral_cluster_connection =====")
+    try:
+        pg_cluster.find_bin_dir()
+    except FileNotFoundError:
+        pytest.skip("no PostgreSQL server binaries installed")
+    if hasattr(os, "geteuid") and os.geteuid() == 0:
+        pytest.skip("initdb refuses to run as root")
+
+    with pg_cluster.ephemeral_cluster(apply_config=True) as cluster:
+        assert config.DB_HOST == cluster["DB_HOST"]
+        assert check_connection() is True
+
+    assert not os.path.exists(cluster["DB_HOST"])
+    assert config.DB_HOST != cluster["DB_HOST"]
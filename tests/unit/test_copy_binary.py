@@ -0,0 +1,95 @@
+# Stdlib imports
+import logging
+import struct
+from datetime import date, datetime
+
+# Third-party imports
+import numpy as np
+import pytest
+
+# Internal imports
+from src.db.utils import copy_binary as cb
+
+
+
+def _parse(stream: bytes, n_cols: int) -> list:
+    """Minimal binary COPY reader: returns the raw field bytes (None for NULL) per row."""
+    assert stream.startswith(b"PGCOPY\n\xff\r\n\x00")
+    pos, rows = 19, []
+    while True:
+        (count,) = struct.unpack_from(">h", stream, pos)
+        pos += 2
+        if count == -1:
+            break
+        assert count == n_cols
+        row = []
+        for _ in range(count):
+            (length,) = struct.unpack_from(">i", stream, pos)
+            pos += 4
+            row.append(None if length == -1 else stream[pos:pos + length])
+            pos += max(length, 0)
+        rows.append(row)
+    assert pos == len(stream)
+    return rows
+
+
+def test_fixed_width_fast_path():
+    """Test if NULL-free fixed-width columns encode to the expected wire values"""
+    logging.info("==== test_fixed_width_fast_path =====")
+    stream = cb.encode_copy_binary([
+        (np.array([7, 8], dtype=np.int32), "int4"),
+        (np.array(["2000-01-02", "2024-02-29"], dtype="datetime64[D]"), "date"),
+        (np.array([True, False]), "bool"),
+        (np.array(["2000-01-01T00:00:01", "1999-12-31T23:59:59"], dtype="datetime64[us]"), "timestamp"),
+    ])
+    rows = _parse(stream, 4)
+
+    assert struct.unpack(">i", rows[0][0])[0] == 7
+    assert struct.unpack(">i", rows[0][1])[0] == 1
+    assert struct.unpack(">i", rows[1][1])[0] == (date(2024, 2, 29) - date(2000, 1, 1)).days
+    assert rows[0][2] == b"\x01" and rows[1][2] == b"\x00"
+    assert struct.unpack(">q", rows[0][3])[0] == 1_000_000
+    assert struct.unpack(">q", rows[1][3])[0] == -1_000_000
+
+
+def test_nulls_and_text_columns():
+    """Test if NULLs and text/enum columns use the generic per-row path correctly"""
+    logging.info("==== test_nulls_and_text_columns =====")
+    stream = cb.encode_copy_binary([
+        ([1, None], "int4"),
+        (["payed", None], "enum"),
+        ([datetime(2000, 1, 1), None], "timestamp"),
+        (["Grüße", "x"], "text"),
+    ])
+    rows = _parse(stream, 4)
+
+    assert rows[0] == [struct.pack(">i", 1), b"payed", struct.pack(">q", 0), "Grüße".encode()]
+    assert rows[1] == [None, None, None, b"x"]
+
+
+def test_generic_path_matches_fast_path():
+    """Test if both encoding paths produce identical bytes for the same data"""
+    logging.info("==== test_generic_path_matches_fast_path =====")
+    columns = [(np.arange(5, dtype=np.int64), "int8"), (np.arange(5) % 2 == 0, "bool")]
+    fast = cb.encode_copy_binary(columns)
+    generic = cb.COPY_HEADER + b"".join(
+        struct.pack(">h", 2) + a + b
+        for a, b in zip(cb._field_bytes(*columns[0]), cb._field_bytes(*columns[1]))
+    ) + cb.COPY_TRAILER
+    assert fast == generic
+
+
+def test_epoch_microsecond_timestamps():
+    """Test if int64 Unix-epoch microseconds are accepted as timestamps"""
+    logging.info("==== test_epoch_microsecond_timestamps =====")
+    stream = cb.encode_copy_binary([(np.array([cb.UNIX_TO_PG_US + 5], dtype=np.int64), "timestamp")])
+    assert struct.unpack(">q", _parse(stream, 1)[0][0])[0] == 5
+
+
+def test_rejects_bad_input():
+    """Test if mismatched lengths and unknown types raise ValueError"""
+    logging.info("==== test_rejects_bad_input =====")
+    with pytest.raises(ValueError):
+        cb.encode_copy_binary([([1, 2], "int4"), ([1], "int4")])
+    with pytest.raises(ValueError):
+        cb.encode_copy_binary([([1], "uuid")])
@@ -0,0 +1,52 @@
+# Stdlib imports
+import csv
+import logging
+
+# Third-party imports
+import pytest
+
+# Internal imports
+from src.db.connection import managed_connection
+from src.db.utils import db_export
+
+
+# Committed scratch tables in the cloned test database; a concurrent writer commits between two tables
+
+@pytest.fixture
+def export_tables(test_database):
+    tables = ["export_probe_a", "export_probe_b"]
+    with managed_connection(commit=True) as conn, conn.cursor() as cur:
+        for table in tables:
+            cur.execute(f"CREATE TABLE {table} (id INT);")
+            cur.execute(f"INSERT INTO {table} VALUES (1);")
+    try:
+        yield tables
+    finally:
+        with managed_connection(commit=True) as conn, conn.cursor() as cur:
+            for table in tables:
+                cur.execute(f"DROP TABLE IF EXISTS {table};")
+
+
+@pytest.mark.parametrize("method", db_export.EXPORT_METHODS)
+def test_export_reads_all_tables_from_one_snapshot(export_tables, tmp_path, monkeypatch, method):
+    """Test if rows committed while an export runs are missing from every exported file"""
+    logging.info("==== test_export_reads_all_tables_from_one_snapshot =====")
+    first, second = export_tables
+    exporter = "export_table_copy" if method == "copy" else "export_table_cursor"
+    export_table = getattr(db_export, exporter)
+
+    def export_then_write(cur_or_conn, table_name, *args, **kwargs):
+        result = export_table(cur_or_conn, table_name, *args, **kwargs)
+        if table_name == first:
+            with managed_connection(commit=True) as conn, conn.cursor() as cur:
+                cur.execute(f"INSERT INTO {second} VALUES (2);")
+        return result
+
+    monkeypatch.setattr(db_export, exporter, export_then_write)
+    files = db_export.export_database_streaming(tmp_path, method=method, tables=export_tables)
+
+    with open(files[second], newline="") as f:
+        assert list(csv.reader(f)) == [["id"], ["1"]]
+    with managed_connection() as conn, conn.cursor() as cur:
+        cur.execute(f"SELECT COUNT(*) FROM {second};")
+        assert cur.fetchone()[0] == 2
@@ -0,0 +1,52 @@
+# Stdlib imports
+import logging
+from datetime import date, datetime
+
+# Third-party imports
+import pyarrow as pa
+
+# Internal imports
+from src.db.utils import db_export_parquet as pqexport
+
+
+
+def _schema():
+    return pa.schema([
+        pa.field("id", pa.int32(), metadata={"pg_type": "int4"}),
+        pa.field("status", pqexport.ENUM_TYPE, metadata={"pg_type": "booking_status"}),
+        pa.field("start_date", pa.timestamp("us"), metadata={"pg_type": "timestamp"}),
+        pa.field("day", pa.date32(), metadata={"pg_type": "date"}),
+        pa.field("payload", pa.string(), metadata={"pg_type": "json"}),
+    ])
+
+
+def test_rows_to_record_batch_types():
+    """Test if row tuples convert to a record batch with the mapped Arrow types"""
+    logging.info("==== test_rows_to_record_batch_types =====")
+    rows = [
+        (1, "pending", datetime(2024, 1, 2, 3, 4, 5), date(2024, 1, 2), '{"a": 1}'),
+        (2, "confirmed", datetime(2024, 2, 3), date(2024, 2, 3), None),
+        (3, "pending", None, date(2024, 3, 4), '{}'),
+    ]
+    batch = pqexport.rows_to_record_batch(rows, _schema())
+
+    assert batch.num_rows == 3
+    assert batch.schema.field("status").type == pqexport.ENUM_TYPE
+    assert batch.column("status").dictionary.to_pylist() == ["pending", "confirmed"]
+    assert batch.column("start_date").to_pylist()[0] == datetime(2024, 1, 2, 3, 4, 5)
+    assert batch.column("payload").null_count == 1
+
+
+def test_rows_to_record_batch_empty():
+    """Test if an empty chunk still yields a batch with the full schema"""
+    logging.info("==== test_rows_to_record_batch_empty =====")
+    batch = pqexport.rows_to_record_batch([], _schema())
+    assert batch.num_rows == 0
+    assert batch.schema.names == ["id", "status", "start_date", "day", "payload"]
+
+
+def test_select_query_casts_json():
+    """Test if only JSON columns are selected as text"""
+    logging.info("==== test_select_query_casts_json =====")
+    query = repr(pqexport._select_query("notifications", _schema()))
+    assert query.count("::text") == 1
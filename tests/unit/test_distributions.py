@@ -0,0 +1,78 @@
+# Stdlib imports
+import datetime
+import logging
+import random
+
+# Third-party imports
+import numpy as np
+import pytest
+
+# Internal imports
+import src.db.data_lists as seeds
+from src.db.utils import distributions
+from src.db.utils.timestamps import Window
+
+
+
+def test_rank_probabilities_and_id_sampler(monkeypatch):
+    """Test if zipf/pareto/normal concentrate on hot ranks and id samplers are reproducible under random.seed"""
+    logging.info("==== test_rank_probabilities_and_id_sampler =====")
+    assert distributions.rank_probabilities(10, "uniform") is None
+    zipf = distributions.rank_probabilities(1000, "zipf", s=1.1)
+    pareto = distributions.rank_probabilities(1000, "pareto", alpha=1.16)
+    normal = distributions.rank_probabilities(1000, "normal", mean=0.5, sd=0.05)
+    for p in (zipf, pareto, normal):
+        assert p.sum() == pytest.approx(1.0)
+    assert zipf[0] > zipf[1] > zipf[-1]
+    assert pareto[:200].sum() > 0.7            # roughly 80/20
+    assert normal[500] > 100 * normal[0]
+    with pytest.raises(ValueError):
+        distributions.rank_probabilities(10, "lognormal")
+
+    monkeypatch.setattr(seeds, "distributions", {"bookings.guest_account_id": {"kind": "zipf", "s": 1.5}})
+    ids = list(range(1, 501))
+    random.seed(11)
+    sampler = distributions.id_sampler("bookings.guest_account_id", ids)
+    draws = sampler.draw_many(5000)
+    random.seed(11)
+    assert distributions.id_sampler("bookings.guest_account_id", ids).draw_many(5000) == draws
+    top_share = max(draws.count(i) for i in set(draws)) / len(draws)
+    assert top_share > 0.3                     # 1 / zeta(1.5) ≈ 0.38
+    assert set(draws) <= set(ids)
+
+    # unlisted columns stay uniform and draw like random.choice
+    random.seed(5)
+    expected = [random.choice(ids) for _ in range(20)]
+    random.seed(5)
+    uniform = distributions.id_sampler("reviews.accommodation_id", ids)
+    assert [uniform.draw() for _ in range(20)] == expected
+
+
+def test_timestamp_sampler_distributions():
+    """Test if seasonal and normal timestamp samplers weight days as configured and stay in the window"""
+    logging.info("==== test_timestamp_sampler_distributions =====")
+    start, stop = datetime.datetime(2022, 1, 1), datetime.datetime(2023, 12, 31)
+    window = Window(start, stop)
+
+    random.seed(3)
+    expected = random.randint(0, int((stop - start).total_seconds()))
+    random.seed(3)
+    assert distributions.build_timestamp_sampler(window).draw_seconds() == expected
+
+    months = [1] * 11 + [10]
+    seasonal = distributions.build_timestamp_sampler(window, "seasonal", months=months)
+    random.seed(4)
+    drawn = [seasonal.draw() for _ in range(3000)]
+    assert all(start <= ts <= stop for ts in drawn)
+    assert sum(ts.month == 12 for ts in drawn) / len(drawn) > 0.4   # 10 / 21 of the weight
+
+    normal = distributions.build_timestamp_sampler(window, "normal", mean=0.9, sd=0.05)
+    seconds = normal.draw_many_seconds(3000)
+    assert seconds.min() >= 0 and seconds.max() <= normal.delta_seconds
+    assert np.median(seconds) / normal.delta_seconds == pytest.approx(0.9, abs=0.03)
+
+    days = np.arange("2024-01-01", "2024-01-08", dtype="datetime64[D]")
+    weekdays = distributions.day_weights(days, "seasonal", weekdays=[1, 2, 3, 4, 5, 6, 7])
+    assert weekdays.tolist() == [1, 2, 3, 4, 5, 6, 7]   # 2024-01-01 was a Monday
+    with pytest.raises(ValueError):
+        distributions.day_weights(days, "seasonal", months=[1, 2])
@@ -0,0 +1,62 @@
+# Stdlib imports
+import datetime
+import logging
+
+# Internal imports
+import src.db.data_lists as seeds
+from src.db import etl_star
+
+
+# `conn` (tests/conftest.py): per-test SAVEPOINT on the session connection to the cloned test database
+
+def _watermarks(cur) -> dict:
+    cur.execute("SELECT fact_table, last_source_id FROM etl_watermarks;")
+    return dict(cur.fetchall())
+
+def _fact_rows(steps: list) -> dict:
+    return {step["step"]: step["rows"] for step in steps if step["step"] in etl_star.FACTS}
+
+
+def test_incremental_load_appends_only_rows_past_the_watermark(conn):
+    """Test if an incremental star schema load only appends bookings and payments above the watermarks"""
+    logging.info("==== test_incremental_load_appends_only_rows_past_the_watermark =====")
+    cur = conn.cursor()
+
+    # the seeded template ran the full load: watermarks sit at the highest source ids
+    cur.execute("SELECT (SELECT MAX(id) FROM bookings), (SELECT MAX(id) FROM payments);")
+    max_booking_id, max_payment_id = cur.fetchone()
+    assert _watermarks(cur) == {"fact_booking": max_booking_id, "fact_payment": max_payment_id}
+
+    cur.execute("""
+        SELECT b.guest_account_id, b.accommodation_id, p.payment_method_id
+        FROM bookings b
+        JOIN payments p ON p.id = b.payment_id
+        ORDER BY b.id
+        LIMIT 1;
+    """)
+    guest_id, accommodation_id, method_id = cur.fetchone()
+    cur.execute("""
+        INSERT INTO payments (customer_id, amount_cents, status, payment_method_id)
+        VALUES (%s, 5000, 'payed', %s)
+        RETURNING id;
+    """, (guest_id, method_id))
+    payment_id = cur.fetchone()[0]
+    start = seeds.start_timestamp + datetime.timedelta(days=30)
+    cur.execute("""
+        INSERT INTO bookings (guest_account_id, accommodation_id, start_date, end_date, payment_id, status)
+        VALUES (%s, %s, %s, %s, %s, 'confirmed')
+        RETURNING id;
+    """, (guest_id, accommodation_id, start, start + datetime.timedelta(days=2), payment_id))
+    booking_id = cur.fetchone()[0]
+
+    assert _fact_rows(etl_star.load_star(cur)) == {"fact_booking": 1, "fact_payment": 1}
+    assert _watermarks(cur) == {"fact_booking": booking_id, "fact_payment": payment_id}
+    cur.execute("SELECT booking_id, nights, amount_cents, start_date_key IS NOT NULL FROM fact_booking WHERE booking_id > %s;", (max_booking_id,))
+    assert cur.fetchall() == [(booking_id, 2, 5000, True)]
+    cur.execute("SELECT payment_id, booking_id FROM fact_payment WHERE payment_id > %s;", (max_payment_id,))
+    assert cur.fetchall() == [(payment_id, booking_id)]
+
+    # nothing new: a second incremental load appends nothing
+    assert _fact_rows(etl_star.load_star(cur)) == {"fact_booking": 0, "fact_payment": 0}
+    cur.execute("SELECT COUNT(*) FROM fact_booking WHERE booking_id = %s;", (booking_id,))
+    assert cur.fetchone()[0] == 1
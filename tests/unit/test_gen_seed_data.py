@@ -6,20 +6,9 @@ import pytest
 
 # Internal imports
 import src.db.utils.db_introspect as introspect
-from src.db.connection import db_connection
 
 
-
-@pytest.fixture(scope="function")
-def conn():
-    connection = db_connection()
-    connection.autocommit = False
-
-    try:
-        yield connection
-    finally:
-        connection.rollback()
-        connection.close()
+# `conn` (tests/conftest.py): per-test SAVEPOINT on the session connection to the cloned test database
 
 # === INTEGRITY TESTS ===
 def test_all_tables_filled(conn):
@@ -579,6 +568,23 @@ def test_bookings_integrity(conn):
 
     logging.info("")
 
+def test_bookings_per_accommodation(conn):
+    """Test if bookings are spread over accommodations with several bookings per listing and one payment each"""
+    logging.info("==== test_bookings_per_accommodation =====")
+    cur = conn.cursor()
+
+    cur.execute("""
+        SELECT COUNT(*), COUNT(DISTINCT accommodation_id), COUNT(DISTINCT payment_id)
+        FROM bookings;
+    """)
+    n_bookings, n_booked, n_payments = cur.fetchone()
+    cur.execute("SELECT MAX(n) FROM (SELECT COUNT(*) AS n FROM bookings GROUP BY accommodation_id) per_accommodation;")
+    max_per_accommodation = cur.fetchone()[0]
+
+    assert n_payments == n_bookings
+    assert n_booked < n_bookings
+    assert max_per_accommodation > 1
+
 
 # === FAULTY DATA INSERTION TESTS ===
 def test_accounts(conn):
@@ -0,0 +1,67 @@
+# Stdlib imports
+import logging
+
+# Internal imports
+from src.db.utils import index_advisor
+
+
+
+def _index(table, name, columns, primary=False, unique=False, idx_scan=0):
+    return {
+        "table_name": table,
+        "index_name": name,
+        "columns": columns,
+        "is_primary": primary,
+        "is_unique": unique or primary,
+        "is_partial_or_expression": False,
+        "method": "btree",
+        "size_bytes": 8192,
+        "idx_scan": idx_scan,
+        "index_writes": 100,
+    }
+
+
+SCHEMA_INDEXES = [
+    _index("credentials", "credentials_pkey", ["account_id"], primary=True, idx_scan=5),
+    _index("credentials", "idx_credentials_account_id", ["account_id"], idx_scan=3),
+    _index("accommodation_calendar", "accommodation_calendar_pkey", ["accommodation_id", "day"], primary=True),
+    _index("accommodation_calendar", "idx_calendar_accommodation_day", ["accommodation_id", "day"], idx_scan=9),
+    _index("bookings", "bookings_pkey", ["id"], primary=True, idx_scan=7),
+    _index("bookings", "idx_bookings_accommodation", ["accommodation_id"], idx_scan=2),
+    _index("bookings", "idx_bookings_accommodation_dates", ["accommodation_id", "start_date", "end_date"], idx_scan=4),
+    _index("bookings", "idx_bookings_guest", ["guest_account_id"]),
+]
+
+
+def test_redundant_indexes_from_schema():
+    """Test if duplicates of primary keys and prefix indexes are reported, constraint indexes kept"""
+    logging.info("==== test_redundant_indexes_from_schema =====")
+    findings = {f["index_name"]: f for f in index_advisor.find_redundant_indexes(SCHEMA_INDEXES)}
+
+    assert set(findings) == {"idx_credentials_account_id", "idx_calendar_accommodation_day", "idx_bookings_accommodation"}
+    assert findings["idx_credentials_account_id"]["finding"] == "duplicate"
+    assert findings["idx_credentials_account_id"]["covered_by"] == "credentials_pkey"
+    assert findings["idx_bookings_accommodation"]["finding"] == "prefix"
+    assert findings["idx_bookings_accommodation"]["covered_by"] == "idx_bookings_accommodation_dates"
+
+
+def test_unused_and_missing_indexes():
+    """Test if never-scanned plain indexes and unindexed foreign keys of seq-scan-heavy tables are reported"""
+    logging.info("==== test_unused_and_missing_indexes =====")
+    tables = [
+        {"table_name": "messages", "seq_scan": 500, "seq_tup_read": 5_000_000, "idx_scan": 10, "n_live_tup": 10_000},
+        {"table_name": "bookings", "seq_scan": 1, "seq_tup_read": 200_000, "idx_scan": 50, "n_live_tup": 10_000},
+    ]
+    foreign_keys = [
+        {"table_name": "messages", "constraint_name": "messages_sender_id_fkey", "columns": ["sender_id"]},
+        {"table_name": "bookings", "constraint_name": "bookings_payment_id_fkey", "columns": ["payment_id"]},
+    ]
+    stats = {"indexes": SCHEMA_INDEXES, "tables": tables, "foreign_keys": foreign_keys}
+
+    findings = index_advisor.advise(stats)
+    by_kind = {}
+    for finding in findings:
+        by_kind.setdefault(finding["finding"], []).append(finding["index_name"])
+
+    assert by_kind["unused"] == ["idx_bookings_guest"]
+    assert by_kind["missing"] == ["idx_messages_sender_id"]
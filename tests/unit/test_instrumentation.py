@@ -0,0 +1,69 @@
+# Stdlib imports
+import json
+import logging
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+# Internal imports
+from src.db.utils import instrumentation
+
+
+
+@pytest.fixture(autouse=True)
+def clean_stages():
+    instrumentation.reset()
+    yield
+    instrumentation.reset()
+
+
+def test_nested_stages_attribute_to_innermost():
+    """Test if decorated and scoped stages are recorded separately, innermost stage active"""
+    logging.info("==== test_nested_stages_attribute_to_innermost =====")
+
+    @instrumentation.stage("inner")
+    def inner():
+        return instrumentation._active()
+
+    with instrumentation.stage_scope("outer") as outer:
+        assert inner().name == "inner"
+        assert instrumentation._active() is outer
+    assert instrumentation._active() is None
+
+    names = [stats.name for stats in instrumentation.completed_stages()]
+    assert names == ["inner", "outer"]
+
+
+def test_pool_workers_count_towards_submitting_stage():
+    """Test if functions bound with in_active_stage() record into the submitting thread's stage from pool workers"""
+    logging.info("==== test_pool_workers_count_towards_submitting_stage =====")
+
+    def record(_):
+        stats = instrumentation._active()
+        if stats is not None:
+            instrumentation.InstrumentedCursor._record(None, stats, 0.0, 1, 1, 10)
+        return stats
+
+    with instrumentation.stage_scope("build_indexes") as outer:
+        with ThreadPoolExecutor(max_workers=4) as pool:
+            assert all(stats is None for stats in pool.map(record, range(4)))
+            assert all(stats is outer for stats in pool.map(instrumentation.in_active_stage(record), range(400)))
+    assert instrumentation.in_active_stage(record) is record
+    assert (outer.statements, outer.round_trips, outer.rows_sent, outer.bytes_sent) == (400, 400, 400, 4000)
+
+
+def test_stage_summary_splits_network_and_server(tmp_path):
+    """Test if the summary splits wall time into generation, network and server time"""
+    logging.info("==== test_stage_summary_splits_network_and_server =====")
+    stats = instrumentation.StageStats("accounts", wall_s=2.0, db_s=0.5, statements=100, round_trips=100,
+                                       rows_sent=100, bytes_sent=4096)
+
+    rows = instrumentation.stage_summary([stats], rtt=0.001)
+    assert rows[0]["generation_s"] == 1.5
+    assert rows[0]["network_s"] == 0.1
+    assert rows[0]["server_s"] == 0.4
+
+    out = tmp_path / "stages.jsonl"
+    instrumentation.write_jsonl(out, rows)
+    line = json.loads(out.read_text().splitlines()[0])
+    assert line["stage"] == "accounts" and line["round_trips"] == 100
@@ -0,0 +1,66 @@
+# Stdlib imports
+import logging
+import pytest
+
+# Internal imports
+from src.db.utils import leak_tracker
+
+
+
+class FakeResource:
+    """Stand-in for a psycopg2 connection/cursor: only `closed` is inspected."""
+    def __init__(self):
+        self.closed = False
+
+
+@pytest.fixture(autouse=True)
+def clean_registry(monkeypatch):
+    monkeypatch.setattr(leak_tracker.config, "DB_LEAK_CHECK", "log")
+    leak_tracker.reset()
+    yield
+    leak_tracker.reset()
+
+
+def test_open_resources_reports_call_site():
+    """Test if unclosed objects are reported with the call site that opened them"""
+    logging.info("==== test_open_resources_reports_call_site =====")
+    conn = FakeResource()
+    leak_tracker.track(conn, "connection")
+
+    leaks = leak_tracker.open_resources()
+    assert len(leaks) == 1
+    kind, site = leaks[0]
+    assert kind == "connection"
+    assert "test_leak_tracker.py" in site
+    assert "test_open_resources_reports_call_site" in site
+
+    conn.closed = True
+    assert leak_tracker.open_resources() == []
+
+
+def test_collected_objects_are_forgotten():
+    """Test if garbage-collected objects drop out of the registry"""
+    logging.info("==== test_collected_objects_are_forgotten =====")
+    leak_tracker.track(FakeResource(), "cursor")
+    assert leak_tracker.open_resources() == []
+
+
+def test_report_leaks_modes():
+    """Test if report_leaks logs, raises or stays silent depending on the mode"""
+    logging.info("==== test_report_leaks_modes =====")
+    cur = FakeResource()
+    leak_tracker.track(cur, "cursor")
+
+    assert leak_tracker.report_leaks(mode="off") == {}
+    assert sum(leak_tracker.report_leaks(mode="log").values()) == 1
+    with pytest.raises(leak_tracker.ConnectionLeakError):
+        leak_tracker.report_leaks(mode="raise")
+
+
+def test_tracking_disabled(monkeypatch):
+    """Test if nothing is registered when the leak check is off"""
+    logging.info("==== test_tracking_disabled =====")
+    monkeypatch.setattr(leak_tracker.config, "DB_LEAK_CHECK", "off")
+    res = FakeResource()
+    leak_tracker.track(res, "connection")
+    assert leak_tracker.open_resources() == []
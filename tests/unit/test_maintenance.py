@@ -0,0 +1,43 @@
+# Stdlib imports
+import datetime
+import logging
+
+# Internal imports
+from src.db import maintenance
+
+
+
+def _row(table, live, modified, analyzed):
+    return {"table": table, "n_live_tup": live, "n_mod_since_analyze": modified, "last_analyzed": analyzed, "last_vacuumed": None}
+
+
+def test_find_stale_tables_reasons():
+    """Test if never analyzed, pre-load and heavily modified tables are reported as stale"""
+    logging.info("==== test_find_stale_tables_reasons =====")
+    load_start = datetime.datetime(2024, 1, 1, 12, 0, tzinfo=datetime.timezone.utc)
+    after, before = load_start + datetime.timedelta(minutes=5), load_start - datetime.timedelta(days=1)
+    rows = [
+        _row("bookings", 1000, 0, None),
+        _row("payments", 1000, 0, before),
+        _row("reviews", 1000, 200, after),
+        _row("accounts", 1000, 50, after),
+        _row("amenities", 0, 0, None),
+    ]
+
+    stale = {row["table"]: row["reason"] for row in maintenance.find_stale_tables(rows, analyzed_since=load_start)}
+
+    assert stale == {
+        "bookings": "never analyzed",
+        "payments": "analyzed before load",
+        "reviews": "modified since analyze",
+    }
+
+
+def test_find_stale_tables_without_load_start():
+    """Test if old statistics are fresh when no load start is given and few rows changed"""
+    logging.info("==== test_find_stale_tables_without_load_start =====")
+    analyzed = datetime.datetime(2020, 1, 1, tzinfo=datetime.timezone.utc)
+    rows = [_row("bookings", 1000, 100, analyzed)]
+
+    assert maintenance.find_stale_tables(rows) == []
+    assert len(maintenance.find_stale_tables(rows, stale_fraction=0.05)) == 1
@@ -0,0 +1,32 @@
+# Stdlib imports
+import datetime
+import logging
+
+# Internal imports
+from src.db import partitions
+
+
+
+def test_month_starts_cover_window_across_year_end():
+    """Test if the monthly partition bounds cover the whole window including a year change"""
+    logging.info("==== test_month_starts_cover_window_across_year_end =====")
+    months = partitions.month_starts(datetime.date(2022, 11, 15), datetime.date(2023, 2, 1))
+
+    assert months == [
+        datetime.date(2022, 11, 1),
+        datetime.date(2022, 12, 1),
+        datetime.date(2023, 1, 1),
+        datetime.date(2023, 2, 1),
+    ]
+    assert partitions.next_month(datetime.date(2022, 12, 1)) == datetime.date(2023, 1, 1)
+
+
+def test_partition_name_round_trip():
+    """Test if partition names encode their month and DEFAULT partitions are not parsed"""
+    logging.info("==== test_partition_name_round_trip =====")
+    month = datetime.date(2024, 3, 1)
+    name = partitions.partition_name("accommodation_calendar", month)
+
+    assert name == "accommodation_calendar_y2024m03"
+    assert partitions.partition_month(name) == month
+    assert partitions.partition_month("accommodation_calendar_default") is None
@@ -0,0 +1,54 @@
+# Stdlib imports
+import logging
+
+# Third-party imports
+import pytest
+
+# Internal imports
+from src.db.utils import passwords
+
+
+
+def test_hash_formats_and_verification():
+    """Test if stdlib hashes are salted per row, deterministic per seed and verify against their plaintext"""
+    logging.info("==== test_hash_formats_and_verification =====")
+    pbkdf2 = passwords._hash_range("pbkdf2_sha256", 1000, 7, 0, 3)
+    scrypt = passwords._hash_range("scrypt", 4, 7, 0, 3)
+    assert passwords._hash_range("pbkdf2_sha256", 1000, 7, 0, 3) == pbkdf2
+    assert passwords._hash_range("pbkdf2_sha256", 1000, 8, 0, 3) != pbkdf2
+    assert all(h.startswith("pbkdf2_sha256$1000$") for h in pbkdf2)
+    assert all(h.startswith("$scrypt$ln=4,r=8,p=1$") for h in scrypt)
+    assert len({h.split("$")[2] for h in pbkdf2}) == 3      # one salt per row
+
+    for i, (p_hash, s_hash) in enumerate(zip(pbkdf2, scrypt)):
+        assert passwords.verify_password(passwords.plain_password(7, i), p_hash)
+        assert passwords.verify_password(passwords.plain_password(7, i), s_hash)
+        assert not passwords.verify_password(passwords.plain_password(7, i + 1), p_hash)
+
+    with pytest.raises(ValueError):
+        passwords.hash_passwords(1, "md5")
+
+
+def test_hash_passwords_pool_and_cache(tmp_path, monkeypatch):
+    """Test if pooled hashing matches serial hashing and seeded hashes are cached and extended"""
+    logging.info("==== test_hash_passwords_pool_and_cache =====")
+    monkeypatch.setattr(passwords, "HASH_CACHE_DIR", tmp_path)
+    monkeypatch.setattr(passwords, "CHUNK_SIZE", 8)
+    serial = passwords.compute_hashes("pbkdf2_sha256", 500, 3, 0, 40, workers=1)
+    assert passwords.compute_hashes("pbkdf2_sha256", 500, 3, 0, 40, workers=2) == serial
+
+    assert passwords.hash_passwords(20, "pbkdf2_sha256", 500, seed=3, workers=1) == serial[:20]
+    path = passwords.cache_path("pbkdf2_sha256", 500, 3)
+    assert path.read_text().splitlines() == serial[:20]
+
+    # a smaller run reads the prefix, a larger one hashes only the missing tail
+    monkeypatch.setattr(passwords, "compute_hashes", lambda *args, **kwargs: pytest.fail("cache miss"))
+    assert passwords.hash_passwords(10, "pbkdf2_sha256", 500, seed=3) == serial[:10]
+    monkeypatch.undo()
+    monkeypatch.setattr(passwords, "HASH_CACHE_DIR", tmp_path)
+    assert passwords.hash_passwords(40, "pbkdf2_sha256", 500, seed=3, workers=1) == serial
+    assert path.read_text().splitlines() == serial
+
+    # unseeded runs are not cached
+    assert len(passwords.hash_passwords(5, "pbkdf2_sha256", 500, workers=1)) == 5
+    assert [p.name for p in tmp_path.iterdir()] == [path.name]
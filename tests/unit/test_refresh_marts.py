@@ -0,0 +1,149 @@
+# Stdlib imports
+import datetime
+import logging
+from collections import defaultdict
+
+# Third-party imports
+from psycopg2 import sql
+
+# Internal imports
+from src.db import refresh_marts as marts
+
+
+# `conn` (tests/conftest.py): per-test SAVEPOINT on the session connection to the cloned test database
+
+def _aggregate_rows(cur) -> dict:
+    rows = {}
+    for agg_table in marts.AGGREGATE_TABLES:
+        cur.execute(sql.SQL("SELECT * FROM {}").format(sql.Identifier(agg_table)))
+        rows[agg_table] = sorted(cur.fetchall(), key=repr)
+    return rows
+
+
+def test_refresh_incremental_matches_rebuild(conn):
+    """Test if the incremental refresh after inserts, updates and deletes equals a full rebuild of every agg_* table"""
+    logging.info("==== test_refresh_incremental_matches_rebuild =====")
+    cur = conn.cursor()
+
+    # Inserts: a payed, confirmed booking across a month boundary and a review
+    cur.execute("""
+        SELECT b.guest_account_id, b.accommodation_id, p.payment_method_id
+        FROM bookings b
+        JOIN payments p ON p.id = b.payment_id
+        ORDER BY b.id
+        LIMIT 1;
+    """)
+    guest_id, accommodation_id, method_id = cur.fetchone()
+    cur.execute("""
+        INSERT INTO payments (customer_id, amount_cents, status, payment_method_id)
+        VALUES (%s, 12345, 'payed', %s)
+        RETURNING id;
+    """, (guest_id, method_id))
+    payment_id = cur.fetchone()[0]
+    cur.execute("""
+        INSERT INTO bookings (guest_account_id, accommodation_id, start_date, end_date, payment_id, status)
+        VALUES (%s, %s, '2031-02-26', '2031-03-03', %s, 'confirmed');
+    """, (guest_id, accommodation_id, payment_id))
+    cur.execute("""
+        INSERT INTO reviews (accommodation_id, author_account_id, rating, description)
+        VALUES (%s, %s, 1, 'Incremental refresh test');
+    """, (accommodation_id, guest_id))
+
+    # Updates: move a counted booking, change the amount of a linked payment, flip a rating
+    cur.execute("""
+        UPDATE bookings
+        SET start_date = start_date + INTERVAL '3 days', end_date = end_date + INTERVAL '3 days'
+        WHERE id = (SELECT MIN(id) FROM bookings WHERE status IN ('confirmed', 'completed'));
+    """)
+    cur.execute("""
+        UPDATE payments
+        SET amount_cents = amount_cents + 100, status = 'payed'
+        WHERE id = (SELECT MAX(payment_id) FROM bookings WHERE status IN ('confirmed', 'completed'));
+    """)
+    cur.execute("UPDATE reviews SET rating = 6 - rating WHERE id = (SELECT MIN(id) FROM reviews);")
+
+    # Deletes: a booking without payouts, an unlinked payment and a review
+    cur.execute("""
+        DELETE FROM bookings
+        WHERE id = (
+            SELECT MIN(b.id)
+            FROM bookings b
+            WHERE b.status IN ('confirmed', 'completed')
+              AND NOT EXISTS (SELECT 1 FROM payouts po WHERE po.booking_id = b.id)
+        );
+    """)
+    cur.execute("SELECT MIN(payment_id) FROM bookings WHERE status IN ('confirmed', 'completed');")
+    deleted_payment_id = cur.fetchone()[0]
+    cur.execute("UPDATE bookings SET payment_id = NULL WHERE payment_id = %s;", (deleted_payment_id,))
+    cur.execute("DELETE FROM payments WHERE id = %s;", (deleted_payment_id,))
+    cur.execute("DELETE FROM reviews WHERE id = (SELECT MAX(id) FROM reviews WHERE description <> 'Incremental refresh test');")
+
+    result = marts.refresh_incremental(cur)
+    assert result["changes"] > 0
+    assert all(result["keys"].values())
+    incremental = _aggregate_rows(cur)
+
+    marts.rebuild_aggregates(cur)
+    rebuilt = _aggregate_rows(cur)
+    for agg_table in marts.AGGREGATE_TABLES:
+        assert incremental[agg_table] == rebuilt[agg_table], agg_table
+
+
+def test_marts_match_base_table_aggregates(conn):
+    """Test if every refreshed mart equals the same aggregates computed in Python from the base tables"""
+    logging.info("==== test_marts_match_base_table_aggregates =====")
+    cur = conn.cursor()
+    for mart_name in marts.MARTS:
+        marts.refresh_mart(cur, mart_name, concurrently=False)
+
+    cur.execute("""
+        SELECT b.id, b.accommodation_id, b.start_date, b.end_date, b.status, a.host_account_id,
+               ad.id IS NOT NULL, ad.city, p.status, p.amount_cents
+        FROM bookings b
+        JOIN accommodations a ON a.id = b.accommodation_id
+        LEFT JOIN addresses ad ON ad.id = a.address_id
+        LEFT JOIN payments p ON p.id = b.payment_id;
+    """)
+    bookings = cur.fetchall()
+    cur.execute("SELECT booking_id, amount_cents FROM payouts WHERE booking_id IS NOT NULL;")
+    payouts = defaultdict(list)
+    for booking_id, amount_cents in cur.fetchall():
+        payouts[booking_id].append(amount_cents)
+
+    revenue = defaultdict(lambda: [0, 0])
+    nights = defaultdict(set)
+    reconciliation = {}
+    for booking_id, accommodation_id, start, end, status, host_id, has_address, city, payment_status, amount in bookings:
+        if status not in ("confirmed", "completed"):
+            continue
+        if has_address and payment_status == "payed":
+            revenue[(start.date(), host_id, city)][0] += 1
+            revenue[(start.date(), host_id, city)][1] += amount
+        night = start.date()
+        while night < end.date():
+            nights[(accommodation_id, night.replace(day=1))].add(night)
+            night += datetime.timedelta(days=1)
+        payout_amounts = payouts.get(booking_id, [])
+        reconciliation[booking_id] = (
+            amount if payment_status == "payed" and amount is not None else 0,
+            sum(a for a in payout_amounts if a is not None),
+            len(payout_amounts),
+        )
+
+    cur.execute("SELECT day, host_account_id, city, bookings, revenue_cents FROM mart_daily_revenue;")
+    assert {(day, host, city): [n, cents] for day, host, city, n, cents in cur.fetchall()} == dict(revenue)
+
+    cur.execute("SELECT accommodation_id, month, booked_nights FROM mart_monthly_occupancy;")
+    assert {(acc, month): n for acc, month, n in cur.fetchall()} == {key: len(days) for key, days in nights.items()}
+
+    cur.execute("SELECT booking_id, payed_cents, payout_cents, payouts FROM mart_payout_reconciliation;")
+    assert {booking_id: tuple(values) for booking_id, *values in cur.fetchall()} == reconciliation
+
+    cur.execute("SELECT accommodation_id, rating, created_at FROM reviews;")
+    reviews = defaultdict(list)
+    for accommodation_id, rating, created_at in cur.fetchall():
+        reviews[accommodation_id].append((rating, created_at))
+    cur.execute("SELECT accommodation_id, reviews, max_rating, last_review_at FROM mart_review_ratings;")
+    assert {acc: (n, max_rating, last) for acc, n, max_rating, last in cur.fetchall()} == {
+        acc: (len(rows), max(r for r, _ in rows), max(c for _, c in rows)) for acc, rows in reviews.items()
+    }
@@ -0,0 +1,95 @@
+# Stdlib imports
+import logging
+import os
+
+# Third-party imports
+import psycopg2
+import pytest
+
+# Internal imports
+from src import config
+from src.db import run_sql_files as setup
+from src.db import snapshots
+from src.db.connection import managed_connection
+
+
+# Each test applies its own small SQL files to an empty scratch database on the test server
+
+@pytest.fixture
+def migration_db(postgres_server, tmp_path, monkeypatch):
+    worker = os.environ.get("PYTEST_XDIST_WORKER", "main")
+    dbname = f"{config.DB_NAME}_migrations_{worker}"
+    snapshots.recreate_database(dbname)
+    monkeypatch.setattr(config, "DB_NAME", dbname)
+    monkeypatch.setattr(setup, "SQL_DIR", tmp_path)
+    try:
+        yield tmp_path
+    finally:
+        monkeypatch.undo()
+        snapshots.drop_database(dbname)
+
+def _fetch(query: str, params=None) -> list:
+    with managed_connection() as conn, conn.cursor() as cur:
+        cur.execute(query, params)
+        return cur.fetchall()
+
+def _index_names(table: str) -> set:
+    return {row[0] for row in _fetch("SELECT indexname FROM pg_indexes WHERE tablename = %s;", (table,))}
+
+
+def test_run_sql_files_defers_indexes_and_skips_applied_files(migration_db, monkeypatch):
+    """Test if applied files are recorded and skipped, plain indexes wait for build_deferred_indexes() and edits raise"""
+    logging.info("==== test_run_sql_files_defers_indexes_and_skips_applied_files =====")
+    sql_file = migration_db / "01_a.sql"
+    sql_file.write_text("""
+        CREATE TABLE a (id INT, x INT);
+        CREATE UNIQUE INDEX idx_a_id ON a(id);
+        CREATE INDEX idx_a_x    -- deferred
+            ON a(x);
+    """)
+    monkeypatch.setattr(setup, "FILES", ["01_a.sql"])
+
+    setup.run_sql_files()
+    assert _fetch("SELECT filename, checksum FROM schema_migrations;") == [("01_a.sql", setup.file_checksum(sql_file))]
+    assert _index_names("a") == {"idx_a_id"}
+    pending = _fetch("SELECT filename, statement FROM schema_deferred_indexes WHERE built_at IS NULL;")
+    assert [(filename, "idx_a_x" in statement) for filename, statement in pending] == [("01_a.sql", True)]
+
+    # a second run skips the file (CREATE TABLE a would fail otherwise)
+    setup.run_sql_files()
+
+    setup.build_deferred_indexes(workers=2)
+    assert _index_names("a") == {"idx_a_id", "idx_a_x"}
+    assert _fetch("SELECT COUNT(*) FROM schema_deferred_indexes WHERE built_at IS NULL;") == [(0,)]
+
+    sql_file.write_text(sql_file.read_text() + "\nCREATE TABLE b (id INT);\n")
+    with pytest.raises(setup.MigrationChecksumError):
+        setup.run_sql_files()
+
+
+def test_build_deferred_indexes_resumes_pending_indexes(migration_db, monkeypatch):
+    """Test if a failed index build stays pending and the next build only runs the pending indexes"""
+    logging.info("==== test_build_deferred_indexes_resumes_pending_indexes =====")
+    (migration_db / "01_b.sql").write_text("""
+        CREATE TABLE b (x INT, y INT);
+        CREATE INDEX idx_b_x ON b(x);
+        CREATE INDEX idx_b_missing ON b(missing_column);
+    """)
+    monkeypatch.setattr(setup, "FILES", ["01_b.sql"])
+    setup.run_sql_files()
+
+    with pytest.raises(psycopg2.Error):
+        setup.build_deferred_indexes(workers=1)
+    assert _index_names("b") == {"idx_b_x"}
+    pending = _fetch("SELECT position, statement FROM schema_deferred_indexes WHERE built_at IS NULL;")
+    assert len(pending) == 1 and "idx_b_missing" in pending[0][1]
+
+    # repair the failed statement; rebuilding idx_b_x would fail with "already exists"
+    with managed_connection(commit=True) as conn, conn.cursor() as cur:
+        cur.execute(
+            "UPDATE schema_deferred_indexes SET statement = %s WHERE position = %s;",
+            ("CREATE INDEX idx_b_missing ON b(y)", pending[0][0]),
+        )
+    setup.build_deferred_indexes(workers=1)
+    assert _index_names("b") == {"idx_b_x", "idx_b_missing"}
+    assert _fetch("SELECT COUNT(*) FROM schema_deferred_indexes WHERE built_at IS NULL;") == [(0,)]
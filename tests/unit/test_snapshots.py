@@ -0,0 +1,44 @@
+# Stdlib imports
+import logging
+
+# Internal imports
+from src.db import snapshots
+
+
+
+def test_snapshot_name_encodes_key():
+    """Test if snapshot names differ per profile/seed/checksum and stay valid identifiers"""
+    logging.info("==== test_snapshot_name_encodes_key =====")
+    checksum = "ab" * 32
+    name = snapshots.snapshot_name(checksum, "1k", 42)
+
+    assert name == "snap_1k_s42_abababababab"
+    assert len(name) <= 63
+    assert name != snapshots.snapshot_name(checksum, "1k", 43)
+    assert name != snapshots.snapshot_name(checksum, "100k", 42)
+    assert name != snapshots.snapshot_name("cd" * 32, "1k", 42)
+
+
+def test_schema_checksum_is_stable():
+    """Test if the schema checksum only depends on the file contents"""
+    logging.info("==== test_schema_checksum_is_stable =====")
+    checksum = snapshots.schema_checksum()
+
+    assert len(checksum) == 64
+    assert checksum == snapshots.schema_checksum()
+
+
+def test_snapshot_sources_cover_pipeline_modules():
+    """Test if the checksum sources include every SQL file, the pipeline and the src/db modules"""
+    logging.info("==== test_snapshot_sources_cover_pipeline_modules =====")
+    sources = {path.relative_to(snapshots.PROJECT_ROOT).as_posix() for path in snapshots.snapshot_sources()}
+
+    assert {f"src/sql/{fname}" for fname in snapshots.setup.FILES} <= sources
+    assert {
+        "src/main.py",
+        "src/db/sql_repo.py",
+        "src/db/refresh_marts.py",
+        "src/db/etl_star.py",
+        "src/db/maintenance.py",
+        "src/db/utils/copy_binary.py",
+    } <= sources
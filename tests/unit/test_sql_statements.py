@@ -0,0 +1,39 @@
+# Stdlib imports
+import logging
+
+# Internal imports
+from src.db.utils.sql_statements import is_parallel_index, split_statements
+
+
+
+def test_split_statements_respects_quotes_comments_and_dollar_bodies():
+    """Test if semicolons inside literals, comments and dollar-quoted bodies do not split a statement"""
+    logging.info("==== test_split_statements_respects_quotes_comments_and_dollar_bodies =====")
+    text = """
+    -- header; not a statement
+    INSERT INTO t VALUES ('a;b', 'it''s;');
+    /* block; comment */
+    CREATE FUNCTION f() RETURNS trigger AS $$
+    BEGIN
+        PERFORM 1; RETURN NEW;
+    END;
+    $$ LANGUAGE plpgsql;
+    SELECT "odd;name" FROM t;
+    SELECT E'it\\'s;', e'\\\\', name'x;y' FROM t
+    """
+    statements = split_statements(text)
+
+    assert len(statements) == 4
+    assert statements[0].endswith("VALUES ('a;b', 'it''s;')")
+    assert "RETURN NEW;" in statements[1]
+    assert statements[2] == 'SELECT "odd;name" FROM t'
+    assert statements[3] == "SELECT E'it\\'s;', e'\\\\', name'x;y' FROM t"
+
+
+def test_is_parallel_index_skips_unique_indexes():
+    """Test if only plain CREATE INDEX statements are classified as parallel index builds"""
+    logging.info("==== test_is_parallel_index_skips_unique_indexes =====")
+    assert is_parallel_index("-- Faster lookup\nCREATE INDEX idx_a ON a(x)")
+    assert is_parallel_index("create index idx_b on b(y)")
+    assert not is_parallel_index("CREATE UNIQUE INDEX idx_c ON c(z)")
+    assert not is_parallel_index("CREATE TABLE index_log (id INT)")
@@ -0,0 +1,58 @@
+# Stdlib imports
+import logging
+import random
+
+# Third-party imports
+import numpy as np
+import pytest
+
+# Internal imports
+from src.db.utils import textgen
+from src.db.utils.samplers import Sampler
+
+
+
+def test_template_text_batches():
+    """Test if template texts join one token per slot and pre-joined slot groups keep every combination"""
+    logging.info("==== test_template_text_batches =====")
+    slots = [
+        (Sampler(["wow", "meh"]), True, "! "),
+        (Sampler(["cozy", "cold", "loud"]), False, ". "),
+        (Sampler([f"w{i}" for i in range(5000)]), False, "!"),
+    ]
+    template = textgen.TemplateText(slots)
+    assert [len(tokens) for tokens, _ in template.groups] == [6, 5000]
+
+    random.seed(1)
+    texts = template.generate(3000)
+    random.seed(1)
+    assert template.generate(3000).tolist() == texts.tolist()
+
+    firsts = {text.split("! ")[0] for text in texts}
+    seconds = {text.split("! ")[1].split(". ")[0] for text in texts}
+    assert firsts == {"Wow", "Meh"} and seconds == {"cozy", "cold", "loud"}
+    assert all(text.endswith("!") and text.split(". ")[1][:-1] in {f"w{i}" for i in range(5000)} for text in texts)
+    assert len(template.generate(0)) == 0
+
+
+def test_word_and_markov_text():
+    """Test if word and Markov texts respect the length bounds and only use valid words/transitions"""
+    logging.info("==== test_word_and_markov_text =====")
+    lengths = textgen.LengthDistribution("lognormal", min=2, max=40, median=6, sigma=1.0)
+    random.seed(2)
+    words = textgen.WordText(Sampler(["ho", "jingle", "bell"]), lengths).generate(2000)
+    counts = np.array([len(text.split(" ")) for text in words])
+    assert counts.min() >= 2 and counts.max() <= 40 and 4 <= np.median(counts) <= 8
+    assert {word for text in words for word in text.split(" ")} == {"ho", "jingle", "bell"}
+
+    markov = textgen.MarkovText(["Snow falls softly.", "Snow melts fast!"], textgen.LengthDistribution("uniform", 1, 12))
+    allowed = {("Snow", "falls"), ("falls", "softly."), ("Snow", "melts"), ("melts", "fast."), ("softly.", "Snow"), ("fast.", "Snow")}
+    for text in markov.generate(500):
+        tokens = text.split(" ")
+        assert tokens[0] == "Snow" and 1 <= len(tokens) <= 12
+        assert set(zip(tokens, tokens[1:])) <= allowed
+
+    with pytest.raises(ValueError):
+        textgen.LengthDistribution("zipf")
+    with pytest.raises(ValueError):
+        textgen.build_model({"model": "gpt"})
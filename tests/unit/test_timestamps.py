@@ -0,0 +1,68 @@
+# Stdlib imports
+import datetime
+import logging
+import random
+
+# Third-party imports
+import numpy as np
+import pytest
+
+# Internal imports
+from src.db.utils import distributions
+from src.db.utils.timestamps import TimestampSampler, Window, from_epoch_us, to_epoch_us
+
+
+
+def test_conditional_draws_stay_in_bounds():
+    """Test if before/after draws respect their bounds for uniform and weighted samplers without retries"""
+    logging.info("==== test_conditional_draws_stay_in_bounds =====")
+    window = Window(datetime.datetime(2022, 1, 1), datetime.datetime(2023, 12, 31, 12))
+    anchor = datetime.datetime(2022, 3, 10, 15, 30)
+    seasonal = distributions.build_timestamp_sampler(window, "seasonal", months=[0] * 11 + [1])
+    random.seed(7)
+    for sampler in (TimestampSampler(window), seasonal):
+        for _ in range(500):
+            assert window.start <= sampler.draw(before=anchor) < anchor
+            within = sampler.draw(after=anchor, before=anchor + datetime.timedelta(days=3))
+            assert anchor <= within < anchor + datetime.timedelta(days=3)
+
+        before = np.full(2000, to_epoch_us(anchor))
+        drawn = sampler.draw_many_epoch_us(2000, before=before)
+        assert drawn.min() >= window.start_us and drawn.max() < to_epoch_us(anchor)
+        # spread over the range like the single draws (68 days before the anchor)
+        assert len(set(drawn // (86_400 * 1_000_000))) > 50
+        assert len({ts.date() for ts in (sampler.draw(before=anchor) for _ in range(2000))}) > 50
+
+    # only December is weighted: ranges around the March anchor fall back to uniform, free draws hit December
+    assert all(ts.month == 12 for ts in seasonal.draw_many(300))
+    assert all(from_epoch_us(us).month == 12 for us in seasonal.draw_many_epoch_us(300).tolist())
+
+    with pytest.raises(ValueError):
+        TimestampSampler(window).draw(before=window.start)
+
+
+def test_batched_draws_are_native_and_reproducible():
+    """Test if batched draws return datetimes/epoch µs, are reproducible under random.seed and match single draws"""
+    logging.info("==== test_batched_draws_are_native_and_reproducible =====")
+    start, stop = datetime.datetime(2022, 1, 1), datetime.datetime(2023, 12, 31)
+    window = Window(start, stop)
+    sampler = TimestampSampler(window)
+
+    random.seed(3)
+    expected = start + datetime.timedelta(seconds=random.randint(0, int((stop - start).total_seconds())))
+    random.seed(3)
+    assert sampler.draw() == expected
+    random.seed(3)
+    assert from_epoch_us(sampler.draw_epoch_us()) == expected
+
+    random.seed(9)
+    first = sampler.draw_many(1000)
+    random.seed(9)
+    assert sampler.draw_many(1000) == first
+    assert all(isinstance(ts, datetime.datetime) and start <= ts <= stop for ts in first)
+
+    # per-row bounds: every row lies within 2 days after its own anchor
+    anchors = sampler.draw_many_epoch_us(1000, before=to_epoch_us(stop - datetime.timedelta(days=2)))
+    following = sampler.draw_many_epoch_us(1000, after=anchors, before=anchors + 2 * 86_400_000_000)
+    assert following.dtype == np.int64
+    assert np.all(following >= anchors) and np.all(following < anchors + 2 * 86_400_000_000)
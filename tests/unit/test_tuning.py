@@ -0,0 +1,23 @@
+# Stdlib imports
+import logging
+
+# Internal imports
+from src.db import tuning
+
+
+
+def test_detect_profile_matches_show_values():
+    """Test if server settings are mapped to the profile they match, case-insensitively"""
+    logging.info("==== test_detect_profile_matches_show_values =====")
+    settings = {name: value.upper() for name, value in tuning.PROFILES["bulk_load"].items()}
+
+    assert tuning.detect_profile(settings) == "bulk_load"
+    assert tuning.detect_profile(dict(tuning.PROFILES["serve"])) == "serve"
+    assert tuning.detect_profile({**settings, "max_wal_size": "2GB"}) == "custom"
+
+
+def test_profiles_tune_the_same_settings():
+    """Test if every profile sets every tuned setting, so switching never leaves a value behind"""
+    logging.info("==== test_profiles_tune_the_same_settings =====")
+    for profile in tuning.PROFILES.values():
+        assert sorted(profile) == tuning.TUNED_SETTINGS